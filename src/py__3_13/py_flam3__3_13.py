@@ -16,12 +16,10 @@ __py_version__ = "3.13.10" # H22 UP
 __license__ = "GPL v3.0"
 __maintainer__ = "Alessandro Nardini"
 
-import hou
-import nodesearch
 
 import os
+import sys
 import json
-import colorsys
 import platform
 import traceback
 import lxml.etree as lxmlET
@@ -52,15 +50,39 @@ from copy import copy
 from platform import python_version
 from platform import system as platform_system
 from collections.abc import Iterable
+from collections.abc import Iterator
 from collections.abc import Callable
 from collections.abc import KeysView
+from collections import OrderedDict
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, Future
+from concurrent.futures.process import BrokenProcessPool
 from sys import stdout as sys_stdout
+from sys import getsizeof as sys_getsizeof
+from threading import Lock
+from threading import Event
+from threading import Thread
+from threading import local
+from types import MappingProxyType
 from itertools import count as it_count
 from itertools import islice as it_islice
 from textwrap import wrap
 from datetime import datetime
 from re import sub as re_sub
 from re import search as re_search
+from re import match as re_match
+from re import finditer as re_finditer
+from re import Match as re_Match
+from re import Pattern as re_Pattern
+from re import compile as re_compile
+from io import BytesIO
+from io import StringIO
+from struct import pack as struct_pack
+from zlib import compress as zlib_compress
+from zlib import crc32 as zlib_crc32
+from hashlib import blake2b
+from shutil import copymode
+from tempfile import mkstemp
 from webbrowser import open as www_open
 from inspect import cleandoc as i_cleandoc
 
@@ -71,129 +93,193 @@ from typing import (
     Never,
     Protocol,
     Type,
+    TextIO,
+    TypeGuard,
+    TYPE_CHECKING,
 )
 
 from numpy import (
+    abs as np_abs,
+    arctan2 as np_arctan2,
     array as np_array,
+    bincount as np_bincount,
+    clip as np_clip,
+    cos as np_cos,
+    cosh as np_cosh,
+    errstate as np_errstate,
+    exp as np_exp,
     float32 as np_float32,
+    float64 as np_float64,
+    floor as np_floor,
+    fmod as np_fmod,
+    frombuffer as np_frombuffer,
+    interp as np_interp,
+    isfinite as np_isfinite,
+    log as np_log,
+    log1p as np_log1p,
+    nan_to_num as np_nan_to_num,
+    ones as np_ones,
     pad as np_pad,
+    percentile as np_percentile,
+    pi as np_pi,
     resize as np_resize,
+    rint as np_rint,
     searchsorted as np_searchsorted,
+    select as np_select,
+    sin as np_sin,
+    sinh as np_sinh,
+    sqrt as np_sqrt,
+    tan as np_tan,
     transpose as np_transpose,
+    trunc as np_trunc,
+    uint8 as np_uint8,
+    where as np_where,
+    zeros as np_zeros,
 )
+from numpy.random import default_rng as np_default_rng
+from numpy.random import Generator as np_Generator
 from numpy.typing import NDArray
 
 
+# hou and nodesearch are only available inside Houdini.
+# Without them this module can still be imported to use its hou-free parts on their own, like: flame_model and flam3h_preview_renderer.
+if TYPE_CHECKING:
+    import hou
+    import nodesearch
+else:
+    try:
+        import hou
+        import nodesearch
+    except ImportError:
+        hou = None
+        nodesearch = None
+__houdini__: bool = hou is not None
+
+
 # Lets get some data from the HDA python module section
 F3H_NODE_TYPE_NAME_CATEGORY: str = 'alexnardini::Sop/FLAM3H'
-nodetype: hou.SopNodeType = hou.nodeType(F3H_NODE_TYPE_NAME_CATEGORY)
-try:
-    # This is the major version number only, for example version 1 or version 2, as integer
-    __v__: int = nodetype.hdaModule().__v__
-except AttributeError:
-    __v__: int = 0
-    print(f"ERROR - FLAM3H™ python module is missing: \"__v__\"\n-> Set to a backup value of: {__v__}\n")
-else:
-    if not isinstance(__v__, int):
+if __houdini__:
+    nodetype: hou.SopNodeType = hou.nodeType(F3H_NODE_TYPE_NAME_CATEGORY)
+    try:
+        # This is the major version number only, for example version 1 or version 2, as integer
+        __v__: int = nodetype.hdaModule().__v__
+    except AttributeError:
         __v__: int = 0
-        print(f"WARNING - FLAM3H™ python module data: \"__v__\" is not a valid data\n-> Set to a backup value of: {__v__}\n")
-try:
-    # this is the full version number, for example version 1.9.80 or 2.0.22, as string
-    __version__: str = nodetype.hdaModule().__version__
-except AttributeError:
-    __version__: str = "Unknown"
-    print(f"ERROR - FLAM3H™ python module is missing: \"__version__\"\n-> Set to a backup value of: {__version__}\n")
-else:
-    if not isinstance(__version__, str):
+        print(f"ERROR - FLAM3H™ python module is missing: \"__v__\"\n-> Set to a backup value of: {__v__}\n")
+    else:
+        if not isinstance(__v__, int):
+            __v__: int = 0
+            print(f"WARNING - FLAM3H™ python module data: \"__v__\" is not a valid data\n-> Set to a backup value of: {__v__}\n")
+    try:
+        # this is the full version number, for example version 1.9.80 or 2.0.22, as string
+        __version__: str = nodetype.hdaModule().__version__
+    except AttributeError:
         __version__: str = "Unknown"
-        print(f"WARNING - FLAM3H™ python module data: \"__version__\" is not a valid data\n-> Set to a backup value of: {__version__}\n")
-try:
-    # This is the status of the tool for this version, for example Prototype or Production
-    __status__: str = nodetype.hdaModule().__status__
-except AttributeError:
-    __status__: str = "Unknown"
-    print(f"ERROR - FLAM3H™ python module is missing: \"__status__\"\n-> Set to a backup value of: {__status__}\n")
-else:
-    if not isinstance(__status__, str):
+        print(f"ERROR - FLAM3H™ python module is missing: \"__version__\"\n-> Set to a backup value of: {__version__}\n")
+    else:
+        if not isinstance(__version__, str):
+            __version__: str = "Unknown"
+            print(f"WARNING - FLAM3H™ python module data: \"__version__\" is not a valid data\n-> Set to a backup value of: {__version__}\n")
+    try:
+        # This is the status of the tool for this version, for example Prototype or Production
+        __status__: str = nodetype.hdaModule().__status__
+    except AttributeError:
         __status__: str = "Unknown"
-        print(f"WARNING - FLAM3H™ python module data: \"__status__\" is not a valid data\n-> Set to a backup value of: {__status__}\n")
-try:
-    # This is the module file name given to the file loaded inside the Extra Files section of FLAM3H™
-    __module_filename__: str = nodetype.hdaModule().__module_filename__
-except AttributeError:
-    __module_filename__: str = "Unknown"
-    print(f"ERROR - FLAM3H™ python module is missing: \"__module_filename__\"\n-> Set to a backup value of: {__module_filename__}\n")
-else:
-    if not isinstance(__module_filename__, str):
+        print(f"ERROR - FLAM3H™ python module is missing: \"__status__\"\n-> Set to a backup value of: {__status__}\n")
+    else:
+        if not isinstance(__status__, str):
+            __status__: str = "Unknown"
+            print(f"WARNING - FLAM3H™ python module data: \"__status__\" is not a valid data\n-> Set to a backup value of: {__status__}\n")
+    try:
+        # This is the module file name given to the file loaded inside the Extra Files section of FLAM3H™
+        __module_filename__: str = nodetype.hdaModule().__module_filename__
+    except AttributeError:
         __module_filename__: str = "Unknown"
-        print(f"WARNING - FLAM3H™ python module data: \"__module_filename__\" is not a valid data\n-> Set to a backup value of: {__module_filename__}\n")
-try:
-    # This is a tuple containing all the houdini versions where this FLAM3H™ OTL is allowed to run
-    __h_versions__: tuple[int, ...] = nodetype.hdaModule().__h_versions__
-except AttributeError:
-    __h_versions__: tuple[int, ...] = (999,)
-    print(f"ERROR - FLAM3H™ python module is missing: \"__h_versions__\"\n-> Set to a backup value of: {__h_versions__}\n")
-else:
-    if not nodetype.hdaModule().is_nonempty_int_tuple(__h_versions__):
+        print(f"ERROR - FLAM3H™ python module is missing: \"__module_filename__\"\n-> Set to a backup value of: {__module_filename__}\n")
+    else:
+        if not isinstance(__module_filename__, str):
+            __module_filename__: str = "Unknown"
+            print(f"WARNING - FLAM3H™ python module data: \"__module_filename__\" is not a valid data\n-> Set to a backup value of: {__module_filename__}\n")
+    try:
+        # This is a tuple containing all the houdini versions where this FLAM3H™ OTL is allowed to run
+        __h_versions__: tuple[int, ...] = nodetype.hdaModule().__h_versions__
+    except AttributeError:
         __h_versions__: tuple[int, ...] = (999,)
-        print(f"WARNING - FLAM3H™ python module data: \"__h_versions__\" is not a valid data\n-> Set to a backup value of: {__h_versions__}\n")
-try:
-    # This is telling us if FLAM3H™ will run only on a selected Houdini version numbers or also beyound those.
-    __range_type__: bool = nodetype.hdaModule().__range_type__  # True for closed range. False for open range
-except AttributeError:
-    __range_type__: bool = True
-    print(f"ERROR - FLAM3H™ python module is missing: \"__range_type__\"\n-> Set to a backup value of: {__range_type__}\n")
-else:
-    if not isinstance(__range_type__, bool):
+        print(f"ERROR - FLAM3H™ python module is missing: \"__h_versions__\"\n-> Set to a backup value of: {__h_versions__}\n")
+    else:
+        if not nodetype.hdaModule().is_nonempty_int_tuple(__h_versions__):
+            __h_versions__: tuple[int, ...] = (999,)
+            print(f"WARNING - FLAM3H™ python module data: \"__h_versions__\" is not a valid data\n-> Set to a backup value of: {__h_versions__}\n")
+    try:
+        # This is telling us if FLAM3H™ will run only on a selected Houdini version numbers or also beyound those.
+        __range_type__: bool = nodetype.hdaModule().__range_type__  # True for closed range. False for open range
+    except AttributeError:
         __range_type__: bool = True
-        print(f"WARNING - FLAM3H™ python module data: \"__range_type__\" is not a valid data\n-> Set to a backup value of: {__range_type__}\n")
-try:
-    # This is the full Houdini dot version used to compile all the cvex code included
-    __vcc_compiler__: str = nodetype.hdaModule().__vcc_compiler__
-except AttributeError:
-    __vcc_compiler__: str = "Unknown"
-    print(f"ERROR - FLAM3H™ python module is missing: \"__vcc_compiler__\"\n-> Set to a backup value of: {__vcc_compiler__}\n")
-else:
-    if not isinstance(__vcc_compiler__, str):
+        print(f"ERROR - FLAM3H™ python module is missing: \"__range_type__\"\n-> Set to a backup value of: {__range_type__}\n")
+    else:
+        if not isinstance(__range_type__, bool):
+            __range_type__: bool = True
+            print(f"WARNING - FLAM3H™ python module data: \"__range_type__\" is not a valid data\n-> Set to a backup value of: {__range_type__}\n")
+    try:
+        # This is the full Houdini dot version used to compile all the cvex code included
+        __vcc_compiler__: str = nodetype.hdaModule().__vcc_compiler__
+    except AttributeError:
         __vcc_compiler__: str = "Unknown"
-        print(f"WARNING - FLAM3H™ python module data: \"__vcc_compiler__\" is not a valid data\n-> Set to a backup value of: {__vcc_compiler__}\n")
-try:
-    # This is the OpenCL language version number being used to compile the OpenCL kernel code included
-    __opencl__: str = nodetype.hdaModule().__opencl__
-except AttributeError:
-    __opencl__: str = "Unknown"
-    print(f"ERROR - FLAM3H™ python module is missing: \"__opencl__\"\n-> Set to a backup value of: {__opencl__}\n")
-else:
-    if not isinstance(__opencl__, str):
+        print(f"ERROR - FLAM3H™ python module is missing: \"__vcc_compiler__\"\n-> Set to a backup value of: {__vcc_compiler__}\n")
+    else:
+        if not isinstance(__vcc_compiler__, str):
+            __vcc_compiler__: str = "Unknown"
+            print(f"WARNING - FLAM3H™ python module data: \"__vcc_compiler__\" is not a valid data\n-> Set to a backup value of: {__vcc_compiler__}\n")
+    try:
+        # This is the OpenCL language version number being used to compile the OpenCL kernel code included
+        __opencl__: str = nodetype.hdaModule().__opencl__
+    except AttributeError:
         __opencl__: str = "Unknown"
-        print(f"WARNING - FLAM3H™ python module data: \"__opencl__\" is not a valid data\n-> Set to a backup value of: {__opencl__}\n")
-try:
-    # This is the least Houdini version allowed
-    __h_version_min__: int = nodetype.hdaModule().__h_version_min__
-except AttributeError:
-    if __h_versions__[0] != 999:
-        __h_version_min__: int = __h_versions__[0]
+        print(f"ERROR - FLAM3H™ python module is missing: \"__opencl__\"\n-> Set to a backup value of: {__opencl__}\n")
     else:
-        __h_version_min__: int = 999
-        print(f"ERROR - FLAM3H™ python module is missing: \"__h_version_min__\"\n-> Set to a backup value of: {__h_version_min__}\n")
-else:
-    if not isinstance(__h_version_min__, int):
-        __h_version_min__: int = 999
-        print(f"WARNING - FLAM3H™ python module data: \"__h_version_min__\" is not a valid data\n-> Set to a backup value of: {__h_version_min__}\n")
-try:
-    # This is the max Houdini version allowed. if "__range_type__" is False, it will run beyound this version regardless
-    __h_version_max__: int = nodetype.hdaModule().__h_version_max__
-except AttributeError:
-    if __h_versions__[0] != 999:
-        __h_version_max__: int = __h_versions__[-1]
+        if not isinstance(__opencl__, str):
+            __opencl__: str = "Unknown"
+            print(f"WARNING - FLAM3H™ python module data: \"__opencl__\" is not a valid data\n-> Set to a backup value of: {__opencl__}\n")
+    try:
+        # This is the least Houdini version allowed
+        __h_version_min__: int = nodetype.hdaModule().__h_version_min__
+    except AttributeError:
+        if __h_versions__[0] != 999:
+            __h_version_min__: int = __h_versions__[0]
+        else:
+            __h_version_min__: int = 999
+            print(f"ERROR - FLAM3H™ python module is missing: \"__h_version_min__\"\n-> Set to a backup value of: {__h_version_min__}\n")
     else:
-        __h_version_max__: int = 999
-        print(f"ERROR - FLAM3H™ python module is missing: \"__h_version_max__\"\n-> Set to a backup value of: {__h_version_max__}\n")
-else:
-    if not isinstance(__h_version_max__, int):
-        __h_version_max__: int = 999
-        print(f"WARNING - FLAM3H™ python module data: \"__h_version_max__\" is not a valid data\n-> Set to a backup value of: {__h_version_max__}\n")
+        if not isinstance(__h_version_min__, int):
+            __h_version_min__: int = 999
+            print(f"WARNING - FLAM3H™ python module data: \"__h_version_min__\" is not a valid data\n-> Set to a backup value of: {__h_version_min__}\n")
+    try:
+        # This is the max Houdini version allowed. if "__range_type__" is False, it will run beyound this version regardless
+        __h_version_max__: int = nodetype.hdaModule().__h_version_max__
+    except AttributeError:
+        if __h_versions__[0] != 999:
+            __h_version_max__: int = __h_versions__[-1]
+        else:
+            __h_version_max__: int = 999
+            print(f"ERROR - FLAM3H™ python module is missing: \"__h_version_max__\"\n-> Set to a backup value of: {__h_version_max__}\n")
+    else:
+        if not isinstance(__h_version_max__, int):
+            __h_version_max__: int = 999
+            print(f"WARNING - FLAM3H™ python module data: \"__h_version_max__\" is not a valid data\n-> Set to a backup value of: {__h_version_max__}\n")
 
+else:
+    # Outside Houdini there is no HDA python module section to get those from.
+    nodetype: hou.SopNodeType = cast(Any, None)
+    __v__: int = 0
+    __version__: str = "Unknown"
+    __status__: str = "Unknown"
+    __module_filename__: str = "Unknown"
+    __h_versions__: tuple[int, ...] = (999,)
+    __range_type__: bool = True
+    __vcc_compiler__: str = "Unknown"
+    __opencl__: str = "Unknown"
+    __h_version_min__: int = 999
+    __h_version_max__: int = 999
 
 '''
     THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
@@ -308,6 +394,8 @@ else:
                     
                     flam3h_iterator_utils
                     flam3h_palette_utils
+                    _library_cache
+                    _json_index
                     flam3h_about_utils
                     flam3h_ui_msg_utils
                     
@@ -316,16 +404,26 @@ else:
 
                     flam3h_varsPRM_APO
                     
+                    flame_model
+                    flame_model_hou
+                    flam3h_preview_renderer
+                    
                     _xml
+                    _xml_index
+                    _xml_flames_data
                     _xml_tree
                     in_flame(_xml_tree)
                     in_flame_iter_data(in_flame)
                     in_flame_utils
                     in_flame_checks
+                    in_flame_parms_plan
+                    in_flame_prefetch
 
                     out_flame_utils
                     out_flame_render_properties(out_flame_utils)
                     out_flame_xforms_data(out_flame_utils)
+                    flam3h_library_converter
+                    flam3h_library_catalog
                     
                     SvgIcon(QtWidgets.QWidget)
                     pyside_master_app_names
@@ -383,6 +481,9 @@ type TA_Affine = list[Iterable[float]]
 type TA_OUT_Pre_Affine = Triple[tuple[str, ...]]
 type TA_OUT_Post_Affine = Triple[tuple[str | list[Never], ...]]
 type TA_OUT_Affine_FF = Triple[str]
+type TA_OUT_XF_Snapshot = dict[str, tuple[Any, ...]]
+type TA_OUT_Vars_Lookup = tuple[tuple[tuple[str, int], ...], tuple[str, ...]]
+type TA_OUT_Vars_Snapshot = tuple[tuple[str, int, float, tuple[str, ...], tuple[float, ...]], ...]
 
 type TA_PrmData = (
     int 
@@ -432,6 +533,7 @@ type TA_XAOS_Collect = list[list[str | float] | list[Never]]
 type TA_RoundFloats = Iterable[Iterable[str | float]]
 type TA_F3H_Init = tuple[str | None, bool, int, str, bool, bool]
 type TA_Menu = list[int | str]
+type TA_XML_FlameVals = tuple[str | list[Never], ...] | _xml_flames_data
 
 
 # FLAM3H™ misc namespace collections
@@ -478,6 +580,7 @@ class f3h_userData:
     XFVIZ_SOLO: Final = 'XF VIZ'
     # Node user data
     XML_LAST: Final = 'XML_last_loaded'
+    IN_PREFETCH: Final = 'IN_prefetch_count'
     
     
 class f3h_cachedUserData:
@@ -506,9 +609,14 @@ class f3h_cachedUserData:
     in_presets_menu_off: Final = 'in_presets_menu_off'
     in_presets_menu_off_idx: Final = 'in_presets_menu_off_idx'
     in_presets_filepath: Final = 'in_presets_filepath'
+    in_xml_last_check: Final = 'in_xml_last_check'
+    in_reset_parms_inventory: Final = 'in_reset_parms_inventory'
+    in_reset_parms_dirty: Final = 'in_reset_parms_dirty'
     out_presets_menu: Final = 'out_presets_menu'
     out_presets_filepath: Final = 'out_presets_filepath'
     vars_menu_all_simple: Final = 'vars_menu_all_simple'
+    xaos_prev: Final = 'xaos_prev'
+    xaos_notes: Final = 'xaos_notes'
 
 
 class f3h_affineDefaults:
@@ -516,8 +624,8 @@ class f3h_affineDefaults:
     FLAM3H™ Affine default values in various formats.</br>
     
     '''
-    # Default affine values
-    DEFAULT_DICT: Final[dict[str, hou.Vector2 | float]] = {"affine_x": hou.Vector2((1.0, 0.0)), "affine_y": hou.Vector2((0.0, 1.0)), "affine_o": hou.Vector2((0.0, 0.0)), "angle": float(0.0)} # X, Y, O, ANGLE
+    # Default affine values (only used by the FLAM3H™ node so it is left empty outside Houdini)
+    DEFAULT_DICT: Final[dict[str, hou.Vector2 | float]] = {"affine_x": hou.Vector2((1.0, 0.0)), "affine_y": hou.Vector2((0.0, 1.0)), "affine_o": hou.Vector2((0.0, 0.0)), "angle": float(0.0)} if __houdini__ else {} # X, Y, O, ANGLE
     DEFAULT_VALS: Final[list[tuple[float, ...] | float]] = [(1.0, 0.0), (0.0, 1.0), (0.0, 0.0), 0.0]
     DEFAULT_IDENT: Final[list[float]] = [1.0, 0.0, 0.0, 1.0, 0.0, 0.0]
 
@@ -694,6 +802,8 @@ class f3h_tabs:
         
         # CP MISC
         DEFAULT_FILE_EXT: Final = '.json'
+        # The palette lib file index sidecar file (_json_index)
+        DEFAULT_INDEX_FILE_EXT: Final = '.f3hidx'
         DEFAULT_AUTO_NAME: Final = 'Palette'
         DEFAULT_COUNT_64: Final = '64' # not used
         DEFAULT_COUNT_128: Final = '128'
@@ -984,7 +1094,7 @@ class F3H_Exception:
 class F3H_Exception
 
 @STATICMETHODS
-F3H_traceback_print_infos(e: Any, traceback_info: bool = False, extra_info: str | None = None) -> None:
+F3H_traceback_print_infos(e: Any, traceback_info: bool = False, extra_info: str | None = None, out: TextIO | None = None) -> None:
 
 @METHODS
 
@@ -1006,7 +1116,7 @@ F3H_traceback_print_infos(e: Any, traceback_info: bool = False, extra_info: str
         
     
     @staticmethod
-    def F3H_traceback_print_infos(e: Any, traceback_info: bool = False, extra_info: str | None = None) -> None:
+    def F3H_traceback_print_infos(e: Any, traceback_info: bool = False, extra_info: str | None = None, out: TextIO | None = None) -> None:
         """ Simple print exception infos.</br>
         Additionally it can print also the full traceback infos.
         
@@ -1014,6 +1124,7 @@ F3H_traceback_print_infos(e: Any, traceback_info: bool = False, extra_info: str
             e(Any): Any of the exceptions type.
             traceback_info(bool): Default to: False</br>If True, it will print also the full traceback.
             extra_info(str | None): Default to: None</br>Add a string message to print it under a: "Extra info" message
+            out(TextIO | None): Default to: None</br>Where to print out. If None, the usual sys.stdout.
             
         Returns:
             (None):
@@ -1031,18 +1142,18 @@ F3H_traceback_print_infos(e: Any, traceback_info: bool = False, extra_info: str
             filename: str | None = last_frame.filename
             lineno: int | None = last_frame.lineno
             
-        print(f"FLAM3H™ Exception Type: {exc_type}")
-        print(f"\tPY filename: {__module_filename__}")
-        print(f"\tModule name: {filename}")
-        print(f"\tCode line: {lineno}")
-        print(f"\tMessage: {str(e)}")
+        print(f"FLAM3H™ Exception Type: {exc_type}", file=out)
+        print(f"\tPY filename: {__module_filename__}", file=out)
+        print(f"\tModule name: {filename}", file=out)
+        print(f"\tCode line: {lineno}", file=out)
+        print(f"\tMessage: {str(e)}", file=out)
         if extra_info is not None:
-            print(f"\tExtra info: {extra_info}")
+            print(f"\tExtra info: {extra_info}", file=out)
         
         # Optional
         if traceback_info:
-            print("\nFull Traceback:")
-            tb.print_exc(file=sys_stdout)
+            print("\nFull Traceback:", file=out)
+            tb.print_exc(file=out if out is not None else sys_stdout)
             
             
     # CLASS: PROPERTIES
@@ -2175,6 +2286,9 @@ class flam3h_scripts
 * is_post_affine_default_on_load(node: hou.SopNode) -> None:
 * unpin_parameter_editor_with_f3h_node(f3h_node: hou.SopNode) -> None:
 * hou_session_data_clear_and_restore() -> None:
+* flam3h_on_loaded_deferred_event(event_type: hou.EnumValue) -> None:
+* flam3h_on_loaded_presets_restore(node: hou.SopNode) -> None:
+* flam3h_on_loaded_deferred_run() -> None:
 
 @METHODS
 * flam3h_compatible_type(self, range_type: bool, kwargs: dict[str, Any] | None = None, msg: bool = True) -> bool:
@@ -2188,6 +2302,7 @@ class flam3h_scripts
 * flam3h_on_create(self) -> None:
 * flam3h_on_loaded_compatible_false(self) -> None:
 * flam3h_on_loaded_compatible_true(self) -> None:
+* flam3h_on_loaded_deferred_add(self) -> bool:
 * flam3h_on_loaded(self) -> None:
 * flam3h_on_deleted(self) -> None:
 
@@ -2195,6 +2310,9 @@ class flam3h_scripts
     
     __slots__ = ("_kwargs", "_node", "_gpu")
     
+    # The FLAM3H™ nodes being loaded with the current hip file, waiting for their deferred on load work to run.
+    ON_LOADED_DEFERRED: list[hou.SopNode] = []
+    
     def __init__(self, kwargs: dict[str, Any]) -> None:
         """
         Args:
@@ -2685,6 +2803,136 @@ class flam3h_scripts
             pass
 
 
+    @staticmethod
+    def flam3h_on_loaded_deferred_event(event_type: hou.EnumValue) -> None:
+        """Hip file event callback registered by: flam3h_on_loaded_deferred_add(...)</br>
+        Once the hip file is done loading or merging, run the deferred on load work of all the FLAM3H™ nodes that have been loaded with it.</br>
+        In a graphical Houdini session it is deferred once more until the UI is idle so the hip file is fully open and responsive first.</br></br>
+        
+        If a new hip file start loading or the scene is cleared before that, the collected FLAM3H™ nodes and the prefetched flame presets are dropped and this callback removed</br>
+        so they do not leak into the next hip file load.</br>
+
+        Args:
+            event_type(hou.EnumValue): The hip file event type.
+
+        Returns:
+            (None):
+        """
+        _hipFileEventType = hou.hipFileEventType # pyright: ignore[reportAttributeAccessIssue]  # Houdini HOM API
+        if event_type in (_hipFileEventType.BeforeLoad, _hipFileEventType.BeforeClear):
+            hou.hipFile.removeEventCallback(flam3h_scripts.flam3h_on_loaded_deferred_event) # pyright: ignore[reportAttributeAccessIssue]  # Houdini HOM API
+            flam3h_scripts.ON_LOADED_DEFERRED.clear()
+            in_flame_utils.PREFETCH.clear()
+            return
+        
+        if event_type not in (_hipFileEventType.AfterLoad, _hipFileEventType.AfterMerge):
+            return
+        
+        hou.hipFile.removeEventCallback(flam3h_scripts.flam3h_on_loaded_deferred_event) # pyright: ignore[reportAttributeAccessIssue]  # Houdini HOM API
+        
+        if hou.isUIAvailable():
+            try:
+                import hdefereval
+            except ImportError:
+                pass
+            else:
+                hdefereval.executeDeferred(flam3h_scripts.flam3h_on_loaded_deferred_run)
+                return
+            
+        flam3h_scripts.flam3h_on_loaded_deferred_run()
+        
+        
+    @staticmethod
+    def flam3h_on_loaded_presets_restore(node: hou.SopNode) -> None:
+        """On hip file load, restore the IN and CP presets menus selection from their SYS Tab mem menu parameters.</br>
+        This must run after the presets menus inits: flam3h_general_utils.flam3h_init_presets_CP_PRESETS(0) and flam3h_general_utils.flam3h_init_presets_IN_PRESETS(0)</br>
+        as they can reset them.</br>
+
+        Args:
+            node(hou.SopNode): This FLAM3H™ node.
+
+        Returns:
+            (None):
+        """
+        # The following is a workaround to keep the correct preset inside the IN Tab when the hip file was saved
+        # as it always get reset to ZERO on load for some reason. The preset inside the SYS Tab is correct after load.
+        # Need to investigate why. the IN_SYS_PRESETS menu parameter is set inside:
+        # 
+        #   - in_flame_utils(self.kwargs).in_to_flam3h()
+        #   - in_flame_utils(self.kwargs).in_to_flam3h_sys()
+        #
+        #
+        # They are already unlocked and cleared from their keyframes from: flam3h_general_utils(self.kwargs).flam3h_init_presets_on_loaded()
+        node.parm(f3h_tabs.IN.PRM_PRESETS).set(node.parm(f3h_tabs.IN.PRM_SYS_PRESETS).eval())
+        node.parm(f3h_tabs.IN.PRM_PRESETS_OFF).set(node.parm(f3h_tabs.IN.PRM_SYS_PRESETS_OFF).eval())
+        
+        
+        # Same goes for the palette preset entrie, and some time goes also out of range
+        # so we store the selection first inside a mem menu parameter on Load inside:
+        #
+        #   - flam3h_palette_utils(self.kwargs).json_to_flam3h_ramp_SET_PRESET_DATA(node)
+        #   - flam3h_palette_utils(self.kwargs).json_to_flam3h_ramp_sys()
+        #
+        # and on Save inside:
+        #
+        #   - flam3h_palette_utils(self.kwargs).flam3h_ramp_save()
+        #
+        #
+        # They are already unlocked and cleared from their keyframes from: flam3h_general_utils(self.kwargs).flam3h_init_presets_on_loaded()
+        node.parm(f3h_tabs.CP.PRM_PALETTE_PRESETS).set(node.parm(f3h_tabs.CP.PRM_SYS_PALETTE_PRESETS).eval())
+        node.parm(f3h_tabs.CP.PRM_PALETTE_PRESETS_OFF).set(node.parm(f3h_tabs.CP.PRM_SYS_PALETTE_PRESETS_OFF).eval())
+        
+        
+    @staticmethod
+    def flam3h_on_loaded_deferred_run() -> None:
+        """Run the deferred on load work of all the FLAM3H™ nodes loaded with the last hip file, all at once.</br>
+        The about tab messages are the same for all the FLAM3H™ nodes so they are built only once and then set on each of them.</br>
+        The CP, IN and OUT presets files are read and indexed here, so the presets menus are ready to use without holding up the hip file load.</br>
+        The IN and CP presets selection is restored right after: flam3h_scripts.flam3h_on_loaded_presets_restore(...)</br>
+        The flame files indexes are shared by all the FLAM3H™ nodes, so a flame file used by more than one of them is read only once.</br>
+
+        Args:
+            (None):
+
+        Returns:
+            (None):
+        """
+        nodes: list[hou.SopNode] = []
+        for node in flam3h_scripts.ON_LOADED_DEFERRED:
+            try:
+                node.type()
+            except hou.ObjectWasDeleted:
+                pass
+            else:
+                nodes.append(node)
+        flam3h_scripts.ON_LOADED_DEFERRED.clear()
+        
+        if not nodes:
+            return
+        
+        about: flam3h_about_utils = flam3h_about_utils({'node': nodes[0]})
+        parms_about: dict[str, str] = { f3h_tabs.ABOUT.MSG_PRM_F3H_ABOUT: about.flam3h_about_msg_data(),
+                                        f3h_tabs.ABOUT.MSG_PRM_F3H_PLUGINS: about.flam3h_about_plugins_msg_data(),
+                                        **about.flam3h_about_web_msg_data()
+                                        }
+        
+        # This is not something the user should be able to undo.
+        with hou.undos.disabler(): # pyright: ignore[reportCallIssue]   # Houdini HOM API
+            for node in nodes:
+                flam3h_prm_utils.setParms(node, parms_about)
+                
+                general: flam3h_general_utils = flam3h_general_utils({'node': node})
+                # init CP PRESETS: mode (int): ZERO: To be used to prevent to load a preset when loading back a hip file.
+                # The menus data are cleared only once, by the IN PRESETS init.
+                general.flam3h_init_presets_CP_PRESETS(0, False)
+                # init IN PRESETS: mode (int): ZERO: To be used to prevent to load a preset when loading back a hip file.
+                general.flam3h_init_presets_IN_PRESETS(0)
+                # init OUT PRESETS
+                general.flam3h_init_presets_OUT_PRESETS(False)
+                # Only now, so the presets menus inits above do not reset them
+                flam3h_scripts.flam3h_on_loaded_presets_restore(node)
+    
+    
     # CLASS: PROPERTIES
     ##########################################
     ##########################################
@@ -3314,6 +3562,28 @@ class flam3h_scripts
                 self.flam3h_on_create_lock_parms(node)
             
 
+    def flam3h_on_loaded_deferred_add(self) -> bool:
+        """Collect this FLAM3H™ node to run its non critical on load work (about tab messages and presets files) only once the hip file is done loading or merging,</br>
+        together with all the other FLAM3H™ nodes being loaded with it: flam3h_on_loaded_deferred_run()</br></br>
+        
+        This definition must run inside a:
+        * if hou.hipFile.isLoadingHipFile():
+            ....
+        
+        Args:
+            (self):
+            
+        Returns:
+            (bool): True if this is the first FLAM3H™ node being loaded with the hip file, so the per scene work is run only once.
+        """
+        deferred: list[hou.SopNode] = self.ON_LOADED_DEFERRED
+        first: bool = not deferred
+        if first:
+            hou.hipFile.addEventCallback(flam3h_scripts.flam3h_on_loaded_deferred_event) # pyright: ignore[reportAttributeAccessIssue]  # Houdini HOM API
+        deferred.append(self.node)
+        return first
+    
+
     def flam3h_on_loaded(self) -> None:
         """Initialize FLAM3H™ node on hip file load and all the data it need to run.</br>
         
@@ -3340,6 +3610,9 @@ class flam3h_scripts
             
             if hou.hipFile.isLoadingHipFile(): #type: ignore
                 
+                # The about tab messages and the presets menus are set once the hip file is done loading, for all the FLAM3H™ nodes at once.
+                first_loaded: bool = self.flam3h_on_loaded_deferred_add()
+                
                 # Restore if it is needed
                 self.flam3h_on_loaded_compatible_true()
                 
@@ -3350,28 +3623,22 @@ class flam3h_scripts
                 # it wont block the houdini session until user input.
                 self.flam3h_check_first_node_instance_msg(False)
                 
-                # Update FLAM3H™ viewport preferences
-                self.flam3h_on_create_set_prefs_viewport()
-                # Init FLAM3H™ xform handles viz viewport' wire width
-                self.flam3h_on_create_init_viewportWireWidth()
+                # The viewports are shared by all the FLAM3H™ nodes and their viewport preferences are already synced,
+                # so this is done only once for the first FLAM3H™ node being loaded.
+                if first_loaded:
+                    # Update FLAM3H™ viewport preferences
+                    self.flam3h_on_create_set_prefs_viewport()
+                    # Init FLAM3H™ xform handles viz viewport' wire width
+                    self.flam3h_on_create_init_viewportWireWidth()
                 
-                # init CP PRESETS: mode (int): ZERO: To be used to prevent to load a preset when loading back a hip file.
-                flam3h_general_utils(self.kwargs).flam3h_init_presets_CP_PRESETS(0)
-                # init IN PRESETS: mode (int): ZERO: To be used to prevent to load a preset when loading back a hip file.
-                flam3h_general_utils(self.kwargs).flam3h_init_presets_IN_PRESETS(0)
-                # init OUT PRESETS
-                flam3h_general_utils(self.kwargs).flam3h_init_presets_OUT_PRESETS()
+                # init CP, IN and OUT PRESETS: only their file paths here, the presets files are read and the presets restored once the hip file is done loading.
+                flam3h_general_utils(self.kwargs).flam3h_init_presets_on_loaded()
                 # init RIP: Remove Invalid Points
                 flam3h_iterator_utils.flam3h_on_load_opacity_zero(node, self.gpu)
                 
                 # Set color correction curves to their defaults if there is need to do it (ex: hip files with older version of FLAM3H™)
                 out_flame_utils.out_render_curves_set_defaults_on_load(node)
                 
-                # update about tab just in case
-                flam3h_about_utils(self.kwargs).flam3h_about_msg()
-                flam3h_about_utils(self.kwargs).flam3h_about_plugins_msg()
-                flam3h_about_utils(self.kwargs).flam3h_about_web_msg()
-                
                 # CAMERA SENSOR
                 #
                 # If a FLAM3H™ node is in camera sensor mode and its display flag ON, update the viewport to actually be in camera sensor mode.
@@ -3386,34 +3653,6 @@ class flam3h_scripts
                         # Clear stashed cams data
                         flam3h_general_utils.util_clear_stashed_cam_data()
                 
-                # The following is a workaround to keep the correct preset inside the IN Tab when the hip file was saved
-                # as it always get reset to ZERO on load for some reason. The preset inside the SYS Tab is correct after load.
-                # Need to investigate why. the IN_SYS_PRESETS menu parameter is set inside:
-                # 
-                #   - in_flame_utils(self.kwargs).in_to_flam3h()
-                #   - in_flame_utils(self.kwargs).in_to_flam3h_sys()
-                #
-                #
-                # They are already unlocked and cleared from their keyframes from the above: flam3h_general_utils(self.kwargs).flam3h_init_presets_IN_PRESETS(0) 
-                node.parm(f3h_tabs.IN.PRM_PRESETS).set(node.parm(f3h_tabs.IN.PRM_SYS_PRESETS).eval())
-                node.parm(f3h_tabs.IN.PRM_PRESETS_OFF).set(node.parm(f3h_tabs.IN.PRM_SYS_PRESETS_OFF).eval())
-                
-                
-                # Same goes for the palette preset entrie, and some time goes also out of range
-                # so we store the selection first inside a mem menu parameter on Load inside:
-                #
-                #   - flam3h_palette_utils(self.kwargs).json_to_flam3h_ramp_SET_PRESET_DATA(node)
-                #   - flam3h_palette_utils(self.kwargs).json_to_flam3h_ramp_sys()
-                #
-                # and on Save inside:
-                #
-                #   - flam3h_palette_utils(self.kwargs).flam3h_ramp_save()
-                #
-                #
-                # They are already unlocked and cleared from their keyframes from the above: flam3h_general_utils(self.kwargs).flam3h_init_presets_CP_PRESETS(0)
-                node.parm(f3h_tabs.CP.PRM_PALETTE_PRESETS).set(node.parm(f3h_tabs.CP.PRM_SYS_PALETTE_PRESETS).eval())
-                node.parm(f3h_tabs.CP.PRM_PALETTE_PRESETS_OFF).set(node.parm(f3h_tabs.CP.PRM_SYS_PALETTE_PRESETS_OFF).eval())
-
                 # init/clear copy/paste iterator's data and prm
                 # This was causing some issues and got updated.
                 flam3h_iterator_utils(self.kwargs).flam3h_paste_reset_hou_session_data(True)
@@ -3594,6 +3833,7 @@ class flam3h_general_utils
 * flam3h_init_presets_CP_PRESETS(self, mode: int = 1, destroy_menus: bool = True, json_file: bool | None = None, f3h_json_file: bool | None = None, json_path_checked: str | bool | None = None) -> None:
 * flam3h_init_presets_IN_PRESETS(self, mode: int = 1) -> None:
 * flam3h_init_presets_OUT_PRESETS(self, destroy_menus: bool = True) -> None:
+* flam3h_init_presets_on_loaded(self) -> None:
 * flam3h_display_help(self) -> None:
 * util_store_all_viewers_color_scheme(self) -> None:
 * colorSchemeDark(self, update_others: bool = True) -> None:
@@ -5671,10 +5911,10 @@ class flam3h_general_utils
             # Set the CP filepath parameter to this checked and corrected filepath
             flam3h_prm_utils.set(node, f3h_tabs.IN.PRM_PATH, xml_checked)
             
-            # We are using the class: _xml_tree becasue we really need to carefully validate the loaded flame file.
+            # We really need to carefully validate the loaded flame file.
             # This is important as all the toggles we are setting here will be used to speed up the population of the menu presets.
-            # apo = _xml_tree(xml)
-            if not _xml_tree(xml_checked).isvalidtree:
+            # A flame file already indexed with trusted byte offsets is not parsed again, the index is shared by all the FLAM3H™ nodes.
+            if not _xml_tree.xmlfile_isvalid(xml_checked):
                 
                 if clipboard:
                     self.remove_locked_from_flame_stats(node)
@@ -5695,6 +5935,9 @@ class flam3h_general_utils
                 # Only set when NOT on an: onLoaded python script
                 if mode and xml_checked != in_presets_filepath_history:
                     
+                    # Remember the folder so its flame files are cataloged by their stats once the library catalog is asked for
+                    flam3h_library_catalog.add_dir(os.path.dirname(xml_checked))
+                    
                     # IN is valid file
                     flam3h_prm_utils.private_prm_set(node, f3h_tabs.IN.PVT_PRM_ISVALID_FILE, 1)
                     # We store the file path only when we know it is a valid Flame file path
@@ -5780,7 +6023,9 @@ class flam3h_general_utils
             # Set the IN filepath parameter to this checked and corrected filepath
             flam3h_prm_utils.set(node, f3h_tabs.OUT.PRM_PATH, xml_checked)
             
-            apo = _xml_tree(xml_checked) #type: ignore
+            # A flame file already indexed with trusted byte offsets is not parsed again, the index is shared by all the FLAM3H™ nodes.
+            index: _xml_index = _xml_index.xmlfile_index(xml_checked)
+            apo: _xml_index | _xml_tree = index if index.offsets is not None else _xml_tree(xml_checked)
             if apo.isvalidtree:
                 
                 if xml_checked != out_presets_filepath_history:
@@ -5822,6 +6067,43 @@ class flam3h_general_utils
             #     print(f'{node.name()}.OUT: please select a valid file location.')
 
 
+    def flam3h_init_presets_on_loaded(self) -> None:
+        """On hip file load, do only the CP, IN and OUT presets bookkeeping that need no file to be read:</br>
+        unlock the presets menu parameters, clear their keyframes and set the file path parameters to their checked and corrected file paths.</br>
+        The presets files validity has already been checked against the files on disk: flam3h_scripts.flam3h_presets_cache_filepath_on_load()</br></br>
+        
+        The presets files parsing and indexing, and with it the menus data and the presets selection restore, is left to: flam3h_scripts.flam3h_on_loaded_deferred_run()</br>
+        so it run only once the hip file is done loading.</br>
+        
+        Args:
+            (self):
+            
+        Returns:
+            (None):
+        """
+        node: hou.SopNode = self.node
+        
+        for prm_name in (f3h_tabs.CP.PRM_PALETTE_PRESETS, f3h_tabs.CP.PRM_PALETTE_PRESETS_OFF, f3h_tabs.CP.PRM_SYS_PALETTE_PRESETS, f3h_tabs.CP.PRM_SYS_PALETTE_PRESETS_OFF,
+                         f3h_tabs.IN.PRM_PRESETS, f3h_tabs.IN.PRM_PRESETS_OFF, f3h_tabs.IN.PRM_SYS_PRESETS, f3h_tabs.IN.PRM_SYS_PRESETS_OFF,
+                         f3h_tabs.OUT.PRM_PRESETS, f3h_tabs.OUT.PRM_SYS_PRESETS):
+            p: hou.Parm = node.parm(prm_name)
+            p.lock(False)
+            p.deleteAllKeyframes()
+            
+        # CP
+        json_path_checked: str | bool = out_flame_utils.out_check_outpath(node, os.path.expandvars(node.parm(f3h_tabs.CP.PRM_PATH).eval()), f3h_tabs.CP.DEFAULT_FILE_EXT, f3h_tabs.CP.DEFAULT_AUTO_NAME)
+        if json_path_checked is not False:
+            flam3h_prm_utils.set(node, f3h_tabs.CP.PRM_PATH, json_path_checked)
+        # IN
+        in_xml_checked: str | bool = out_flame_utils.out_check_outpath(node, os.path.expandvars(node.parm(f3h_tabs.IN.PRM_PATH).eval()), f3h_tabs.OUT.DEFAULT_FILE_EXT, f3h_tabs.OUT.DEFAULT_AUTO_NAME, False, False)
+        if in_xml_checked is not False:
+            flam3h_prm_utils.set(node, f3h_tabs.IN.PRM_PATH, in_xml_checked)
+        # OUT
+        out_xml_checked: str | bool = out_flame_utils.out_check_outpath(node, os.path.expandvars(node.parm(f3h_tabs.OUT.PRM_PATH).eval()), f3h_tabs.OUT.DEFAULT_FILE_EXT, f3h_tabs.OUT.DEFAULT_AUTO_NAME)
+        if out_xml_checked is not False:
+            flam3h_prm_utils.set(node, f3h_tabs.OUT.PRM_PATH, out_xml_checked)
+
+
     def flam3h_display_help(self) -> None:
         """Open the Houdini help browser to display the FLAM3H™ node documentation.</br>
 
@@ -6472,9 +6754,10 @@ class flam3h_iterator_utils
 * auto_set_xaos_shuffle(node, iter_count: int, n: flam3h_iterator_prm_names) -> None:
 * auto_set_xaos_div_str(node: hou.SopNode) -> tuple[str, str]:
 * auto_set_xaos_data_get_MP_MEM(node: hou.SopNode) -> list[int] | None:
-* auto_set_xaos_data_get_XAOS_PREV(node: hou.SopNode) -> list[list[str]] | None:
+* auto_set_xaos_data_get_XAOS_PREV(node: hou.SopNode) -> list[list[float]] | None:
 * auto_set_xaos_data_set_MP_MEM(node: hou.SopNode, data: list | tuple) -> None:
 * auto_set_xaos_data_set_XAOS_PREV(node: hou.SopNode, data: list | tuple) -> None:
+* auto_set_xaos_data_set_notes(node: hou.SopNode, xaos: TA_STR_ListUnflattened, div_xaos: str, div_weight: str) -> None:
 * flam3h_on_load_opacity_zero(node: hou.SopNode, f3h_all: bool = False) -> None:
 * destroy_cachedUserData(node, data: str, must_exist: bool = False) -> None:
 * destroy_cachedUserData_all_f3h(node, data_name: str) -> None:
@@ -7403,7 +7686,7 @@ class flam3h_iterator_utils
             for mp_idx in range(1, iter_count + 1): _mpmem_x_append(node.parm(f"{mpmem_x_name}_{mp_idx}").eval() - 1)
             
             xaos_collect: TA_XAOS_Collect = out_flame_utils.out_xaos_collect(node, iter_count, n.xaos)
-            fill_all_xaos: list[list[float]] = [np_pad(item, (0, iter_count - len(item)), 'constant', constant_values = 1).tolist() for item in xaos_collect] # this probably not needed here but just to be sure
+            fill_all_xaos: list[list[float]] = out_flame_utils.out_xaos_fill(xaos_collect, iter_count) # this probably not needed here but just to be sure
             fill_all_xaos_swap: list[list[float]] = [[this_xaos[mpmem_x[idx]] for idx in range(len(this_xaos))] for this_xaos in fill_all_xaos]
             
             # reset mpmem_x
@@ -7413,21 +7696,11 @@ class flam3h_iterator_utils
             
             # AUTO DIV XAOS strings
             div_xaos, div_weight = flam3h_iterator_utils.auto_set_xaos_div_str(node)
-            # Convert to strings
-            xaos_str: list[list[str]] = [[str(item) for item in xaos] for xaos in fill_all_xaos_swap]
-            # Build FLAM3H™ xaos strings
-            _join: Callable[[Iterable[str]], str] = div_weight.join
-            xaos_str_round_floats: list[str] = [_join(x) for x in out_flame_utils.out_util_round_floats(xaos_str)]
             # set all multi parms xaos strings parms
-            prm_xaos_name: str = n.xaos
-            for mp_idx in range(1, iter_count + 1):
-                prm = node.parm(f"{prm_xaos_name}_{mp_idx}")
-                prm.lock(False)
-                prm.deleteAllKeyframes() # This parameter can not be animated
-            for mp_idx, xaos in enumerate(xaos_str_round_floats): node.parm(f"{prm_xaos_name}_{mp_idx + 1}").set(div_xaos + xaos)
+            flam3h_iterator_utils.auto_set_xaos_data_set_notes(node, out_flame_utils.out_util_round_floats(fill_all_xaos_swap), div_xaos, div_weight)
             
             # Update xaos prev
-            flam3h_iterator_utils.auto_set_xaos_data_set_XAOS_PREV(node, xaos_str)
+            flam3h_iterator_utils.auto_set_xaos_data_set_XAOS_PREV(node, fill_all_xaos_swap)
 
 
     @staticmethod
@@ -7470,19 +7743,31 @@ class flam3h_iterator_utils
         
         
     @staticmethod
-    def auto_set_xaos_data_get_XAOS_PREV(node: hou.SopNode) -> list[list[str]] | None:
+    def auto_set_xaos_data_get_XAOS_PREV(node: hou.SopNode) -> list[list[float]] | None:
         """Retrieve the desire data from FLAM3H™ data srting parameters</br>
-    and reconvert it back to usable types.</br>
+    and reconvert it back to usable types.</br></br>
+    
+    The xaos history is kept as a numeric matrix inside the node cachedUserData as well,</br>
+    so the data string parameter is parsed back only if it changed since it was last set (hip file load, undos, etc.).</br>
 
         Args:
             node(hou.SopNode): FLAM3H™ node
 
         Returns:
-            (list | None): A valid data type of the same data retrieved to be used inside: auto_set_xaos()
+            (list[list[float]] | None): A valid data type of the same data retrieved to be used inside: auto_set_xaos()</br>Each call return its own copy of the rows so they can be safely modified.
         """
         get_prm: str = node.parm(f3h_tabs.PREFS.PVT_PRM_DATA_PRM_XAOS_PREV).eval()
         if get_prm:
-            return [x.split(' ') for x in get_prm.split(':')]
+            
+            cached: tuple[str, list[list[float]]] | None = node.cachedUserData(f3h_cachedUserData.xaos_prev)
+            if cached is None or cached[0] != get_prm:
+                try:
+                    cached = (get_prm, [[float(x) for x in xaos.split(' ') if x] for xaos in get_prm.split(':')])
+                except ValueError:
+                    return None
+                node.setCachedUserData(f3h_cachedUserData.xaos_prev, cached)
+                
+            return [list(xaos) for xaos in cached[1]]
         
         return None
         
@@ -7521,15 +7806,54 @@ class flam3h_iterator_utils
         # to prm from: flam3_xaos_convert()
         if isinstance(data, tuple):
             data_to_prm: str = ':'.join(data)
-            # set
-            flam3h_prm_utils.private_prm_set(node, f3h_tabs.PREFS.PVT_PRM_DATA_PRM_XAOS_PREV, data_to_prm)
+            xaos_prev: list[list[float]] = [[float(x) for x in xaos.split(' ') if x] for xaos in data]
             
         else:
             _join: Callable[[Iterable[str]], str] = ' '.join
-            data_to_prm: str = ':'.join([_join(xaos) for xaos in data])
-            # set
-            flam3h_prm_utils.private_prm_set(node, f3h_tabs.PREFS.PVT_PRM_DATA_PRM_XAOS_PREV, data_to_prm)
+            data_to_prm: str = ':'.join([_join([str(x) for x in xaos]) for xaos in data])
+            xaos_prev: list[list[float]] = [[float(x) for x in xaos] for xaos in data]
+            
+        # set
+        flam3h_prm_utils.private_prm_set(node, f3h_tabs.PREFS.PVT_PRM_DATA_PRM_XAOS_PREV, data_to_prm)
+        # and keep the numeric matrix at hand, paired with the string it has been set from.
+        node.setCachedUserData(f3h_cachedUserData.xaos_prev, (data_to_prm, xaos_prev))
+        
+        
+    @staticmethod
+    def auto_set_xaos_data_set_notes(node: hou.SopNode, xaos: TA_STR_ListUnflattened, div_xaos: str, div_weight: str) -> None:
+        """Set all the iterator's xaos notes parameters from the xaos weights already rounded into strings.</br>
+        This is the only place where the xaos weights are formatted back into the xaos notes strings.</br></br>
+        
+        The parsed values of each note are stored inside the node cachedUserData keyed by the note string itself,</br>
+        so out_flame_utils.out_xaos_collect(...) will not need to parse them back as long as they are not modified by the user.
+
+        Args:
+            node(hou.SopNode): The FLAM3H™ node
+            xaos(TA_STR_ListUnflattened): The xaos weights of each iterator already rounded into strings: out_flame_utils.out_util_round_floats(...)
+            div_xaos(str): The xaos note prefix. From: auto_set_xaos_div_str(...)
+            div_weight(str): The xaos weights separator. From: auto_set_xaos_div_str(...)
+
+        Returns:
+            (None):
+        """
+        _join: Callable[[Iterable[str]], str] = div_weight.join
+        notes: list[str] = [div_xaos + _join(x) for x in xaos]
+        prm_xaos_name: str = flam3h_iterator_prm_names().xaos
+        for mp_idx in range(1, len(notes) + 1):
+            prm = node.parm(f"{prm_xaos_name}_{mp_idx}")
+            prm.lock(False)
+            prm.deleteAllKeyframes() # This parameter can not be animated
+        for mp_idx, note in enumerate(notes): node.parm(f"{prm_xaos_name}_{mp_idx + 1}").set(note)
+        
+        xaos_notes: dict[str, tuple[float, ...]] = {}
+        _out_xaos_note_parse: Callable[[str], tuple[float, ...] | None] = out_flame_utils.out_xaos_note_parse
+        for note in notes:
+            parsed: tuple[float, ...] | None = _out_xaos_note_parse(note)
+            if parsed is not None:
+                xaos_notes[note] = parsed
+        node.setCachedUserData(f3h_cachedUserData.xaos_notes, xaos_notes)
             
+
             
     @staticmethod
     def flam3h_on_load_opacity_zero(node: hou.SopNode, gpu: bool, f3h_all: bool = False) -> None:
@@ -7923,16 +8247,43 @@ class flam3h_iterator_utils
         # Only if a valid preset has been loaded from a disk file ( not clipboard )
         if xml and xml_isFile and xml == xml_history and inisvalidfile and inisvalidpreset and not clipboard:
             
-            # Build the apo data
             preset_id: int = int(node.parm(f3h_tabs.IN.PRM_PRESETS).eval())
-            apo_data: in_flame_iter_data = in_flame_iter_data(node, xml, preset_id)
-            if apo_data.isvalidtree:
+            old_data: str | None = node.userData(f3h_userData.XML_LAST)
+            
+            # Cheap change detection first.
+            # If the "XML_last_loaded" user data is the same as the last time it has been checked against this flame file,
+            # and either the flame file did not change at all (mtime, size) or the loaded flame preset bytes did not change (digest),
+            # there is nothing to update and the flame preset does not need to be loaded and compared.
+            index: _xml_index = _xml_index.xmlfile_index(xml)
+            old_digest: bytes | None = blake2b(old_data.encode(), digest_size=16).digest() if old_data is not None else None
+            check: tuple | None = node.cachedUserData(f3h_cachedUserData.in_xml_last_check)
+            if old_digest is not None and check is not None and check[:3] == (xml, preset_id, old_digest):
+                
+                if check[3] == index.stat:
+                    return
+                
+                flame_digest: bytes | None = index.flame_digest(preset_id)
+                if flame_digest is not None and flame_digest == check[4]:
+                    node.setCachedUserData(f3h_cachedUserData.in_xml_last_check, (xml, preset_id, old_digest, index.stat, flame_digest))
+                    return
+            
+            # Build the apo data
+            in_data: in_flame = in_flame(node, xml, preset_id)
+            if in_data.isvalidtree:
                 
-                old_data: str | None = node.userData(f3h_userData.XML_LAST)
-                now_data: str = lxmlET.tostring(apo_data.flame[preset_id], encoding="unicode")
+                assert in_data.flame is not None
+                now_data: str = lxmlET.tostring(in_data.flame[preset_id], encoding="unicode")
                 now_data_isvalid = _xml_tree(now_data).isvalidtree
+                if now_data_isvalid and old_data is not None:
+                    # From here on the "XML_last_loaded" user data will match the flame preset on disk (it is either the same or it is being updated below),
+                    # remember what it has been checked against so next time it can be skipped if nothing changed.
+                    node.setCachedUserData(f3h_cachedUserData.in_xml_last_check, (xml, preset_id, blake2b(now_data.encode(), digest_size=16).digest(), index.stat, index.flame_digest(preset_id)))
+                    
                 if old_data is not None and old_data != now_data and now_data_isvalid:
                     
+                    # The flame preset changed on disk, now build the full apo data for the flame stats.
+                    apo_data: in_flame_iter_data = in_flame_iter_data(node, xml, preset_id)
+                    
                     if menu_update:
                         # Update IN presets menus.
                         # This just in case the changes are made to the currently loaded Flame preset name so those menus are up to date too.
@@ -9308,7 +9659,7 @@ class flam3h_iterator_utils
                 flam3h_general_utils.set_status_msg(_MSG, 'WARN')
                 flam3h_general_utils.flash_message(node, f"This iterator is Marked")
             else:
-                self.pastePRM_T_from_list(node, from_FLAM3H_NODE, flam3h_iterator().allT, flam3h_varsPRM().varsPRM, idx, idx_from)
+                self.pastePRM_T_from_list(node, from_FLAM3H_NODE, flam3h_iterator().allT, VARS_FLAM3H_PRM_FROM_IDX, idx, idx_from)
                 self.paste_from_list(node, from_FLAM3H_NODE, flam3h_iterator().allMisc, idx, idx_from)
                 self.paste_set_note(node, from_FLAM3H_NODE, 0, f3h_copyPaste.DEFAULT_SEC_ALL, idx, idx_from)
 
@@ -9587,9 +9938,9 @@ class flam3h_iterator_utils
                 flam3h_general_utils.flash_message(node, f"Select a different FLAM3H™ node's FF")
             else:
                 f3h_iter_FF: flam3h_iterator_FF = flam3h_iterator_FF()
-                self.pastePRM_T_from_list(node, from_FLAM3H_NODE, f3h_iter_FF.sec_prevarsT_FF, flam3h_varsPRM_FF(f3h_ffPrmPrx.PRM_PP).varsPRM_FF(), "", "")
-                self.pastePRM_T_from_list(node, from_FLAM3H_NODE, f3h_iter_FF.sec_varsT_FF, flam3h_varsPRM_FF(f3h_ffPrmPrx.PRM).varsPRM_FF(), "", "")
-                self.pastePRM_T_from_list(node, from_FLAM3H_NODE, f3h_iter_FF.sec_postvarsT_FF, flam3h_varsPRM_FF(f3h_ffPrmPrx.PRM_PP).varsPRM_FF(), "", "")
+                self.pastePRM_T_from_list(node, from_FLAM3H_NODE, f3h_iter_FF.sec_prevarsT_FF, VARS_FLAM3H_PRM_FF_PP_FROM_IDX, "", "")
+                self.pastePRM_T_from_list(node, from_FLAM3H_NODE, f3h_iter_FF.sec_varsT_FF, VARS_FLAM3H_PRM_FF_FROM_IDX, "", "")
+                self.pastePRM_T_from_list(node, from_FLAM3H_NODE, f3h_iter_FF.sec_postvarsT_FF, VARS_FLAM3H_PRM_FF_PP_FROM_IDX, "", "")
                 self.paste_from_list(node, from_FLAM3H_NODE, f3h_iter_FF.allMisc_FF, "", "")
                 self.paste_set_note(node, from_FLAM3H_NODE, 1, f3h_copyPaste.DEFAULT_SEC_ALL, "", "")
 
@@ -9778,7 +10129,7 @@ class flam3h_iterator_utils
             flam3h_prm_utils.set(node, prm_selmem, paste_sel)
 
             f3h_iter: flam3h_iterator = flam3h_iterator()
-            varsPRM = flam3h_varsPRM().varsPRM
+            varsPRM = VARS_FLAM3H_PRM_FROM_IDX
             
             match paste_sel:
                 
@@ -10043,19 +10394,19 @@ class flam3h_iterator_utils
                     
                 # set FF PRE VARS
                 case 2:
-                    self.pastePRM_T_from_list(node, from_FLAM3H_NODE, f3h_iter_FF.sec_prevarsT_FF, flam3h_varsPRM_FF(f3h_ffPrmPrx.PRM_PP).varsPRM_FF(), "", "")
+                    self.pastePRM_T_from_list(node, from_FLAM3H_NODE, f3h_iter_FF.sec_prevarsT_FF, VARS_FLAM3H_PRM_FF_PP_FROM_IDX, "", "")
                     self.paste_from_list(node, from_FLAM3H_NODE, f3h_iter_FF.sec_prevarsW_FF, "", "")
                     self.paste_set_note(node, from_FLAM3H_NODE, 2, f3h_copyPaste.DEFAULT_SEC_PREVARS, "", "")
                     
                 # set FF VARS
                 case 3:
-                    self.pastePRM_T_from_list(node, from_FLAM3H_NODE, f3h_iter_FF.sec_varsT_FF, flam3h_varsPRM_FF(f3h_ffPrmPrx.PRM).varsPRM_FF(), "", "")
+                    self.pastePRM_T_from_list(node, from_FLAM3H_NODE, f3h_iter_FF.sec_varsT_FF, VARS_FLAM3H_PRM_FF_FROM_IDX, "", "")
                     self.paste_from_list(node, from_FLAM3H_NODE, f3h_iter_FF.sec_varsW_FF, "", "")
                     self.paste_set_note(node, from_FLAM3H_NODE, 2, f3h_copyPaste.DEFAULT_SEC_VARS, "", "")
                     
                 # set FF POST VARS
                 case 4:
-                    self.pastePRM_T_from_list(node, from_FLAM3H_NODE, f3h_iter_FF.sec_postvarsT_FF, flam3h_varsPRM_FF(f3h_ffPrmPrx.PRM_PP).varsPRM_FF(), "", "")
+                    self.pastePRM_T_from_list(node, from_FLAM3H_NODE, f3h_iter_FF.sec_postvarsT_FF, VARS_FLAM3H_PRM_FF_PP_FROM_IDX, "", "")
                     self.paste_from_list(node, from_FLAM3H_NODE, f3h_iter_FF.sec_postvarsW_FF, "", "")
                     self.paste_set_note(node, from_FLAM3H_NODE, 2, f3h_copyPaste.DEFAULT_SEC_POSTVARS, "", "")
                     
@@ -10109,15 +10460,8 @@ class flam3h_iterator_utils
         # update parameterUserData: flam3h_xaos_iterators_prev
         self.auto_set_xaos_data_set_XAOS_PREV(node, xaos_new)
         
-        prm_xaos: str = flam3h_iterator_prm_names().xaos
-        for idx in range(f3d.iter_count):
-            # Build
-            value: str = div_xaos
-            if xaos_new[idx]:
-                value += div_weight.join(xaos_new[idx].split())
-            # Set
-            prm = node.parm(f"{prm_xaos}_{idx + 1}")
-            flam3h_prm_utils.set(node, prm, value)
+        # Set
+        self.auto_set_xaos_data_set_notes(node, [xaos_new[idx].split() for idx in range(f3d.iter_count)], div_xaos, div_weight)
 
         # Get preference xaos mode and print to Houdini's status bar
         if f3d.xm:
@@ -10817,7 +11161,7 @@ class flam3h_iterator_utils
         
         mpmem: list[int] = []
         mpmem_hou_get: list[int] = []
-        xaos_str_hou_get: list[list[str]] = []
+        xaos_hou_get: list[list[float]] = []
         
         # get mpmem parms now
         mp_mem_name: str = n.main_mpmem
@@ -10833,17 +11177,16 @@ class flam3h_iterator_utils
         
         # collect all xaos
         val: TA_XAOS_Collect = out_flame_utils.out_xaos_collect(node, iter_count, n.xaos)
-        # fill missing weights if any
-        fill_all_xaos: list[list[float]] = [np_pad(item, (0, iter_count - len(item)), 'constant', constant_values = 1).tolist() for item in val]
-        # convert all xaos into array of strings
-        xaos_str: list[list[str]] = [[str(item) for item in xaos] for xaos in fill_all_xaos]
+        # fill missing weights if any.
+        # This is the numeric xaos matrix, it will be formatted back into strings only when setting the xaos notes.
+        xaos: list[list[float]] = out_flame_utils.out_xaos_fill(val, iter_count)
         
         # get xaos from CachedUserData
-        __xaos_str_hou_get: list[list[str]] | None = self.auto_set_xaos_data_get_XAOS_PREV(node)
-        if __xaos_str_hou_get is None:
-            xaos_str_hou_get = xaos_str
+        __xaos_hou_get: list[list[float]] | None = self.auto_set_xaos_data_get_XAOS_PREV(node)
+        if __xaos_hou_get is None:
+            xaos_hou_get = xaos
         else:
-            xaos_str_hou_get = __xaos_str_hou_get
+            xaos_hou_get = __xaos_hou_get
             
         # Check if our current set of iterators is different from the history
         s_current: set = set(mpmem)
@@ -10867,7 +11210,7 @@ class flam3h_iterator_utils
 
                 # update the xaos history
                 # update parameterUserData: flam3h_xaos_iterators_prev
-                self.auto_set_xaos_data_set_XAOS_PREV(node, xaos_str)
+                self.auto_set_xaos_data_set_XAOS_PREV(node, xaos)
                 
                 # Update copy/paste iterator's index if there is a need to do so
                 try:
@@ -10955,7 +11298,7 @@ class flam3h_iterator_utils
 
                 # update the xaos history
                 # update parameterUserData: flam3h_xaos_iterators_prev
-                self.auto_set_xaos_data_set_XAOS_PREV(node, xaos_str)
+                self.auto_set_xaos_data_set_XAOS_PREV(node, xaos)
                 
                 # Update copy/paste iterator's index if there is a need to do so
                 try:
@@ -11009,14 +11352,14 @@ class flam3h_iterator_utils
                 # Clear menu cache
                 self.destroy_cachedUserData(node, f3h_cachedUserData.iter_sel)
 
-                xaos_str = xaos_str_hou_get
-                del xaos_str[idx_del_inbetween]
-                for x in xaos_str:
+                xaos = xaos_hou_get
+                del xaos[idx_del_inbetween]
+                for x in xaos:
                     del x[idx_del_inbetween]
 
                 # update the xaos history
                 # update parameterUserData: flam3h_xaos_iterators_prev
-                self.auto_set_xaos_data_set_XAOS_PREV(node, xaos_str)
+                self.auto_set_xaos_data_set_XAOS_PREV(node, xaos)
                 
                 # Update copy/paste iterator's index if there is a need to do so
                 try:
@@ -11086,16 +11429,16 @@ class flam3h_iterator_utils
                 # Clear menu cache
                 self.destroy_cachedUserData(node, f3h_cachedUserData.iter_sel)
 
-                for xidx, x in enumerate(xaos_str):
+                for xidx, x in enumerate(xaos):
                     if xidx != idx_add_inbetween:
-                        x.insert(idx_add_inbetween, '1.0')
+                        x.insert(idx_add_inbetween, 1.0)
                         # x already had the new iterator weight added to the end of it
                         # so lets remove the last element as it is not longer needed
                         del x[-1]
                         
                 # update the xaos history
                 # update parameterUserData: flam3h_xaos_iterators_prev
-                self.auto_set_xaos_data_set_XAOS_PREV(node, xaos_str)
+                self.auto_set_xaos_data_set_XAOS_PREV(node, xaos)
                 
                 # Update copy/paste iterator's index if there is a need to do so
                 try:
@@ -11141,19 +11484,12 @@ class flam3h_iterator_utils
         # Otherwise just update the xaos history
         else:
             # update parameterUserData: flam3h_xaos_iterators_prev
-            self.auto_set_xaos_data_set_XAOS_PREV(node, xaos_str)
+            self.auto_set_xaos_data_set_XAOS_PREV(node, xaos)
             # becasue we are re-ordering mpmem values later on
             self.destroy_userData(node, f"{f3h_userData.PRX}_{f3h_userData.MARKED_ITER_LABEL}")
         
         # set all multi parms xaos strings parms
-        _join: Callable[[Iterable[str]], str] = div_weight.join
-        xaos_str_round_floats: list[str] = [_join(x) for x in out_flame_utils.out_util_round_floats(xaos_str)]
-        prm_xaos_name: str = n.xaos
-        for mp_idx in range(1, iter_count + 1):
-            prm = node.parm(f"{prm_xaos_name}_{mp_idx}")
-            prm.lock(False)
-            prm.deleteAllKeyframes() # This parameter can not be animated
-        for mp_idx, xaos in enumerate(xaos_str_round_floats): node.parm(f"{prm_xaos_name}_{mp_idx + 1}").set(div_xaos + xaos)
+        self.auto_set_xaos_data_set_notes(node, out_flame_utils.out_util_round_floats(xaos), div_xaos, div_weight)
         
         # reset iterator's mpmem and mpmem_x parms
         mp_mem_x_name: str = n.main_mpmem_x
@@ -11465,7 +11801,11 @@ class flam3h_palette_utils
 * isJSON_F3H(node: hou.SopNode, filepath: str | bool,  msg: bool = True, parm_path_name: str = f3h_tabs.CP.PRM_PATH) -> tuple[bool, bool]:
 * isJSON_F3H_on_preset_load(node: hou.SopNode, filepath: str | bool,  msg: bool = True, parm_path_name: str = f3h_tabs.CP.PRM_PATH) -> tuple[bool, bool]:
 * rgb_to_hex(rgb: tuple[float, ...]) -> str:
+* rgb_to_hex_array(rgb: NDArray[np_float64]) -> str:
+* ramp_lookup_array(ramp: hou.Ramp, positions: list[int | float]) -> NDArray[np_float64]:
 * hex_to_rgb(hex: str) -> tuple[int, ...]:
+* hex_to_rgb_array(hex: str) -> NDArray[np_float32] | None:
+* hsv_adjust_rgb_array(rgb: NDArray[np_float64], hsv_vals: tuple[float, float, float]) -> NDArray[np_float64]:
 * find_nearest_idx(array: list | tuple, value: int | float) -> int | float:
 * json_to_flam3h_palette_plus_MSG(node: hou.SopNode, HEXs: list, mode: bool = False, palette_plus_msg: bool = False) -> None:
 * json_to_flam3h_palette_plus_preset_MSG(node: hou.SopNode, _MSG: str) -> None:
@@ -11494,7 +11834,7 @@ class flam3h_palette_utils
 * json_to_flam3h_ramp(self, use_kwargs: bool = True) -> None:
 * palette_cp(self, palette_plus_msg: bool = False) -> None:
 * palette_cp_to_tmp(self) -> None:
-* palette_hsv(self) -> None:
+* palette_hsv(self, rmpsrc: hou.Ramp | None = None) -> None:
 * palette_lock(self) -> None:
 * reset_CP_LOCK_MSG(self) -> None:
 * reset_CP_TMP(self) -> None:
@@ -11638,6 +11978,11 @@ class flam3h_palette_utils
         Returns:
             (str | bool): The preset name, or False if not.
         """
+        if isinstance(filepath, str):
+            index: _json_index = _json_index.jsonfile_index(filepath)
+            if index.name:
+                return index.name[0]
+            
         try:
             with open(filepath, 'r') as r:
                 preset_name: str = list(json.load(r).keys())[0]
@@ -11673,8 +12018,13 @@ class flam3h_palette_utils
                 
                 # If we made it this far, mean we loaded a valid JSON file,
                 # lets now check if the preset is actually a F3H Palette preset.
-                with open(filepath, 'r') as r:
-                    data: dict = json.load(r)[preset]
+                assert isinstance(preset, str)
+                data_ra: dict | None = _json_index.jsonfile_index(str(filepath)).preset_load(0, preset)
+                if data_ra is not None:
+                    data: dict = data_ra
+                else:
+                    with open(filepath, 'r') as r:
+                        data: dict = json.load(r)[preset]
                     
                 # This is the moment of the truth ;)
                 try:
@@ -11747,6 +12097,48 @@ class flam3h_palette_utils
         """
         hex: str = ''.join(['{:02X}'.format(int(round(x))) for x in [flam3h_general_utils.clamp(255*x) for x in rgb]])
         return hex
+    
+    
+    @staticmethod
+    def rgb_to_hex_array(rgb: NDArray[np_float64]) -> str:
+        """Convert many RGB color values into HEX color values all at once.</br>
+        This give the same result as running: flam3h_palette_utils.rgb_to_hex(...) on each color and joining them together</br>
+        but clamp, round and quantize the whole array in one go.</br>
+
+        Args:
+            rgb(NDArray[np_float64]): A (N, 3) array of RGB color values normalized to 0-1.
+
+        Returns:
+            (str): The HEX color values packed into one string (6 characters each, one after the other)
+        """
+        # NaN to 0.0 and infinites to the range limits, same as flam3h_general_utils.clamp(...) does.
+        # np_rint(...) round half to even, same as the python round(...)
+        rgb_255: NDArray[np_float64] = np_clip(np_nan_to_num(255 * rgb, nan=0.0, posinf=255.0, neginf=0.0), 0, 255)
+        return np_rint(rgb_255).astype(np_uint8).tobytes().hex().upper()
+    
+    
+    @staticmethod
+    def ramp_lookup_array(ramp: hou.Ramp, positions: list[int | float]) -> NDArray[np_float64]:
+        """Sample a color ramp at many positions all at once.</br>
+        When all the ramp keys use the linear basis and are in ascending order, the samples are linearly interpolated in one go,</br>
+        otherwise it fallback on the Houdini ramp lookup for each position so any other basis is sampled exactly as Houdini does.</br>
+
+        Args:
+            ramp(hou.Ramp): The color ramp to sample.
+            positions(list[int | float]): The ramp positions to sample, from 0 to 1.
+
+        Returns:
+            (NDArray[np_float64]): A (N, 3) array of the sampled RGB color values.
+        """
+        keys: tuple[float, ...] = ramp.keys()
+        linear: hou.EnumValue = hou.rampBasis.Linear # pyright: ignore[reportAttributeAccessIssue]  # Houdini HOM API
+        if len(keys) > 1 and all(b == linear for b in ramp.basis()) and all(k0 < k1 for k0, k1 in zip(keys, keys[1:])):
+            values: NDArray[np_float64] = np_array(ramp.values(), dtype=np_float64).reshape(-1, 3)
+            pos: NDArray[np_float64] = np_array(positions, dtype=np_float64)
+            return np_array([np_interp(pos, keys, values[:, c]) for c in range(3)], dtype=np_float64).T
+        
+        _lookup: Callable[[float], tuple[float, ...]] = ramp.lookup
+        return np_array([_lookup(p) for p in positions], dtype=np_float64).reshape(-1, 3)
 
 
     @staticmethod
@@ -11763,26 +12155,103 @@ class flam3h_palette_utils
     
     
     @staticmethod
-    def find_nearest_idx(array: list | tuple, value: int | float) -> int | float:
-        """Given a value, find the closest value in the array that is bigger than the value passed in.</br>
-        
+    def hex_to_rgb_array(hex: str) -> NDArray[np_float32] | None:
+        """Convert many HEX color values packed into one string (6 characters each, one after the other) all at once.</br>
+        This is used to load big palettes (256+ colors) without converting one HEX color value at a time.</br>
+
         Args:
-            array(list, tuple): the array of values to search into.
-            value:(int, float): The value to use to find its closest and bigger value into the array.
+            hex(str): the HEX color values to convert.
 
         Returns:
-            (int | float): the closest value in the array that is bigger than the value passed in. Can be either an integer or a float
+            (NDArray[np_float32] | None): A (N, 3) array of RGB color values normalized to 0-1 or None if the string is not made of HEX color values only.
         """   
-        idx: int = int(np_searchsorted(array, value, side="left"))
-        return array[idx]
+        if len(hex) % 6:
+            return None
+        
+        try:
+            data: bytes = bytes.fromhex(hex)
+            
+        except ValueError:
+            return None
+        
+        # bytes.fromhex(...) skip any whitespace in between the HEX values, so make sure there was none.
+        if len(data) * 2 != len(hex):
+            return None
+        
+        return np_frombuffer(data, dtype=np_uint8).reshape(-1, 3).astype(np_float32) / 255.0
     
     
     @staticmethod
-    def json_to_flam3h_palette_plus_MSG(node: hou.SopNode, HEXs: list, mode: bool = False, palette_plus_msg: bool = False) -> None:
-        """Given a value, find the closest value in the array that is bigger than the value passed in.</br></br>
-       
-        I am using a manual f-string build here.</br>
-        Probably dynamically build a list would be better but if i'll need to add more strings i'll look into it.
+    def hsv_adjust_rgb_array(rgb: NDArray[np_float64], hsv_vals: tuple[float, float, float]) -> NDArray[np_float64]:
+        """Apply the HSV values to many RGB color values all at once.</br>
+        This is the same as running: colorsys.hsv_to_rgb(h + hsv_vals[0], s * hsv_vals[1], v * hsv_vals[2]) on each colorsys.rgb_to_hsv(r, g, b) color</br>
+        but done on the whole array in one go so to keep the HSV parameters interactive on big palettes (256+ colors).</br>
+
+        Args:
+            rgb(NDArray[np_float64]): A (N, 3) array of RGB color values.
+            hsv_vals(tuple[float, float, float]): The HSV values to apply: hue shift, saturation multiplier and value multiplier.
+
+        Returns:
+            (NDArray[np_float64]): A (N, 3) array of the HSV corrected RGB color values.
+        """   
+        r, g, b = rgb[:, 0], rgb[:, 1], rgb[:, 2]
+        
+        # RGB to HSV ( colorsys.rgb_to_hsv )
+        maxc: NDArray[np_float64] = rgb.max(axis=1)
+        minc: NDArray[np_float64] = rgb.min(axis=1)
+        rangec: NDArray[np_float64] = maxc - minc
+        gray: NDArray = minc == maxc
+        with np_errstate(divide='ignore', invalid='ignore'):
+            s: NDArray[np_float64] = np_where(gray, 0.0, rangec / maxc)
+            rc: NDArray[np_float64] = (maxc - r) / rangec
+            gc: NDArray[np_float64] = (maxc - g) / rangec
+            bc: NDArray[np_float64] = (maxc - b) / rangec
+            h: NDArray[np_float64] = np_where(r == maxc, bc - gc, np_where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc))
+            h = np_where(gray, 0.0, (h / 6.0) % 1.0)
+        
+        # Apply the HSV values
+        h = h + hsv_vals[0]
+        s = s * hsv_vals[1]
+        v: NDArray[np_float64] = maxc * hsv_vals[2]
+        
+        # HSV to RGB ( colorsys.hsv_to_rgb )
+        h6: NDArray[np_float64] = h * 6.0
+        i: NDArray[np_float64] = np_trunc(h6)
+        f: NDArray[np_float64] = h6 - i
+        p: NDArray[np_float64] = v * (1.0 - s)
+        q: NDArray[np_float64] = v * (1.0 - s * f)
+        t: NDArray[np_float64] = v * (1.0 - s * (1.0 - f))
+        i = i % 6
+        sextant: list[NDArray] = [i == 0, i == 1, i == 2, i == 3, i == 4, i == 5]
+        out: NDArray[np_float64] = np_array([np_select(sextant, [v, q, p, p, t, v]), 
+                                             np_select(sextant, [t, v, v, q, p, p]), 
+                                             np_select(sextant, [p, p, t, v, v, q])]).T
+        # No saturation, no hue
+        out[s == 0.0] = v[s == 0.0, None]
+        return out
+    
+    
+    @staticmethod
+    def find_nearest_idx(array: list | tuple, value: int | float) -> int | float:
+        """Given a value, find the closest value in the array that is bigger than the value passed in.</br>
+        
+        Args:
+            array(list, tuple): the array of values to search into.
+            value:(int, float): The value to use to find its closest and bigger value into the array.
+
+        Returns:
+            (int | float): the closest value in the array that is bigger than the value passed in. Can be either an integer or a float
+        """   
+        idx: int = int(np_searchsorted(array, value, side="left"))
+        return array[idx]
+    
+    
+    @staticmethod
+    def json_to_flam3h_palette_plus_MSG(node: hou.SopNode, HEXs: list, mode: bool = False, palette_plus_msg: bool = False) -> None:
+        """Given a value, find the closest value in the array that is bigger than the value passed in.</br></br>
+       
+        I am using a manual f-string build here.</br>
+        Probably dynamically build a list would be better but if i'll need to add more strings i'll look into it.
         
         Args:
             node(hou.SopNode): The current FLAM3H™ node.
@@ -12065,9 +12534,14 @@ class flam3h_palette_utils
             _is_valid_preset: bool = self.node.parm(f3h_tabs.CP.PVT_PRM_ISVALID_PRESET).eval()
             
             if json_is_file and _is_valid_file and _is_valid_preset:
-                    
-                with open(json_file_path) as f:
-                    menuitems: list = list(json.load(f).keys())
+                
+                # Only the palette presets names are needed so get them from the palette lib file index.
+                index: _json_index = _json_index.jsonfile_index(json_file_path)
+                if index.isvalid:
+                    menuitems: list = list(index.name)
+                else:
+                    with open(json_file_path) as f:
+                        menuitems: list = list(json.load(f).keys())
                 
                 enum: bool = node.parm(f3h_tabs.PREFS.PRM_ENUMERATE_MENU).eval()
                 _menu_func: Callable[[hou.SopNode, TA_Menu, int, str], None] = (self.menu_cp_presets_loop_enum if enum else self.menu_cp_presets_loop)
@@ -12166,9 +12640,14 @@ class flam3h_palette_utils
             _is_valid_preset: bool = node.parm(f3h_tabs.CP.PVT_PRM_ISVALID_PRESET).eval()
             
             if self.isJSON_F3H(node, json_file_path, False)[-1] and _is_valid_file and not _is_valid_preset:
-                    
-                with open(json_file_path) as f:
-                    menuitems: list = list(json.load(f).keys())
+                
+                # Only the palette presets names are needed so get them from the palette lib file index.
+                index: _json_index = _json_index.jsonfile_index(json_file_path)
+                if index.isvalid:
+                    menuitems: list = list(index.name)
+                else:
+                    with open(json_file_path) as f:
+                        menuitems: list = list(json.load(f).keys())
                     
                 enum: bool = node.parm(f3h_tabs.PREFS.PRM_ENUMERATE_MENU).eval()
                 _menu_func: Callable[[hou.SopNode, TA_Menu, int, str], None] = (self.menu_cp_presets_empty_loop_enum if enum else self.menu_cp_presets_empty_loop)
@@ -12265,14 +12744,13 @@ class flam3h_palette_utils
             
         keys_count: str = out_flame_utils(self.kwargs).out_palette_keys_count(self.palette_plus_do, len(palette.keys()), 1, False)
         POSs: list[int | float] = list(it_islice(it_count(0, 1.0/(int(keys_count)-1)), int(keys_count)))
-        _rgb_to_hex: Callable[[tuple[float, ...]], str] = self.rgb_to_hex
-        HEXs: list[str] = [_rgb_to_hex(palette.lookup(p)) for p in POSs]
+        HEXs: str = self.rgb_to_hex_array(self.ramp_lookup_array(palette, POSs))
         
         if hsv_vals_prm[0] == hsv_vals_prm[1] == hsv_vals_prm[2] == 1:
-            json_dict: dict[str, dict[str, str]] = { presetname: {f3h_tabs.CP.DEFAULT_JSON_KEY_NAME_HEX: ''.join(HEXs),  } }
+            json_dict: dict[str, dict[str, str]] = { presetname: {f3h_tabs.CP.DEFAULT_JSON_KEY_NAME_HEX: HEXs,  } }
         else:
             hsv_vals: str = ' '.join([str(x) for x in hsv_vals_prm])
-            json_dict: dict[str, dict[str, str]] = { presetname: {f3h_tabs.CP.DEFAULT_JSON_KEY_NAME_HEX: ''.join(HEXs), f3h_tabs.CP.DEFAULT_JSON_KEY_NAME_HSV: hsv_vals} }
+            json_dict: dict[str, dict[str, str]] = { presetname: {f3h_tabs.CP.DEFAULT_JSON_KEY_NAME_HEX: HEXs, f3h_tabs.CP.DEFAULT_JSON_KEY_NAME_HSV: hsv_vals} }
             
         # OUTPUT DATA
         return json_dict, json.dumps(json_dict, indent=4)
@@ -12376,15 +12854,19 @@ class flam3h_palette_utils
                             # if the file exist and is a valid JSON file
                             if json_file and f3h_json_file:
                                 
-                                with open(out_path_checked,'r') as r:
-                                    prevdata = json.load(r)
+                                # Append the new palette preset in place if possible,
+                                # otherwise (the palette preset name already exist, ...) rewrite the entire file.
+                                if not _json_index.jsonfile_index(out_path_checked).preset_append(json_dict):
                                     
-                                newdata: dict = json_dict
-                                prevdata.update(newdata)
-                                data: dict | str = json.dumps(prevdata, indent = 4)
-                                assert isinstance(data, str)
-                                with open(out_path_checked, 'w') as w:
-                                    w.write(data)
+                                    with open(out_path_checked,'r') as r:
+                                        prevdata = json.load(r)
+                                        
+                                    newdata: dict = json_dict
+                                    prevdata.update(newdata)
+                                    data: dict | str = json.dumps(prevdata, indent = 4)
+                                    assert isinstance(data, str)
+                                    with open(out_path_checked, 'w') as w:
+                                        w.write(data)
                                     
                             # Otherwise mean it is either not a F3H json file, empty or not exist,
                             # just create one with the current ramp in it
@@ -12405,12 +12887,15 @@ class flam3h_palette_utils
                         if json_file and f3h_json_file:
                             
                             # Set some parameters
-                            with open(out_path_checked) as f:
-                                data: dict | str = json.load(f)
+                            index: _json_index = _json_index.jsonfile_index(out_path_checked)
+                            if index.isvalid:
+                                presets_count: int = len(index.name)
+                            else:
+                                with open(out_path_checked) as f:
+                                    presets_count: int = len(json.load(f).keys())
                             
                             # Set all CP preset menus parameter index
-                            assert isinstance(data, dict)
-                            for prm in (node.parm(f3h_tabs.CP.PRM_PALETTE_PRESETS), node.parm(f3h_tabs.CP.PRM_PALETTE_PRESETS_OFF), node.parm(f3h_tabs.CP.PRM_SYS_PALETTE_PRESETS), node.parm(f3h_tabs.CP.PRM_SYS_PALETTE_PRESETS_OFF)): flam3h_prm_utils.set(node, prm, str(len(data.keys())-1))
+                            for prm in (node.parm(f3h_tabs.CP.PRM_PALETTE_PRESETS), node.parm(f3h_tabs.CP.PRM_PALETTE_PRESETS_OFF), node.parm(f3h_tabs.CP.PRM_SYS_PALETTE_PRESETS), node.parm(f3h_tabs.CP.PRM_SYS_PALETTE_PRESETS_OFF)): flam3h_prm_utils.set(node, prm, str(presets_count-1))
                             # Clearup the Palette name if any were given
                             prm = node.parm(f3h_tabs.CP.PRM_PALETTE_PRESET_NAME)
                             flam3h_prm_utils.set(node, prm, '')
@@ -12420,7 +12905,6 @@ class flam3h_palette_utils
                             flam3h_prm_utils.private_prm_set(node, f3h_tabs.CP.PVT_PRM_ISVALID_PRESET, 1)
                             # Make sure to update the tmp ramp with the just saved one
                             self.palette_cp_to_tmp()
-                            del data
                             
                             # Set the file path to the corrected one
                             flam3h_prm_utils.set(node, f3h_tabs.CP.PRM_PATH, out_path_checked)
@@ -12573,9 +13057,15 @@ class flam3h_palette_utils
                 # get current preset name and preset_id(index)
                 preset, preset_id = self.json_to_flam3h_get_preset_name_and_id(node)
                 
+                # Load only the selected palette preset if possible
+                data_ra: dict | None = _json_index.jsonfile_index(filepath).preset_load(preset_id, preset)
+                if data_ra is not None:
+                    data: dict = data_ra
+                else:
+                    with open(filepath, 'r') as r:
+                        data: dict = json.load(r)[preset]
+                
                 # 'hsv_check' is for backward compatibility
-                with open(filepath, 'r') as r:
-                    data: dict = json.load(r)[preset]
                     
                 try:
                     hsv_vals: list[float] = [float(x) for x in str(data[f3h_tabs.CP.DEFAULT_JSON_KEY_NAME_HSV]).split(' ')]
@@ -12584,21 +13074,29 @@ class flam3h_palette_utils
                     hsv_vals: list[float] = []
                     hsv_check: bool = False
                 
-                # Get usable color values
-                HEXs: list[str] = [hex for hex in wrap(data[f3h_tabs.CP.DEFAULT_JSON_KEY_NAME_HEX], 6)]
-                
-                try:
-                    _hex_to_rgb: Callable[[str], tuple] = self.hex_to_rgb
-                    RGBs: list[list[int]] = [list(map(abs, _hex_to_rgb(hex))) for hex in HEXs]
-                    
-                except ValueError as e:
-                    F3H_Exception.F3H_traceback_print_infos(e, extra_info='Invalid hex values in the loaded palette.')
-                    rgb_from_XML_PALETTE: list[list[float]] = []
+                # Get usable color values, all at once if possible.
+                RGBs_bulk: NDArray[np_float32] | None = self.hex_to_rgb_array(data[f3h_tabs.CP.DEFAULT_JSON_KEY_NAME_HEX])
+                if RGBs_bulk is not None:
+                    rgb_from_XML_PALETTE: list[list[float]] = RGBs_bulk.tolist()
+                    # The palette message only need the number of colors, one HEX color value every 6 characters.
+                    hex_data: str = data[f3h_tabs.CP.DEFAULT_JSON_KEY_NAME_HEX]
+                    HEXs: list[str] = [hex_data[i:i + 6] for i in range(0, len(hex_data), 6)]
                     
                 else:
-                    # Convert to NumPy array and normalize
-                    RGBs_array: NDArray[np_float32] = np_array(RGBs[:len(HEXs)], dtype=np_float32)
-                    rgb_from_XML_PALETTE: list[list[float]] = (RGBs_array / 255.0).tolist()
+                    HEXs: list[str] = [hex for hex in wrap(data[f3h_tabs.CP.DEFAULT_JSON_KEY_NAME_HEX], 6)]
+                    
+                    try:
+                        _hex_to_rgb: Callable[[str], tuple] = self.hex_to_rgb
+                        RGBs: list[list[int]] = [list(map(abs, _hex_to_rgb(hex))) for hex in HEXs]
+                        
+                    except ValueError as e:
+                        F3H_Exception.F3H_traceback_print_infos(e, extra_info='Invalid hex values in the loaded palette.')
+                        rgb_from_XML_PALETTE: list[list[float]] = []
+                        
+                    else:
+                        # Convert to NumPy array and normalize
+                        RGBs_array: NDArray[np_float32] = np_array(RGBs[:len(HEXs)], dtype=np_float32)
+                        rgb_from_XML_PALETTE: list[list[float]] = (RGBs_array / 255.0).tolist()
                 
                 del data
                 
@@ -12810,21 +13308,29 @@ class flam3h_palette_utils
                     else:
                         hsv_check: bool = True
                     
-                    # Get usable color values
-                    HEXs: list[str] = [hex for hex in wrap(data[f3h_tabs.CP.DEFAULT_JSON_KEY_NAME_HEX], 6)]
-                    
-                    try:
-                        _hex_to_rgb: Callable[[str], tuple] = self.hex_to_rgb
-                        RGBs: list[list[int]] = [list(map(abs, _hex_to_rgb(hex))) for hex in HEXs]
-                        
-                    except ValueError as e:
-                        F3H_Exception.F3H_traceback_print_infos(e, extra_info='Invalid hex values in the loaded palette from Clipboard.')
-                        rgb_from_XML_PALETTE: list[list[float]] = []
+                    # Get usable color values, all at once if possible.
+                    RGBs_bulk: NDArray[np_float32] | None = self.hex_to_rgb_array(data[f3h_tabs.CP.DEFAULT_JSON_KEY_NAME_HEX])
+                    if RGBs_bulk is not None:
+                        rgb_from_XML_PALETTE: list[list[float]] = RGBs_bulk.tolist()
+                        # The palette message only need the number of colors, one HEX color value every 6 characters.
+                        hex_data: str = data[f3h_tabs.CP.DEFAULT_JSON_KEY_NAME_HEX]
+                        HEXs: list[str] = [hex_data[i:i + 6] for i in range(0, len(hex_data), 6)]
                         
                     else:
-                        # Convert to NumPy array and normalize
-                        RGBs_array: NDArray[np_float32] = np_array(RGBs[:len(HEXs)], dtype=np_float32)
-                        rgb_from_XML_PALETTE: list[list[float]] = (RGBs_array / 255.0).tolist()
+                        HEXs: list[str] = [hex for hex in wrap(data[f3h_tabs.CP.DEFAULT_JSON_KEY_NAME_HEX], 6)]
+                        
+                        try:
+                            _hex_to_rgb: Callable[[str], tuple] = self.hex_to_rgb
+                            RGBs: list[list[int]] = [list(map(abs, _hex_to_rgb(hex))) for hex in HEXs]
+                            
+                        except ValueError as e:
+                            F3H_Exception.F3H_traceback_print_infos(e, extra_info='Invalid hex values in the loaded palette from Clipboard.')
+                            rgb_from_XML_PALETTE: list[list[float]] = []
+                            
+                        else:
+                            # Convert to NumPy array and normalize
+                            RGBs_array: NDArray[np_float32] = np_array(RGBs[:len(HEXs)], dtype=np_float32)
+                            rgb_from_XML_PALETTE: list[list[float]] = (RGBs_array / 255.0).tolist()
                         
                     del data
                     
@@ -12943,17 +13449,9 @@ class flam3h_palette_utils
         """    
         node: hou.SopNode = self.node
         rmpsrc: hou.Ramp = node.parm(f3h_tabs.CP.PRM_RAMP_SRC_NAME).evalAsRamp()
-        rmphsv = node.parm(f3h_tabs.CP.PRM_RAMP_HSV_NAME)
-        # Clear and re-set
-        # self.delete_ramp_all_keyframes(rmphsv) # this get a little expensive to run every time and since the *.flame format do not support animations we can avoid it.
-        rmphsv.lock(False)
-        rmphsv.set(rmpsrc)
-        # Apply HSV if any
-        #
-        # self.palette_hsv is running also inside self.palette_lock()
-        # becasue it used to get call also from other Houdini parameter's callback scripts.
-        # Need to come back and make changes...
-        self.palette_hsv()
+        # Clear and re-set and apply HSV if any.
+        # The source ramp is passed in so it is evaluated only once.
+        self.palette_hsv(rmpsrc)
 
         if node.parm(f3h_tabs.CP.PVT_PRM_ISVALID_FILE).eval():
             rmptmp: hou.Ramp = node.parm(f3h_tabs.CP.PRM_RAMP_TMP_NAME).evalAsRamp()
@@ -12985,35 +13483,34 @@ class flam3h_palette_utils
         rmptmp.set(rmpsrc)
 
 
-    def palette_hsv(self) -> None:
+    def palette_hsv(self, rmpsrc: hou.Ramp | None = None) -> None:
         """Apply a HSV to the paltte colors/keys.</br>
         
         Args:
             (self):
+            rmpsrc(hou.Ramp | None): Default to: None</br>The source palette ramp if already evaluated, otherwise it will be evaluated from the source palette parameter.
             
         Returns:
             (None):
         """  
         node: hou.SopNode = self.node
-        rmpsrc: hou.Ramp = node.parm(f3h_tabs.CP.PRM_RAMP_SRC_NAME).evalAsRamp()
+        ramp_src: hou.Ramp = rmpsrc if rmpsrc is not None else node.parm(f3h_tabs.CP.PRM_RAMP_SRC_NAME).evalAsRamp()
         rmphsv = node.parm(f3h_tabs.CP.PRM_RAMP_HSV_NAME)
         hsvprm_vals: tuple[float, float, float] = node.parmTuple(f3h_tabs.CP.PRM_RAMP_HSV_VAL_NAME).eval()
         if hsvprm_vals[0] != 1 or hsvprm_vals[1] != 1 or hsvprm_vals[2] != 1:
             
-            # Apply color correction
-            _hsv_to_rgb: Callable[[float, float, float], tuple[float, float, float]] = colorsys.hsv_to_rgb
-            _rgb_to_hsv: Callable[[float, float, float], tuple[float, float, float]] = colorsys.rgb_to_hsv
-            _RGBs: list[tuple[float, float, float]] = [_hsv_to_rgb(h + hsvprm_vals[0], s * hsvprm_vals[1], v * hsvprm_vals[2]) for h, s, v in (_rgb_to_hsv(r, g, b) for r, g, b in rmpsrc.values())]
+            # Apply color correction (all color keys at once)
+            _RGBs: list[list[float]] = flam3h_palette_utils.hsv_adjust_rgb_array(np_array(ramp_src.values(), dtype=np_float64).reshape(-1, 3), hsvprm_vals).tolist()
             
             # Set the ramp
             rmphsv.lock(False)
-            rmphsv.set(hou.Ramp(rmpsrc.basis(), rmpsrc.keys(), _RGBs))
+            rmphsv.set(hou.Ramp(ramp_src.basis(), ramp_src.keys(), _RGBs))
             
         else:
             # Clear and re-set
             # self.delete_ramp_all_keyframes(rmphsv) # this get a little expensive to run every time and since the *.flame format do not support animations we can avoid it.
             rmphsv.lock(False)
-            rmphsv.set(rmpsrc)
+            rmphsv.set(ramp_src)
 
 
     def palette_lock(self) -> None:
@@ -13026,11 +13523,8 @@ class flam3h_palette_utils
         Returns:
             (None):
         """    
+        # self.palette_hsv is running inside self.palette_cp() already so no need to run it twice.
         self.palette_cp()
-        # self.palette_hsv is running also inside self.palette_cp()
-        # becasue it get call also from other Houdini parameter's callback scripts.
-        # Need to come back and make changes...
-        self.palette_hsv()
 
 
     def reset_CP_LOCK_MSG(self) -> None:
@@ -13243,407 +13737,656 @@ class flam3h_palette_utils
         else: self.reset_CP(3)
 
 
-# FLAM3H™ ABOUT start here
-##########################################
-##########################################
-##########################################
-##########################################
-##########################################
-##########################################
-##########################################
-##########################################
-
-
-class flam3h_about_utils():
+class _library_cache:
     """
-class flam3h_about_utils
+class _library_cache
 
-@STATICMETHOD
-* flam3h_about_format_items(items: list[str] | tuple[str, ...], exclude: list[str] | tuple[str, ...] = (), npl: int = 5, capitalize: bool = False) -> tuple[str, int]:
-* flam3h_about_show_info_panel(node: hou.SopNode) -> None:
+@STATICMETHODS
+* library_key(libfile: str, stat: tuple[int, int]) -> tuple[str, int, int]:
+* index_nbytes(name: tuple[str | list[Never], ...], offsets: tuple[tuple[int, int], ...] | None) -> int:
 
 @METHODS
-* flam3h_about_msg(self) -> None:
-* flam3h_about_plugins_msg(self) -> None:
-* flam3h_about_web_msg(self) -> None:
-* flam3h_about_web_homepage(self) -> None:
-* flam3h_about_web_github(self) -> None:
-* flam3h_about_web_instagram(self) -> None:
-* flam3h_about_web_youtube(self) -> None:
-* flam3h_about_web_flam3_paper(self) -> None:
-* flam3h_about_web_flam3_github(self) -> None:
-* flam3h_web_run(self, key: str) -> None:
+* get(self, libfile: str, stat: tuple[int, int]) -> Any | None:
+* put(self, libfile: str, stat: tuple[int, int], index: Any, nbytes: int) -> None:
+* discard(self, libfile: str) -> None:
+* clear(self) -> None:
+* __len__(self) -> int:
+
     """
     
-    __slots__ = ("_kwargs", "_node")
+    __slots__ = ("_max_entries", "_max_nbytes", "_nbytes", "_entries", "_lock")
     
-    def __init__(self, kwargs: dict[str, Any]) -> None:
+    def __init__(self, max_entries: int, max_nbytes: int) -> None:
+        """Process-wide cache of the presets library files indexes (flame files and palette lib files).</br>
+        The indexes hold the presets names, their byte offsets and the validity flags of a library file,</br>
+        and they are shared by all the FLAM3H™ nodes in the Houdini session so a library file is parsed only once</br>
+        no matter how many FLAM3H™ nodes are pointing to it.</br></br>
+        
+        Each index is keyed by the library file (realpath, mtime, size) so the same file reached from different paths is indexed only once</br>
+        and a modified file is never served its old index. The least recently used indexes are evicted</br>
+        once there are more than: max_entries or their estimated memory footprint is bigger than: max_nbytes</br>
+
+        Args:
+            (self):
+            max_entries(int): The maximum number of library files indexes to keep.
+            max_nbytes(int): The maximum estimated memory footprint, in bytes, of all the library files indexes kept.
         """
+        self._max_entries: int = max_entries
+        self._max_nbytes: int = max_nbytes
+        self._nbytes: int = 0
+        self._entries: OrderedDict[tuple[str, int, int], tuple[Any, int]] = OrderedDict()
+        self._lock: Lock = Lock()
+        
+        
+    @staticmethod
+    def library_key(libfile: str, stat: tuple[int, int]) -> tuple[str, int, int]:
+        """Build the cache key of a library file.</br>
+
         Args:
-            kwargs(dict): this FLAM3H™ node houdini kwargs.
-            
+            libfile(str): The library file full path.
+            stat(tuple[int, int]): The library file (mtime in nanoseconds, size in bytes): _xml_index.xmlfile_stat(...)
+
         Returns:
-            (None):
-        """ 
-        self._kwargs: dict[str, Any] = kwargs
-        self._node: hou.SopNode = kwargs['node']
+            (tuple[str, int, int]): The library file (realpath, mtime, size)
+        """
+        return os.path.realpath(libfile), stat[0], stat[1]
+    
+    
+    @staticmethod
+    def index_nbytes(name: tuple[str | list[Never], ...], offsets: tuple[tuple[int, int], ...] | None) -> int:
+        """Estimate the memory footprint of a library file index, used by the cache memory cap.</br>
+        Only the presets names and their byte offsets are accounted for as they are what grow with the library file size.</br>
 
+        Args:
+            name(tuple[str | list[Never], ...]): The library file presets names.
+            offsets(tuple[tuple[int, int], ...] | None): The library file presets (start, end) byte offsets.
+
+        Returns:
+            (int): The estimated memory footprint in bytes.
+        """
+        nbytes: int = sys_getsizeof(name) + sum(map(sys_getsizeof, name))
+        if offsets:
+            # Each offset is a tuple of two integers.
+            nbytes += sys_getsizeof(offsets) + len(offsets) * (sys_getsizeof(offsets[0]) + 2 * sys_getsizeof(offsets[0][1]))
+        return nbytes
+    
+    
+    def get(self, libfile: str, stat: tuple[int, int]) -> Any | None:
+        """Get the cached index of a library file and mark it as the most recently used.</br>
 
-    @staticmethod
-    def flam3h_about_format_items(items: list[str] | tuple[str, ...], exclude: list[str] | tuple[str, ...] = (), npl: int = 5, capitalize: bool = False) -> tuple[str, int]:
-        """Format a list of items into a string with n items per line.</br>
         Args:
-            items(list[str] | tuple[str, ...]): The list or tuple of items to format.
-            exclude(list[str] | tuple[str, ...]): Default to: <b>Empty Tuple</b><br>The list of items to exclude.
-            npl(int): Default to: <b>5</b><br>The number of items per line.
-            capitalize(bool): Default to: <b>False</b><br>Whether to capitalize each item.
+            (self):
+            libfile(str): The library file full path.
+            stat(tuple[int, int]): The library file (mtime in nanoseconds, size in bytes): _xml_index.xmlfile_stat(...)
 
         Returns:
-            (str): The formatted string.<br><b>(int)</b>:<br>The number of items in the formatted string.
-        """ 
-        
-        items_sorted: list[str] = [item for item in sorted(items) if item not in exclude]
-        if capitalize:
-            _str_capitalize: Callable[[str], str] = str.capitalize
-            items_sorted = [_str_capitalize(item) for item in items_sorted]
-        items_sorted_grp: list[list[str]] = [items_sorted[i:i + npl] for i in range(0, len(items_sorted), npl)]
-        _join: Callable[[Iterable[str]], str] = ', '.join
-        _len: Callable[[list[Any]], int] = len
-        items_txt: str = ''.join( [_join(grp) + "." if idx == (_len(items_sorted_grp)-1) else _join(grp) + ",\n" for idx, grp in enumerate(items_sorted_grp)] )
-        return items_txt, _len(items_sorted)
-        
+            (Any | None): The library file index or None if not cached for this version of the file.
+        """
+        key: tuple[str, int, int] = self.library_key(libfile, stat)
+        with self._lock:
+            entry: tuple[Any, int] | None = self._entries.get(key)
+            if entry is None:
+                return None
+            
+            self._entries.move_to_end(key)
+            return entry[0]
         
-    @staticmethod
-    def flam3h_about_show_info_panel(node: hou.SopNode) -> None:
-        """Display default pyside about message panel.</br>
         
+    def put(self, libfile: str, stat: tuple[int, int], index: Any, nbytes: int) -> None:
+        """Cache the index of a library file as the most recently used.</br>
+        Any index of an older version of the same library file is dropped,</br>
+        then the least recently used indexes are evicted until the cache is back within its limits.</br>
+        The most recently cached index is always kept, even if it is bigger than the memory cap on its own.</br>
+
         Args:
-            node(hou.SopNode): This FLAM3H™ node. In this case will be set to: kwargs['node'] directly in the parameter callback script string.
-            
+            (self):
+            libfile(str): The library file full path.
+            stat(tuple[int, int]): The library file (mtime in nanoseconds, size in bytes) the index has been built from.
+            index(Any): The library file index.
+            nbytes(int): The library file index estimated memory footprint in bytes.
+
         Returns:
             (None):
-        """ 
-        
-        pyside_utils.pyside_panels_safe_launch(
-                                                pyside_master.F3H_msg_panel, 
-                                                launch_app_name=pyside_master_app_names.PS_CLS_ABOUT,
-                                                f3h_node=node,  
-                                                links=True,
-                                                auto_close_ms=4000, 
-                                                fade_in_ms=400, 
-                                                fade_out_ms=400
-                                               )
-        
-        
+        """
+        key: tuple[str, int, int] = self.library_key(libfile, stat)
+        entries: OrderedDict[tuple[str, int, int], tuple[Any, int]] = self._entries
+        with self._lock:
+            for k in [k for k in entries if k[0] == key[0]]:
+                self._nbytes -= entries.pop(k)[1]
+                
+            entries[key] = (index, nbytes)
+            self._nbytes += nbytes
+            
+            while len(entries) > 1 and (len(entries) > self._max_entries or self._nbytes > self._max_nbytes):
+                self._nbytes -= entries.popitem(last=False)[1][1]
+                
+                
+    def discard(self, libfile: str) -> None:
+        """Drop the cached index of a library file, whatever version of the file it has been built from.</br>
 
-    # CLASS: PROPERTIES
-    ##########################################
-    ##########################################
-        
-    @property
-    def kwargs(self) ->  dict[str, Any]:
-        return self._kwargs
-    
-    @property
-    def node(self) -> hou.SopNode:
-        return self._node
+        Args:
+            (self):
+            libfile(str): The library file full path.
 
+        Returns:
+            (None):
+        """
+        realpath: str = os.path.realpath(libfile)
+        entries: OrderedDict[tuple[str, int, int], tuple[Any, int]] = self._entries
+        with self._lock:
+            for k in [k for k in entries if k[0] == realpath]:
+                self._nbytes -= entries.pop(k)[1]
+                
+                
+    def clear(self) -> None:
+        """Drop all the cached library files indexes.</br>
 
-    def flam3h_about_msg(self) -> None:
-        """Build and set the FLAM3H™ about message.</br>
-        
         Args:
             (self):
-            
+
         Returns:
             (None):
-        """    
-        
-        nl: str = "\n"
-        nnl: str = "\n\n"
+        """
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            
+            
+    def __len__(self) -> int:
+        """
+        Args:
+            (self):
+
+        Returns:
+            (int): The number of library files indexes currently cached.
+        """
+        return len(self._entries)
+
+
+class _json_index:
+    """
+class _json_index
+
+@STATICMETHODS
+* jsonfile_index(jsonfile: str) -> _json_index:
+* jsonfile_index_path(jsonfile: str) -> str:
+* index_dir_prune(index_dir: str) -> None:
+
+@METHODS
+* preset_idx(self, preset: str) -> int | None:
+* preset_load(self, idx: int, preset: str | None = None) -> dict | None:
+* preset_append(self, json_dict: dict) -> bool:
+* __index_build(self, data: bytes) -> None:
+* __index_read(self) -> bool:
+* __index_write(self) -> None:
+
+    """
+    
+    __slots__ = ("_jsonfile", "_stat", "_isvalid", "_name", "_name_idx", "_offsets", "_append_at")
+    
+    # The palette files indexed in this Houdini session, shared by all the FLAM3H™ nodes.
+    CACHE: Final[_library_cache] = _library_cache(64, 32 * 1024 * 1024)
+    # The index sidecar files folder name, inside the Houdini user preferences directory.
+    INDEX_DIR_NAME: Final = 'FLAM3H_palette_index'
+    # The index sidecar files folder is pruned once per Houdini session, the first time a sidecar file is saved.
+    INDEX_DIR_PRUNED: bool = False
+    # The palette lib file layout written by FLAM3H™: json.dumps(..., indent=4), the only one palette presets are appended to in place.
+    LAYOUT_HEAD: Final = b'{\n    "'
+    LAYOUT_TAIL: Final = b'\n}'
+    # The JSON tokens the index is built from, scanning the palette lib file bytes without decoding the palette presets values.
+    RE_WS: Final[re_Pattern[bytes]] = re_compile(rb'[ \t\n\r]*')
+    RE_STRING: Final[re_Pattern[bytes]] = re_compile(rb'"(?:[^"\\\x00-\x1f]|\\.)*"')
+    RE_NESTING: Final[re_Pattern[bytes]] = re_compile(rb'["{}\[\]]')
+    RE_SCALAR: Final[re_Pattern[bytes]] = re_compile(rb'[^,}\]\s]+')
+    
+    def __init__(self, jsonfile: str, stat: tuple[int, int] | None = None) -> None:
+        """Index of a palette lib file.</br>
+        It collect the palette presets names and their byte offsets inside the file so that a single palette preset</br>
+        can be loaded without loading the entire palette lib file and a new palette preset can be appended in place.</br></br>
         
-        # year = datetime.now().strftime("%Y")
+        The index is also saved into a sidecar file so it is built only once, even across Houdini sessions,</br>
+        while the palette lib file itself stay a regular *.json file.</br>
+        The sidecar files live inside the Houdini user preferences directory and not next to the palette lib files,</br>
+        so shared or read only palette lib directories are never written into. If a sidecar file can not be saved, the index is just rebuilt the next time.</br>
+        Sidecar files no longer matching their palette lib file (modified, moved or deleted) are removed.</br></br>
         
-        flam3h_author: str = f"AUTHOR: {__author__}"
+        Do not use this class directly but always go through: _json_index.jsonfile_index(...)</br>
+        so the index is built only once for each file (realpath, mtime, size).</br>
 
-        if __v__ > 1:
-            flam3h_code: str = f"CODE: opencl {__opencl__}, cvex {__vcc_compiler__}, python {__py_version__}"
-        elif __v__ == 1:
-            flam3h_code: str = f"CODE: cvex {__vcc_compiler__}, python {__py_version__}"
-        else:
-            flam3h_code: str = f"CODE: **opencl, **cvex, **python"
+        Args:
+            (self):
+            jsonfile(str): The palette lib file full path.
+            stat(tuple[int, int] | None): Default to: None</br>The palette lib file (mtime, size) this index is being built from.
+        """
+        self._jsonfile: str = jsonfile
+        self._stat: tuple[int, int] | None = stat
+        self._isvalid: bool = False
+        self._name: tuple[str, ...] = ()
+        self._name_idx: dict[str, int] = {}
+        self._offsets: tuple[tuple[int, int], ...] = ()
+        self._append_at: int = 0
+        
+        if stat is not None and not self.__index_read():
             
-        flam3h_houdini_version: str = f"VERSION: {__version__} - {__status__} :: ({__license__})"
-        Implementation_build: str = f"{flam3h_author}\n{flam3h_houdini_version}\n{flam3h_code}\n{__copyright__}"
+            try:
+                with open(jsonfile, 'rb') as f:
+                    data: bytes = f.read()
+                    
+            except OSError:
+                pass
+            
+            else:
+                self.__index_build(data)
+                if self._isvalid:
+                    self.__index_write()
         
-        code_references: str = f"""CODE REFERENCES
-Flam3, Apophysis, Fractorium :: ({__license__})"""
+        
+    @staticmethod
+    def jsonfile_index(jsonfile: str) -> _json_index:
+        """Return the cached index of a palette lib file or build a new one if the file changed since it was last indexed.</br>
 
-        special_thanks: str = """SPECIAL THANKS
-Praveen Brijwal"""
+        Args:
+            jsonfile(str): The palette lib file full path.
 
-        example_flames_header: str = 'EXAMPLE FLAMES'
-        items: tuple = ('C-91', 'GaborTimar', 'Golubaja', 'Lucy', 'Neonrauschen', 'Pillemaster', 'Plangkye', 'Seph', 'Tatasz', 'Triptychaos', 'TyrantWave', 'Zy0rg', 'b33rheart')
-        example_flames: str = self.flam3h_about_format_items(items)[0]
-
-        host_header: str = 'HOST'
-        h_version_str: str = '.'.join(str(x) for x in hou.applicationVersion())
-        license_type: str = str(hou.licenseCategory()).split(".")[-1]
-        houdini_v: str = f"SideFX Houdini {h_version_str}, {license_type}"
-        python_v: str = f"Python: {python_version()}"
-        ws: str = f"WS: {hou.machineName()}"
-        user: str = f"User: {hou.userName()}"
-        platform: str = f"Platform: {flam3h_general_utils.detect_os()}"
+        Returns:
+            (_json_index): The palette lib file index.
+        """
+        stat: tuple[int, int] | None = _xml_index.xmlfile_stat(jsonfile)
+        if stat is None:
+            _json_index.CACHE.discard(jsonfile)
+            return _json_index(jsonfile)
         
-        build: tuple[str, ...] = (Implementation_build, nnl,
-                                code_references, nnl,
-                                special_thanks, nnl,
-                                example_flames_header, nl,
-                                example_flames, nnl,
-                                host_header, nl,
-                                houdini_v, nl,
-                                python_v, nl,
-                                ws, nl,
-                                user, nl,
-                                platform
-                                )
+        index: _json_index | None = _json_index.CACHE.get(jsonfile, stat)
+        if index is not None:
+            return index
         
-        gpu_section_header: str = 'GPU DEVICES'
+        index = _json_index(jsonfile, stat)
+        _json_index.CACHE.put(jsonfile, stat, index, index.nbytes)
+        return index
+    
+    
+    @staticmethod
+    def jsonfile_index_path(jsonfile: str) -> str:
+        """Get the index sidecar file path of a palette lib file.</br>
+        It is inside the Houdini user preferences directory, named after the palette lib file realpath digest.</br>
+        Outside Houdini, the HOUDINI_USER_PREF_DIR environment variable is used if set, otherwise the user home directory.</br>
+
+        Args:
+            jsonfile(str): The palette lib file full path.
+
+        Returns:
+            (str): The index sidecar file full path.
+        """
+        digest: str = blake2b(os.path.realpath(jsonfile).encode('utf-8'), digest_size=16).hexdigest()
+        if __houdini__:
+            pref_dir: str = hou.homeHoudiniDirectory() # pyright: ignore[reportAttributeAccessIssue]  # Houdini HOM API
+        else:
+            pref_dir: str = os.environ.get('HOUDINI_USER_PREF_DIR') or os.path.expanduser('~')
+        return os.path.join(pref_dir, _json_index.INDEX_DIR_NAME, f"{digest}{f3h_tabs.CP.DEFAULT_INDEX_FILE_EXT}")
+    
+    
+    @staticmethod
+    def index_dir_prune(index_dir: str) -> None:
+        """Remove the index sidecar files whose palette lib file has been modified, moved or deleted since they have been saved,</br>
+        as well as the ones that can not be read. Those would never be used again.</br>
+
+        Args:
+            index_dir(str): The index sidecar files folder full path.
+
+        Returns:
+            (None):
+        """
+        try:
+            entries: list[os.DirEntry] = list(os.scandir(index_dir))
+        except OSError:
+            return
         
-        h_version: int = flam3h_general_utils.houdini_version(2)
-        if h_version == 210:
-            # GPU section is only available in Houdini 21.0 and above since it relies on the "gpumem" hscript command that was added in this version.
-            
-            gpu_devices_gpumem: list[str] = hou.hscript('gpumem -l')
-            if 'unknown' in gpu_devices_gpumem[-1].lower():
-                print(f"{self.node.name()}: Error while trying to get GPU devices info with the \"gpumem\" hscript command.\nThis command should be available in Houdini 21.0 and above.")
-                pass 
-            else:
-                gpu_devices_str: str = '\n'.join([x[:-1] for x in gpu_devices_gpumem if x])
-                
-                build += (  nnl, 
-                            gpu_section_header, nl, 
-                            gpu_devices_str
-                            )
-         
-        elif h_version >= 220:
-            # Houdini 22.0 added OpenCL devices queries directly to their HOM python API, so we can use it to get the GPU devices info.
-            
-            gpu_devices = cast(
-                tuple[hou.OpenCLDevice, ...],
-                hou.opencl.devices(hou.openCLDeviceType.GPU) # pyright: ignore[reportCallIssue, reportAttributeAccessIssue]  # Houdini HOM API
-            )
+        for entry in entries:
+            if not entry.name.endswith(f3h_tabs.CP.DEFAULT_INDEX_FILE_EXT) or not entry.is_file():
+                continue
             
-            if gpu_devices:
-                gpu_devices_build: list = []
-                for gpu in gpu_devices:
-                    gpu_devices_build.append(f"{gpu.label()} - Driver: {gpu.driverVersion()}")
+            try:
+                with open(entry.path, 'r') as r:
+                    data: dict = json.load(r)
+                stale: bool = _xml_index.xmlfile_stat(data['path']) != tuple(data['stat'])
                 
-                gpu_devices_str: str = gpu_devices_build[0] if len(gpu_devices_build) == 1 else '\n'.join(gpu_devices_build)
+            except (OSError, UnicodeDecodeError, json.decoder.JSONDecodeError, KeyError, TypeError, ValueError):
+                stale = True
                 
-                build += (  nnl, 
-                            gpu_section_header, nl, 
-                            gpu_devices_str
-                            )
-        
-        flam3h_prm_utils.set(self.node, f3h_tabs.ABOUT.MSG_PRM_F3H_ABOUT, ''.join(build))
+            if stale:
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
 
 
-    def flam3h_about_plugins_msg(self) -> None:
-        """Build and set the FLAM3H™ about plugins message.</br>
-        
+    # CLASS: PROPERTIES
+    ##########################################
+    ##########################################
+    
+    @property
+    def jsonfile(self) -> str:
+        return self._jsonfile
+    
+    @property
+    def stat(self) -> tuple[int, int] | None:
+        return self._stat
+    
+    @property
+    def isvalid(self) -> bool:
+        return self._isvalid
+    
+    @property
+    def name(self) -> tuple[str, ...]:
+        return self._name
+    
+    @property
+    def offsets(self) -> tuple[tuple[int, int], ...]:
+        return self._offsets
+    
+    @property
+    def nbytes(self) -> int:
+        # The name lookup dictionary is about the same size as the names themselves.
+        return 2 * _library_cache.index_nbytes(self._name, self._offsets)
+    
+    
+    def preset_idx(self, preset: str) -> int | None:
+        """Get the index of a palette preset from its name.</br>
+
         Args:
             (self):
-            
+            preset(str): The palette preset name.
+
         Returns:
-            (None):
-        """    
-        
-        vars_txt, num_items = self.flam3h_about_format_items(list(VARS_FLAM3_DICT_IDX.keys()), ("linear3d",), 5, True)
-        vars_txt_MSG: str = f"They are also available as PRE and POST.\n\nNumber of plugins/variations: {num_items}\n\n{vars_txt}"
-        
-        flam3h_prm_utils.set(self.node, f3h_tabs.ABOUT.MSG_PRM_F3H_PLUGINS, vars_txt_MSG)
-        
-        
-    def flam3h_about_web_msg(self) -> None:
-        """Build and set the FLAM3H™ about web heading's msgs.</br>
-        
+            (int | None): The palette preset index or None if not found.
+        """
+        return self._name_idx.get(preset)
+    
+    
+    def preset_load(self, idx: int, preset: str | None = None) -> dict | None:
+        """Random access to a single palette preset.</br>
+        Only the selected palette preset bytes are read from the palette lib file and parsed,</br>
+        so the load time depend on the selected palette preset size and not on the entire palette lib size.</br>
+
         Args:
             (self):
-            
+            idx(int): The palette preset index out of all the palette presets inside the palette lib file.
+            preset(str | None): Default to: None</br>If provided, the palette preset name expected at this index.
+
         Returns:
-            (None):
-        """    
+            (dict | None): The palette preset data or None if it could not be loaded this way.
+        """
+        if not self._isvalid or not 0 <= idx < len(self._offsets):
+            return None
         
-        node: hou.SopNode = self.node
+        if preset is not None and self._name[idx] != preset:
+            return None
         
-        # values
-        _FLAM3HWEB_MSG: str = 'FLAM3H™ web'
-        _FLAM3HGIT_MSG: str = 'FLAM3H™ github'
-        _FLAM3HINSTA_MSG: str = 'FLAM3H™ instagram'
-        _FLAM3HYOUTUBE_MSG: str = 'FLAM3H™ youtube tutorials'
-        _FLAM3PDF_MSG: str = 'The Fractal Flame Algorithm(FLAM3) pdf'
-        _FLAM3GIT_MSG: str = 'The Fractal Flame Algorithm(FLAM3) github'
-        _FRACTGIT_MSG: str = 'Fractorium github'
-        _FRACTWEB_MSG: str = 'Fractorium web'
+        # The offsets are only valid for the file version they have been collected from.
+        if _xml_index.xmlfile_stat(self._jsonfile) != self._stat:
+            return None
         
-        # {prm_name: value, ...}
-        parms_about_web: dict[str, str] = { f3h_tabs.ABOUT.MSG_PRM_F3H_WEB: _FLAM3HWEB_MSG,
-                                            f3h_tabs.ABOUT.MSG_PRM_F3H_GIT: _FLAM3HGIT_MSG,
-                                            f3h_tabs.ABOUT.MSG_PRM_F3H_INSTA: _FLAM3HINSTA_MSG,
-                                            f3h_tabs.ABOUT.MSG_PRM_F3H_YOUTUBE: _FLAM3HYOUTUBE_MSG,
-                                            f3h_tabs.ABOUT.MSG_PRM_FLAM3_PDF: _FLAM3PDF_MSG,
-                                            f3h_tabs.ABOUT.MSG_PRM_FLAM3_GIT: _FLAM3GIT_MSG,
-                                            f3h_tabs.ABOUT.MSG_PRM_FRACT_GITHUB: _FRACTGIT_MSG,
-                                            f3h_tabs.ABOUT.MSG_PRM_FRACT_WEB: _FRACTWEB_MSG
-                                            }
-        flam3h_prm_utils.setParms(node, parms_about_web)
+        start, end = self._offsets[idx]
+        try:
+            with open(self._jsonfile, 'rb') as f:
+                f.seek(start)
+                data: dict = json.loads(f.read(end - start).decode('utf-8'))
+                
+        except (OSError, UnicodeDecodeError, json.decoder.JSONDecodeError):
+            return None
         
-
-    def flam3h_about_web_homepage(self) -> None:
-        """Open a web browser to the FLAM3H™ homepage.</br>
+        return data if isinstance(data, dict) else None
+    
+    
+    def preset_append(self, json_dict: dict) -> bool:
+        """Append new palette presets at the end of the palette lib file without serializing again the existing palette presets.</br>
+        The palette lib file content will be the same as if it was rewritten with: json.dumps(..., indent=4)</br>
+        It is written into a temporary file and then moved in place so an interrupted write never leave a broken palette lib file behind.</br></br>
         
+        This only work with palette lib files laid out the way FLAM3H™ write them: json.dumps(..., indent=4)</br>
+        so the file must start with: LAYOUT_HEAD and end with: LAYOUT_TAIL right after the last palette preset.</br>
+        For any other layout (hand edited, written by other tools, ...), nothing is done and the entire file must be rewritten.</br>
+        The same if any of the palette presets names is already present in the palette lib file,</br>
+        as the existing palette preset need to be replaced in its place.</br>
+
         Args:
             (self):
-            
+            json_dict(dict): The palette presets data to append.
+
         Returns:
-            (None):
+            (bool): True if the palette presets have been appended. False if not and the entire file must be rewritten.
         """
-        page: str = "https://www.alexnardini.net/"
-        www_open(page)
+        if not self._isvalid or not self._name or not json_dict or any(preset in self._name_idx for preset in json_dict):
+            return False
         
-
-    def flam3h_about_web_github(self) -> None:
-        """Open a web browser to the FLAM3H™ github repository.</br>
+        if _xml_index.xmlfile_stat(self._jsonfile) != self._stat:
+            return False
         
-        Args:
-            (self):
-            
-        Returns:
-            (None):
-        """  
-        page: str = "https://github.com/alexnardini/FLAM3_for_SideFX_Houdini"
-        www_open(page)
+        # Strip the outer curly braces, what is left are the palette presets entries indented as they would be inside the palette lib file.
+        entries: str = json.dumps(json_dict, indent=4)[2:-2]
+        # Where the new palette presets will start, skipping: ',\n    "'
+        start: int = self._append_at + 6
         
-
-    def flam3h_about_web_instagram(self) -> None:
-        """Open a web browser to the FLAM3H™ instagram account.</br>
+        offsets: list[tuple[int, int]] = []
+        for preset, preset_data in json_dict.items():
+            value_start: int = start + len(json.dumps(preset)) + 2
+            value_end: int = value_start + len(json.dumps(preset_data, indent=4).replace('\n', '\n    '))
+            offsets.append((value_start, value_end))
+            # Skip: ',\n    '
+            start = value_end + 6
         
-        Args:
-            (self):
+        try:
+            with open(self._jsonfile, 'rb') as f:
+                data: bytes = f.read(self._append_at)
+                tail: bytes = f.read()
             
-        Returns:
-            (None):
-        """  
-        page: str = "https://www.instagram.com/alexnardini/"
-        www_open(page)
+            if not data.startswith(self.LAYOUT_HEAD) or tail != self.LAYOUT_TAIL:
+                return False
+            
+            # Replace the file the palette lib path resolve to, so a symbolic link is not turned into a regular file.
+            real_path: str = os.path.realpath(self._jsonfile)
+            fd, tmp_path = mkstemp(prefix='.f3h_', suffix='.tmp', dir=os.path.dirname(real_path))
+            try:
+                with os.fdopen(fd, 'wb') as w:
+                    w.write(data)
+                    w.write(f",\n{entries}\n}}".encode('utf-8'))
+                copymode(real_path, tmp_path)
+                os.replace(tmp_path, real_path)
+                
+            except OSError:
+                os.remove(tmp_path)
+                raise
+                
+        except OSError:
+            return False
+        
+        self._name += tuple(json_dict.keys())
+        self._name_idx = {preset: idx for idx, preset in enumerate(self._name)}
+        self._offsets += tuple(offsets)
+        self._append_at = offsets[-1][1]
+        self._stat = _xml_index.xmlfile_stat(self._jsonfile)
+        self.__index_write()
+        # Re-key the shared index to the new version of the palette lib file.
+        if self._stat is not None:
+            _json_index.CACHE.put(self._jsonfile, self._stat, self, self.nbytes)
+        return True
     
     
-    def flam3h_about_web_youtube(self) -> None:
-        """Open a web browser to the FLAM3H™ youtube video tutorials.</br>
+    def __index_build(self, data: bytes) -> None:
+        """Scan the palette lib file data and collect the palette presets names and their values byte offsets.</br>
+        The palette presets are collected the same way: json.load(...) does, including duplicate names</br>
+        for which the last value win while keeping the position of the first one.</br></br>
         
-        Args:
-            (self):
-            
-        Returns:
-            (None):
-        """  
-        page: str = "https://www.youtube.com/@alexnardiniITALY/videos"
-        www_open(page)
+        Only the palette presets names are decoded. The palette presets values are skipped over by matching</br>
+        their strings and brackets, so they are not validated here but only when loaded with: _json_index.preset_load(...)</br>
 
-
-    def flam3h_about_web_flam3_paper(self) -> None:
-        """Open a web browser to the original "the fractal flame algorithm" publication/paper pdf.</br>
-        
         Args:
             (self):
-            
+            data(bytes): The palette lib file data.
+
         Returns:
             (None):
-        """  
-        page: str = "https://flam3.com/flame_draves.pdf"
-        www_open(page)
-        
-
-    def flam3h_about_web_flam3_github(self) -> None:
-        """Open a web browser to the original FLAM3 github repository.</br>
+        """
+        # These always match, eventually an empty string.
+        _ws: Callable[[bytes, int], re_Match[bytes]] = self.RE_WS.match # pyright: ignore[reportAssignmentType]
+        _string: Callable[[bytes, int], re_Match[bytes] | None] = self.RE_STRING.match
         
-        Args:
-            (self):
+        def _value_end(start: int) -> int | None:
+            char: bytes = data[start:start + 1]
+            if char == b'"':
+                m: re_Match[bytes] | None = _string(data, start)
+                return m.end() if m is not None else None
             
-        Returns:
-            (None):
-        """  
-        page: str = "https://github.com/scottdraves/flam3"
-        www_open(page)
+            if char in (b'{', b'['):
+                depth: int = 0
+                idx: int = start
+                while True:
+                    m = self.RE_NESTING.search(data, idx)
+                    if m is None:
+                        return None
+                    
+                    char = m.group()
+                    if char == b'"':
+                        m = _string(data, m.start())
+                        if m is None:
+                            return None
+                    elif char in (b'{', b'['):
+                        depth += 1
+                    else:
+                        depth -= 1
+                        if not depth:
+                            return m.end()
+                    idx = m.end()
+            
+            m = self.RE_SCALAR.match(data, start)
+            return m.end() if m is not None else None
         
+        entries: dict[str, tuple[int, int]] = {}
+        append_at: int = 0
         
-    def flam3h_about_web_bitbucket(self) -> None:
-        """Open a web browser to the Fractorium Bitbucket repository.</br>
+        idx: int = _ws(data, 0).end()
+        if data[idx:idx + 1] != b'{':
+            return
         
-        Args:
-            (self):
+        idx = _ws(data, idx + 1).end()
+        if data[idx:idx + 1] == b'}':
+            idx += 1
             
-        Returns:
-            (None):
-        """  
-        page: str = "https://bitbucket.org/mfeemster/fractorium/src/master/"
-        www_open(page)
+        else:
+            while True:
+                key: re_Match[bytes] | None = _string(data, idx)
+                if key is None:
+                    return
+                
+                try:
+                    preset: str = json.loads(key.group())
+                except ValueError:
+                    return
+                
+                idx = _ws(data, key.end()).end()
+                if data[idx:idx + 1] != b':':
+                    return
+                
+                start: int = _ws(data, idx + 1).end()
+                end: int | None = _value_end(start)
+                if end is None:
+                    return
+                
+                entries[preset] = (start, end)
+                append_at = end
+                
+                idx = _ws(data, end).end()
+                if data[idx:idx + 1] == b',':
+                    idx = _ws(data, idx + 1).end()
+                elif data[idx:idx + 1] == b'}':
+                    idx += 1
+                    break
+                else:
+                    return
         
+        # Anything after the closing curly brace make it not a valid JSON file.
+        if _ws(data, idx).end() != len(data):
+            return
         
-    def flam3h_about_web_fractorium_github(self) -> None:
-        """Open a web browser to the Fractorium Bitbucket repository.</br>
+        self._isvalid = True
+        self._name = tuple(entries.keys())
+        self._name_idx = {preset: idx for idx, preset in enumerate(self._name)}
+        self._offsets = tuple(entries.values())
+        self._append_at = append_at
         
+        
+    def __index_read(self) -> bool:
+        """Load the index from its sidecar file if it has been saved from this very same palette lib file version (mtime, size).</br>
+        A sidecar file saved from a different palette lib file version is removed.</br>
+
         Args:
             (self):
-            
+
         Returns:
-            (None):
-        """  
-        page: str = "https://github.com/mfeemster/fractorium/tree/master"
-        www_open(page)
-        
+            (bool): True if the index has been loaded. False if not.
+        """
+        index_path: str = self.jsonfile_index_path(self._jsonfile)
+        try:
+            with open(index_path, 'r') as r:
+                data: dict = json.load(r)
+            
+            if tuple(data['stat']) != self._stat or data['path'] != os.path.realpath(self._jsonfile):
+                # Stale, remove it in case the palette lib file can not be indexed again to overwrite it.
+                os.remove(index_path)
+                return False
+            
+            name: tuple[str, ...] = tuple(str(preset) for preset in data['name'])
+            offsets: tuple[tuple[int, int], ...] = tuple((int(start), int(end)) for start, end in data['offsets'])
+            append_at: int = int(data['append_at'])
+            
+        except (OSError, UnicodeDecodeError, json.decoder.JSONDecodeError, KeyError, TypeError, ValueError):
+            return False
         
-    def flam3h_about_web_fractorium(self) -> None:
-        """Open a web browser to the Fractorium Bitbucket repository.</br>
+        if len(name) != len(offsets):
+            return False
         
-        Args:
-            (self):
-            
-        Returns:
-            (None):
-        """  
-        page: str = "http://fractorium.com/"
-        www_open(page)
+        self._isvalid = True
+        self._name = name
+        self._name_idx = {preset: idx for idx, preset in enumerate(name)}
+        self._offsets = offsets
+        self._append_at = append_at
+        return True
         
         
-    def flam3h_web_run(self, key: str) -> None:
-        """Select the appropriate web open definition to run.</br>
+    def __index_write(self) -> None:
+        """Save the index into its sidecar file.</br>
+        It is first written into a temporary file and then moved in place so concurrent Houdini sessions never read a partial sidecar file.</br>
+        The first time this run in a Houdini session, the stale sidecar files are pruned: _json_index.index_dir_prune(...)</br>
+        If it can not be saved (read only locations, ...) it will just be rebuilt the next time it is needed.</br>
 
         Args:
             (self):
-            key(str): The key value that define whitch web definition to run.
 
         Returns:
             (None):
         """
-        
-        web: dict[str, Callable[[], None]] = {'web': self.flam3h_about_web_homepage,
-                                              'git': self.flam3h_about_web_github,
-                                              'insta': self.flam3h_about_web_instagram,
-                                              'youtube': self.flam3h_about_web_youtube,
-                                              'paper': self.flam3h_about_web_flam3_paper,
-                                              'flam3git': self.flam3h_about_web_flam3_github,
-                                              'fractbitbucket': self.flam3h_about_web_bitbucket,
-                                              'fractgithub': self.flam3h_about_web_fractorium_github,
-                                              'fractweb': self.flam3h_about_web_fractorium,
-                                            }
-        
-        run: Callable[[], None] | None = web.get(key)
-        if run is not None: run()
+        data: dict = {'path': os.path.realpath(self._jsonfile), 'stat': self._stat, 'name': self._name, 'offsets': self._offsets, 'append_at': self._append_at}
+        index_path: str = self.jsonfile_index_path(self._jsonfile)
+        if not _json_index.INDEX_DIR_PRUNED:
+            _json_index.INDEX_DIR_PRUNED = True
+            self.index_dir_prune(os.path.dirname(index_path))
+        try:
+            os.makedirs(os.path.dirname(index_path), exist_ok=True)
+            fd, tmp_path = mkstemp(prefix='.f3h_', suffix='.tmp', dir=os.path.dirname(index_path))
+            try:
+                with os.fdopen(fd, 'w') as w:
+                    json.dump(data, w)
+                os.replace(tmp_path, index_path)
+                
+            except OSError:
+                os.remove(tmp_path)
+                raise
+                
+        except OSError:
+            pass
 
 
-# FLAM3H™ UI MESSAGES start here
+# FLAM3H™ ABOUT start here
 ##########################################
 ##########################################
 ##########################################
@@ -13654,13 +14397,28 @@ Praveen Brijwal"""
 ##########################################
 
 
-class flam3h_ui_msg_utils():
+class flam3h_about_utils():
     """
-class flam3h_ui_msg_utils
+class flam3h_about_utils
+
+@STATICMETHOD
+* flam3h_about_format_items(items: list[str] | tuple[str, ...], exclude: list[str] | tuple[str, ...] = (), npl: int = 5, capitalize: bool = False) -> tuple[str, int]:
+* flam3h_about_show_info_panel(node: hou.SopNode) -> None:
+* flam3h_about_plugins_msg_data() -> str:
+* flam3h_about_web_msg_data() -> dict[str, str]:
 
 @METHODS
-* ui_xaos_infos(self) -> None:
-* ui_OUT_presets_name_infos(self) -> None:
+* flam3h_about_msg_data(self) -> str:
+* flam3h_about_msg(self) -> None:
+* flam3h_about_plugins_msg(self) -> None:
+* flam3h_about_web_msg(self) -> None:
+* flam3h_about_web_homepage(self) -> None:
+* flam3h_about_web_github(self) -> None:
+* flam3h_about_web_instagram(self) -> None:
+* flam3h_about_web_youtube(self) -> None:
+* flam3h_about_web_flam3_paper(self) -> None:
+* flam3h_about_web_flam3_github(self) -> None:
+* flam3h_web_run(self, key: str) -> None:
     """
     
     __slots__ = ("_kwargs", "_node")
@@ -13677,6 +14435,102 @@ class flam3h_ui_msg_utils
         self._node: hou.SopNode = kwargs['node']
 
 
+    @staticmethod
+    def flam3h_about_format_items(items: list[str] | tuple[str, ...], exclude: list[str] | tuple[str, ...] = (), npl: int = 5, capitalize: bool = False) -> tuple[str, int]:
+        """Format a list of items into a string with n items per line.</br>
+        Args:
+            items(list[str] | tuple[str, ...]): The list or tuple of items to format.
+            exclude(list[str] | tuple[str, ...]): Default to: <b>Empty Tuple</b><br>The list of items to exclude.
+            npl(int): Default to: <b>5</b><br>The number of items per line.
+            capitalize(bool): Default to: <b>False</b><br>Whether to capitalize each item.
+
+        Returns:
+            (str): The formatted string.<br><b>(int)</b>:<br>The number of items in the formatted string.
+        """ 
+        
+        items_sorted: list[str] = [item for item in sorted(items) if item not in exclude]
+        if capitalize:
+            _str_capitalize: Callable[[str], str] = str.capitalize
+            items_sorted = [_str_capitalize(item) for item in items_sorted]
+        items_sorted_grp: list[list[str]] = [items_sorted[i:i + npl] for i in range(0, len(items_sorted), npl)]
+        _join: Callable[[Iterable[str]], str] = ', '.join
+        _len: Callable[[list[Any]], int] = len
+        items_txt: str = ''.join( [_join(grp) + "." if idx == (_len(items_sorted_grp)-1) else _join(grp) + ",\n" for idx, grp in enumerate(items_sorted_grp)] )
+        return items_txt, _len(items_sorted)
+        
+        
+    @staticmethod
+    def flam3h_about_show_info_panel(node: hou.SopNode) -> None:
+        """Display default pyside about message panel.</br>
+        
+        Args:
+            node(hou.SopNode): This FLAM3H™ node. In this case will be set to: kwargs['node'] directly in the parameter callback script string.
+            
+        Returns:
+            (None):
+        """ 
+        
+        pyside_utils.pyside_panels_safe_launch(
+                                                pyside_master.F3H_msg_panel, 
+                                                launch_app_name=pyside_master_app_names.PS_CLS_ABOUT,
+                                                f3h_node=node,  
+                                                links=True,
+                                                auto_close_ms=4000, 
+                                                fade_in_ms=400, 
+                                                fade_out_ms=400
+                                               )
+        
+        
+        
+    @staticmethod
+    def flam3h_about_plugins_msg_data() -> str:
+        """Build the FLAM3H™ about plugins message.</br>
+        
+        Args:
+            (None):
+            
+        Returns:
+            (str): The FLAM3H™ about plugins message.
+        """    
+        
+        vars_txt, num_items = flam3h_about_utils.flam3h_about_format_items(list(VARS_FLAM3_DICT_IDX.keys()), ("linear3d",), 5, True)
+        return f"They are also available as PRE and POST.\n\nNumber of plugins/variations: {num_items}\n\n{vars_txt}"
+        
+        
+    @staticmethod
+    def flam3h_about_web_msg_data() -> dict[str, str]:
+        """Build the FLAM3H™ about web heading's msgs.</br>
+        
+        Args:
+            (None):
+            
+        Returns:
+            (dict[str, str]): {prm_name: value, ...}
+        """    
+        
+        # values
+        _FLAM3HWEB_MSG: str = 'FLAM3H™ web'
+        _FLAM3HGIT_MSG: str = 'FLAM3H™ github'
+        _FLAM3HINSTA_MSG: str = 'FLAM3H™ instagram'
+        _FLAM3HYOUTUBE_MSG: str = 'FLAM3H™ youtube tutorials'
+        _FLAM3PDF_MSG: str = 'The Fractal Flame Algorithm(FLAM3) pdf'
+        _FLAM3GIT_MSG: str = 'The Fractal Flame Algorithm(FLAM3) github'
+        _FRACTGIT_MSG: str = 'Fractorium github'
+        _FRACTWEB_MSG: str = 'Fractorium web'
+        
+        # {prm_name: value, ...}
+        parms_about_web: dict[str, str] = { f3h_tabs.ABOUT.MSG_PRM_F3H_WEB: _FLAM3HWEB_MSG,
+                                            f3h_tabs.ABOUT.MSG_PRM_F3H_GIT: _FLAM3HGIT_MSG,
+                                            f3h_tabs.ABOUT.MSG_PRM_F3H_INSTA: _FLAM3HINSTA_MSG,
+                                            f3h_tabs.ABOUT.MSG_PRM_F3H_YOUTUBE: _FLAM3HYOUTUBE_MSG,
+                                            f3h_tabs.ABOUT.MSG_PRM_FLAM3_PDF: _FLAM3PDF_MSG,
+                                            f3h_tabs.ABOUT.MSG_PRM_FLAM3_GIT: _FLAM3GIT_MSG,
+                                            f3h_tabs.ABOUT.MSG_PRM_FRACT_GITHUB: _FRACTGIT_MSG,
+                                            f3h_tabs.ABOUT.MSG_PRM_FRACT_WEB: _FRACTWEB_MSG
+                                            }
+        return parms_about_web
+        
+        
     # CLASS: PROPERTIES
     ##########################################
     ##########################################
@@ -13688,348 +14542,674 @@ class flam3h_ui_msg_utils
     @property
     def node(self) -> hou.SopNode:
         return self._node
-        
 
-    def ui_xaos_infos(self) -> None:
-        """Open a message window with informations/tips about setting Xaos.</br>
 
+    def flam3h_about_msg_data(self) -> str:
+        """Build the FLAM3H™ about message.</br>
+        
         Args:
             (self):
             
         Returns:
-            (None):
-        """
+            (str): The FLAM3H™ about message.
+        """    
         
-        ALL_msg = """The default mode is \"xaos TO\".\nYou can change it to use \"xaos FROM\" mode instead in the preferences tab.
-
-Xaos is fully automatic,
-however below are some general rules on how it work:
-
-
-XAOS USAGE:
-
-To set Xaos for a flame with 4 iterators,
-use the " xaos: " keyword followed by each iterator weights values separated by a colon:
-\" xaos:1:2:3:4 \" ( xaos keyword can be uppercase too if you prefer. )
-
-If no set,
-FLAM3H™ will assume all Xaos values are 1.0, the equivalent of: \" xaos:1:1:1:1 \"
-
-If you set only iterator 1 and iterator 2,
-FLAM3H™ will always fill in the rest with a value of 1.0. \" xaos:0:0 \" will be interpreted as \" xaos:0:0:1:1 \"
-
-When turning iterators ON and OFF and removing or adding them,
-FLAM3H™ will internally remove and reformat Xaos values to account for missing iterators.
-
-When reordering iterators,
-FLAM3H™ will also reorder the Xaos values to match the new iterators order.
-
-In short, it is fully automatic.
-
-
-XAOS COMMAND OPTIONS:
-
-If you type a non-numeric character in any of the xaos's weights,
-FLAM3H™ will undo to what you had before.
-
-If you dnt use the “ xaos: ” keywork at the beginning,
-FLAM3H™ will undo to what you had before.
-
-If you type a number,
-the entire xaos string will be reset to all weights set to that number.
-
-If you type a negative number, it will be reset to a value of: 1"""
+        nl: str = "\n"
+        nnl: str = "\n\n"
         
-        node: hou.SopNode = self.node
-        # Check and Update this data
-        flam3h_iterator_utils(self.kwargs).update_xml_last_loaded()
-
-        if self.kwargs["ctrl"]:
-            if hou.isUIAvailable():
-                hou.ui.displayMessage(
-                    ALL_msg, # pyright: ignore[reportArgumentType]
-                    buttons=("Got it, thank you",), 
-                    severity = hou.severityType.Message, # pyright: ignore[reportAttributeAccessIssue] # Houdini HOM API
-                    default_choice = 0, 
-                    close_choice = -1, 
-                    help = None, 
-                    title = "FLAM3H™ Xaos usage infos", 
-                    details = None, 
-                    details_label = None, 
-                    details_expanded = False
-                )
+        # year = datetime.now().strftime("%Y")
+        
+        flam3h_author: str = f"AUTHOR: {__author__}"
 
+        if __v__ > 1:
+            flam3h_code: str = f"CODE: opencl {__opencl__}, cvex {__vcc_compiler__}, python {__py_version__}"
+        elif __v__ == 1:
+            flam3h_code: str = f"CODE: cvex {__vcc_compiler__}, python {__py_version__}"
         else:
-            # current node
-            autodiv = node.parm(f3h_tabs.PREFS.PVT_PRM_XAOS_AUTO_SPACE).eval()
-            if autodiv:
-                flam3h_prm_utils.private_prm_set(node, f3h_tabs.PREFS.PVT_PRM_XAOS_AUTO_SPACE, 0)
-                flam3h_iterator_utils(self.kwargs).auto_set_xaos()
-                
-                _MSG: str = f"{node.name()}: Xaos weights auto space: OFF"
-                flam3h_general_utils.set_status_msg(_MSG, 'MSG')
-                
-            else:
-                flam3h_prm_utils.private_prm_set(node, f3h_tabs.PREFS.PVT_PRM_XAOS_AUTO_SPACE, 1)
-                flam3h_iterator_utils(self.kwargs).auto_set_xaos()
-                
-                _MSG: str = f"{node.name()}: Xaos weights auto space: ON"
-                flam3h_general_utils.set_status_msg(_MSG, 'IMP')
-
+            flam3h_code: str = f"CODE: **opencl, **cvex, **python"
             
-    def ui_OUT_presets_name_infos(self) -> None:
-        """Open a message window with informations/tips about setting Flame names in the OUT tab.</br>
+        flam3h_houdini_version: str = f"VERSION: {__version__} - {__status__} :: ({__license__})"
+        Implementation_build: str = f"{flam3h_author}\n{flam3h_houdini_version}\n{flam3h_code}\n{__copyright__}"
+        
+        code_references: str = f"""CODE REFERENCES
+Flam3, Apophysis, Fractorium :: ({__license__})"""
 
-        Args:
-            (self):
-            
-        Returns:
-            (None):
-        """
+        special_thanks: str = """SPECIAL THANKS
+Praveen Brijwal"""
+
+        example_flames_header: str = 'EXAMPLE FLAMES'
+        items: tuple = ('C-91', 'GaborTimar', 'Golubaja', 'Lucy', 'Neonrauschen', 'Pillemaster', 'Plangkye', 'Seph', 'Tatasz', 'Triptychaos', 'TyrantWave', 'Zy0rg', 'b33rheart')
+        example_flames: str = self.flam3h_about_format_items(items)[0]
 
+        host_header: str = 'HOST'
+        h_version_str: str = '.'.join(str(x) for x in hou.applicationVersion())
+        license_type: str = str(hou.licenseCategory()).split(".")[-1]
+        houdini_v: str = f"SideFX Houdini {h_version_str}, {license_type}"
+        python_v: str = f"Python: {python_version()}"
+        ws: str = f"WS: {hou.machineName()}"
+        user: str = f"User: {hou.userName()}"
+        platform: str = f"Platform: {flam3h_general_utils.detect_os()}"
         
-        ALL_msg = """ FLAM3H™ CPU(Cvex) only
+        build: tuple[str, ...] = (Implementation_build, nnl,
+                                code_references, nnl,
+                                special_thanks, nnl,
+                                example_flames_header, nl,
+                                example_flames, nnl,
+                                host_header, nl,
+                                houdini_v, nl,
+                                python_v, nl,
+                                ws, nl,
+                                user, nl,
+                                platform
+                                )
         
-The iteration number you want your fractal flame to use when you load it back into FLAM3H™
-can be baked into the preset name you choose for it. 
-
-For instance,
-the Flame preset “My_Awesome_GrandJulia” will be loaded with 64 iterations by default.
-However, if the iteration number is added to the preset name after a double colon,
-as in “My_Awesome_GrandJulia::16,” it will override all settings
-and load the preset with 16 as the iteration numbers.
-
-Therefore,
-do some tests before saving it,
-and choose the ideal iteration number to incorporate into the preset name.
-
-If you like,
-you can manually edit the created XML/Flame file
-and change the flame → “name” key afterwards.
-    
-"""
-        if hou.isUIAvailable():
-            hou.ui.displayMessage(
-                ALL_msg, # pyright: ignore[reportArgumentType]
-                buttons=("Got it, thank you",), 
-                severity = hou.severityType.Message, # pyright: ignore[reportAttributeAccessIssue] # Houdini HOM API
-                default_choice = 0, 
-                close_choice = -1, 
-                help = None, 
-                title = "FLAM3H™ Presets name infos", 
-                details = None, 
-                details_label = None, 
-                details_expanded = False
+        gpu_section_header: str = 'GPU DEVICES'
+        
+        h_version: int = flam3h_general_utils.houdini_version(2)
+        if h_version == 210:
+            # GPU section is only available in Houdini 21.0 and above since it relies on the "gpumem" hscript command that was added in this version.
+            
+            gpu_devices_gpumem: list[str] = hou.hscript('gpumem -l')
+            if 'unknown' in gpu_devices_gpumem[-1].lower():
+                print(f"{self.node.name()}: Error while trying to get GPU devices info with the \"gpumem\" hscript command.\nThis command should be available in Houdini 21.0 and above.")
+                pass 
+            else:
+                gpu_devices_str: str = '\n'.join([x[:-1] for x in gpu_devices_gpumem if x])
+                
+                build += (  nnl, 
+                            gpu_section_header, nl, 
+                            gpu_devices_str
+                            )
+         
+        elif h_version >= 220:
+            # Houdini 22.0 added OpenCL devices queries directly to their HOM python API, so we can use it to get the GPU devices info.
+            
+            gpu_devices = cast(
+                tuple[hou.OpenCLDevice, ...],
+                hou.opencl.devices(hou.openCLDeviceType.GPU) # pyright: ignore[reportCallIssue, reportAttributeAccessIssue]  # Houdini HOM API
             )
+            
+            if gpu_devices:
+                gpu_devices_build: list = []
+                for gpu in gpu_devices:
+                    gpu_devices_build.append(f"{gpu.label()} - Driver: {gpu.driverVersion()}")
+                
+                gpu_devices_str: str = gpu_devices_build[0] if len(gpu_devices_build) == 1 else '\n'.join(gpu_devices_build)
+                
+                build += (  nnl, 
+                            gpu_section_header, nl, 
+                            gpu_devices_str
+                            )
+        
+        return ''.join(build)
+    
+    
+    def flam3h_about_msg(self) -> None:
+        """Build and set the FLAM3H™ about message.</br>
+        
+        Args:
+            (self):
+            
+        Returns:
+            (None):
+        """    
+        flam3h_prm_utils.set(self.node, f3h_tabs.ABOUT.MSG_PRM_F3H_ABOUT, self.flam3h_about_msg_data())
 
 
-# LOAD XML FLAME FILES start here
-##########################################
-##########################################
-##########################################
-##########################################
-##########################################
-##########################################
-##########################################
-##########################################
+    def flam3h_about_plugins_msg(self) -> None:
+        """Build and set the FLAM3H™ about plugins message.</br>
+        
+        Args:
+            (self):
+            
+        Returns:
+            (None):
+        """    
+        flam3h_prm_utils.set(self.node, f3h_tabs.ABOUT.MSG_PRM_F3H_PLUGINS, self.flam3h_about_plugins_msg_data())
+        
+        
+    def flam3h_about_web_msg(self) -> None:
+        """Build and set the FLAM3H™ about web heading's msgs.</br>
+        
+        Args:
+            (self):
+            
+        Returns:
+            (None):
+        """    
+        flam3h_prm_utils.setParms(self.node, self.flam3h_about_web_msg_data())
+        
+        
+    def flam3h_about_web_homepage(self) -> None:
+        """Open a web browser to the FLAM3H™ homepage.</br>
+        
+        Args:
+            (self):
+            
+        Returns:
+            (None):
+        """
+        page: str = "https://www.alexnardini.net/"
+        www_open(page)
+        
 
+    def flam3h_about_web_github(self) -> None:
+        """Open a web browser to the FLAM3H™ github repository.</br>
+        
+        Args:
+            (self):
+            
+        Returns:
+            (None):
+        """  
+        page: str = "https://github.com/alexnardini/FLAM3_for_SideFX_Houdini"
+        www_open(page)
+        
 
-class xml_keys:
-    '''
-    Xml standard keys for Xml flame files.</br>
-    It also include Fractorium keys where applicable along with defaults.</br></br>
-    
-    Used when loading/saving flame Xml files.</br>
+    def flam3h_about_web_instagram(self) -> None:
+        """Open a web browser to the FLAM3H™ instagram account.</br>
+        
+        Args:
+            (self):
+            
+        Returns:
+            (None):
+        """  
+        page: str = "https://www.instagram.com/alexnardini/"
+        www_open(page)
     
-    Mainly for organizational purposes and namespace.</br></br>
     
-    * Xml keys names always start with the prefix: <b>XML_</b>
-    * Default values always start with the prefix: <b>DEFAULT_</b>
-    * Regex always start with the prefix: <b>REGEX_</b>
-    * Miscellaneous constants can be anything else.</b>
-    '''
-    # For now we force to assume a valid flame's XML file must have this tree.root name.
-    XML_ROOT: Final = 'flames'
-    # And this for a valid chaotica file ( not supported )
-    XML_ROOT_CHAOS: Final = 'ifs'
-
-    XML_APP_NAME_FLAM3H: Final = 'FLAM3H'
-    XML_APP_NAME_FLAM3H_CL: Final = 'FLAM3H-CL'
-    XML_APP_NAME_FRACTORIUM: Final = 'EMBER'
+    def flam3h_about_web_youtube(self) -> None:
+        """Open a web browser to the FLAM3H™ youtube video tutorials.</br>
+        
+        Args:
+            (self):
+            
+        Returns:
+            (None):
+        """  
+        page: str = "https://www.youtube.com/@alexnardiniITALY/videos"
+        www_open(page)
 
-    XML_NAME: Final = 'flame'
-    XML_VERSION: Final = 'version'
-    XML_SIZE: Final = 'size'
-    XML_RESOLUTION: Final = 'resolution' # This is not used by the Flame format but only a one off for the IN Infos Flame stats UI
-    XML_CENTER: Final = 'center'
-    XML_ROTATE: Final = 'rotate'
-    XML_SCALE: Final = 'scale'
-    XML_BG: Final = 'background'
-    XML_SUPERSAMPLE: Final = 'supersample'
-    XML_FILTER: Final = 'filter'
-    XML_QUALITY: Final = 'quality'
-    XML_BRIGHTNESS: Final = 'brightness'
-    XML_GAMMA: Final = 'gamma'
-    XML_GAMMA_THRESHOLD: Final = 'gamma_threshold'
-    XML_VIBRANCY: Final = 'vibrancy'
-    XML_POWER: Final = 'highlight_power'
-    XML_K2: Final = 'logscale_k2'
-    XML_RADIUS: Final = 'estimator_radius'
-    XML_ESTIMATOR_MINIMUM: Final = 'estimator_minimum'
-    XML_ESTIMATOR_CURVE: Final = 'estimator_curve'
-    XML_PALETTE_MODE: Final = 'palette_mode'
-    XML_INTERPOLATION: Final = 'interpolation'
-    XML_INTERPOLATION_TYPE: Final = 'interpolation_type'
-    XML_PLUGINS: Final = 'plugins'
-    XML_NEW_LINEAR: Final = 'new_linear'
-    
-    XML_CC_CURVES: Final = 'curves'    
-    DEFAULT_CC_CURVES: Final = '0 0 1 0.25 0.25 1 0.5 0.5 1 0.75 0.75 1 0 0 1 0.25 0.25 1 0.5 0.5 1 0.75 0.75 1 0 0 1 0.25 0.25 1 0.5 0.5 1 0.75 0.75 1 0 0 1 0.25 0.25 1 0.5 0.5 1 0.75 0.75 1'
-    DEFAULT_CC_CURVES_B: Final = '0 0 1 0.25 0.25 1 0.75 0.75 1 1 1 1 0 0 1 0.25 0.25 1 0.75 0.75 1 1 1 1 0 0 1 0.25 0.25 1 0.75 0.75 1 1 1 1 0 0 1 0.25 0.25 1 0.75 0.75 1 1 1 1'
-    DEFAULT_CC_CURVES_C: Final = '0 0 1 0.25 0.25 1 1 1 1 0.75 0.75 1 0 0 1 0.25 0.25 1 1 1 1 0.75 0.75 1 0 0 1 0.25 0.25 1 1 1 1 0.75 0.75 1 0 0 1 0.25 0.25 1 1 1 1 0.75 0.75 1'
-    DEFAULT_CC_CURVES_ALL: tuple[str, ...] = (DEFAULT_CC_CURVES.__str__(), DEFAULT_CC_CURVES_B.__str__(), DEFAULT_CC_CURVES_C.__str__()) # I'll do a better solution another day for this
 
-    XML_CC_CURVE_OVERALL: Final = 'overall_curve'
-    XML_CC_CURVE_RED: Final = 'red_curve'
-    XML_CC_CURVE_GREEN: Final = 'green_curve'
-    XML_CC_CURVE_BLUE: Final = 'blue_curve'
-    DEFAULT_CC_CURVE: Final = '0 0 0.25 0.25 0.5 0.5 0.75 0.75 1 1'
-    DEFAULT_CC_CURVE_B: Final = '0 0 0.25 0.25 0.75 0.75 1 1'
-    DEFAULT_CC_CURVE_C: Final = '0 0 0.25 0.25 1 1 0.75 0.75' # This order is odd but I have some flames coming in with this so...
-    DEFAULT_CC_CURVE_ALL: tuple[str, ...] = (DEFAULT_CC_CURVE.__str__(), DEFAULT_CC_CURVE_B.__str__(), DEFAULT_CC_CURVE_C.__str__()) # I'll do a better solution another day for this
+    def flam3h_about_web_flam3_paper(self) -> None:
+        """Open a web browser to the original "the fractal flame algorithm" publication/paper pdf.</br>
+        
+        Args:
+            (self):
+            
+        Returns:
+            (None):
+        """  
+        page: str = "https://flam3.com/flame_draves.pdf"
+        www_open(page)
+        
 
-    XML_PRE_AFFINE: Final = 'coefs'
-    XML_POST_AFFINE: Final = 'post'
+    def flam3h_about_web_flam3_github(self) -> None:
+        """Open a web browser to the original FLAM3 github repository.</br>
+        
+        Args:
+            (self):
+            
+        Returns:
+            (None):
+        """  
+        page: str = "https://github.com/scottdraves/flam3"
+        www_open(page)
+        
+        
+    def flam3h_about_web_bitbucket(self) -> None:
+        """Open a web browser to the Fractorium Bitbucket repository.</br>
+        
+        Args:
+            (self):
+            
+        Returns:
+            (None):
+        """  
+        page: str = "https://bitbucket.org/mfeemster/fractorium/src/master/"
+        www_open(page)
+        
+        
+    def flam3h_about_web_fractorium_github(self) -> None:
+        """Open a web browser to the Fractorium Bitbucket repository.</br>
+        
+        Args:
+            (self):
+            
+        Returns:
+            (None):
+        """  
+        page: str = "https://github.com/mfeemster/fractorium/tree/master"
+        www_open(page)
+        
+        
+    def flam3h_about_web_fractorium(self) -> None:
+        """Open a web browser to the Fractorium Bitbucket repository.</br>
+        
+        Args:
+            (self):
+            
+        Returns:
+            (None):
+        """  
+        page: str = "http://fractorium.com/"
+        www_open(page)
+        
+        
+    def flam3h_web_run(self, key: str) -> None:
+        """Select the appropriate web open definition to run.</br>
 
-    XML_XF: Final = 'xform'
-    XML_XF_NAME: Final = 'name'
-    XML_XF_WEIGHT: Final = 'weight'
-    XML_XF_COLOR: Final = 'color'
-    XML_XF_VAR_COLOR: Final = 'var_color'
-    XML_XF_SYMMETRY: Final = 'symmetry'
-    XML_XF_COLOR_SPEED: Final = 'color_speed'
-    XML_XF_OPACITY: Final = 'opacity'
-    XML_XF_PB: Final = 'pre_blur'
-    XML_XF_XAOS: Final = 'chaos'
-    XML_XF_ANIMATE: Final = 'animate' # Fractorium only
+        Args:
+            (self):
+            key(str): The key value that define whitch web definition to run.
 
-    XML_FF: Final = 'finalxform'
+        Returns:
+            (None):
+        """
+        
+        web: dict[str, Callable[[], None]] = {'web': self.flam3h_about_web_homepage,
+                                              'git': self.flam3h_about_web_github,
+                                              'insta': self.flam3h_about_web_instagram,
+                                              'youtube': self.flam3h_about_web_youtube,
+                                              'paper': self.flam3h_about_web_flam3_paper,
+                                              'flam3git': self.flam3h_about_web_flam3_github,
+                                              'fractbitbucket': self.flam3h_about_web_bitbucket,
+                                              'fractgithub': self.flam3h_about_web_fractorium_github,
+                                              'fractweb': self.flam3h_about_web_fractorium,
+                                            }
+        
+        run: Callable[[], None] | None = web.get(key)
+        if run is not None: run()
 
-    XML_PALETTE: Final = 'palette'
-    XML_PALETTE_COUNT: Final = 'count'
-    XML_PALETTE_FORMAT: Final = 'format'
-    
-    DEFAULT_VAR_PRE_PRX: Final = "pre_"
-    DEFAULT_VAR_POST_PRX: Final = "post_"
-    
-    REGEX_PRE = "^(?:pre_)"
-    REGEX_POST = "^(?:post_)"
+
+# FLAM3H™ UI MESSAGES start here
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+
+
+class flam3h_ui_msg_utils():
+    """
+class flam3h_ui_msg_utils
+
+@METHODS
+* ui_xaos_infos(self) -> None:
+* ui_OUT_presets_name_infos(self) -> None:
+    """
     
+    __slots__ = ("_kwargs", "_node")
     
-    class f3h:
-        '''
-        FLAM3H™ custom XML keys and defaults.</br>
-        Used when loading/saving flame XML files.</br>
-        '''
-        XML_RIP: Final = 'flam3h_rip'
-        XML_F3C: Final = 'flam3h_f3c'
-        XML_HSV: Final = 'flam3h_hsv'
-        XML_MB_FPS: Final = 'flam3h_mb_fps'
-        XML_MB_SAMPLES: Final = 'flam3h_mb_samples'
-        XML_MB_SHUTTER: Final = 'flam3h_mb_shutter'
-        XML_CP_SAMPLES: Final = 'flam3h_cp_samples'
-        XML_CP_SAMPLES_BASIS: Final = 'flam3h_cp_basis'
+    def __init__(self, kwargs: dict[str, Any]) -> None:
+        """
+        Args:
+            kwargs(dict): this FLAM3H™ node houdini kwargs.
+            
+        Returns:
+            (None):
+        """ 
+        self._kwargs: dict[str, Any] = kwargs
+        self._node: hou.SopNode = kwargs['node']
+
+
+    # CLASS: PROPERTIES
+    ##########################################
+    ##########################################
         
-        XML_PRE_AFFINE: Final = 'f3h_coefs'
-        XML_PRE_AFFINE_ANGLE: Final = 'f3h_coefs_angle'
-        XML_POST_AFFINE: Final = 'f3h_post'
-        XML_POST_AFFINE_ANGLE: Final = 'f3h_post_angle'
+    @property
+    def kwargs(self) ->  dict[str, Any]:
+        return self._kwargs
+    
+    @property
+    def node(self) -> hou.SopNode:
+        return self._node
         
-        # It happen that Houdini sometime round value to many, many decimals.
-        # I am limiting this to max 8 decimals on export so not to have the xml file explode with trailing floats...
-        # Increase this if for some reason you need more precision.
-        DEFAULT_ROUND_DECIMAL_COUNT: Final = 8
+
+    def ui_xaos_infos(self) -> None:
+        """Open a message window with informations/tips about setting Xaos.</br>
+
+        Args:
+            (self):
+            
+        Returns:
+            (None):
+        """
         
-        # LIMITS for the number of variations FLAM3H™ allow based on their type.
-        DEFAULT_MAX_ITER_VARS: Final = 4
-        DEFAULT_MAX_ITER_VARS_PRE: Final = 2
-        DEFAULT_MAX_ITER_VARS_POST: Final = 1
-        DEFAULT_MAX_FF_VARS: Final = 2
-        DEFAULT_MAX_FF_VARS_PRE: Final = 1
-        DEFAULT_MAX_FF_VARS_POST: Final = 2
+        ALL_msg = """The default mode is \"xaos TO\".\nYou can change it to use \"xaos FROM\" mode instead in the preferences tab.
 
+Xaos is fully automatic,
+however below are some general rules on how it work:
 
-# XML OUT render key data prm names HOUDINI
-# for now make sense to expose those, I may add more in the future if needed
-# Note that those are the FLAM3H™ UI parameter's names for the OUT Render properties tab.
-XML_RENDER_HOUDINI_DICT: dict[str, str] = { xml_keys.XML_XF_NAME: f3h_tabs.OUT.PRM_FLAME_PRESET_NAME,
-                                            xml_keys.XML_SIZE: f3h_tabs.OUT.PRM_RENDER_SIZE,
-                                            xml_keys.XML_CENTER: f3h_tabs.OUT.PRM_RENDER_CENTER,
-                                            xml_keys.XML_ROTATE: f3h_tabs.OUT.PRM_RENDER_ROTATE,
-                                            xml_keys.XML_SCALE: f3h_tabs.OUT.PRM_RENDER_SCALE,
-                                            xml_keys.XML_QUALITY: f3h_tabs.OUT.PRM_RENDER_QUALITY,
-                                            xml_keys.XML_BRIGHTNESS: f3h_tabs.OUT.PRM_RENDER_BRIGHTNESS,
-                                            xml_keys.XML_GAMMA: f3h_tabs.OUT.PRM_RENDER_GAMMA,
-                                            xml_keys.XML_POWER: f3h_tabs.OUT.PRM_RENDER_POWER,
-                                            xml_keys.XML_K2: f3h_tabs.OUT.PRM_RENDER_K2,
-                                            xml_keys.XML_VIBRANCY: f3h_tabs.OUT.PRM_RENDER_VIBRANCY,
-                                            xml_keys.XML_CC_CURVES: f3h_tabs.PREFS.PVT_PRM_RENDER_CC_CURVES,
-                                            xml_keys.XML_CC_CURVE_OVERALL: f3h_tabs.PREFS.PVT_PRM_RENDER_CC_CURVE_OVERALL,
-                                            xml_keys.XML_CC_CURVE_RED: f3h_tabs.PREFS.PVT_PRM_RENDER_CC_CURVE_RED,
-                                            xml_keys.XML_CC_CURVE_GREEN: f3h_tabs.PREFS.PVT_PRM_RENDER_CC_CURVE_GREEN,
-                                            xml_keys.XML_CC_CURVE_BLUE: f3h_tabs.PREFS.PVT_PRM_RENDER_CC_CURVE_BLUE
-                                            }
 
+XAOS USAGE:
 
-# This is used inside: __get_name_list_str(...)
-# to set what default single value should be used in case something goes wrong during the processed string value cleanup/correction
-XML_TO_F3H_DEFAULT_VALS: dict[str, str] = { xml_keys.XML_XF_WEIGHT: '0.5', 
-                                            xml_keys.XML_XF_COLOR: '0', 
-                                            xml_keys.XML_XF_COLOR_SPEED: '0', 
-                                            xml_keys.XML_XF_SYMMETRY: '0', 
-                                            xml_keys.XML_XF_OPACITY: '1', 
-                                            xml_keys.f3h.XML_HSV: '1', 
-                                            xml_keys.XML_SIZE: '1024'
-                                            }
+To set Xaos for a flame with 4 iterators,
+use the " xaos: " keyword followed by each iterator weights values separated by a colon:
+\" xaos:1:2:3:4 \" ( xaos keyword can be uppercase too if you prefer. )
 
+If no set,
+FLAM3H™ will assume all Xaos values are 1.0, the equivalent of: \" xaos:1:1:1:1 \"
 
-# This is used inside: def xf_list_cleanup(...) and def xf_list_cleanup_str(...)
-# to gather a proper default list of values in case the one from the XML is empty.
-XML_TO_F3H_LIST_DEFAULT_VALS: dict[str, str] = {xml_keys.XML_SIZE: '1024 1024', 
-                                                xml_keys.XML_CENTER: '0 0', 
-                                                xml_keys.f3h.XML_HSV: '1 1 1'
-                                                }
+If you set only iterator 1 and iterator 2,
+FLAM3H™ will always fill in the rest with a value of 1.0. \" xaos:0:0 \" will be interpreted as \" xaos:0:0:1:1 \"
 
+When turning iterators ON and OFF and removing or adding them,
+FLAM3H™ will internally remove and reformat Xaos values to account for missing iterators.
 
-# Since we get the folowing keys in a separate action, we exclude them for later variation's names searches to help speed up a little.
-XML_XF_KEY_EXCLUDE: tuple[str, ...] = ( xml_keys.XML_XF_WEIGHT, 
-                                        xml_keys.XML_XF_COLOR, 
-                                        xml_keys.XML_XF_VAR_COLOR, 
-                                        xml_keys.XML_XF_SYMMETRY, 
-                                        xml_keys.XML_XF_COLOR_SPEED, 
-                                        xml_keys.XML_XF_NAME, 
-                                        xml_keys.XML_XF_ANIMATE, # this is being added as it is a Fractorium only XML key and we are not using it in FLAM3H™
-                                        xml_keys.XML_XF_PB, 
-                                        xml_keys.XML_PRE_AFFINE, 
-                                        xml_keys.f3h.XML_PRE_AFFINE, 
-                                        xml_keys.f3h.XML_PRE_AFFINE_ANGLE, 
-                                        xml_keys.XML_POST_AFFINE, 
-                                        xml_keys.f3h.XML_POST_AFFINE, 
-                                        xml_keys.f3h.XML_POST_AFFINE_ANGLE, 
-                                        xml_keys.XML_XF_XAOS, 
-                                        xml_keys.XML_XF_OPACITY
-                                        )
+When reordering iterators,
+FLAM3H™ will also reorder the Xaos values to match the new iterators order.
 
+In short, it is fully automatic.
 
-# This has been fixed and now radial_blur variation matches all the other apps
-# but I leave it here just in case other variation will need it.
-XML_XF_PRM_EXCEPTION: tuple[str, ...] = ("None",)
 
+XAOS COMMAND OPTIONS:
 
-# This is used as a faster idx lookup table.
-# From the XML's xforms, each variations look itself up inside here to get the corresponding FLAM3H™ var idx it is mapped to.
-# The key names matter and must match the variation's names as known by other apps ( in my case: Apophysis and Fratorium )
-#
+If you type a non-numeric character in any of the xaos's weights,
+FLAM3H™ will undo to what you had before.
+
+If you dnt use the “ xaos: ” keywork at the beginning,
+FLAM3H™ will undo to what you had before.
+
+If you type a number,
+the entire xaos string will be reset to all weights set to that number.
+
+If you type a negative number, it will be reset to a value of: 1"""
+        
+        node: hou.SopNode = self.node
+        # Check and Update this data
+        flam3h_iterator_utils(self.kwargs).update_xml_last_loaded()
+
+        if self.kwargs["ctrl"]:
+            if hou.isUIAvailable():
+                hou.ui.displayMessage(
+                    ALL_msg, # pyright: ignore[reportArgumentType]
+                    buttons=("Got it, thank you",), 
+                    severity = hou.severityType.Message, # pyright: ignore[reportAttributeAccessIssue] # Houdini HOM API
+                    default_choice = 0, 
+                    close_choice = -1, 
+                    help = None, 
+                    title = "FLAM3H™ Xaos usage infos", 
+                    details = None, 
+                    details_label = None, 
+                    details_expanded = False
+                )
+
+        else:
+            # current node
+            autodiv = node.parm(f3h_tabs.PREFS.PVT_PRM_XAOS_AUTO_SPACE).eval()
+            if autodiv:
+                flam3h_prm_utils.private_prm_set(node, f3h_tabs.PREFS.PVT_PRM_XAOS_AUTO_SPACE, 0)
+                flam3h_iterator_utils(self.kwargs).auto_set_xaos()
+                
+                _MSG: str = f"{node.name()}: Xaos weights auto space: OFF"
+                flam3h_general_utils.set_status_msg(_MSG, 'MSG')
+                
+            else:
+                flam3h_prm_utils.private_prm_set(node, f3h_tabs.PREFS.PVT_PRM_XAOS_AUTO_SPACE, 1)
+                flam3h_iterator_utils(self.kwargs).auto_set_xaos()
+                
+                _MSG: str = f"{node.name()}: Xaos weights auto space: ON"
+                flam3h_general_utils.set_status_msg(_MSG, 'IMP')
+
+            
+    def ui_OUT_presets_name_infos(self) -> None:
+        """Open a message window with informations/tips about setting Flame names in the OUT tab.</br>
+
+        Args:
+            (self):
+            
+        Returns:
+            (None):
+        """
+
+        
+        ALL_msg = """ FLAM3H™ CPU(Cvex) only
+        
+The iteration number you want your fractal flame to use when you load it back into FLAM3H™
+can be baked into the preset name you choose for it. 
+
+For instance,
+the Flame preset “My_Awesome_GrandJulia” will be loaded with 64 iterations by default.
+However, if the iteration number is added to the preset name after a double colon,
+as in “My_Awesome_GrandJulia::16,” it will override all settings
+and load the preset with 16 as the iteration numbers.
+
+Therefore,
+do some tests before saving it,
+and choose the ideal iteration number to incorporate into the preset name.
+
+If you like,
+you can manually edit the created XML/Flame file
+and change the flame → “name” key afterwards.
+    
+"""
+        if hou.isUIAvailable():
+            hou.ui.displayMessage(
+                ALL_msg, # pyright: ignore[reportArgumentType]
+                buttons=("Got it, thank you",), 
+                severity = hou.severityType.Message, # pyright: ignore[reportAttributeAccessIssue] # Houdini HOM API
+                default_choice = 0, 
+                close_choice = -1, 
+                help = None, 
+                title = "FLAM3H™ Presets name infos", 
+                details = None, 
+                details_label = None, 
+                details_expanded = False
+            )
+
+
+# LOAD XML FLAME FILES start here
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+
+
+class xml_keys:
+    '''
+    Xml standard keys for Xml flame files.</br>
+    It also include Fractorium keys where applicable along with defaults.</br></br>
+    
+    Used when loading/saving flame Xml files.</br>
+    
+    Mainly for organizational purposes and namespace.</br></br>
+    
+    * Xml keys names always start with the prefix: <b>XML_</b>
+    * Default values always start with the prefix: <b>DEFAULT_</b>
+    * Regex always start with the prefix: <b>REGEX_</b>
+    * Miscellaneous constants can be anything else.</b>
+    '''
+    # For now we force to assume a valid flame's XML file must have this tree.root name.
+    XML_ROOT: Final = 'flames'
+    # And this for a valid chaotica file ( not supported )
+    XML_ROOT_CHAOS: Final = 'ifs'
+
+    XML_APP_NAME_FLAM3H: Final = 'FLAM3H'
+    XML_APP_NAME_FLAM3H_CL: Final = 'FLAM3H-CL'
+    XML_APP_NAME_FRACTORIUM: Final = 'EMBER'
+
+    XML_NAME: Final = 'flame'
+    XML_VERSION: Final = 'version'
+    XML_SIZE: Final = 'size'
+    XML_RESOLUTION: Final = 'resolution' # This is not used by the Flame format but only a one off for the IN Infos Flame stats UI
+    XML_CENTER: Final = 'center'
+    XML_ROTATE: Final = 'rotate'
+    XML_SCALE: Final = 'scale'
+    XML_BG: Final = 'background'
+    XML_SUPERSAMPLE: Final = 'supersample'
+    XML_FILTER: Final = 'filter'
+    XML_QUALITY: Final = 'quality'
+    XML_BRIGHTNESS: Final = 'brightness'
+    XML_GAMMA: Final = 'gamma'
+    XML_GAMMA_THRESHOLD: Final = 'gamma_threshold'
+    XML_VIBRANCY: Final = 'vibrancy'
+    XML_POWER: Final = 'highlight_power'
+    XML_K2: Final = 'logscale_k2'
+    XML_RADIUS: Final = 'estimator_radius'
+    XML_ESTIMATOR_MINIMUM: Final = 'estimator_minimum'
+    XML_ESTIMATOR_CURVE: Final = 'estimator_curve'
+    XML_PALETTE_MODE: Final = 'palette_mode'
+    XML_INTERPOLATION: Final = 'interpolation'
+    XML_INTERPOLATION_TYPE: Final = 'interpolation_type'
+    XML_PLUGINS: Final = 'plugins'
+    XML_NEW_LINEAR: Final = 'new_linear'
+    
+    XML_CC_CURVES: Final = 'curves'    
+    DEFAULT_CC_CURVES: Final = '0 0 1 0.25 0.25 1 0.5 0.5 1 0.75 0.75 1 0 0 1 0.25 0.25 1 0.5 0.5 1 0.75 0.75 1 0 0 1 0.25 0.25 1 0.5 0.5 1 0.75 0.75 1 0 0 1 0.25 0.25 1 0.5 0.5 1 0.75 0.75 1'
+    DEFAULT_CC_CURVES_B: Final = '0 0 1 0.25 0.25 1 0.75 0.75 1 1 1 1 0 0 1 0.25 0.25 1 0.75 0.75 1 1 1 1 0 0 1 0.25 0.25 1 0.75 0.75 1 1 1 1 0 0 1 0.25 0.25 1 0.75 0.75 1 1 1 1'
+    DEFAULT_CC_CURVES_C: Final = '0 0 1 0.25 0.25 1 1 1 1 0.75 0.75 1 0 0 1 0.25 0.25 1 1 1 1 0.75 0.75 1 0 0 1 0.25 0.25 1 1 1 1 0.75 0.75 1 0 0 1 0.25 0.25 1 1 1 1 0.75 0.75 1'
+    DEFAULT_CC_CURVES_ALL: tuple[str, ...] = (DEFAULT_CC_CURVES.__str__(), DEFAULT_CC_CURVES_B.__str__(), DEFAULT_CC_CURVES_C.__str__()) # I'll do a better solution another day for this
+
+    XML_CC_CURVE_OVERALL: Final = 'overall_curve'
+    XML_CC_CURVE_RED: Final = 'red_curve'
+    XML_CC_CURVE_GREEN: Final = 'green_curve'
+    XML_CC_CURVE_BLUE: Final = 'blue_curve'
+    DEFAULT_CC_CURVE: Final = '0 0 0.25 0.25 0.5 0.5 0.75 0.75 1 1'
+    DEFAULT_CC_CURVE_B: Final = '0 0 0.25 0.25 0.75 0.75 1 1'
+    DEFAULT_CC_CURVE_C: Final = '0 0 0.25 0.25 1 1 0.75 0.75' # This order is odd but I have some flames coming in with this so...
+    DEFAULT_CC_CURVE_ALL: tuple[str, ...] = (DEFAULT_CC_CURVE.__str__(), DEFAULT_CC_CURVE_B.__str__(), DEFAULT_CC_CURVE_C.__str__()) # I'll do a better solution another day for this
+
+    XML_PRE_AFFINE: Final = 'coefs'
+    XML_POST_AFFINE: Final = 'post'
+
+    XML_XF: Final = 'xform'
+    XML_XF_NAME: Final = 'name'
+    XML_XF_WEIGHT: Final = 'weight'
+    XML_XF_COLOR: Final = 'color'
+    XML_XF_VAR_COLOR: Final = 'var_color'
+    XML_XF_SYMMETRY: Final = 'symmetry'
+    XML_XF_COLOR_SPEED: Final = 'color_speed'
+    XML_XF_OPACITY: Final = 'opacity'
+    XML_XF_PB: Final = 'pre_blur'
+    XML_XF_XAOS: Final = 'chaos'
+    XML_XF_ANIMATE: Final = 'animate' # Fractorium only
+
+    XML_FF: Final = 'finalxform'
+
+    XML_PALETTE: Final = 'palette'
+    XML_PALETTE_COUNT: Final = 'count'
+    XML_PALETTE_FORMAT: Final = 'format'
+    
+    DEFAULT_VAR_PRE_PRX: Final = "pre_"
+    DEFAULT_VAR_POST_PRX: Final = "post_"
+    
+    REGEX_PRE = "^(?:pre_)"
+    REGEX_POST = "^(?:post_)"
+    
+    
+    class f3h:
+        '''
+        FLAM3H™ custom XML keys and defaults.</br>
+        Used when loading/saving flame XML files.</br>
+        '''
+        XML_RIP: Final = 'flam3h_rip'
+        XML_F3C: Final = 'flam3h_f3c'
+        XML_HSV: Final = 'flam3h_hsv'
+        XML_MB_FPS: Final = 'flam3h_mb_fps'
+        XML_MB_SAMPLES: Final = 'flam3h_mb_samples'
+        XML_MB_SHUTTER: Final = 'flam3h_mb_shutter'
+        XML_CP_SAMPLES: Final = 'flam3h_cp_samples'
+        XML_CP_SAMPLES_BASIS: Final = 'flam3h_cp_basis'
+        
+        XML_PRE_AFFINE: Final = 'f3h_coefs'
+        XML_PRE_AFFINE_ANGLE: Final = 'f3h_coefs_angle'
+        XML_POST_AFFINE: Final = 'f3h_post'
+        XML_POST_AFFINE_ANGLE: Final = 'f3h_post_angle'
+        
+        # It happen that Houdini sometime round value to many, many decimals.
+        # I am limiting this to max 8 decimals on export so not to have the xml file explode with trailing floats...
+        # Increase this if for some reason you need more precision.
+        DEFAULT_ROUND_DECIMAL_COUNT: Final = 8
+        
+        # LIMITS for the number of variations FLAM3H™ allow based on their type.
+        DEFAULT_MAX_ITER_VARS: Final = 4
+        DEFAULT_MAX_ITER_VARS_PRE: Final = 2
+        DEFAULT_MAX_ITER_VARS_POST: Final = 1
+        DEFAULT_MAX_FF_VARS: Final = 2
+        DEFAULT_MAX_FF_VARS_PRE: Final = 1
+        DEFAULT_MAX_FF_VARS_POST: Final = 2
+
+
+# XML OUT render key data prm names HOUDINI
+# for now make sense to expose those, I may add more in the future if needed
+# Note that those are the FLAM3H™ UI parameter's names for the OUT Render properties tab.
+XML_RENDER_HOUDINI_DICT: dict[str, str] = { xml_keys.XML_XF_NAME: f3h_tabs.OUT.PRM_FLAME_PRESET_NAME,
+                                            xml_keys.XML_SIZE: f3h_tabs.OUT.PRM_RENDER_SIZE,
+                                            xml_keys.XML_CENTER: f3h_tabs.OUT.PRM_RENDER_CENTER,
+                                            xml_keys.XML_ROTATE: f3h_tabs.OUT.PRM_RENDER_ROTATE,
+                                            xml_keys.XML_SCALE: f3h_tabs.OUT.PRM_RENDER_SCALE,
+                                            xml_keys.XML_QUALITY: f3h_tabs.OUT.PRM_RENDER_QUALITY,
+                                            xml_keys.XML_BRIGHTNESS: f3h_tabs.OUT.PRM_RENDER_BRIGHTNESS,
+                                            xml_keys.XML_GAMMA: f3h_tabs.OUT.PRM_RENDER_GAMMA,
+                                            xml_keys.XML_POWER: f3h_tabs.OUT.PRM_RENDER_POWER,
+                                            xml_keys.XML_K2: f3h_tabs.OUT.PRM_RENDER_K2,
+                                            xml_keys.XML_VIBRANCY: f3h_tabs.OUT.PRM_RENDER_VIBRANCY,
+                                            xml_keys.XML_CC_CURVES: f3h_tabs.PREFS.PVT_PRM_RENDER_CC_CURVES,
+                                            xml_keys.XML_CC_CURVE_OVERALL: f3h_tabs.PREFS.PVT_PRM_RENDER_CC_CURVE_OVERALL,
+                                            xml_keys.XML_CC_CURVE_RED: f3h_tabs.PREFS.PVT_PRM_RENDER_CC_CURVE_RED,
+                                            xml_keys.XML_CC_CURVE_GREEN: f3h_tabs.PREFS.PVT_PRM_RENDER_CC_CURVE_GREEN,
+                                            xml_keys.XML_CC_CURVE_BLUE: f3h_tabs.PREFS.PVT_PRM_RENDER_CC_CURVE_BLUE
+                                            }
+
+
+# This is used inside: __get_name_list_str(...)
+# to set what default single value should be used in case something goes wrong during the processed string value cleanup/correction
+XML_TO_F3H_DEFAULT_VALS: dict[str, str] = { xml_keys.XML_XF_WEIGHT: '0.5', 
+                                            xml_keys.XML_XF_COLOR: '0', 
+                                            xml_keys.XML_XF_COLOR_SPEED: '0', 
+                                            xml_keys.XML_XF_SYMMETRY: '0', 
+                                            xml_keys.XML_XF_OPACITY: '1', 
+                                            xml_keys.f3h.XML_HSV: '1', 
+                                            xml_keys.XML_SIZE: '1024'
+                                            }
+
+
+# This is used inside: def xf_list_cleanup(...) and def xf_list_cleanup_str(...)
+# to gather a proper default list of values in case the one from the XML is empty.
+XML_TO_F3H_LIST_DEFAULT_VALS: dict[str, str] = {xml_keys.XML_SIZE: '1024 1024', 
+                                                xml_keys.XML_CENTER: '0 0', 
+                                                xml_keys.f3h.XML_HSV: '1 1 1'
+                                                }
+
+
+# Since we get the folowing keys in a separate action, we exclude them for later variation's names searches to help speed up a little.
+XML_XF_KEY_EXCLUDE: tuple[str, ...] = ( xml_keys.XML_XF_WEIGHT, 
+                                        xml_keys.XML_XF_COLOR, 
+                                        xml_keys.XML_XF_VAR_COLOR, 
+                                        xml_keys.XML_XF_SYMMETRY, 
+                                        xml_keys.XML_XF_COLOR_SPEED, 
+                                        xml_keys.XML_XF_NAME, 
+                                        xml_keys.XML_XF_ANIMATE, # this is being added as it is a Fractorium only XML key and we are not using it in FLAM3H™
+                                        xml_keys.XML_XF_PB, 
+                                        xml_keys.XML_PRE_AFFINE, 
+                                        xml_keys.f3h.XML_PRE_AFFINE, 
+                                        xml_keys.f3h.XML_PRE_AFFINE_ANGLE, 
+                                        xml_keys.XML_POST_AFFINE, 
+                                        xml_keys.f3h.XML_POST_AFFINE, 
+                                        xml_keys.f3h.XML_POST_AFFINE_ANGLE, 
+                                        xml_keys.XML_XF_XAOS, 
+                                        xml_keys.XML_XF_OPACITY
+                                        )
+
+
+# This has been fixed and now radial_blur variation matches all the other apps
+# but I leave it here just in case other variation will need it.
+XML_XF_PRM_EXCEPTION: tuple[str, ...] = ("None",)
+
+
+# This is used as a faster idx lookup table.
+# From the XML's xforms, each variations look itself up inside here to get the corresponding FLAM3H™ var idx it is mapped to.
+# The key names matter and must match the variation's names as known by other apps ( in my case: Apophysis and Fratorium )
+#
 # Note:
 #       Variation name "linear3d" has been added to this dict as it is often used in old Flames and we are remapping it to "linear" on load.
 VARS_FLAM3_DICT_IDX: dict[str, int] = { "linear": 0, 
@@ -14142,187 +15322,1194 @@ VARS_FLAM3_DICT_IDX: dict[str, int] = { "linear": 0,
                                         "point_symmetry": 105
                                         }
 
-# This dictionary for a faster look up table, Fractorium has so many variations!
-# We are using this to check for missing variations coming from the loaded flame file
-# as Fractorium seem to have them all ;) and it is the app I am now comparing against for this data.
-#
-# All of the variations that Fractorium has but FLAM3H™ does not are known as: Missing variations.
-# FLAM3H™ was designed to work in tandem with Fractorium,
-# and it makes an effort to learn as much as it can about everything that Fractorium is capable of, in this case, about all the variations he posses.
-# All of the variations that Fractorium lacks will be categorized as: Unknown variations.
-#
-# If you want an Unknown variation to be recognized by FLAM3H™, add it here inside the corresponding dictionary letter entrie based on its name.
+# This dictionary for a faster look up table, Fractorium has so many variations!
+# We are using this to check for missing variations coming from the loaded flame file
+# as Fractorium seem to have them all ;) and it is the app I am now comparing against for this data.
+#
+# All of the variations that Fractorium has but FLAM3H™ does not are known as: Missing variations.
+# FLAM3H™ was designed to work in tandem with Fractorium,
+# and it makes an effort to learn as much as it can about everything that Fractorium is capable of, in this case, about all the variations he posses.
+# All of the variations that Fractorium lacks will be categorized as: Unknown variations.
+#
+# If you want an Unknown variation to be recognized by FLAM3H™, add it here inside the corresponding dictionary letter entrie based on its name.
+
+VARS_FRACTORIUM_DICT: dict[str, set[str]] = {"a": {"arch", "arcsech", "arcsech2", "arcsinh", "arctanh", "asteria", "auger"},
+                                            "b": {"barycentroid", "bcircle", "bcollide", "bent", "bent2", "bipolar", "bisplit", "blade", "blade3d", "blob", "blob2", "blob3d", "block", "blocky", "blur", "blur_circle", "blur_heart", "blur_linear", "blur_pixelize", "blur_square", "blur_zoom", "blur3d", "bmod", "boarders", "boarders2", "bswirl", "btransform", "bubble", "bubble2", "bubblet3d", "butterfly", "bwraps", "bwraps_rand"},
+                                            "c": {"cardioid", "cell", "checks", "circleblur", "circlecrop", "circlecrop2", "circlelinear", "circlerand", "circlesplit", "circletrans1", "circlize", "circlize2", "circus", "collideoscope", "concentric", "conic", "cos", "cos_wrap", "cosh", "coshq", "cosine", "cosq", "cot", "coth", "coth_spiral", "cothq", "cotq", "cpow", "cpow2", "cpow3", "crackle", "crackle2", "crescents", "crob", "crop", "cropn", "cross", "csc", "csch", "cschq", "cscq", "cubic3d", "cubic_lattice3d", "curl", "curl3d", "curl_sp", "curvature", "curve", "cylinder", "cylinder2"},
+                                            "d": {"delta_a", "depth", "depth_blur", "depth_blur2", "depth_gaussian", "depth_gaussian2", "depth_ngon", "depth_ngon2", "depth_sine", "depth_sine2", "diamond", "disc", "disc2", "disc3d", "dragonfire", "dust","d_spherical"},
+                                            "e": {"eclipse", "ecollide", "edisc", "ejulia", "elliptic", "emod", "emotion", "ennepers", "epispiral", "epush", "erf", "erotate", "escale", "escher", "estiq", "eswirl", "ex", "excinis", "exp", "exp2", "expo", "exponential", "extrude", "eyefish"},
+                                            "f": {"falloff", "falloff2", "falloff3", "fan", "fan2", "farblur", "fdisc", "fibonacci", "fibonacci2", "fisheye", "flatten", "flip_circle", "flip_x", "flip_y", "flower", "flower_db", "flux", "foci", "foci3d", "foci_p", "fourth", "funnel"},
+                                            "g": {"gamma", "gaussian", "gaussian_blur", "gdoffs", "glynnia", "glynnia2", "glynnsim1", "glynnsim2", "glynnsim3", "glynnsim4", "glynnsim5", "gnarly", "gridout"},
+                                            "h": {"handkerchief", "heart", "heat", "helicoid", "helix", "hemisphere", "henon", "hexaplay3d", "hexcrop", "hexes", "hexnix3d", "hex_modulus", "hex_rand", "hex_truchet", "ho", "hole", "horseshoe", "hyperbolic", "hypercrop", "hypershift", "hypershift2", "hypertile", "hypertile1", "hypertile2", "hypertile3d", "hypertile3d1", "hypertile3d2"},
+                                            "i": {"idisc", "inkdrop", "interference2"},
+                                            "j": {"jac_cn", "jac_dn", "jac_sn", "julia", "julia3d", "julia3dq", "julia3dz", "juliac", "julian", "julian2", "julian3dx", "julianab", "juliaq", "juliascope"}, 
+                                            "k": {"kaleidoscope"},
+                                            "l": {"lazyjess", "lazysusan", "lazy_travis", "lens", "line", "linear", "linear_t", "linear_t3d", "linear_xz", "linear_yz", "linear3d", "lissajous", "log", "log_db", "loq", "loonie", "loonie2", "loonie3", "loonie3d", "lozi"},
+                                            "m": {"mask", "mcarpet", "mirror_x", "mirror_y", "mirror_z", "mobiq", "mobius", "mobius_strip", "mobiusn", "modulus", "modulusx", "modulusy", "murl", "murl2"},
+                                            "n": {"nblur", "ngon", "noise", "npolar"},
+                                            "o": {"octagon", "octapol", "ortho", "oscilloscope", "oscilloscope2", "ovoid", "ovoid3d"},
+                                            "p": {"panorama1", "panorama2", "parabola", "pdj", "perspective", "petal", "phoenix_julia", "pie", "pie3d", "pixel_flow", "poincare", "poincare2", "poincare3d", "point_symmetry", "polar", "polar2", "polynomial", "popcorn", "popcorn2", "popcorn23d", "pow_block", "power", "pressure_wave", "projective", "prose3d", "psphere", "pulse"},
+                                            "q": {"q_ode"},
+                                            "r": {"radial_blur", "radial_gaussian", "rand_cubes", "rational3", "rays", "rays1", "rays2", "rays3", "rblur", "rectangles", "rings", "rings2", "ripple", "rippled", "rotate", "rotate_x", "rotate_y", "rotate_z", "roundspher", "roundspher3d"},
+                                            "s": {"scry", "scry2", "scry3d", "sec", "secant2", "sech", "sechq", "secq", "separation", "shift", "shred_rad", "shredrad", "shred_lin", "shredlin", "sigmoid", "sin", "sineblur", "sinh", "sinhq", "sinq", "sintrange", "sinus_grid", "sinusoidal", "sinusoidal3d", "smartshape", "smartcrop", "spher", "sphereblur", "spherical", "spherical3d", "sphericaln", "spherivoid", "sphyp3d", "spiral", "spiral_wing", "spiralwing", "splitbrdr",  "spirograph", "split", "split_brdr", "splits", "splits3d", "square", "squares", "square3d", "squarize", "squirrel", "squish", "sschecks", "starblur", "starblur2", "stripes", "stwin", "super_shape", "super_shape3d","svf", "swirl", "swirl3", "swirl3r", "synth"},
+                                            "t": {"tan", "tancos", "tangent", "tanh", "tanhq", "tanh_spiral", "tanq", "target", "target0", "target2", "taurus", "tile_hlp", "tile_log", "trade", "truchet", "truchet_fill", "truchet_hex_fill", "truchet_hex_crop", "truchet_glyph", "truchet_inv", "truchet_knot", "twintrian", "twoface"},
+                                            "u": {"unicorngaloshen", "unpolar"},
+                                            "v": {"vibration", "vibration2", "vignette", "voron"},
+                                            "w": {"w", "waffle", "waves", "waves2", "waves22", "waves23", "waves23d", "waves2b", "waves2_radial", "waves3", "waves4", "waves42", "wavesn", "wdisc", "wedge", "wedge_julia", "wedge_sph", "whorl"},
+                                            "x": {"x", "xerf", "xheart", "xtrb"},
+                                            "y": {"y"},
+                                            "z": {"z", "zblur", "zcone", "zscale","ztranslate"}
+                                            }
+
+
+class flam3h_varsPRM_APO:
+    
+    '''
+    The following parameters matches the Apophysis/Fractorium parameter's names,
+    so no need to regex for now as the strings names are matching already.
+    
+    There are a few exceptions so far witch I handled simply for now, but it work.
+    
+    They are grouped as follow and based on the FLAM3H™ node parametric parameters:
+    
+    for generic variation:
+    ("variation name", bool: (parametric or not parametric)),
+    
+    for parametric variation:
+    ("variation name", (prm_1, ..., prm_4), (prm_1, ..., prm_4), bool: (parametric or not parametric)),
+    
+    -> (prm_1, ..., prm_4) accept a max of 4 entries (hou.Vector4) and based on the number of parameters
+    they are then automatically converted to the expeted v_type using the function: 
+    in_flame_utils.in_util_typemaker(data: list) -> TA_TypeMaker:
+    
+    The (("variation_name") entrie, is not used here and only for reference.
+    '''
+    
+    __slots__ = ("varsPRM", "varsPRM_FRACTORIUM_EXCEPTIONS")
+    
+    def __init__(self) -> None:
+        
+        self.varsPRM: tuple[tuple, ...] = ( ("linear", 0), 
+                                            ("sinusoidal", 0), 
+                                            ("spherical", 0), 
+                                            ("swirl", 0), 
+                                            ("horseshoe", 0), 
+                                            ("polar", 0), 
+                                            ("handkerchief", 0), 
+                                            ("heart", 0), 
+                                            ("disc", 0), 
+                                            ("spiral", 0), 
+                                            ("hyperbolic", 0), 
+                                            ("diamond", 0), 
+                                            ("ex", 0), 
+                                            ("julia", 0), 
+                                            ("bent", 0), 
+                                            ("waves", 0), 
+                                            ("fisheye", 0), 
+                                            ("popcorn", 0), 
+                                            ("exponential", 0), 
+                                            ("power", 0), 
+                                            ("cosine", 0), 
+                                            ("rings", 0), 
+                                            ("fan", 0), 
+                                            ("bubble", 0), 
+                                            ("cylinder", 0), 
+                                            ("eyefish", 0), 
+                                            ("blur", 0), 
+                                            ("curl", ("curl_c1", "curl_c2"), 1), 
+                                            ("ngon", ("ngon_power", "ngon_sides", "ngon_corners", "ngon_circle"), 1), 
+                                            ("pdj", ("pdj_a", "pdj_b", "pdj_c", "pdj_d"), 1), 
+                                            ("blob", ("blob_low", "blob_high", "blob_waves"), 1), 
+                                            ("juliaN", ("julian_power", "julian_dist"), 1), 
+                                            ("juliascope", ("juliascope_power", "juliascope_dist"), 1), 
+                                            ("gaussian_blur", 0), 
+                                            ("fan2", ("fan2_x", "fan2_y"), 1), 
+                                            ("rings2", ("rings2_val",), 1), 
+                                            ("rectangles", ("rectangles_x", "rectangles_y"), 1), 
+                                            ("radial_blur", ("radial_blur_angle",), 1), 
+                                            ("pie", ("pie_slices", "pie_thickness", "pie_rotation"), 1), 
+                                            ("arch", 0), 
+                                            ("tangent", 0), 
+                                            ("square", 0), 
+                                            ("rays", 0), 
+                                            ("blade", 0), 
+                                            ("secant2", 0), 
+                                            ("twintrian", 0), 
+                                            ("cross", 0), 
+                                            ("disc2", ("disc2_rot", "disc2_twist"), 1), 
+                                            ("supershape", ("super_shape_m", "super_shape_rnd", "super_shape_holes"), ("super_shape_n1", "super_shape_n2", "super_shape_n3"), 1), 
+                                            ("flower", ("flower_petals", "flower_holes"), 1), 
+                                            ("conic", ("conic_eccentricity", "conic_holes"), 1), 
+                                            ("parabola", ("parabola_height", "parabola_width"), 1), 
+                                            ("bent2", ("bent2_x", "bent2_y"), 1), 
+                                            ("bipolar", ("bipolar_shift",), 1),
+                                            ("boarders", 0),
+                                            ("butterfly", 0), 
+                                            ("cell", ("cell_size",), 1), 
+                                            ("cpow", ("cpow_power", "cpow_r", "cpow_i"), 1), 
+                                            ("edisc", 0), 
+                                            ("elliptic", 0), 
+                                            ("noise", 0), 
+                                            ("escher", ("escher_beta",), 1), 
+                                            ("foci", 0), 
+                                            ("lazysusan", ("lazysusan_x", "lazysusan_y"), ("lazysusan_spin", "lazysusan_twist", "lazysusan_space"), 1), 
+                                            ("loonie", 0), 
+                                            ("pre blur", 0), 
+                                            ("modulus", ("modulus_x", "modulus_y"), 1), 
+                                            ("oscilloscope", ("oscope_frequency", "oscope_amplitude", "oscope_damping", "oscope_separation"), 1), 
+                                            ("polar2", 0), 
+                                            ("popcorn2", ("popcorn2_x", "popcorn2_y"), ("popcorn2_c",), 1), 
+                                            ("scry", 0), 
+                                            ("separation", ("separation_x", "separation_y"), ("separation_xinside", "separation_yinside"), 1), 
+                                            ("split", ("split_xsize", "split_ysize"), 1), 
+                                            ("splits", ("splits_x", "splits_y"), 1), 
+                                            ("stripes", ("stripes_space", "stripes_warp"), 1), 
+                                            ("wedge", ("wedge_swirl", "wedge_angle", "wedge_hole", "wedge_count",), 1), 
+                                            ("wedge_julia", ("wedge_julia_power", "wedge_julia_angle", "wedge_julia_dist", "wedge_julia_count"), 1), 
+                                            ("wedge_sph", ("wedge_sph_swirl", "wedge_sph_angle", "wedge_sph_hole", "wedge_sph_count"), 1), 
+                                            ("whorl", ("whorl_inside", "whorl_outside"), 1), 
+                                            ("waves2", ("waves2_scalex", "waves2_scaley"), ("waves2_freqx", "waves2_freqy"), 1), 
+                                            ("exp", 0), 
+                                            ("log", 0), 
+                                            ("sin", 0), 
+                                            ("cos", 0), 
+                                            ("tan", 0), 
+                                            ("sec", 0), 
+                                            ("csc", 0), 
+                                            ("cot", 0), 
+                                            ("sinh", 0), 
+                                            ("cosh", 0), 
+                                            ("tanh", 0), 
+                                            ("sech", 0), 
+                                            ("csch", 0), 
+                                            ("coth", 0), 
+                                            ("auger", ("auger_freq", "auger_scale", "auger_sym", "auger_weight"), 1), 
+                                            ("flux", ("flux_spread",), 1), 
+                                            ("mobius", ("Re_A", "Re_B", "Re_C", "Re_D"), ("Im_A", "Im_B", "Im_C", "Im_D"), 1),
+                                            ("curve", ("curve_xlength", "curve_ylength"), ("curve_xamp", "curve_yamp"), 1), 
+                                            ("persp", ("perspective_angle", "perspective_dist"), 1), 
+                                            ("bwraps", ("bwraps_cellsize", "bwraps_space", "bwraps_gain"), ("bwraps_inner_twist", "bwraps_outer_twist"), 1), 
+                                            ("hemisphere", 0), 
+                                            ("polynomial", ("polynomial_powx", "polynomial_powy"), ("polynomial_lcx", "polynomial_lcy"), ("polynomial_scx", "polynomial_scy"), 1),
+                                            ("crop", ("crop_left", "crop_top", "crop_right", "crop_bottom"), ("crop_scatter_area", "crop_zero"), 1), 
+                                            ("unpolar", 0), 
+                                            ("glynnia", 0), 
+                                            ("point_symmetry", ("point_symmetry_order", "point_symmetry_centre_x", "point_symmetry_centre_y"), 1)
+                                        )
+
 
-VARS_FRACTORIUM_DICT: dict[str, set[str]] = {"a": {"arch", "arcsech", "arcsech2", "arcsinh", "arctanh", "asteria", "auger"},
-                                            "b": {"barycentroid", "bcircle", "bcollide", "bent", "bent2", "bipolar", "bisplit", "blade", "blade3d", "blob", "blob2", "blob3d", "block", "blocky", "blur", "blur_circle", "blur_heart", "blur_linear", "blur_pixelize", "blur_square", "blur_zoom", "blur3d", "bmod", "boarders", "boarders2", "bswirl", "btransform", "bubble", "bubble2", "bubblet3d", "butterfly", "bwraps", "bwraps_rand"},
-                                            "c": {"cardioid", "cell", "checks", "circleblur", "circlecrop", "circlecrop2", "circlelinear", "circlerand", "circlesplit", "circletrans1", "circlize", "circlize2", "circus", "collideoscope", "concentric", "conic", "cos", "cos_wrap", "cosh", "coshq", "cosine", "cosq", "cot", "coth", "coth_spiral", "cothq", "cotq", "cpow", "cpow2", "cpow3", "crackle", "crackle2", "crescents", "crob", "crop", "cropn", "cross", "csc", "csch", "cschq", "cscq", "cubic3d", "cubic_lattice3d", "curl", "curl3d", "curl_sp", "curvature", "curve", "cylinder", "cylinder2"},
-                                            "d": {"delta_a", "depth", "depth_blur", "depth_blur2", "depth_gaussian", "depth_gaussian2", "depth_ngon", "depth_ngon2", "depth_sine", "depth_sine2", "diamond", "disc", "disc2", "disc3d", "dragonfire", "dust","d_spherical"},
-                                            "e": {"eclipse", "ecollide", "edisc", "ejulia", "elliptic", "emod", "emotion", "ennepers", "epispiral", "epush", "erf", "erotate", "escale", "escher", "estiq", "eswirl", "ex", "excinis", "exp", "exp2", "expo", "exponential", "extrude", "eyefish"},
-                                            "f": {"falloff", "falloff2", "falloff3", "fan", "fan2", "farblur", "fdisc", "fibonacci", "fibonacci2", "fisheye", "flatten", "flip_circle", "flip_x", "flip_y", "flower", "flower_db", "flux", "foci", "foci3d", "foci_p", "fourth", "funnel"},
-                                            "g": {"gamma", "gaussian", "gaussian_blur", "gdoffs", "glynnia", "glynnia2", "glynnsim1", "glynnsim2", "glynnsim3", "glynnsim4", "glynnsim5", "gnarly", "gridout"},
-                                            "h": {"handkerchief", "heart", "heat", "helicoid", "helix", "hemisphere", "henon", "hexaplay3d", "hexcrop", "hexes", "hexnix3d", "hex_modulus", "hex_rand", "hex_truchet", "ho", "hole", "horseshoe", "hyperbolic", "hypercrop", "hypershift", "hypershift2", "hypertile", "hypertile1", "hypertile2", "hypertile3d", "hypertile3d1", "hypertile3d2"},
-                                            "i": {"idisc", "inkdrop", "interference2"},
-                                            "j": {"jac_cn", "jac_dn", "jac_sn", "julia", "julia3d", "julia3dq", "julia3dz", "juliac", "julian", "julian2", "julian3dx", "julianab", "juliaq", "juliascope"}, 
-                                            "k": {"kaleidoscope"},
-                                            "l": {"lazyjess", "lazysusan", "lazy_travis", "lens", "line", "linear", "linear_t", "linear_t3d", "linear_xz", "linear_yz", "linear3d", "lissajous", "log", "log_db", "loq", "loonie", "loonie2", "loonie3", "loonie3d", "lozi"},
-                                            "m": {"mask", "mcarpet", "mirror_x", "mirror_y", "mirror_z", "mobiq", "mobius", "mobius_strip", "mobiusn", "modulus", "modulusx", "modulusy", "murl", "murl2"},
-                                            "n": {"nblur", "ngon", "noise", "npolar"},
-                                            "o": {"octagon", "octapol", "ortho", "oscilloscope", "oscilloscope2", "ovoid", "ovoid3d"},
-                                            "p": {"panorama1", "panorama2", "parabola", "pdj", "perspective", "petal", "phoenix_julia", "pie", "pie3d", "pixel_flow", "poincare", "poincare2", "poincare3d", "point_symmetry", "polar", "polar2", "polynomial", "popcorn", "popcorn2", "popcorn23d", "pow_block", "power", "pressure_wave", "projective", "prose3d", "psphere", "pulse"},
-                                            "q": {"q_ode"},
-                                            "r": {"radial_blur", "radial_gaussian", "rand_cubes", "rational3", "rays", "rays1", "rays2", "rays3", "rblur", "rectangles", "rings", "rings2", "ripple", "rippled", "rotate", "rotate_x", "rotate_y", "rotate_z", "roundspher", "roundspher3d"},
-                                            "s": {"scry", "scry2", "scry3d", "sec", "secant2", "sech", "sechq", "secq", "separation", "shift", "shred_rad", "shredrad", "shred_lin", "shredlin", "sigmoid", "sin", "sineblur", "sinh", "sinhq", "sinq", "sintrange", "sinus_grid", "sinusoidal", "sinusoidal3d", "smartshape", "smartcrop", "spher", "sphereblur", "spherical", "spherical3d", "sphericaln", "spherivoid", "sphyp3d", "spiral", "spiral_wing", "spiralwing", "splitbrdr",  "spirograph", "split", "split_brdr", "splits", "splits3d", "square", "squares", "square3d", "squarize", "squirrel", "squish", "sschecks", "starblur", "starblur2", "stripes", "stwin", "super_shape", "super_shape3d","svf", "swirl", "swirl3", "swirl3r", "synth"},
-                                            "t": {"tan", "tancos", "tangent", "tanh", "tanhq", "tanh_spiral", "tanq", "target", "target0", "target2", "taurus", "tile_hlp", "tile_log", "trade", "truchet", "truchet_fill", "truchet_hex_fill", "truchet_hex_crop", "truchet_glyph", "truchet_inv", "truchet_knot", "twintrian", "twoface"},
-                                            "u": {"unicorngaloshen", "unpolar"},
-                                            "v": {"vibration", "vibration2", "vignette", "voron"},
-                                            "w": {"w", "waffle", "waves", "waves2", "waves22", "waves23", "waves23d", "waves2b", "waves2_radial", "waves3", "waves4", "waves42", "wavesn", "wdisc", "wedge", "wedge_julia", "wedge_sph", "whorl"},
-                                            "x": {"x", "xerf", "xheart", "xtrb"},
-                                            "y": {"y"},
-                                            "z": {"z", "zblur", "zcone", "zscale","ztranslate"}
-                                            }
+        # EXCEPTIONS: so I dnt go into regex...
+        # Update this and def in_prm_name_exceptions() if you add/find more
+        self.varsPRM_FRACTORIUM_EXCEPTIONS: dict[int, tuple] = {67: ("oscilloscope", ("oscilloscope_frequency", "oscilloscope_amplitude", "oscilloscope_damping", "oscilloscope_separation"), 1),
+                                                                96: ("Mobius", ("Mobius_Re_A", "Mobius_Re_B", "Mobius_Re_C", "Mobius_Re_D"), ("Mobius_Im_A", "Mobius_Im_B", "Mobius_Im_C", "Mobius_Im_D"), 1)
+                                                                }
 
 
-class flam3h_varsPRM_APO:
+# FLAM3H™ FLAME MODEL start here
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+
+
+class flame_model:
+    """
+class flame_model
+
+@STATICMETHODS
+* palette_decode(palette_hex: str, msg: str = 'Invalid hex values in the loaded Flame palette.', verbose: bool = True) -> NDArray[np_float32] | None:
+* affine_decode(affine: list[float], key: str = '', mp_idx: int | None = None, type: int = 0, verbose: bool = True) -> list[tuple[float, ...]] | list[Never]:
+* affines_array(xforms: tuple[dict[str, str], ...], key: str, type: int = 0, verbose: bool = True) -> NDArray[np_float64] | None:
+* affines_stack(affines: tuple[tuple[tuple[float, ...], ...] | list[Never], ...] | None) -> NDArray[np_float64] | None:
+* from_data(xforms: tuple[dict[str, str], ...], finalxform: dict[str, str] | None, affines: tuple[dict[str, tuple | None], dict[str, tuple | None]], palette: tuple[NDArray[np_float32], str] | None, name: str = '', version: str = '', plugins: str = '') -> flame_model:
+* warnings_out() -> TextIO:
+
+    """
+    
+    # Per thread, where the warnings found while decoding a flame preset are printed out to: flame_model.warnings_out()
+    WARNINGS: Final[local] = local()
+    
+    __slots__ = ("_name", "_version", "_plugins", "_xforms", "_finalxform", "_coefs", "_post", "_finalxform_coefs", "_finalxform_post", "_palette", "_palette_format")
+    
+    def __init__(self, flame: lxmlET._Element, verbose: bool = True) -> None:
+        """The data of a flame preset as plain python and NumPy types only: no Houdini types are used</br>
+        so the parsing can run in worker processes and outside Houdini.</br>
+        The Houdini types are built out of it by: flame_model_hou</br></br>
+        
+        * The xforms are the raw XML key/value pairs.
+        * The affines are (N, 3, 2) arrays: ((X.x, X.y), (Y.x, Y.y), (O.x, O.y)) for each xform.
+        * The palette is a (N, 3) array of RGB color values normalized to 0-1.
+
+        Args:
+            (self):
+            flame(lxmlET._Element): The flame preset XML element.
+            verbose(bool): Default to: True</br>Print out the warnings about the invalid values found while decoding the flame preset.</br>Set it to False when the flame preset has already been decoded by: in_flame_iter_data so they are not printed out twice.
+        """
+        self._name: str = str(flame.get(xml_keys.XML_XF_NAME, ''))
+        self._version: str = str(flame.get(xml_keys.XML_VERSION, ''))
+        self._plugins: str = str(flame.get(xml_keys.XML_PLUGINS, ''))
+        self._xforms: tuple[dict[str, str], ...] = tuple(dict(xf.attrib) for xf in flame.iter(xml_keys.XML_XF))
+        finalxform: lxmlET._Element | None = flame.find(xml_keys.XML_FF)
+        self._finalxform: dict[str, str] | None = dict(finalxform.attrib) if finalxform is not None else None
+        
+        self._coefs: NDArray[np_float64] | None = self.affines_array(self._xforms, xml_keys.XML_PRE_AFFINE, 0, verbose)
+        self._post: NDArray[np_float64] | None = self.affines_array(self._xforms, xml_keys.XML_POST_AFFINE, 0, verbose)
+        if self._finalxform is not None:
+            ff_coefs: NDArray[np_float64] | None = self.affines_array((self._finalxform,), xml_keys.XML_PRE_AFFINE, 1, verbose)
+            ff_post: NDArray[np_float64] | None = self.affines_array((self._finalxform,), xml_keys.XML_POST_AFFINE, 1, verbose)
+            self._finalxform_coefs: NDArray[np_float64] | None = ff_coefs[0] if ff_coefs is not None else None
+            self._finalxform_post: NDArray[np_float64] | None = ff_post[0] if ff_post is not None else None
+        else:
+            self._finalxform_coefs: NDArray[np_float64] | None = None
+            self._finalxform_post: NDArray[np_float64] | None = None
+        
+        palette: lxmlET._Element | None = flame.find(xml_keys.XML_PALETTE)
+        if palette is not None and palette.text:
+            self._palette: NDArray[np_float32] | None = self.palette_decode(palette.text, verbose=verbose)
+            self._palette_format: str = str(palette.get(xml_keys.XML_PALETTE_FORMAT))
+        else:
+            self._palette: NDArray[np_float32] | None = None
+            self._palette_format: str = str(None)
+            
+            
+    @staticmethod
+    def warnings_out() -> TextIO:
+        """Get where to print out the warnings found while decoding a flame preset.</br>
+        It is the current sys.stdout, unless the calling thread set a buffer into: flame_model.WARNINGS.out</br>
+        so a worker thread can collect them to be printed out later without replacing sys.stdout for everyone else: in_flame_prefetch(...)</br>
+
+        Returns:
+            (TextIO): The calling thread warnings buffer if any, otherwise the current sys.stdout.
+        """
+        out: TextIO | None = getattr(flame_model.WARNINGS, 'out', None)
+        return out if out is not None else sys.stdout
+    
+    
+    @staticmethod
+    def palette_decode(palette_hex: str, msg: str = 'Invalid hex values in the loaded Flame palette.', verbose: bool = True) -> NDArray[np_float32] | None:
+        """Decode the HEX color values of a flame preset palette.</br>
+        Big palettes (256+ colors) are decoded all at once, one HEX color value at a time only as a fallback.</br>
+
+        Args:
+            palette_hex(str): The flame preset XML palette text.
+            msg(str): Default to: 'Invalid hex values in the loaded Flame palette.'</br>The extra info to print out if the HEX color values are not valid.
+            verbose(bool): Default to: True</br>Print out the error if the HEX color values are not valid.
+
+        Returns:
+            (NDArray[np_float32] | None): A (N, 3) array of RGB color values normalized to 0-1 or None if something went wrong.
+        """
+        all_lines: list[str] = [line.replace(" ", "") for line in palette_hex.splitlines()]
+        _len: Callable[[str], int] = len
+        
+        # Each line is decoded in chunks of 6 characters so this is possible only if no line has any leftover.
+        clean_lines: list[str] = [clean for line in all_lines if _len(clean := line.strip()) > 1]
+        if all(not _len(clean) % 6 for clean in clean_lines):
+            RGBs_bulk: NDArray[np_float32] | None = flam3h_palette_utils.hex_to_rgb_array(''.join(clean_lines))
+            if RGBs_bulk is not None:
+                return RGBs_bulk if len(RGBs_bulk) else None
+        
+        HEXs: list[str] = [h for line in all_lines if (clean := i_cleandoc(line)) and _len(clean) > 1 for h in wrap(clean, 6)]
+        
+        try:
+            _hex_to_rgb: Callable[[str], tuple] = flam3h_palette_utils.hex_to_rgb
+            RGBs: list[list[int]] = [list(map(abs, _hex_to_rgb(hex))) for hex in HEXs]
+            
+        except ValueError as e:
+            if verbose: F3H_Exception.F3H_traceback_print_infos(e, extra_info=msg, out=flame_model.warnings_out())
+            return None
+        
+        if not RGBs:
+            return None
+        
+        # Convert to NumPy array and normalize
+        RGBs_array: NDArray[np_float32] = np_array(RGBs[:len(HEXs)], dtype=np_float32)
+        return RGBs_array / 255.0
+    
+    
+    @staticmethod
+    def affine_decode(affine: list[float], key: str = '', mp_idx: int | None = None, type: int = 0, verbose: bool = True) -> list[tuple[float, ...]] | list[Never]:
+        """Build proper affine values composed of (x, y) tuples.</br>
+        It will also check the affine passed in and provide an alternative defaults affine values</br>
+        if not correct and print out messages to inform the user about different cases.</br>
+        
+        Args:
+            affine(list[float]): values from the xml
+            key(str): Default to: ''</br>The type of affine to build: xml_keys.XML_PRE_AFFINE, xml_keys.XML_POST_AFFINE, xml_keys.f3h.XML_PRE_AFFINE, xml_keys.f3h.XML_POST_AFFINE
+            mp_idx(int | None): Default to: None</br>Multi parameter index, for messaging purpose only.
+            type(int): Default to: 0(Zero)</br>It is either an iterator: 0 or an FF: 1
+            verbose(bool): Default to: True</br>Print out the messages or not.
+
+        Returns:
+            (list[tuple[float, ...]]): a list of tuples: ((X.x, X.y), (Y.x, Y.y), (O.x, O.y)) / ((A, D), (B, E), (C, F)), or an empty list if something is wrong
+        """
+        affine_count: int = len(affine)
+        if affine_count == 6:
+            return [tuple(affine[i:i + 2]) for i in (0, 2, 4)]
+        
+        if verbose: print(datetime.now().strftime('%b-%d-%Y %H:%M:%S'), file=flame_model.warnings_out())
+        
+        sel: dict[str, str] = {xml_keys.XML_PRE_AFFINE: f"Pre affine", xml_keys.XML_POST_AFFINE: f"Post affine", xml_keys.f3h.XML_PRE_AFFINE: f"F3H Pre affine", xml_keys.f3h.XML_POST_AFFINE: f"F3H Post affine"}
+        sel_key: str | None = sel.get(key)
+        
+        # Is it an iterator or an FF or None ?
+        iter_type: int | str | None = None
+        if mp_idx is not None:
+            
+            match type:
+                
+                case 0:
+                    iter_type = mp_idx
+                    
+                case 1:
+                    iter_type = 'FF'
+                    
+                case _:
+                    iter_type = None
+        
+        if key in [xml_keys.XML_PRE_AFFINE, xml_keys.XML_POST_AFFINE]:
+            if affine_count == 0:
+                if iter_type is not None:
+                    _MSG: str = f"\t{sel_key} on iterator.{iter_type}, have no affine values. Expeted are: 6\n\t:Reverted back to default affine values."
+                
+                else:
+                    _MSG: str = f"\t{sel_key} have {affine_count} values. Expeted are: 6\n\t:Reverted back to default affine values."
+                
+                if verbose: print(f"{_MSG}\n", file=flame_model.warnings_out())
+                
+                return [tuple( f3h_affineDefaults.DEFAULT_IDENT[i:i + 2] ) for i in (0, 2, 4)]
+            
+            if iter_type is not None:
+                _MSG: str = f"\t{sel_key} on iterator.{iter_type}, have {affine_count} values. Expeted are: 6\n\t:Using 0.0(Zeros) for missing affine values."
+            
+            else:
+                _MSG: str = f"\t{sel_key} have {affine_count} values. Expeted are: 6\n\t:Using 0.0(Zeros) for missing affine values."
+            
+            if verbose: print(f"{_MSG}\n", file=flame_model.warnings_out())
+            
+            return [tuple( np_pad(affine, (0, 6-min(6, affine_count)), 'constant', constant_values = 0).tolist()[i:i + 2] ) for i in (0, 2, 4)]
+        
+        if sel_key is not None:
+            if iter_type is not None:
+                _MSG: str = f"\t{sel_key} on iterator.{iter_type}, have {affine_count} values. Expeted are: 6\n\t:Skipped"
+                if verbose: print(f"{_MSG}\n", file=flame_model.warnings_out())
+                
+            else:
+                _MSG: str = f"\t{sel_key} have {affine_count} values. Expeted are: 6\n\t:Skipped"
+                if verbose: print(f"{_MSG}\n", file=flame_model.warnings_out())
+                
+        return []
+    
+    
+    @staticmethod
+    def affines_array(xforms: tuple[dict[str, str], ...], key: str, type: int = 0, verbose: bool = True) -> NDArray[np_float64] | None:
+        """Collect one affine type out of all the xforms into a single array.</br>
+        The xforms missing the affine get the identity affine.</br>
+
+        Args:
+            xforms(tuple[dict[str, str], ...]): The xforms raw XML key/value pairs.
+            key(str): The type of affine to collect: xml_keys.XML_PRE_AFFINE, xml_keys.XML_POST_AFFINE, xml_keys.f3h.XML_PRE_AFFINE, xml_keys.f3h.XML_POST_AFFINE
+            type(int): Default to: 0(Zero)</br>It is either an iterator: 0 or an FF: 1
+            verbose(bool): Default to: True</br>Print out the warnings about the invalid affine values or not.
+
+        Returns:
+            (NDArray[np_float64] | None): A (N, 3, 2) array of affines or None if none of the xforms have this affine.
+        """
+        _xf_list_cleanup: Callable[[list[str], str, str | None, bool], list[str]] = in_flame.xf_list_cleanup
+        ident: list[tuple[float, ...]] = [tuple(f3h_affineDefaults.DEFAULT_IDENT[i:i + 2]) for i in (0, 2, 4)]
+        affines: list[list[tuple[float, ...]] | list[Never]] = []
+        found: bool = False
+        for idx, xform in enumerate(xforms):
+            keyval: str | None = xform.get(key)
+            if keyval is not None:
+                affine: list[tuple[float, ...]] | list[Never] = flame_model.affine_decode([float(x) for x in _xf_list_cleanup(str(keyval).split(), '0', key, verbose)], key, idx + 1, type, verbose)
+                if affine:
+                    affines.append(affine)
+                    found = True
+                    continue
+            affines.append(ident)
+            
+        return np_array(affines, dtype=np_float64).reshape(-1, 3, 2) if found else None
+    
+    
+    @staticmethod
+    def affines_stack(affines: tuple[tuple[tuple[float, ...], ...] | list[Never], ...] | None) -> NDArray[np_float64] | None:
+        """Collect one affine type out of all the xforms, already decoded by: flame_model.affine_decode(...), into a single array.</br>
+        The xforms missing the affine get the identity affine, the same as: flame_model.affines_array(...)</br>
+
+        Args:
+            affines(tuple[tuple[tuple[float, ...], ...] | list[Never], ...] | None): One affine for each xform, an empty list if the xform does not have it, as in the: in_flame_iter_data affines columns.
+
+        Returns:
+            (NDArray[np_float64] | None): A (N, 3, 2) array of affines or None if none of the xforms have this affine.
+        """
+        if affines is None or not any(affines):
+            return None
+        ident: list[tuple[float, ...]] = [tuple(f3h_affineDefaults.DEFAULT_IDENT[i:i + 2]) for i in (0, 2, 4)]
+        return np_array([affine if affine else ident for affine in affines], dtype=np_float64).reshape(-1, 3, 2)
+    
+    
+    @staticmethod
+    def from_data(xforms: tuple[dict[str, str], ...], 
+                  finalxform: dict[str, str] | None, 
+                  affines: tuple[dict[str, tuple | None], dict[str, tuple | None]], 
+                  palette: tuple[NDArray[np_float32], str] | None, 
+                  name: str = '', 
+                  version: str = '', 
+                  plugins: str = ''
+                  ) -> flame_model:
+        """Build the data model of a flame preset out of its already decoded data instead of its XML element,</br>
+        so the affines and the palette are not decoded again. This is what: in_flame_iter_data.flame_model_from_data() use.</br>
+
+        Args:
+            xforms(tuple[dict[str, str], ...]): The xforms raw XML key/value pairs.
+            finalxform(dict[str, str] | None): The FF raw XML key/value pairs or None if the flame preset does not have one.
+            affines(tuple[dict[str, tuple | None], dict[str, tuple | None]]): The xforms and the FF decoded data columns, the affines are read from them.
+            palette(tuple[NDArray[np_float32], str] | None): The decoded palette RGB colors and its format or None if the flame preset does not have a valid one.
+            name(str): Default to: ''</br>The flame preset name.
+            version(str): Default to: ''</br>The software version the flame preset has been saved with.
+            plugins(str): Default to: ''</br>The flame preset plugins.
+
+        Returns:
+            (flame_model): The flame preset data model.
+        """
+        model: flame_model = flame_model.__new__(flame_model)
+        model._name = name
+        model._version = version
+        model._plugins = plugins
+        model._xforms = xforms
+        model._finalxform = finalxform
+        
+        xforms_data, finalxform_data = affines
+        model._coefs = flame_model.affines_stack(xforms_data.get(xml_keys.XML_PRE_AFFINE))
+        model._post = flame_model.affines_stack(xforms_data.get(xml_keys.XML_POST_AFFINE))
+        ff_coefs: NDArray[np_float64] | None = flame_model.affines_stack(finalxform_data.get(xml_keys.XML_PRE_AFFINE)) if finalxform is not None else None
+        ff_post: NDArray[np_float64] | None = flame_model.affines_stack(finalxform_data.get(xml_keys.XML_POST_AFFINE)) if finalxform is not None else None
+        model._finalxform_coefs = ff_coefs[0] if ff_coefs is not None else None
+        model._finalxform_post = ff_post[0] if ff_post is not None else None
+        
+        model._palette, model._palette_format = palette if palette is not None else (None, str(None))
+        return model
+    
+    
+    # CLASS: PROPERTIES
+    ##########################################
+    ##########################################
+    
+    @property
+    def name(self) -> str:
+        return self._name
     
-    '''
-    The following parameters matches the Apophysis/Fractorium parameter's names,
-    so no need to regex for now as the strings names are matching already.
+    @property
+    def version(self) -> str:
+        return self._version
     
-    There are a few exceptions so far witch I handled simply for now, but it work.
+    @property
+    def plugins(self) -> str:
+        return self._plugins
     
-    They are grouped as follow and based on the FLAM3H™ node parametric parameters:
+    @property
+    def xforms(self) -> tuple[dict[str, str], ...]:
+        return self._xforms
     
-    for generic variation:
-    ("variation name", bool: (parametric or not parametric)),
+    @property
+    def finalxform(self) -> dict[str, str] | None:
+        return self._finalxform
     
-    for parametric variation:
-    ("variation name", (prm_1, ..., prm_4), (prm_1, ..., prm_4), bool: (parametric or not parametric)),
+    @property
+    def coefs(self) -> NDArray[np_float64] | None:
+        return self._coefs
     
-    -> (prm_1, ..., prm_4) accept a max of 4 entries (hou.Vector4) and based on the number of parameters
-    they are then automatically converted to the expeted v_type using the function: 
-    in_flame_utils.in_util_typemaker(data: list) -> TA_TypeMaker:
+    @property
+    def post(self) -> NDArray[np_float64] | None:
+        return self._post
     
-    The (("variation_name") entrie, is not used here and only for reference.
-    '''
+    @property
+    def finalxform_coefs(self) -> NDArray[np_float64] | None:
+        return self._finalxform_coefs
     
-    __slots__ = ("varsPRM", "varsPRM_FRACTORIUM_EXCEPTIONS")
+    @property
+    def finalxform_post(self) -> NDArray[np_float64] | None:
+        return self._finalxform_post
     
-    def __init__(self) -> None:
+    @property
+    def palette(self) -> NDArray[np_float32] | None:
+        return self._palette
+    
+    @property
+    def palette_format(self) -> str:
+        return self._palette_format
+
+
+
+class flame_model_hou:
+    """
+class flame_model_hou
+
+@STATICMETHODS
+* ramp(rgb: NDArray[np_float32] | NDArray[np_float64]) -> hou.Ramp:
+* affine(affine: Iterable[Iterable[float]]) -> list[hou.Vector2]:
+* affines(affines: NDArray[np_float64] | None) -> tuple[tuple[hou.Vector2, ...], ...] | None:
+
+    """
+    
+    __slots__ = ()
+    
+    @staticmethod
+    def ramp(rgb: NDArray[np_float32] | NDArray[np_float64]) -> hou.Ramp:
+        """Build a FLAM3H™ palette hou.Ramp out of a flame_model palette, the color keys evenly spaced and linear.</br>
+
+        Args:
+            rgb(NDArray[np_float32] | NDArray[np_float64]): A (N, 3) array of RGB color values normalized to 0-1, with N bigger than 1(One).
+
+        Returns:
+            (hou.Ramp): The palette color ramp.
+        """
+        ramp_keys_count: int = len(rgb)
+        POSs: list[int | float] = list(it_islice(it_count(0, 1.0/(ramp_keys_count-1)), (ramp_keys_count)))
+        BASESs: list = [hou.rampBasis.Linear] * (ramp_keys_count) # pyright: ignore[reportAttributeAccessIssue] # Houdini HOM API
+        return hou.Ramp(BASESs, POSs, rgb.tolist())
+    
+    
+    @staticmethod
+    def affine(affine: Iterable[Iterable[float]]) -> list[hou.Vector2]:
+        """Build an affine out of hou.Vector2 ready to be used to set the affine parameters.</br>
+
+        Args:
+            affine(Iterable[Iterable[float]]): The affine: ((X.x, X.y), (Y.x, Y.y), (O.x, O.y)) as coming from: flame_model.affine_decode(...) or one of the flame_model affines arrays.
+
+        Returns:
+            (list[hou.Vector2]): The affine: [hou.Vector2(X), hou.Vector2(Y), hou.Vector2(O)] or an empty list if the affine is empty.
+        """
+        return [hou.Vector2(tuple(v)) for v in affine]
+    
+    
+    @staticmethod
+    def affines(affines: NDArray[np_float64] | None) -> tuple[tuple[hou.Vector2, ...], ...] | None:
+        """Build all the affines of a flame_model affines array out of hou.Vector2.</br>
+
+        Args:
+            affines(NDArray[np_float64] | None): A (N, 3, 2) array of affines.
+
+        Returns:
+            (tuple[tuple[hou.Vector2, ...], ...] | None): The affines for each xform or None if there are none.
+        """
+        if affines is None:
+            return None
         
-        self.varsPRM: tuple[tuple, ...] = ( ("linear", 0), 
-                                            ("sinusoidal", 0), 
-                                            ("spherical", 0), 
-                                            ("swirl", 0), 
-                                            ("horseshoe", 0), 
-                                            ("polar", 0), 
-                                            ("handkerchief", 0), 
-                                            ("heart", 0), 
-                                            ("disc", 0), 
-                                            ("spiral", 0), 
-                                            ("hyperbolic", 0), 
-                                            ("diamond", 0), 
-                                            ("ex", 0), 
-                                            ("julia", 0), 
-                                            ("bent", 0), 
-                                            ("waves", 0), 
-                                            ("fisheye", 0), 
-                                            ("popcorn", 0), 
-                                            ("exponential", 0), 
-                                            ("power", 0), 
-                                            ("cosine", 0), 
-                                            ("rings", 0), 
-                                            ("fan", 0), 
-                                            ("bubble", 0), 
-                                            ("cylinder", 0), 
-                                            ("eyefish", 0), 
-                                            ("blur", 0), 
-                                            ("curl", ("curl_c1", "curl_c2"), 1), 
-                                            ("ngon", ("ngon_power", "ngon_sides", "ngon_corners", "ngon_circle"), 1), 
-                                            ("pdj", ("pdj_a", "pdj_b", "pdj_c", "pdj_d"), 1), 
-                                            ("blob", ("blob_low", "blob_high", "blob_waves"), 1), 
-                                            ("juliaN", ("julian_power", "julian_dist"), 1), 
-                                            ("juliascope", ("juliascope_power", "juliascope_dist"), 1), 
-                                            ("gaussian_blur", 0), 
-                                            ("fan2", ("fan2_x", "fan2_y"), 1), 
-                                            ("rings2", ("rings2_val",), 1), 
-                                            ("rectangles", ("rectangles_x", "rectangles_y"), 1), 
-                                            ("radial_blur", ("radial_blur_angle",), 1), 
-                                            ("pie", ("pie_slices", "pie_thickness", "pie_rotation"), 1), 
-                                            ("arch", 0), 
-                                            ("tangent", 0), 
-                                            ("square", 0), 
-                                            ("rays", 0), 
-                                            ("blade", 0), 
-                                            ("secant2", 0), 
-                                            ("twintrian", 0), 
-                                            ("cross", 0), 
-                                            ("disc2", ("disc2_rot", "disc2_twist"), 1), 
-                                            ("supershape", ("super_shape_m", "super_shape_rnd", "super_shape_holes"), ("super_shape_n1", "super_shape_n2", "super_shape_n3"), 1), 
-                                            ("flower", ("flower_petals", "flower_holes"), 1), 
-                                            ("conic", ("conic_eccentricity", "conic_holes"), 1), 
-                                            ("parabola", ("parabola_height", "parabola_width"), 1), 
-                                            ("bent2", ("bent2_x", "bent2_y"), 1), 
-                                            ("bipolar", ("bipolar_shift",), 1),
-                                            ("boarders", 0),
-                                            ("butterfly", 0), 
-                                            ("cell", ("cell_size",), 1), 
-                                            ("cpow", ("cpow_power", "cpow_r", "cpow_i"), 1), 
-                                            ("edisc", 0), 
-                                            ("elliptic", 0), 
-                                            ("noise", 0), 
-                                            ("escher", ("escher_beta",), 1), 
-                                            ("foci", 0), 
-                                            ("lazysusan", ("lazysusan_x", "lazysusan_y"), ("lazysusan_spin", "lazysusan_twist", "lazysusan_space"), 1), 
-                                            ("loonie", 0), 
-                                            ("pre blur", 0), 
-                                            ("modulus", ("modulus_x", "modulus_y"), 1), 
-                                            ("oscilloscope", ("oscope_frequency", "oscope_amplitude", "oscope_damping", "oscope_separation"), 1), 
-                                            ("polar2", 0), 
-                                            ("popcorn2", ("popcorn2_x", "popcorn2_y"), ("popcorn2_c",), 1), 
-                                            ("scry", 0), 
-                                            ("separation", ("separation_x", "separation_y"), ("separation_xinside", "separation_yinside"), 1), 
-                                            ("split", ("split_xsize", "split_ysize"), 1), 
-                                            ("splits", ("splits_x", "splits_y"), 1), 
-                                            ("stripes", ("stripes_space", "stripes_warp"), 1), 
-                                            ("wedge", ("wedge_swirl", "wedge_angle", "wedge_hole", "wedge_count",), 1), 
-                                            ("wedge_julia", ("wedge_julia_power", "wedge_julia_angle", "wedge_julia_dist", "wedge_julia_count"), 1), 
-                                            ("wedge_sph", ("wedge_sph_swirl", "wedge_sph_angle", "wedge_sph_hole", "wedge_sph_count"), 1), 
-                                            ("whorl", ("whorl_inside", "whorl_outside"), 1), 
-                                            ("waves2", ("waves2_scalex", "waves2_scaley"), ("waves2_freqx", "waves2_freqy"), 1), 
-                                            ("exp", 0), 
-                                            ("log", 0), 
-                                            ("sin", 0), 
-                                            ("cos", 0), 
-                                            ("tan", 0), 
-                                            ("sec", 0), 
-                                            ("csc", 0), 
-                                            ("cot", 0), 
-                                            ("sinh", 0), 
-                                            ("cosh", 0), 
-                                            ("tanh", 0), 
-                                            ("sech", 0), 
-                                            ("csch", 0), 
-                                            ("coth", 0), 
-                                            ("auger", ("auger_freq", "auger_scale", "auger_sym", "auger_weight"), 1), 
-                                            ("flux", ("flux_spread",), 1), 
-                                            ("mobius", ("Re_A", "Re_B", "Re_C", "Re_D"), ("Im_A", "Im_B", "Im_C", "Im_D"), 1),
-                                            ("curve", ("curve_xlength", "curve_ylength"), ("curve_xamp", "curve_yamp"), 1), 
-                                            ("persp", ("perspective_angle", "perspective_dist"), 1), 
-                                            ("bwraps", ("bwraps_cellsize", "bwraps_space", "bwraps_gain"), ("bwraps_inner_twist", "bwraps_outer_twist"), 1), 
-                                            ("hemisphere", 0), 
-                                            ("polynomial", ("polynomial_powx", "polynomial_powy"), ("polynomial_lcx", "polynomial_lcy"), ("polynomial_scx", "polynomial_scy"), 1),
-                                            ("crop", ("crop_left", "crop_top", "crop_right", "crop_bottom"), ("crop_scatter_area", "crop_zero"), 1), 
-                                            ("unpolar", 0), 
-                                            ("glynnia", 0), 
-                                            ("point_symmetry", ("point_symmetry_order", "point_symmetry_centre_x", "point_symmetry_centre_y"), 1)
-                                        )
+        _Vector2: Callable = hou.Vector2 # pyright: ignore[reportAttributeAccessIssue]  # Houdini HOM API
+        return tuple(tuple(_Vector2(tuple(v)) for v in affine) for affine in affines.tolist())
+
+
+# FLAM3H™ PREVIEW RENDERER start here
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+
+
+class flam3h_preview_renderer:
+    """
+class flam3h_preview_renderer
+
+@STATICMETHODS
+* variation(v_type: int, x: NDArray[np_float64], y: NDArray[np_float64], prm: tuple[float, ...], coefs: NDArray[np_float64], rng: np_Generator) -> tuple[NDArray[np_float64], NDArray[np_float64]] | None:
+* xform_compile(xform: dict[str, str], coefs: NDArray[np_float64] | None, post: NDArray[np_float64] | None, symmetry_default: str = '0', verbose: bool = True) -> dict[str, Any]:
+* write_png(rgba: NDArray[np_uint8], filepath: str) -> None:
+
+@METHODS
+* render(self) -> NDArray[np_float32] | None:
+* render_uint8(self) -> NDArray[np_uint8] | None:
+
+    """
+
+    # The variations idx the renderer know how to draw. Any other variation is drawn as: linear, and it is listed into: self.vars_unsupported
+    VARS_SUPPORTED: Final[frozenset[int]] = frozenset((0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 40, 41, 80, 81, 82, 83, 84, 88, 89, 90, 98))
+    # The parametric variations parameters default values if they are missing from the xform
+    PRM_DEFAULTS: Final[MappingProxyType[str, float]] = MappingProxyType({ 'ngon_power': 3.0, 'ngon_sides': 5.0, 'ngon_corners': 2.0, 'ngon_circle': 1.0,
+                                                                           'pdj_a': 1.0, 'pdj_b': 1.0, 'pdj_c': 1.0, 'pdj_d': 1.0,
+                                                                           'blob_low': 0.0, 'blob_high': 1.0, 'blob_waves': 1.0,
+                                                                           'julian_power': 1.0, 'julian_dist': 1.0,
+                                                                           'juliascope_power': 1.0, 'juliascope_dist': 1.0,
+                                                                           'rings2_val': 1.0,
+                                                                           'perspective_dist': 1.0 })
+    EPS: Final = 1e-10
+
+    __slots__ = ("_model", "_verbose", "_width", "_height", "_samples", "_batch", "_fuse", "_gamma", "_seed", "_center", "_scale", "_vars_unsupported")
+
+    def __init__(self,
+                 flame: flame_model | in_flame_iter_data,
+                 width: int = 256,
+                 height: int = 256,
+                 samples: int = 1000000,
+                 batch: int = 100000,
+                 fuse: int = 20,
+                 gamma: float = 2.2,
+                 seed: int | None = None,
+                 center: tuple[float, float] | None = None,
+                 scale: float | None = None
+                 ) -> None:
+        """Render a preview image of a flame preset on the CPU with the chaos game, using NumPy only.</br>
+        No Houdini types are used and this module can be imported without Houdini (hou, nodesearch and PySide are optional at import time),</br>
+        so out of a flame_model it can run on machines without Houdini or a GPU, for example to batch render the flame library thumbnails.</br></br>
+
+        All the points of a batch are iterated together: each iteration pick the next xform of every point at once out of the xforms weights and xaos,</br>
+        then run each xform on all the points that picked it as a whole array: pre affine, pre_blur, PRE, VAR and POST variations, post affine and color.</br>
+        The FF is applied to the plotted points only, and the density is log tone mapped into the RGBA preview.</br>
+
+        Only the variations in: VARS_SUPPORTED are drawn, the others are drawn as: linear, so the preview is an approximation of the FLAM3H™ render.
+
+        Args:
+            (self):
+            flame(flame_model | in_flame_iter_data): The flame preset to render. From an in_flame_iter_data, its currently selected flame preset is rendered out of its already decoded data</br>and its xforms values warnings are not printed out again.
+            width(int): Default to: 256</br>The preview width in pixels.
+            height(int): Default to: 256</br>The preview height in pixels.
+            samples(int): Default to: 1000000</br>The number of points to plot.
+            batch(int): Default to: 100000</br>The number of points iterated together. Bigger is faster but use more memory.
+            fuse(int): Default to: 20</br>The number of iterations to run before starting to plot the points.
+            gamma(float): Default to: 2.2</br>The gamma of the log density.
+            seed(int | None): Default to: None</br>The random seed, for repeatable previews.
+            center(tuple[float, float] | None): Default to: None</br>The camera center in world space. If None, the preview is framed around the points.
+            scale(float | None): Default to: None</br>The camera scale in pixels per world unit. If None, the preview is framed around the points.
+        """
+        if isinstance(flame, in_flame_iter_data):
+            self._model: flame_model | None = flame.flame_model_from_data()
+            self._verbose: bool = False
+        else:
+            self._model: flame_model | None = flame
+            self._verbose: bool = True
+        self._width: int = max(1, int(width))
+        self._height: int = max(1, int(height))
+        self._samples: int = max(1, int(samples))
+        self._batch: int = max(1, min(int(batch), self._samples))
+        self._fuse: int = max(0, int(fuse))
+        self._gamma: float = max(self.EPS, float(gamma))
+        self._seed: int | None = seed
+        self._center: tuple[float, float] | None = center
+        self._scale: float | None = scale
+        self._vars_unsupported: list[str] = []
+
+
+    @staticmethod
+    def variation(v_type: int, x: NDArray[np_float64], y: NDArray[np_float64], prm: tuple[float, ...], coefs: NDArray[np_float64], rng: np_Generator) -> tuple[NDArray[np_float64], NDArray[np_float64]] | None:
+        """Run a variation on an array of points, the same way the FLAM3H™ VEX variations do: V_<variation name>(...) in the CVEX variations.h</br>
+        The variation weight is not applied here.</br>
+
+        Args:
+            v_type(int): The variation idx as in: VARS_FLAM3_DICT_IDX
+            x(NDArray[np_float64]): The points X coordinates.
+            y(NDArray[np_float64]): The points Y coordinates.
+            prm(tuple[float, ...]): The variation parameters values in the same order of: VARS_APO_PRM_FROM_IDX[v_type][1], an empty tuple if the variation is not parametric.
+            coefs(NDArray[np_float64]): The xform pre affine as a (3, 2) array. Some variations, like: waves, popcorn, rings and fan, use it.
+            rng(np_Generator): The random numbers generator for the variations using random numbers.
+
+        Returns:
+            (tuple[NDArray[np_float64], NDArray[np_float64]] | None): The X and Y coordinates of the variation output or None if the variation is not supported.
+        """
+        EPS: float = flam3h_preview_renderer.EPS
+        r2: NDArray[np_float64] = x * x + y * y
+        r: NDArray[np_float64] = np_sqrt(r2)
+
+        match v_type:
+
+            case 0: # linear
+                return x, y
+
+            case 1: # sinusoidal
+                return np_sin(x), np_sin(y)
+
+            case 2: # spherical
+                s = 1.0 / (r2 + EPS)
+                return x * s, y * s
+
+            case 3: # swirl
+                s, c = np_sin(r2), np_cos(r2)
+                return x * s - y * c, x * c + y * s
+
+            case 4: # horseshoe
+                s = 1.0 / (r + EPS)
+                return (x - y) * (x + y) * s, 2.0 * x * y * s
+
+            case 5: # polar
+                return np_arctan2(x, y) / np_pi, r - 1.0
+
+            case 6: # handkerchief
+                a = np_arctan2(x, y)
+                return r * np_sin(a + r), r * np_cos(a - r)
+
+            case 7: # heart
+                a = np_arctan2(x, y) * r
+                return r * np_sin(a), -r * np_cos(a)
+
+            case 8: # disc
+                a = np_arctan2(x, y) / np_pi
+                return a * np_sin(np_pi * r), a * np_cos(np_pi * r)
+
+            case 9: # spiral
+                a = np_arctan2(x, y)
+                s = 1.0 / (r + EPS)
+                return s * (np_cos(a) + np_sin(r)), s * (np_sin(a) - np_cos(r))
+
+            case 10: # hyperbolic
+                a = np_arctan2(x, y)
+                return np_sin(a) / (r + EPS), r * np_cos(a)
+
+            case 11: # diamond
+                a = np_arctan2(x, y)
+                return np_sin(a) * np_cos(r), np_cos(a) * np_sin(r)
+
+            case 12: # ex
+                a = np_arctan2(x, y)
+                n0 = np_sin(a + r) ** 3
+                n1 = np_cos(a - r) ** 3
+                return r * (n0 + n1), r * (n0 - n1)
+
+            case 13: # julia
+                a = 0.5 * np_arctan2(x, y) + np_pi * rng.integers(0, 2, x.shape[0])
+                s = np_sqrt(r)
+                return s * np_cos(a), s * np_sin(a)
+
+            case 14: # bent
+                return np_where(x < 0.0, 2.0 * x, x), np_where(y < 0.0, 0.5 * y, y)
+
+            case 15: # waves
+                return x + coefs[1, 0] * np_sin(y / (coefs[2, 0] ** 2 + EPS)), y + coefs[1, 1] * np_sin(x / (coefs[2, 1] ** 2 + EPS))
+
+            case 16: # fisheye
+                s = 2.0 / (r + 1.0)
+                return s * x, s * y
+
+            case 17: # popcorn
+                return x + coefs[2, 0] * np_sin(np_tan(3.0 * y)), y + coefs[2, 1] * np_sin(np_tan(3.0 * x))
+
+            case 18: # exponential
+                s = np_exp(x - 1.0)
+                return s * np_cos(np_pi * y), s * np_sin(np_pi * y)
+
+            case 19: # power
+                sa, ca = x / (r + EPS), y / (r + EPS)
+                s = r ** sa
+                return s * ca, s * sa
+
+            case 20: # cosine
+                a = np_pi * x
+                return np_cos(a) * np_cosh(y), -np_sin(a) * np_sinh(y)
+
+            case 21: # rings
+                dx = coefs[2, 0] ** 2 + EPS
+                s = (np_fmod(r + dx, 2.0 * dx) - dx + r * (1.0 - dx)) / (r + EPS)
+                return s * y, s * x
+
+            case 22: # fan
+                dx = np_pi * (coefs[2, 0] ** 2 + EPS)
+                a = np_arctan2(x, y)
+                a = np_where(np_fmod(a + coefs[2, 1], dx) > 0.5 * dx, a - 0.5 * dx, a + 0.5 * dx)
+                return r * np_cos(a), r * np_sin(a)
+
+            case 23: # bubble
+                s = 4.0 / (r2 + 4.0)
+                return s * x, s * y
+
+            case 24: # cylinder
+                return np_sin(x), y
+
+            case 25: # eyefish
+                s = 2.0 / (r + 1.0)
+                return s * x, s * y
+
+            case 26: # blur
+                a = rng.random(x.shape[0]) * 2.0 * np_pi
+                s = rng.random(x.shape[0])
+                return s * np_cos(a), s * np_sin(a)
+
+            case 27: # curl
+                c1, c2 = prm
+                re = 1.0 + c1 * x + c2 * (x * x - y * y)
+                im = c1 * y + 2.0 * c2 * x * y
+                s = 1.0 / (re * re + im * im + EPS)
+                return (x * re + y * im) * s, (y * re - x * im) * s
+
+            case 28: # ngon
+                power, sides, corners, circle = prm
+                b = 2.0 * np_pi / (sides if sides else EPS)
+                phi = np_arctan2(y, x)
+                phi = phi - b * np_floor(phi / b)
+                phi = np_where(phi > 0.5 * b, phi - b, phi)
+                s = (corners * (1.0 / (np_cos(phi) + EPS) - 1.0) + circle) / (r2 ** (0.5 * power) + EPS)
+                return x * s, y * s
+
+            case 29: # pdj
+                a, b, c, d = prm
+                return np_sin(a * y) - np_cos(b * x), np_sin(c * x) - np_cos(d * y)
+
+            case 30: # blob
+                low, high, waves = prm
+                s = (low + (high - low) * (0.5 + 0.5 * np_sin(waves * np_arctan2(x, y)))) * r / (r + EPS)
+                return s * x, s * y
+
+            case 31 | 32: # julian | juliascope
+                power, dist = prm
+                power = power if power else EPS
+                t = np_trunc(abs(power) * rng.random(x.shape[0]))
+                phi = np_arctan2(y, x)
+                if v_type == 32:
+                    phi = np_where(t % 2.0 == 0.0, phi, -phi)
+                a = (phi + 2.0 * np_pi * t) / power
+                s = r2 ** (0.5 * dist / power)
+                return s * np_cos(a), s * np_sin(a)
+
+            case 33: # gaussian_blur
+                a = rng.random(x.shape[0]) * 2.0 * np_pi
+                s = rng.random((4, x.shape[0])).sum(axis=0) - 2.0
+                return s * np_cos(a), s * np_sin(a)
+
+            case 34: # fan2
+                px, py = prm
+                dx = np_pi * (px * px + EPS)
+                a = np_arctan2(x, y)
+                t = a + py - dx * np_trunc((a + py) / dx)
+                a = np_where(t > 0.5 * dx, a - 0.5 * dx, a + 0.5 * dx)
+                return r * np_sin(a), r * np_cos(a)
+
+            case 35: # rings2
+                dx = prm[0] ** 2 + EPS
+                s = (r - 2.0 * dx * np_trunc((r + dx) / (2.0 * dx)) + r * (1.0 - dx)) / (r + EPS)
+                return s * x, s * y
+
+            case 40: # tangent
+                return np_sin(x) / np_cos(y), np_tan(y)
+
+            case 41: # square
+                return rng.random(x.shape[0]) - 0.5, rng.random(x.shape[0]) - 0.5
+
+            case 80: # exp
+                s = np_exp(x)
+                return s * np_cos(y), s * np_sin(y)
+
+            case 81: # log
+                return 0.5 * np_log(r2 + EPS), np_arctan2(y, x)
+
+            case 82: # sin
+                return np_sin(x) * np_cosh(y), np_cos(x) * np_sinh(y)
+
+            case 83: # cos
+                return np_cos(x) * np_cosh(y), -np_sin(x) * np_sinh(y)
+
+            case 84: # tan
+                s = 1.0 / (np_cos(2.0 * x) + np_cosh(2.0 * y))
+                return np_sin(2.0 * x) * s, np_sinh(2.0 * y) * s
+
+            case 88: # sinh
+                return np_sinh(x) * np_cos(y), np_cosh(x) * np_sin(y)
+
+            case 89: # cosh
+                return np_cosh(x) * np_cos(y), np_sinh(x) * np_sin(y)
+
+            case 90: # tanh
+                s = 1.0 / (np_cos(2.0 * y) + np_cosh(2.0 * x))
+                return np_sinh(2.0 * x) * s, np_sin(2.0 * y) * s
+
+            case 98: # perspective
+                angle, dist = prm
+                a = 0.5 * np_pi * angle
+                s = dist / (dist - y * np_sin(a))
+                return x * s, np_cos(a) * y * s
+
+            case _:
+                return None
+
+
+    @staticmethod
+    def xform_compile(xform: dict[str, str], coefs: NDArray[np_float64] | None, post: NDArray[np_float64] | None, symmetry_default: str = '0', verbose: bool = True) -> dict[str, Any]:
+        """Collect out of an xform raw XML key/value pairs everything the renderer need to run it.</br>
+        The color speed is the xform: color_speed if it has one, like the Fractorium flame presets, otherwise it is derived from its symmetry the way flam3 does: (1 - symmetry) / 2</br>
+
+        Args:
+            xform(dict[str, str]): The xform raw XML key/value pairs as in: flame_model.xforms or flame_model.finalxform
+            coefs(NDArray[np_float64] | None): The xform pre affine as a (3, 2) array. If None, the identity affine is used.
+            post(NDArray[np_float64] | None): The xform post affine as a (3, 2) array or None if it does not have one.
+            symmetry_default(str): Default to: '0'</br>The symmetry value to use if the xform does not have one nor a color_speed. The FF use: '1' so it does not change the points color.
+            verbose(bool): Default to: True</br>Print out the warnings about the invalid xform values or not.
+
+        Returns:
+            (dict[str, Any]): The xform compiled data. The variations are collected into lists of: (v_type, weight, parameters values).
+        """
+        _xf_val_cleanup_str: Callable[[str, str, str | None], str] = in_flame.xf_val_cleanup_str
+        keys: dict[str, str] = {key.lower(): str(val) for key, val in xform.items()}
+
+        def _float(key: str, default: str) -> float:
+            val: str | None = keys.get(key)
+            return float(_xf_val_cleanup_str(val, default, key if verbose else None)) if val is not None else float(default)
+
+        pre_prx: str = xml_keys.DEFAULT_VAR_PRE_PRX
+        post_prx: str = xml_keys.DEFAULT_VAR_POST_PRX
+        xf: dict[str, Any] = {  'weight': _float(xml_keys.XML_XF_WEIGHT, XML_TO_F3H_DEFAULT_VALS[xml_keys.XML_XF_WEIGHT]),
+                                'color': _float(xml_keys.XML_XF_COLOR, XML_TO_F3H_DEFAULT_VALS[xml_keys.XML_XF_COLOR]),
+                                'color_speed': _float(xml_keys.XML_XF_COLOR_SPEED, '0') if xml_keys.XML_XF_COLOR_SPEED in keys else 0.5 * (1.0 - _float(xml_keys.XML_XF_SYMMETRY, symmetry_default)),
+                                'opacity': _float(xml_keys.XML_XF_OPACITY, XML_TO_F3H_DEFAULT_VALS[xml_keys.XML_XF_OPACITY]),
+                                'pre_blur': _float(xml_keys.XML_XF_PB, '0'),
+                                'xaos': [float(x) for x in in_flame.xf_list_cleanup(keys.get(xml_keys.XML_XF_XAOS, '').split(), '1', xml_keys.XML_XF_XAOS, verbose)],
+                                'coefs': coefs if coefs is not None else np_array(f3h_affineDefaults.DEFAULT_IDENT, dtype=np_float64).reshape(3, 2),
+                                'post': post,
+                                'pre': [],
+                                'var': [],
+                                'post_vars': []
+                                }
+
+        for key in keys:
+            if key in XML_XF_KEY_EXCLUDE:
+                continue
+            if key.startswith(pre_prx) and key[len(pre_prx):] in VARS_FLAM3_DICT_IDX:
+                section, name = 'pre', key[len(pre_prx):]
+            elif key.startswith(post_prx) and key[len(post_prx):] in VARS_FLAM3_DICT_IDX:
+                section, name = 'post_vars', key[len(post_prx):]
+            elif key in VARS_FLAM3_DICT_IDX:
+                section, name = 'var', key
+            else:
+                continue
+
+            v_type: int = VARS_FLAM3_DICT_IDX[name]
+            apo_prm: tuple = VARS_APO_PRM_FROM_IDX[v_type]
+            prm: tuple[float, ...] = tuple(_float(prm_name, str(flam3h_preview_renderer.PRM_DEFAULTS.get(prm_name, 0.0))) for prm_name in apo_prm[1]) if apo_prm[-1] else ()
+            xf[section].append((v_type, _float(key, '0'), prm))
+
+        return xf
+
+
+    @staticmethod
+    def write_png(rgba: NDArray[np_uint8], filepath: str) -> None:
+        """Write an RGBA preview into a PNG file using the python standard library only.</br>
+
+        Args:
+            rgba(NDArray[np_uint8]): The (height, width, 4) RGBA preview as coming from: self.render_uint8()
+            filepath(str): The PNG file full path.
+
+        Returns:
+            (None):
+        """
+        height, width = rgba.shape[:2]
+        # Each row start with the filter type byte: 0(Zero) as None
+        raw: bytes = np_pad(rgba.reshape(height, width * 4), ((0, 0), (1, 0)), 'constant', constant_values = 0).astype(np_uint8).tobytes()
+
+        def _chunk(tag: bytes, data: bytes) -> bytes:
+            return struct_pack('>I', len(data)) + tag + data + struct_pack('>I', zlib_crc32(tag + data) & 0xffffffff)
+
+        with open(filepath, 'wb') as f:
+            f.write(b'\x89PNG\r\n\x1a\n')
+            f.write(_chunk(b'IHDR', struct_pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)))
+            f.write(_chunk(b'IDAT', zlib_compress(raw, 6)))
+            f.write(_chunk(b'IEND', b''))
+
+
+    # CLASS: PROPERTIES
+    ##########################################
+    ##########################################
+
+    @property
+    def model(self) -> flame_model | None:
+        return self._model
+
+    @property
+    def vars_unsupported(self) -> list[str]:
+        return self._vars_unsupported
+
+
+    def __xform_run(self, xf: dict[str, Any], x: NDArray[np_float64], y: NDArray[np_float64], c: NDArray[np_float64], rng: np_Generator) -> tuple[NDArray[np_float64], NDArray[np_float64], NDArray[np_float64]]:
+        """Run a compiled xform on an array of points.</br>
+
+        Args:
+            (self):
+            xf(dict[str, Any]): The compiled xform as coming from: self.xform_compile(...)
+            x(NDArray[np_float64]): The points X coordinates.
+            y(NDArray[np_float64]): The points Y coordinates.
+            c(NDArray[np_float64]): The points color in the 0-1 range.
+            rng(np_Generator): The random numbers generator.
+
+        Returns:
+            (tuple[NDArray[np_float64], NDArray[np_float64], NDArray[np_float64]]): The new X, Y coordinates and color of the points.
+        """
+        _variation: Callable[..., tuple[NDArray[np_float64], NDArray[np_float64]] | None] = self.variation
+        coefs: NDArray[np_float64] = xf['coefs']
+        tx: NDArray[np_float64] = x * coefs[0, 0] + y * coefs[1, 0] + coefs[2, 0]
+        ty: NDArray[np_float64] = x * coefs[0, 1] + y * coefs[1, 1] + coefs[2, 1]
 
+        if xf['pre_blur']:
+            a = rng.random(tx.shape[0]) * 2.0 * np_pi
+            s = xf['pre_blur'] * (rng.random((4, tx.shape[0])).sum(axis=0) - 2.0)
+            tx, ty = tx + s * np_cos(a), ty + s * np_sin(a)
 
-        # EXCEPTIONS: so I dnt go into regex...
-        # Update this and def in_prm_name_exceptions() if you add/find more
-        self.varsPRM_FRACTORIUM_EXCEPTIONS: dict[int, tuple] = {67: ("oscilloscope", ("oscilloscope_frequency", "oscilloscope_amplitude", "oscilloscope_damping", "oscilloscope_separation"), 1),
-                                                                96: ("Mobius", ("Mobius_Re_A", "Mobius_Re_B", "Mobius_Re_C", "Mobius_Re_D"), ("Mobius_Im_A", "Mobius_Im_B", "Mobius_Im_C", "Mobius_Im_D"), 1)
-                                                                }
+        # The PRE and POST variations replace the point while the VAR variations are summed together.
+        for v_type, w, prm in xf['pre']:
+            out = _variation(v_type, tx, ty, prm, coefs, rng)
+            tx, ty = (w * out[0], w * out[1]) if out is not None else (w * tx, w * ty)
+
+        if xf['var']:
+            px: NDArray[np_float64] = np_zeros(tx.shape[0], dtype=np_float64)
+            py: NDArray[np_float64] = np_zeros(tx.shape[0], dtype=np_float64)
+            for v_type, w, prm in xf['var']:
+                out = _variation(v_type, tx, ty, prm, coefs, rng)
+                vx, vy = out if out is not None else (tx, ty)
+                px += w * vx
+                py += w * vy
+        else:
+            px, py = tx, ty
+
+        for v_type, w, prm in xf['post_vars']:
+            out = _variation(v_type, px, py, prm, coefs, rng)
+            px, py = (w * out[0], w * out[1]) if out is not None else (w * px, w * py)
+
+        post: NDArray[np_float64] | None = xf['post']
+        if post is not None:
+            px, py = px * post[0, 0] + py * post[1, 0] + post[2, 0], px * post[0, 1] + py * post[1, 1] + post[2, 1]
+
+        # flam3 color blend: a color speed of 0(Zero) leave the color untouched, 0.5 move it half way toward the xform color and 1 replace it.
+        speed: float = xf['color_speed']
+        c = c * (1.0 - speed) + xf['color'] * speed
+        return px, py, c
+
+
+    def __xaos_cdf(self, xfs: list[dict[str, Any]]) -> NDArray[np_float64]:
+        """Build the cumulative probabilities to pick the next xform out of each xform, from the xforms weights and xaos.</br>
+
+        Args:
+            (self):
+            xfs(list[dict[str, Any]]): The compiled xforms.
+
+        Returns:
+            (NDArray[np_float64]): A (N, N) array, each row is the cumulative probabilities of the next xform out of that xform.
+        """
+        n: int = len(xfs)
+        weights: NDArray[np_float64] = np_clip(np_array([xf['weight'] for xf in xfs], dtype=np_float64), 0.0, None)
+        xaos: NDArray[np_float64] = np_ones((n, n), dtype=np_float64)
+        for idx, xf in enumerate(xfs):
+            row: list[float] = xf['xaos'][:n]
+            xaos[idx, :len(row)] = row
+        probs: NDArray[np_float64] = weights[None, :] * np_clip(xaos, 0.0, None)
+        # An xform with all its xaos to 0(Zero) would stop the points: use the plain weights instead.
+        totals: NDArray[np_float64] = probs.sum(axis=1)
+        probs[totals <= 0.0] = weights if weights.sum() > 0.0 else 1.0
+        cdf: NDArray[np_float64] = probs.cumsum(axis=1)
+        return cdf / cdf[:, -1:]
+
+
+    def render(self) -> NDArray[np_float32] | None:
+        """Render the flame preset preview.</br>
+
+        Args:
+            (self):
+
+        Returns:
+            (NDArray[np_float32] | None): The (height, width, 4) RGBA preview in the 0-1 range, not premultiplied, or None if the flame preset has no xforms to render.
+        """
+        model: flame_model | None = self._model
+        if model is None or not model.xforms:
+            return None
+
+        coefs: NDArray[np_float64] | None = model.coefs
+        post: NDArray[np_float64] | None = model.post
+        xfs: list[dict[str, Any]] = [self.xform_compile(xf, coefs[idx] if coefs is not None else None, post[idx] if post is not None else None, '0', self._verbose) for idx, xf in enumerate(model.xforms)]
+        ff: dict[str, Any] | None = self.xform_compile(model.finalxform, model.finalxform_coefs, model.finalxform_post, '1', self._verbose) if model.finalxform is not None else None
+
+        used: set[int] = {v_type for xf in xfs + ([ff] if ff is not None else []) for section in ('pre', 'var', 'post_vars') for v_type, _, _ in xf[section]}
+        self._vars_unsupported = sorted(VARS_APO_PRM_FROM_IDX[v_type][0] for v_type in used - self.VARS_SUPPORTED)
+
+        palette: NDArray[np_float32] | None = model.palette
+        if palette is None or len(palette) < 2:
+            palette = np_array([[0.0, 0.0, 0.0], [1.0, 1.0, 1.0]], dtype=np_float32)
+        palette_last: int = len(palette) - 1
+
+        cdf: NDArray[np_float64] = self.__xaos_cdf(xfs)
+        opacity: NDArray[np_float64] = np_array([xf['opacity'] for xf in xfs], dtype=np_float64)
+        rng: np_Generator = np_default_rng(self._seed)
+        n: int = self._batch
+        x: NDArray[np_float64] = rng.random(n) * 2.0 - 1.0
+        y: NDArray[np_float64] = rng.random(n) * 2.0 - 1.0
+        c: NDArray[np_float64] = rng.random(n)
+        xf_ids: NDArray = rng.integers(0, len(xfs), n)
+
+        width, height = self._width, self._height
+        pixels: int = width * height
+        acc: NDArray[np_float64] = np_zeros((4, pixels), dtype=np_float64)
+        center: tuple[float, float] | None = self._center
+        scale: float | None = self._scale
+        plotted: int = 0
+
+        with np_errstate(all='ignore'):
+
+            iteration: int = 0
+            while plotted < self._samples:
+                # Pick the next xform of all the points at once, out of the xaos row of their current xform.
+                xf_ids = (rng.random(n)[:, None] > cdf[xf_ids]).sum(axis=1)
+                for idx, xf in enumerate(xfs):
+                    mask = xf_ids == idx
+                    if mask.any():
+                        x[mask], y[mask], c[mask] = self.__xform_run(xf, x[mask], y[mask], c[mask], rng)
+
+                # Bad points are sent back inside the bi-unit square, like flam3 does.
+                bad: NDArray = ~(np_isfinite(x) & np_isfinite(y)) | (np_abs(x) > 1e10) | (np_abs(y) > 1e10)
+                if bad.any():
+                    x[bad] = rng.random(int(bad.sum())) * 2.0 - 1.0
+                    y[bad] = rng.random(int(bad.sum())) * 2.0 - 1.0
+
+                iteration += 1
+                if iteration <= self._fuse:
+                    continue
+
+                px, py, pc = x, y, c
+                if ff is not None:
+                    px, py, pc = self.__xform_run(ff, x, y, c, rng)
+
+                if center is None or scale is None:
+                    # Frame the preview around the bulk of the points of the first plotted batch.
+                    ok = np_isfinite(px) & np_isfinite(py)
+                    if not ok.any():
+                        return None
+                    x_lo, x_hi = np_percentile(px[ok], (0.5, 99.5))
+                    y_lo, y_hi = np_percentile(py[ok], (0.5, 99.5))
+                    center = (0.5 * (x_lo + x_hi), 0.5 * (y_lo + y_hi)) if center is None else center
+                    scale = 0.9 * min(width / max(x_hi - x_lo, self.EPS), height / max(y_hi - y_lo, self.EPS)) if scale is None else scale
+
+                ix: NDArray = np_floor((px - center[0]) * scale + 0.5 * width)
+                # The image rows go top to bottom while the world Y axis goes up.
+                iy: NDArray = np_floor(0.5 * height - (py - center[1]) * scale)
+                inside: NDArray = (ix >= 0) & (ix < width) & (iy >= 0) & (iy < height)
+                pixel: NDArray = (iy[inside] * width + ix[inside]).astype(int)
+                w: NDArray[np_float64] = opacity[xf_ids[inside]]
+                rgb: NDArray[np_float32] = palette[np_clip(np_rint(np_nan_to_num(pc[inside]) * palette_last), 0, palette_last).astype(int)]
+                for ch in range(3):
+                    acc[ch] += np_bincount(pixel, weights=w * rgb[:, ch], minlength=pixels)
+                acc[3] += np_bincount(pixel, weights=w, minlength=pixels)
+                plotted += n
+
+            # Log density tone mapping: the color is the average color of the points that hit the pixel.
+            density: NDArray[np_float64] = acc[3]
+            alpha: NDArray[np_float64] = (np_log1p(density) / np_log1p(max(density.max(), self.EPS))) ** (1.0 / self._gamma)
+            rgb_avg: NDArray[np_float64] = np_where(density > 0.0, acc[:3] / np_where(density > 0.0, density, 1.0), 0.0)
+
+        rgba: NDArray[np_float64] = np_clip(np_array((*rgb_avg, alpha)), 0.0, 1.0)
+        return np_transpose(rgba).reshape(height, width, 4).astype(np_float32)
+
+
+    def render_uint8(self) -> NDArray[np_uint8] | None:
+        """Render the flame preset preview as 8bit.</br>
+
+        Args:
+            (self):
+
+        Returns:
+            (NDArray[np_uint8] | None): The (height, width, 4) RGBA preview in the 0-255 range, or None if the flame preset has no xforms to render.
+        """
+        rgba: NDArray[np_float32] | None = self.render()
+        if rgba is None:
+            return None
+        return np_rint(rgba * 255.0).astype(np_uint8)
 
 
 # FLAM3H™ XML TREE start here
@@ -14414,12 +16601,454 @@ class _xml
                 flam3h_prm_utils.private_prm_set(hou.pwd(), f3h_tabs.IN.PVT_PRM_ISVALID_FILE, 0)
                 flam3h_prm_utils.private_prm_set(hou.pwd(), f3h_tabs.IN.PVT_PRM_ISVALID_PRESET, 0)
             
-            except (NameError, AttributeError):
-                _MSG: str = ("\nFLAM3H -> warning: Could not evaluate the current hou.SopNode. Class _xml(...).get_name(...)\n")
-                print(f"{_MSG}\n")
-                flam3h_general_utils.set_status_msg(f"{_MSG}", 'WARN')
-                
-            return ()
+            except (NameError, AttributeError):
+                _MSG: str = ("\nFLAM3H -> warning: Could not evaluate the current hou.SopNode. Class _xml(...).get_name(...)\n")
+                print(f"{_MSG}\n")
+                flam3h_general_utils.set_status_msg(f"{_MSG}", 'WARN')
+                
+            return ()
+
+
+class _xml_index:
+    """
+class _xml_index
+
+@STATICMETHODS
+* xmlfile_stat(xmlfile: str) -> tuple[int, int] | None:
+* xmlfile_index(xmlfile: str) -> _xml_index:
+* flames_offsets(data: bytes, flames_count: int) -> tuple[tuple[int, int], ...] | None:
+* xmlfile_encoding(data: bytes) -> str:
+
+@METHODS
+* flame_load(self, idx: int) -> lxmlET._Element | None:
+* flame_append(self, flame: lxmlET._Element) -> bool:
+* flame_digest(self, idx: int) -> bytes | None:
+* __index_build(self, data: bytes) -> None:
+
+    """
+    
+    __slots__ = ("_xmlfile", "_stat", "_isvalidtree", "_name", "_offsets", "_encoding")
+    
+    # The flame files indexed in this Houdini session, shared by all the FLAM3H™ nodes.
+    CACHE: Final[_library_cache] = _library_cache(64, 64 * 1024 * 1024)
+    
+    def __init__(self, xmlfile: str, stat: tuple[int, int] | None = None) -> None:
+        """Streaming index of a flame file.</br>
+        It collect only the flame presets names and their byte offsets inside the file without building the XML DOM.</br></br>
+        
+        The presets menus scripts run on every UI repaint and they only need the presets names for their labels,</br>
+        so on big flame libraries building a full: _xml_tree(...) class every time was stalling the parameter editor.</br></br>
+        
+        Do not use this class directly but always go through: _xml_index.xmlfile_index(...)</br>
+        so the index is built only once for each file (realpath, mtime, size).</br>
+
+        Args:
+            (self):
+            xmlfile(str): The flame file full path.
+            stat(tuple[int, int] | None): Default to: None</br>The flame file (mtime, size) this index is being built from.
+        """
+        self._xmlfile: str = xmlfile
+        self._stat: tuple[int, int] | None = stat
+        self._isvalidtree: bool = False
+        self._name: tuple[str | list[Never], ...] = ()
+        self._offsets: tuple[tuple[int, int], ...] | None = None
+        self._encoding: str = 'utf-8'
+        
+        if stat is not None:
+            
+            try:
+                with open(xmlfile, 'rb') as f:
+                    data: bytes = f.read()
+                    
+            except OSError:
+                pass
+            
+            else:
+                self.__index_build(data)
+        
+        
+    @staticmethod
+    def xmlfile_stat(xmlfile: str) -> tuple[int, int] | None:
+        """Get the file modification time and size used to validate a cached index.</br>
+
+        Args:
+            xmlfile(str): The flame file full path.
+
+        Returns:
+            (tuple[int, int] | None): The file (mtime in nanoseconds, size in bytes) or None if not a file.
+        """
+        try:
+            st: os.stat_result = os.stat(xmlfile)
+            
+        except (OSError, ValueError):
+            return None
+        
+        return st.st_mtime_ns, st.st_size
+    
+    
+    @staticmethod
+    def xmlfile_index(xmlfile: str) -> _xml_index:
+        """Return the cached index of a flame file or build a new one if the file changed since it was last indexed.</br>
+
+        Args:
+            xmlfile(str): The flame file full path.
+
+        Returns:
+            (_xml_index): The flame file index.
+        """
+        stat: tuple[int, int] | None = _xml_index.xmlfile_stat(xmlfile)
+        if stat is None:
+            _xml_index.CACHE.discard(xmlfile)
+            return _xml_index(xmlfile)
+        
+        index: _xml_index | None = _xml_index.CACHE.get(xmlfile, stat)
+        if index is not None:
+            return index
+        
+        index = _xml_index(xmlfile, stat)
+        _xml_index.CACHE.put(xmlfile, stat, index, index.nbytes)
+        return index
+    
+    
+    @staticmethod
+    def flames_offsets(data: bytes, flames_count: int) -> tuple[tuple[int, int], ...] | None:
+        """Collect the (start, end) byte offsets of each flame preset inside the flame file data.</br>
+        The offsets are validated against the number of flames found by the XML parser</br>
+        and if anything does not add up (comments with flame tags in it, self closing flames, ...) they are discarded.</br>
+
+        Args:
+            data(bytes): The flame file data.
+            flames_count(int): The number of flames found by the XML parser.
+
+        Returns:
+            (tuple[tuple[int, int], ...] | None): Each flame preset (start, end) byte offsets or None if they can not be trusted.
+        """
+        starts: list[int] = [m.start() for m in re_finditer(rb'<flame[\s/>]', data)]
+        ends: list[int] = [m.end() for m in re_finditer(rb'</flame\s*>', data)]
+        if not flames_count or len(starts) != flames_count or len(ends) != flames_count:
+            return None
+        
+        offsets: tuple[tuple[int, int], ...] = tuple(zip(starts, ends))
+        for i, (start, end) in enumerate(offsets):
+            if end < start or (i and start < offsets[i - 1][1]):
+                return None
+            
+        return offsets
+    
+    
+    @staticmethod
+    def xmlfile_encoding(data: bytes) -> str:
+        """Get the encoding declared in the flame file XML declaration.</br>
+        A single flame preset parsed out of its byte offsets do not carry the XML declaration with it,</br>
+        so it must be parsed using the same encoding the entire flame file would have been parsed with.</br>
+
+        Args:
+            data(bytes): The flame file data.
+
+        Returns:
+            (str): The flame file encoding or 'utf-8' if not declared.
+        """
+        match: re_Match[bytes] | None = re_search(rb'^\s*<\?xml[^>]*?encoding\s*=\s*["\']([A-Za-z0-9._\-]+)["\']', data[:256])
+        if match is not None:
+            return match.group(1).decode('ascii')
+        
+        return 'utf-8'
+
+
+    # CLASS: PROPERTIES
+    ##########################################
+    ##########################################
+    
+    @property
+    def xmlfile(self) -> str:
+        return self._xmlfile
+    
+    @property
+    def stat(self) -> tuple[int, int] | None:
+        return self._stat
+    
+    @property
+    def isvalidtree(self) -> bool:
+        return self._isvalidtree
+    
+    @property
+    def name(self) -> tuple[str | list[Never], ...]:
+        return self._name
+    
+    @property
+    def offsets(self) -> tuple[tuple[int, int], ...] | None:
+        return self._offsets
+    
+    @property
+    def nbytes(self) -> int:
+        return _library_cache.index_nbytes(self._name, self._offsets)
+    
+    
+    def flame_load(self, idx: int) -> lxmlET._Element | None:
+        """Random access to a single flame preset.</br>
+        Only the selected flame preset bytes are read from the flame file and parsed,</br>
+        so the load time depend on the selected flame preset size and not on the entire flame library size.</br></br>
+        
+        The flame preset is formatted and its tail set exactly like it would be when parsing the entire flame file</br>
+        so that its serialized string, stored into the FLAM3H™ node data storage, will be identical either ways.</br>
+
+        Args:
+            (self):
+            idx(int): The flame preset index out of all the flame presets inside the flame file.
+
+        Returns:
+            (lxmlET._Element | None): The flame preset or None if it could not be loaded this way.
+        """
+        offsets: tuple[tuple[int, int], ...] | None = self.offsets
+        if offsets is None or not 0 <= idx < len(offsets):
+            return None
+        
+        # The offsets are only valid for the file version they have been collected from.
+        if self.xmlfile_stat(self.xmlfile) != self.stat:
+            return None
+        
+        start, end = offsets[idx]
+        try:
+            with open(self.xmlfile, 'rb') as f:
+                f.seek(start)
+                data: bytes = f.read(end - start)
+                
+        except OSError:
+            return None
+        
+        try:
+            flame: lxmlET._Element = lxmlET.fromstring(data, lxmlET.XMLParser(encoding=self._encoding))
+            
+        except (LookupError, ValueError):
+            return None
+        
+        except lxmlET.XMLSyntaxError:
+            return None
+        
+        root: lxmlET._Element = lxmlET.Element(xml_keys.XML_ROOT)
+        root.append(flame)
+        out_flame_utils._out_pretty_print(root)
+        if idx < len(offsets) - 1:
+            flame.tail = '\n  '
+            
+        return flame
+    
+    
+    def flame_append(self, flame: lxmlET._Element) -> bool:
+        """Append a flame preset at the end of the flame file without parsing and reformatting the entire flame file.</br>
+        Only the new flame preset is serialized and spliced in right before the flame file closing root tag,</br>
+        the flame file is then replaced in one go with a temporary file so it is never left half written.</br></br>
+        
+        For flame files saved by FLAM3H™ the result is the same as appending to the full XML tree and writing it all out again.</br>
+        The index is updated with the new flame preset so it does not need to be rebuilt.</br>
+
+        Args:
+            (self):
+            flame(lxmlET._Element): The flame preset to append, already formatted (out_flame_utils._out_pretty_print(...)) as the child of a flames root.
+
+        Returns:
+            (bool): True if the flame preset has been appended. False if not and the entire flame file must be rewritten.
+        """
+        offsets: tuple[tuple[int, int], ...] | None = self.offsets
+        if offsets is None or self.xmlfile_stat(self.xmlfile) != self.stat:
+            return False
+        
+        # The new flame preset is serialized as ASCII so the flame file encoding must be ASCII compatible.
+        try:
+            if xml_keys.XML_NAME.encode(self._encoding) != xml_keys.XML_NAME.encode('ascii'):
+                return False
+            
+        except LookupError:
+            return False
+        
+        try:
+            with open(self.xmlfile, 'rb') as f:
+                data: bytes = f.read()
+                
+        except OSError:
+            return False
+        
+        # Only white spaces are allowed in between the last flame preset and the closing root tag.
+        last_end: int = offsets[-1][1]
+        match: re_Match[bytes] | None = re_match(rb'\s*(</[^\s>]+\s*>)', data[last_end:])
+        if match is None:
+            return False
+        
+        flame_data: bytes = lxmlET.tostring(flame, with_tail=False)
+        start: int = last_end + 3
+        # Replace the file the flame file path resolve to, so a symbolic link is not turned into a regular file.
+        real_path: str = os.path.realpath(self.xmlfile)
+        try:
+            fd, tmp_path = mkstemp(prefix='.f3h_', suffix='.tmp', dir=os.path.dirname(real_path))
+            try:
+                with os.fdopen(fd, 'wb') as w:
+                    w.write(data[:last_end])
+                    w.write(b'\n  ')
+                    w.write(flame_data)
+                    w.write(b'\n')
+                    w.write(data[last_end + match.start(1):])
+                copymode(real_path, tmp_path)
+                os.replace(tmp_path, real_path)
+                
+            except OSError:
+                os.remove(tmp_path)
+                raise
+            
+        except OSError:
+            return False
+        
+        # The flame preset name is collected the same way: _xml_index.__index_build(...) does.
+        keyval: str | None = flame.get(xml_keys.XML_XF_NAME)
+        self._name += (keyval.strip() if keyval is not None and len(keyval) else '[]', )
+        self._offsets = offsets + ((start, start + len(flame_data)), )
+        self._stat = self.xmlfile_stat(self.xmlfile)
+        # Re-key the shared index to the new version of the flame file.
+        if self._stat is not None:
+            _xml_index.CACHE.put(self.xmlfile, self._stat, self, self.nbytes)
+        return True
+    
+    
+    def flame_digest(self, idx: int) -> bytes | None:
+        """Get a digest of a single flame preset raw bytes, as they are inside the flame file.</br>
+        Used to tell if a flame preset changed on disk without parsing it.</br>
+
+        Args:
+            (self):
+            idx(int): The flame preset index out of all the flame presets inside the flame file.
+
+        Returns:
+            (bytes | None): The flame preset digest or None if it could not be read this way.
+        """
+        offsets: tuple[tuple[int, int], ...] | None = self.offsets
+        if offsets is None or not 0 <= idx < len(offsets):
+            return None
+        
+        if self.xmlfile_stat(self.xmlfile) != self.stat:
+            return None
+        
+        start, end = offsets[idx]
+        try:
+            with open(self.xmlfile, 'rb') as f:
+                f.seek(start)
+                return blake2b(f.read(end - start), digest_size=16).digest()
+                
+        except OSError:
+            return None
+    
+    
+    def __index_build(self, data: bytes) -> None:
+        """Stream parse the flame file data and collect the flame presets names.</br>
+        The flame presets names are collected the same way: _xml_tree.get_name(...) does.</br>
+
+        Args:
+            (self):
+            data(bytes): The flame file data.
+
+        Returns:
+            (None):
+        """
+        _strip: Callable[[str], str] = str.strip
+        names: list[str] = []
+        flames_count: int = 0
+        # The flame presets found where the presets names are collected from
+        top_flames_count: int = 0
+        depth: int = 0
+        rooted: bool = False
+        namespaced: bool = False
+        
+        try:
+            for event, elem in lxmlET.iterparse(BytesIO(data), events=('start', 'end')):
+                
+                if event == 'start':
+                    if depth == 0:
+                        rooted = xml_keys.XML_ROOT in elem.tag.lower()
+                        namespaced = bool(elem.nsmap)
+                        if not rooted:
+                            names.append(_strip(keyval) if (keyval := elem.get(xml_keys.XML_XF_NAME)) is not None and len(keyval) else '[]')
+                            top_flames_count += elem.tag == xml_keys.XML_NAME
+                            
+                    elif depth == 1 and rooted:
+                        names.append(_strip(keyval) if (keyval := elem.get(xml_keys.XML_XF_NAME)) is not None and len(keyval) else '[]')
+                        top_flames_count += elem.tag == xml_keys.XML_NAME
+                        
+                    if elem.tag == xml_keys.XML_NAME:
+                        flames_count += 1
+                        
+                    depth += 1
+                    
+                else:
+                    depth -= 1
+                    # Keep the memory footprint low, we do not need the flames contents.
+                    if depth == 1:
+                        elem.clear()
+                        while elem.getprevious() is not None:
+                            del elem.getparent()[0]
+                            
+        except lxmlET.XMLSyntaxError:
+            return
+        
+        # If there are flames, proceed
+        if flames_count:
+            self._isvalidtree = True
+            self._name = tuple(names)
+            # The byte offsets are used for random access to the flame presets (_xml_index.flame_load(...))
+            # so they are collected only if each name belong to its own flame preset.
+            if not namespaced and len(names) == top_flames_count == flames_count:
+                self._offsets = self.flames_offsets(data, flames_count)
+                self._encoding = self.xmlfile_encoding(data)
+
+
+class _xml_flames_data:
+    """
+class _xml_flames_data
+
+@METHODS
+* __len__(self) -> int:
+* __getitem__(self, idx: int) -> Any:
+* __iter__(self) -> Iterator[Any]:
+
+    """
+    
+    __slots__ = ("_count", "_getter", "_data")
+
+    def __init__(self, count: int, getter: Callable[[int], Any], data: dict[int, Any] | None = None) -> None:
+        """Lazy per flame preset data.</br>
+        It behave like the per flame preset tuples collected from the entire flame file,</br>
+        but each flame preset data is collected only when it is accessed for the first time and then kept.</br></br>
+        
+        Used by: _xml_tree(...) when loading a single flame preset from a flame file (random access)</br>
+        so the flame presets that are not being loaded are never parsed.</br>
+
+        Args:
+            (self):
+            count(int): The number of flame presets.
+            getter(Callable[[int], Any]): The definition collecting the data of the flame preset at the given index.
+            data(dict[int, Any] | None): Default to: None</br>Flame presets data already collected, keyed by their flame preset index.
+        """
+        self._count: int = count
+        self._getter: Callable[[int], Any] = getter
+        self._data: dict[int, Any] = {} if data is None else data
+        
+        
+    def __len__(self) -> int:
+        return self._count
+    
+    
+    def __getitem__(self, idx: int) -> Any:
+        if idx < 0:
+            idx += self._count
+        if not 0 <= idx < self._count:
+            raise IndexError("flame preset index out of range")
+        
+        data: dict[int, Any] = self._data
+        if idx not in data:
+            data[idx] = self._getter(idx)
+            
+        return data[idx]
+    
+    
+    def __iter__(self) -> Iterator[Any]:
+        return (self[idx] for idx in range(self._count))
 
 
 class _xml_tree:
@@ -14427,52 +17056,123 @@ class _xml_tree:
 class _xml_tree
 
 @STATICMETHODS
+* xmlfile_load(xmlfile: str | None, pretty_print: bool = True) -> lxmlET._Element | None:
 * xmlfile_root_chk(xmlfile: str | None, clipboard: bool = False) -> str | None:
 * xmlfile_isvalidtree_chk(xmlfile: str) -> bool:
+* xmlfile_isvalid(xmlfile: str | None) -> TypeGuard[str]:
 
 @METHODS
-* get_name(self, key: str = xml_keys.XML_XF_NAME) -> tuple[str | list[Never], ...]:
-* __get_name_val_str(self, key: str, _DEFAULT: str = '0') -> tuple[str | list[Never], ...]:
-* __get_name_curve_val_str(self, key: str, _DEFAULT: str = '0') -> tuple[str | list[Never], ...]:
-* __get_name_list_str(self, key: str) -> tuple[str | list[Never], ...]:
-* __get_flame(self, key: str = xml_keys.XML_NAME) -> tuple[lxmlET._Element, ...] | None:
-* __get_flame_count(self, flames: list) -> int:
+* __flames_ra_init(self, idx: int | None) -> _xml_flames_data | None:
+* __flame_ra_load(self, idx: int) -> lxmlET._Element:
+* __get_flames_vals(self, func: Callable[[lxmlET._Element], str | list[Never]]) -> TA_XML_FlameVals:
+* get_name(self, key: str = xml_keys.XML_XF_NAME) -> TA_XML_FlameVals:
+* __get_name_val_str(self, key: str, _DEFAULT: str = '0') -> TA_XML_FlameVals:
+* __get_name_curve_val_str(self, key: str, _DEFAULT: str = '0') -> TA_XML_FlameVals:
+* __get_name_list_str(self, key: str) -> TA_XML_FlameVals:
+* __get_flame(self, key: str = xml_keys.XML_NAME) -> tuple[lxmlET._Element, ...] | _xml_flames_data | None:
+* __get_flame_count(self, flames: tuple[lxmlET._Element, ...] | _xml_flames_data | None) -> int:
 
 """
 
-    __slots__ = ("_cached_data", 
-                 "_xmlfile", "_xmlfile_data", "_xmlfile_data_clipboard", "_isvalidtree", "_tree", "_root", 
-                 "_name", "_plugins", "_sw_version")
-    
-    def __init__(self, xmlfile: str) -> None:
+    __slots__ = ("_cached_data",
+                 "_xmlfile", "_isvalidtree", "_tree", "_root", "_root_items", "_index", "_flames_ra")
+
+    def __init__(self, xmlfile: str, idx: int | None = None) -> None:
         """
         Args:
             (self):
             xmlfile (str): xmlfile (str): [xml *.flame file v_type to load]
+            idx(int | None): Default to: None</br>The index of the flame preset we are going to load.</br>If given and the flame file allow it, only this flame preset is parsed out of the flame file (random access).
         """
         self._xmlfile: str = xmlfile
-        self._xmlfile_data: str | None = self.xmlfile_root_chk(self.xmlfile)
-        self._xmlfile_data_clipboard: str | None = self.xmlfile_root_chk(self.xmlfile, True)
-        self._isvalidtree: bool = self.xmlfile_isvalidtree_chk(self.xmlfile)
+        self._flames_ra: _xml_flames_data | None = self.__flames_ra_init(idx)
+
+        if self._flames_ra is not None:
+            self._isvalidtree: bool = True
+
+        else:
+            # The flame data source (a file or the clipboard) is read and parsed only once
+            # and the resulting tree is then shared by all the inheriting classes.
+            #
+            # The tree is not reformatted as it is only read in memory,
+            # only the flame presets being accessed will be (self.__get_flame(...)).
+            root: lxmlET._Element | None = self.xmlfile_load(self.xmlfile, False)
+            self._isvalidtree: bool = root is not None
+
+            if root is not None:
+                self._tree: lxmlET._ElementTree = lxmlET.ElementTree(root)
+                self._root: lxmlET._Element = root
+                # Keep the flame presets at hand so each of them can be accessed directly by its index.
+                self._root_items: tuple[lxmlET._Element, ...] = tuple(root)
+
+
+    @staticmethod
+    def xmlfile_load(xmlfile: str | None, pretty_print: bool = True) -> lxmlET._Element | None:
+        """Read and parse the flame data source only once, either a flame file or the clipboard flame data.</br>
+        This replace the sequence: xmlfile_root_chk(..., True), xmlfile_root_chk(...), xmlfile_isvalidtree_chk(...)</br>
+        followed by a re-parse of the re-serialized pretty printed string, that was parsing the same flame file up to three times.</br></br>
+        
+        A rootless flame preset ( for example a flame saved into the clipboard from FLAM3H™, Apophysis, Fractorium and other)</br>
+        is normalized in place by grouping it under a new root, without any serialize/parse round trip.</br>
+
+        Args:
+            xmlfile(str | None): The flame file full path string or the clipboard flame data string we are trying to load.
+            pretty_print(bool): Default to: True</br>Reformat the entire XML tree. Set it to False when the tree is only read in memory,</br>the flame presets that will be written out can then be reformatted on their own with: out_flame_utils._out_pretty_print_element(...)
             
-        if self.xmlfile_data_clipboard is not None:
-            self._isvalidtree = True
-            self._tree: lxmlET._ElementTree = lxmlET.ElementTree(lxmlET.fromstring(self.xmlfile_data_clipboard))
-            self._root: lxmlET._Element = self.tree.getroot()
+        Returns:
+            (lxmlET._Element | None): The flames root ready to be loaded in or None if not a valid flame data.
+        """
+        if xmlfile is None:
+            return None
+        
+        if os.path.isfile(xmlfile):
             
-        elif self.xmlfile_data is not None:
-            self._isvalidtree = True
-            self._tree: lxmlET._ElementTree = lxmlET.ElementTree(lxmlET.fromstring(self.xmlfile_data))
-            self._root: lxmlET._Element = self.tree.getroot()
+            try:
+                root: lxmlET._Element = lxmlET.parse(xmlfile).getroot()
+                
+            except OSError:
+                return None
+            
+            except lxmlET.XMLSyntaxError:
+                return None
+            
+        else:
+            
+            try:
+                root: lxmlET._Element = lxmlET.fromstring(xmlfile)
+                
+            except ValueError:
+                return None
+            
+            except lxmlET.XMLSyntaxError:
+                return None
             
-        elif self._isvalidtree:
-            self._tree: lxmlET._ElementTree = lxmlET.parse(self.xmlfile)
-            self._root: lxmlET._Element = self.tree.getroot()
+        root_tag: str = root.tag.lower()
+        if xml_keys.XML_ROOT not in root_tag:
+            
+            # If there are flames, proceed
+            if any(True for _ in root.iter(xml_keys.XML_NAME)):
+                newroot: lxmlET._Element = lxmlET.Element(xml_keys.XML_ROOT)
+                newroot.insert(0, root)
+                if pretty_print:
+                    out_flame_utils._out_pretty_print(newroot)
+                return newroot
             
-        # This not private as its cheaper to have it evaluate from this parent class.
-        self._name: tuple[str | list[Never], ...] = self.get_name()
-        self._plugins: tuple[str | list[Never], ...] = self.get_name(xml_keys.XML_PLUGINS)
-        self._sw_version: tuple[str | list[Never], ...] = self.get_name(xml_keys.XML_VERSION)
+            if xml_keys.XML_ROOT_CHAOS in root_tag:
+                # let us know
+                _MSG: str = "IN: Chaotica XML not supported"
+                flam3h_general_utils.set_status_msg(f"{hou.pwd().name()}: {_MSG}", 'WARN')
+                flam3h_general_utils.flash_message(hou.pwd(), _MSG)
+                
+            return None
+        
+        # If there are flames, proceed
+        if any(True for _ in root.iter(xml_keys.XML_NAME)):
+            if pretty_print:
+                out_flame_utils._out_pretty_print(root)
+            return root
+        
+        return None
 
 
     @staticmethod
@@ -14601,6 +17301,29 @@ class _xml_tree
                 return False
         else:
             return False
+        
+        
+    @staticmethod
+    def xmlfile_isvalid(xmlfile: str | None) -> TypeGuard[str]:
+        """Check if the flame data source (a flame file or the clipboard flame data) is valid to load a flame preset from.</br>
+        For a flame file already indexed with trusted byte offsets, the cached flame file index is used</br>
+        so we do not parse the entire flame file just to check it right before loading a single flame preset out of it.</br>
+
+        Args:
+            xmlfile(str | None): The flame file full path string or the clipboard flame data string we are trying to load.
+
+        Returns:
+            (TypeGuard[str]): True if it is a valid flame data or False if not. When True, xmlfile is narrowed to: str
+        """
+        if xmlfile is None:
+            return False
+        
+        if os.path.isfile(xmlfile):
+            index: _xml_index = _xml_index.xmlfile_index(xmlfile)
+            if index.offsets is not None:
+                return index.isvalidtree
+            
+        return _xml_tree(xmlfile).isvalidtree
 
 
     # CLASS: PROPERTIES
@@ -14611,20 +17334,14 @@ class _xml_tree
     def xmlfile(self) -> str:
         return self._xmlfile
     
-    @cached_slot_property
-    def xmlfile_data(self) -> str | None:
-        return self._xmlfile_data
-    
-    @cached_slot_property
-    def xmlfile_data_clipboard(self) -> str | None:
-        return self._xmlfile_data_clipboard
-    
     @cached_slot_property
     def isvalidtree(self) -> bool:
         return self._isvalidtree
     
     @cached_slot_property
     def tree(self) -> lxmlET._ElementTree:
+        if self._flames_ra is not None:
+            return self.root.getroottree()
         return self._tree
     
     @cached_slot_property
@@ -14632,7 +17349,8 @@ class _xml_tree
         """Build the XML file root.<br/>
         
         Note:<br/>
-        This will only be valid if: self._isvalidtree is True
+        This will only be valid if: self._isvalidtree is True</br>
+        When loading a single flame preset (random access), the entire flame file is parsed only the first time this is accessed.
 
         Args:
             (self):
@@ -14640,23 +17358,96 @@ class _xml_tree
         Returns:
             (lxmlET.etree._Element):
         """
+        if self._flames_ra is not None:
+            root: lxmlET._Element | None = self.xmlfile_load(self.xmlfile, False)
+            assert root is not None
+            return root
         return self._root
-    
+
     @cached_slot_property
-    def name(self) -> tuple[str | list[Never], ...]:
-        return self._name
-    
+    def name(self) -> TA_XML_FlameVals:
+        # The flame presets names are already known from the flame file index.
+        if self._flames_ra is not None:
+            return self._index.name
+        return self.get_name()
+
     @cached_slot_property
-    def plugins(self) -> tuple[str | list[Never], ...]:
-        return self._plugins
-    
+    def plugins(self) -> TA_XML_FlameVals:
+        return self.get_name(xml_keys.XML_PLUGINS)
+
     @cached_slot_property
-    def sw_version(self) -> tuple[str | list[Never], ...]:
-        return self._sw_version
-    
+    def sw_version(self) -> TA_XML_FlameVals:
+        return self.get_name(xml_keys.XML_VERSION)
+
+
+    def __flames_ra_init(self, idx: int | None) -> _xml_flames_data | None:
+        """Random access to a single flame preset of a flame file.</br>
+        Instead of parsing the entire flame file (it can be a flame library with thousands of flame presets in it),</br>
+        use the flame file index byte offsets to parse only the flame preset we are going to load.</br></br>
+
+        The flame preset at the given index is loaded right away, all the others only if they are ever accessed.</br>
+        If anything does not allow it, the entire flame file will be parsed as usual instead.</br>
+
+        Args:
+            (self):
+            idx(int | None): The index of the flame preset we are going to load or None to parse the entire flame file.
+
+        Returns:
+            (_xml_flames_data | None): The flame file flame presets or None if random access is not possible.
+        """
+        if idx is None or not os.path.isfile(self.xmlfile):
+            return None
+
+        index: _xml_index = _xml_index.xmlfile_index(self.xmlfile)
+        if not index.isvalidtree or index.offsets is None:
+            return None
+
+        # Clamp the idx the same way: in_flame.__is_valid_idx(...) does
+        flames_count: int = len(index.offsets)
+        idx = 0 if idx < 0 else flames_count - 1 if idx > flames_count - 1 else idx
+        flame: lxmlET._Element | None = index.flame_load(idx)
+        if flame is None:
+            return None
+
+        self._index: _xml_index = index
+        return _xml_flames_data(flames_count, self.__flame_ra_load, {idx: flame})
+
+
+    def __flame_ra_load(self, idx: int) -> lxmlET._Element:
+        """Load a single flame preset from the flame file using its index byte offsets.</br>
+        If the flame file changed since it was indexed, the flame preset is taken from the entire flame file instead.</br>
+
+        Args:
+            (self):
+            idx(int): The flame preset index.
+
+        Returns:
+            (lxmlET._Element): The flame preset.
+        """
+        flame: lxmlET._Element | None = self._index.flame_load(idx)
+        if flame is None:
+            return out_flame_utils._out_pretty_print_element(tuple(self.root.iter(xml_keys.XML_NAME))[idx])
+        return flame
+
+
+    def __get_flames_vals(self, func: Callable[[lxmlET._Element], str | list[Never]]) -> TA_XML_FlameVals:
+        """Collect a value from each flame preset.</br>
+        The values are collected lazily, only for the flame presets being accessed and only once for each of them.</br>
+        On a flame file with thousands of flame presets in it, loading one flame preset will not touch all the others.</br>
+
+        Args:
+            (self):
+            func(Callable[[lxmlET._Element], str | list[Never]]): The definition collecting the value from a flame preset.
+
+        Returns:
+            (TA_XML_FlameVals): The flame presets values.
+        """
+        flames: tuple[lxmlET._Element, ...] | _xml_flames_data = self._flames_ra if self._flames_ra is not None else self._root_items
+        return _xml_flames_data(len(flames), lambda idx: func(flames[idx]))
+
 
     # This not private as its cheaper to have it evaluate from this parent class.
-    def get_name(self, key: str = xml_keys.XML_XF_NAME) -> tuple[str | list[Never], ...]:
+    def get_name(self, key: str = xml_keys.XML_XF_NAME) -> TA_XML_FlameVals:
         """Collect all Flame presets name from the XML Flame file.</br>
 
         Args:
@@ -14664,23 +17455,22 @@ class _xml_tree
             key(str): Default to: xml_keys.XML_XF_NAME</br>The XML Flame's name key.
 
         Returns:
-            (tuple[str | list[Never], ...]): Flame presets names packed into a tuple of strings</br>or an empty list instead if the XML key is not found in the XML preset. Or an empty tuple.
+            (TA_XML_FlameVals): Flame presets names packed into a tuple of strings</br>or an empty list instead if the XML key is not found in the XML preset. Or an empty tuple.
         """
         if self.isvalidtree:
-            
-            root: lxmlET._Element = self.root
+
             _strip: Callable[[str], str] = str.strip
             _len: Callable[[str], int] = len
             if key == xml_keys.XML_XF_NAME:
-                list_values_cleaned: tuple[str | list[Never], ...] = tuple(_strip(keyval) if (keyval := name.get(key)) is not None and _len(keyval) else '[]' for name in root)
+                list_values_cleaned: TA_XML_FlameVals = self.__get_flames_vals(lambda name: _strip(keyval) if (keyval := name.get(key)) is not None and _len(keyval) else '[]')
             else:
-                list_values_cleaned: tuple[str | list[Never], ...] = tuple(_strip(keyval) if (keyval := name.get(key)) is not None and _len(keyval) else [] for name in root)
+                list_values_cleaned: TA_XML_FlameVals = self.__get_flames_vals(lambda name: _strip(keyval) if (keyval := name.get(key)) is not None and _len(keyval) else [])
             return list_values_cleaned
         
         return () 
         
         
-    def __get_name_val_str(self, key: str, _DEFAULT: str = '0') -> tuple[str | list[Never], ...]:
+    def __get_name_val_str(self, key: str, _DEFAULT: str = '0') -> TA_XML_FlameVals:
         """Collect all Flame presets single value from the XML Flame file and return all of them packed into a tuple.</br>
         It will also scan each string value for invalid characters and try to remove them returning a cleaned up string value.</br>
 
@@ -14690,19 +17480,18 @@ class _xml_tree
             _DEFAULT(str): Default to: '0'</br>If something goes wrong, use this default value instead.
 
         Returns:
-            (tuple[str | list[Never], ...]): Flame presets single string values packed into a tuple os strings</br>or an empty list instead if the XML key is not found in the XML preset. Or an empty tuple
-        """      
+            (TA_XML_FlameVals): Flame presets single string values packed into a tuple os strings</br>or an empty list instead if the XML key is not found in the XML preset. Or an empty tuple
+        """
         if self.isvalidtree:
-            
-            root: lxmlET._Element = self.root
+
             _strip: Callable[[str], str] = str.strip
-            list_values_cleaned: tuple[str | list[Never], ...] = tuple(_strip(in_flame.xf_val_cleanup_str(keyval, _DEFAULT, key)) if (keyval := name.get(key)) is not None else [] for name in root)
+            list_values_cleaned: TA_XML_FlameVals = self.__get_flames_vals(lambda name: _strip(in_flame.xf_val_cleanup_str(keyval, _DEFAULT, key)) if (keyval := name.get(key)) is not None else [])
             return list_values_cleaned
             
         return () 
         
         
-    def __get_name_curve_val_str(self, key: str, _DEFAULT: str = '0') -> tuple[str | list[Never], ...]:
+    def __get_name_curve_val_str(self, key: str, _DEFAULT: str = '0') -> TA_XML_FlameVals:
         """Collect all Flame presets multi color correction curve values from the XML Flame file and return all of them packed into a tuple.</br>
         It will also scan each string value for invalid characters and try to remove them returning a cleaned up string value.</br>
 
@@ -14712,20 +17501,19 @@ class _xml_tree
             _DEFAULT(str): Default to: '0'</br>If something goes wrong, use this default value instead.
 
         Returns:
-            (tuple[str | list[Never], ...]): Flame presets multi color correction curve values packed into a tuple of strings</br>or an empty list instead if the XML key is not found in the XML preset. Or an empty tuple.
-        """      
+            (TA_XML_FlameVals): Flame presets multi color correction curve values packed into a tuple of strings</br>or an empty list instead if the XML key is not found in the XML preset. Or an empty tuple.
+        """
         if self.isvalidtree:
-            
-            root: lxmlET._Element = self.root
+
             _strip: Callable[[str], str] = str.strip
             _xf_val_cleanup_split_str: Callable[[str, str, str], str] = in_flame.xf_val_cleanup_split_str
-            list_values_cleaned: tuple[str | list[Never], ...] = tuple(_strip(_xf_val_cleanup_split_str(keyval, _DEFAULT, key)) if (keyval := name.get(key)) is not None and keyval != '' else [] for name in root)
+            list_values_cleaned: TA_XML_FlameVals = self.__get_flames_vals(lambda name: _strip(_xf_val_cleanup_split_str(keyval, _DEFAULT, key)) if (keyval := name.get(key)) is not None and keyval != '' else [])
             return list_values_cleaned
             
         return () 
         
         
-    def __get_name_list_str(self, key: str) -> tuple[str | list[Never], ...]:
+    def __get_name_list_str(self, key: str) -> TA_XML_FlameVals:
         """Collect all Flame presets list values from the XML Flame file.</br>
         Some examples of values to use this definition with are: size, center...</br>
         (all key name that hold multiple string values in it)</br>
@@ -14735,24 +17523,23 @@ class _xml_tree
             key(str): The XML Flame's key name.
 
         Returns:
-            (tuple[str | list[Never], ...]): Return all values packed into a tuple of strings</br>or an empty list instead if the XML key is not found in the XML preset. Or an empty tuple
+            (TA_XML_FlameVals): Return all values packed into a tuple of strings</br>or an empty list instead if the XML key is not found in the XML preset. Or an empty tuple
         """
         if self.isvalidtree:
-            
+
             _d: str | None = XML_TO_F3H_DEFAULT_VALS.get(key)
             if _d is not None: _default: str = _d
             else: _default: str = '0'
-            
-            root: lxmlET._Element = self.root
+
             _strip: Callable[[str], str] = str.strip
             _xf_list_cleanup_str: Callable[[list[str], str, str], str] = in_flame.xf_list_cleanup_str
-            list_values_cleaned: tuple[str | list[Never], ...] = tuple(str(_xf_list_cleanup_str(_strip(keyval).split(), _default, key)) if (keyval := name.get(key)) is not None else [] for name in root)
+            list_values_cleaned: TA_XML_FlameVals = self.__get_flames_vals(lambda name: str(_xf_list_cleanup_str(_strip(keyval).split(), _default, key)) if (keyval := name.get(key)) is not None else [])
             return list_values_cleaned
         
         return () 
         
         
-    def __get_flame(self, key: str = xml_keys.XML_NAME) -> tuple[lxmlET._Element, ...] | None:
+    def __get_flame(self, key: str = xml_keys.XML_NAME) -> tuple[lxmlET._Element, ...] | _xml_flames_data | None:
         """Collect the actual Flame presets object data from the XML file.</br>
 
         Args:
@@ -14760,25 +17547,30 @@ class _xml_tree
             key (str): Default to: xml_keys.XML_NAME</br>The XML Flame's flame key.
 
         Returns:
-            (tuple | None): Flames objects data or None if not found.
+            (tuple | _xml_flames_data | None): Flames objects data or None if not found.
         """
         if self.isvalidtree:
-            return tuple(f for f in self.root.iter(key))
+            if self._flames_ra is not None:
+                return self._flames_ra
+            # The XML tree has been loaded without reformatting it,
+            # so reformat each flame preset only if and when it is accessed as it might be written out.
+            flames: tuple[lxmlET._Element, ...] = tuple(self.root.iter(key))
+            return _xml_flames_data(len(flames), lambda idx: out_flame_utils._out_pretty_print_element(flames[idx]))
         
         return None
 
 
-    def __get_flame_count(self, flames: list) -> int:
+    def __get_flame_count(self, flames: tuple[lxmlET._Element, ...] | _xml_flames_data | None) -> int:
         """Get the number of Flame presets inside the XML file.</br>
 
         Args:
             (self):
-            flames(list): Flames objects data.
+            flames(tuple[lxmlET._Element, ...] | _xml_flames_data | None): Flames objects data.
 
         Returns:
             (int): Number of Flames.
         """
-        if self.isvalidtree:
+        if self.isvalidtree and flames is not None:
             return len(flames)
         
         return 0
@@ -14802,21 +17594,19 @@ class in_flame
 @STATICMETHODS
 * xf_val_cleanup_split_str(val: str, default_val: str = '0', key_name: str | None = None) -> str:
 * xf_val_cleanup_str(val: str, default_val: str = '0', key_name: str | None = None) -> str:
-* xf_list_cleanup(vals: list[str], default_val: str = '0', key_name: str | None = None) -> list[str]:
+* xf_list_cleanup(vals: list[str], default_val: str = '0', key_name: str | None = None, verbose: bool = True) -> list[str]:
 * xf_list_cleanup_str(vals: list[str], default_val: str = '0', key_name: str | None = None) -> str:
-* affine_coupling(affine: list[float], key: str = '', mp_idx: int | None = None, type: int = 0) -> list[hou.Vector2] | list[Never]:
 * check_all_iterator_weights(node: hou.SopNode, keyvalues: list) -> None:
 
 @METHODS
 * __is_valid_idx(self, idx: int) -> int:
 * __get_xforms(self, idx: int, key: str) -> tuple[dict, ...] | None:
-* __get_xaos(self, xforms: tuple[dict, ...] | None, key: str = xml_keys.XML_XF_XAOS) -> tuple[list[str] | list[Never], ...] | None:
-* __get_affine(self, xforms: tuple[dict, ...] | None, key: str, type: int = 0) -> tuple[tuple[hou.Vector2, ...] | list[Never], ...] | None:
-* __get_keyvalue(self, xforms: tuple[dict, ...] | None, key: str, msg: bool = True) -> tuple[float | str, ...] | None:
-* __get_palette(self, idx: int, key: str = xml_keys.XML_PALETTE) -> tuple[hou.Ramp, int, str] | None:
-* __get_palette_flam3h_hsv(self, idx: int) -> TA_TypeMaker | bool:
+* __get_xforms_data(self, xforms: tuple[dict, ...] | None, type: int = 0) -> dict[str, tuple | None]:
+* __get_palette(self, idx: int, key: str = xml_keys.XML_PALETTE) -> tuple[NDArray[np_float32], str] | None:
+* get_flame_model(self, idx: int) -> flame_model | None:
+* __get_palette_flam3h_hsv(self, idx: int) -> list[float] | bool:
 * __get_mb_flam3h_mb(self, idx: int, key: str = '') -> int | float | bool | None:
-* __get_cp_flam3h_samples(self, idx: int, palette: tuple[hou.Ramp, int, str] | None = None) -> int | bool:
+* __get_cp_flam3h_samples(self, idx: int, palette_count: int | None = None) -> int | bool:
 * __get_cp_flam3h_basis(self, idx: int) -> int | bool:
 * __get_flam3h_toggle(self, toggle: str | list[Never]) -> int | None:
 
@@ -14825,63 +17615,25 @@ class in_flame
     """  
 
     __slots__ = ("_cached_data", 
-                 "_node", "_flame", "_flame_count", 
-                 "_out_size", "_out_center", "_out_rotate", "_out_scale", "_out_quality", "_out_brightness", "_out_gamma", "_out_highlight_power", "_out_logscale_k2", "_out_vibrancy", 
-                 "_out_palette_mode", 
-                 "_out_curves", "_out_curve_overall", "_out_curve_red", "_out_curve_green", "_out_curve_blue", 
-                 "_flam3h_sys_rip", "_flam3h_hsv", 
-                 "_flam3h_mb", "_flam3h_mb_samples", "_flam3h_mb_shutter", "_flam3h_cp_samples", "_flam3h_cp_basis", 
-                 "_flam3h_prefs_f3c")
+                 "_node", "_flame", "_flame_count")
 
-    def __init__(self, node: hou.SopNode, xmlfile: str) -> None:
+    def __init__(self, node: hou.SopNode, xmlfile: str, idx: int | None = None) -> None:
         """
         Args:
             (self):
             node(hou.SopNode): This FLAM3H™ node
             xmlfile (str): xml *.flame v_type file to load
+            idx(int | None): Default to: None</br>The index of the flame preset we are going to load, if any.</br>When given, only this flame preset will be parsed out of the flame file if possible.
         """
-        super().__init__(xmlfile)
+        super().__init__(xmlfile, idx)
         
         self._node: hou.SopNode = node
-        self._flame: tuple[lxmlET._Element, ...] | None = self._xml_tree__get_flame() # pyright: ignore[reportAttributeAccessIssue]
+        self._flame: tuple[lxmlET._Element, ...] | _xml_flames_data | None = self._xml_tree__get_flame() # pyright: ignore[reportAttributeAccessIssue]
         self._flame_count: int = self._xml_tree__get_flame_count(self.flame) # pyright: ignore[reportAttributeAccessIssue]
         
-        # render properties
-        self._out_size: tuple[str | list[Never], ...] = self._xml_tree__get_name_list_str(xml_keys.XML_SIZE) # pyright: ignore[reportAttributeAccessIssue]
-        self._out_center: tuple[str | list[Never], ...] = self._xml_tree__get_name_list_str(xml_keys.XML_CENTER) # pyright: ignore[reportAttributeAccessIssue]
-        self._out_rotate: tuple[str | list[Never], ...] = self._xml_tree__get_name_val_str(xml_keys.XML_ROTATE, '0') # pyright: ignore[reportAttributeAccessIssue]
-        self._out_scale: tuple[str | list[Never], ...] = self._xml_tree__get_name_val_str(xml_keys.XML_SCALE, '0') # pyright: ignore[reportAttributeAccessIssue]
-        self._out_quality: tuple[str | list[Never], ...] = self._xml_tree__get_name_val_str(xml_keys.XML_QUALITY, '1000') # pyright: ignore[reportAttributeAccessIssue]
-        self._out_brightness: tuple[str | list[Never], ...] = self._xml_tree__get_name_val_str(xml_keys.XML_BRIGHTNESS, '3') # pyright: ignore[reportAttributeAccessIssue]
-        self._out_gamma: tuple[str | list[Never], ...] = self._xml_tree__get_name_val_str(xml_keys.XML_GAMMA, '2.5') # pyright: ignore[reportAttributeAccessIssue]
-        self._out_highlight_power: tuple[str | list[Never], ...] = self._xml_tree__get_name_val_str(xml_keys.XML_POWER, '5') # pyright: ignore[reportAttributeAccessIssue]
-        self._out_logscale_k2: tuple[str | list[Never], ...] = self._xml_tree__get_name_val_str(xml_keys.XML_K2, '0') # pyright: ignore[reportAttributeAccessIssue]
-        self._out_vibrancy: tuple[str | list[Never], ...] = self._xml_tree__get_name_val_str(xml_keys.XML_VIBRANCY, '0.3333') # pyright: ignore[reportAttributeAccessIssue]
-        
-        # palette lookup samples basis
-        self._out_palette_mode: tuple[str | list[Never], ...] = self.get_name(xml_keys.XML_PALETTE_MODE)
-        
-        # render curves
-        self._out_curves: tuple[str | list[Never], ...] = self._xml_tree__get_name_curve_val_str(xml_keys.XML_CC_CURVES, xml_keys.DEFAULT_CC_CURVES) # pyright: ignore[reportAttributeAccessIssue]
-        self._out_curve_overall: tuple[str | list[Never], ...] = self._xml_tree__get_name_curve_val_str(xml_keys.XML_CC_CURVE_OVERALL, xml_keys.DEFAULT_CC_CURVE) # pyright: ignore[reportAttributeAccessIssue]
-        self._out_curve_red: tuple[str | list[Never], ...] = self._xml_tree__get_name_curve_val_str(xml_keys.XML_CC_CURVE_RED, xml_keys.DEFAULT_CC_CURVE) # pyright: ignore[reportAttributeAccessIssue]
-        self._out_curve_green: tuple[str | list[Never], ...] = self._xml_tree__get_name_curve_val_str(xml_keys.XML_CC_CURVE_GREEN, xml_keys.DEFAULT_CC_CURVE) # pyright: ignore[reportAttributeAccessIssue]
-        self._out_curve_blue: tuple[str | list[Never], ...] = self._xml_tree__get_name_curve_val_str(xml_keys.XML_CC_CURVE_BLUE, xml_keys.DEFAULT_CC_CURVE) # pyright: ignore[reportAttributeAccessIssue]
-
-        # custom to FLAM3H™ only
-        self._flam3h_sys_rip: tuple[str | list[Never], ...] = self._xml_tree__get_name_val_str(xml_keys.f3h.XML_RIP) # pyright: ignore[reportAttributeAccessIssue] # This xml key must be present to be set otherwise leave it untouched
-        self._flam3h_hsv: tuple[str | list[Never], ...] = self._xml_tree__get_name_list_str(xml_keys.f3h.XML_HSV) # pyright: ignore[reportAttributeAccessIssue]
-        
-        # just check any of the MB val and if exist mean there is MB data to be set.
-        # this will act as bool and if true, it will hold our xml_keys.f3h.XML_MB_FPS value ( as string )
-        self._flam3h_mb: tuple[str | list[Never], ...] = self._xml_tree__get_name_val_str(xml_keys.f3h.XML_MB_FPS) # pyright: ignore[reportAttributeAccessIssue] # This xml key must be present to be set otherwise leave it untouched
-        self._flam3h_mb_samples: tuple[str | list[Never], ...] = self._xml_tree__get_name_val_str(xml_keys.f3h.XML_MB_SAMPLES, '16') # pyright: ignore[reportAttributeAccessIssue]
-        self._flam3h_mb_shutter: tuple[str | list[Never], ...] = self._xml_tree__get_name_val_str(xml_keys.f3h.XML_MB_SHUTTER, '0.5') # pyright: ignore[reportAttributeAccessIssue]
-        self._flam3h_cp_samples: tuple[str | list[Never], ...] = self._xml_tree__get_name_val_str(xml_keys.f3h.XML_CP_SAMPLES, '256') # pyright: ignore[reportAttributeAccessIssue]
-        self._flam3h_cp_basis: tuple[str | list[Never], ...] = self._xml_tree__get_name_val_str(xml_keys.f3h.XML_CP_SAMPLES_BASIS, '0') # pyright: ignore[reportAttributeAccessIssue]
+        # The render properties and the FLAM3H™ custom data are collected only when accessed (class: PROPERTIES below)
+        # and only for the flame presets being accessed, as only one flame preset is ever loaded at a time.
 
-        self._flam3h_prefs_f3c: tuple[str | list[Never], ...] = self._xml_tree__get_name_val_str(xml_keys.f3h.XML_F3C) # pyright: ignore[reportAttributeAccessIssue] # This xml key must be present to be set otherwise leave it untouched
-        
 
     @staticmethod
     def xf_val_cleanup_split_str(val: str, default_val: str = '0', key_name: str | None = None) -> str:
@@ -14916,11 +17668,11 @@ class in_flame
                     
                 except ValueError:
                     new.append(default_val)
-                    if key_name is not None: print(f"Warning:\nIN xml key: {key_name}[{idx}] -> NOT A VALUE\n")
+                    if key_name is not None: print(f"Warning:\nIN xml key: {key_name}[{idx}] -> NOT A VALUE\n", file=flame_model.warnings_out())
                     
                 else:
                     new.append(new_val)
-                    if key_name is not None: print(f"Warning:\nIN xml key: {key_name}[{idx}] -> NOT A VALUE (Corrected)\n")
+                    if key_name is not None: print(f"Warning:\nIN xml key: {key_name}[{idx}] -> NOT A VALUE (Corrected)\n", file=flame_model.warnings_out())
             else:
                 new.append(k)
                 
@@ -14950,12 +17702,12 @@ class in_flame
                 float(new_val)
                 
             except ValueError:
-                if key_name is not None: print(f"Warning:\nIN xml key: {key_name} -> NOT A VALUE\n")
+                if key_name is not None: print(f"Warning:\nIN xml key: {key_name} -> NOT A VALUE\n", file=flame_model.warnings_out())
                 
                 return default_val
             
             else:
-                if key_name is not None: print(f"Warning:\nIN xml key: {key_name} -> NOT A VALUE (Corrected)\n")
+                if key_name is not None: print(f"Warning:\nIN xml key: {key_name} -> NOT A VALUE (Corrected)\n", file=flame_model.warnings_out())
                 
                 return new_val
             
@@ -14964,13 +17716,14 @@ class in_flame
 
 
     @staticmethod
-    def xf_list_cleanup(vals: list[str], default_val: str = '0', key_name: str | None = None) -> list[str]:
+    def xf_list_cleanup(vals: list[str], default_val: str = '0', key_name: str | None = None, verbose: bool = True) -> list[str]:
         """ Return a list after attempting to eliminate invalid characters from the provided list values.</br>
         
         Args:
             vals(list[str]): values from the xml
             default_val(str): Default to: '0'</br>If something goes wrong use this as the returned value.
             key_name(str | None): Default to: None</br>If not None</br>it will print out the key_name if not a value.
+            verbose(bool): Default to: True</br>When False, nothing is printed out even if a key_name is provided.
 
         Returns:
             (list[str]): a list of affine values cleaned up from invalid characters
@@ -14995,11 +17748,11 @@ class in_flame
                     
                 except ValueError:
                     _new_append(default_val)
-                    if key_name is not None: print(f"Warning:\nIN xml key: {key_name}[{idx}] -> NOT A VALUE\n")
+                    if key_name is not None and verbose: print(f"Warning:\nIN xml key: {key_name}[{idx}] -> NOT A VALUE\n", file=flame_model.warnings_out())
                     
                 else:
                     _new_append(new_val)
-                    if key_name is not None: print(f"Warning:\nIN xml key: {key_name}[{idx}] -> NOT A VALUE (Corrected)\n")
+                    if key_name is not None and verbose: print(f"Warning:\nIN xml key: {key_name}[{idx}] -> NOT A VALUE (Corrected)\n", file=flame_model.warnings_out())
             else:
                 _new_append(val)
                 
@@ -15038,92 +17791,16 @@ class in_flame
                     
                 except ValueError:
                     _new_append(default_val)
-                    if key_name is not None: print(f"Warning:\nIN xml key: {key_name}[{idx}] -> NOT A VALUE\n")
+                    if key_name is not None: print(f"Warning:\nIN xml key: {key_name}[{idx}] -> NOT A VALUE\n", file=flame_model.warnings_out())
                     
                 else:
                     _new_append(new_val)
-                    if key_name is not None: print(f"Warning:\nIN xml key: {key_name}[{idx}] -> NOT A VALUE (Corrected)\n")
+                    if key_name is not None: print(f"Warning:\nIN xml key: {key_name}[{idx}] -> NOT A VALUE (Corrected)\n", file=flame_model.warnings_out())
                     
             else:
                 _new_append(val)
                     
         return ' '.join(new)
-
-
-    @staticmethod
-    def affine_coupling(affine: list[float], key: str = '', mp_idx: int | None = None, type: int = 0) -> list[hou.Vector2] | list[Never]:
-        """ Build proper affine values composed of hou.Vector2 tuples.</br>
-        It will also check the affine passed in and provide an alternative defaults affine values</br>
-        if not correct and print out messages to inform the user about different cases.</br></br>
-        
-        Note:
-            This will need some work at some point.</br>
-        
-        Args:
-            affine(list[float]): values from the xml
-            key(str): Default to: ''</br>The type of affine to build: xml_keys.XML_PRE_AFFINE, xml_keys.XML_POST_AFFINE, xml_keys.f3h.XML_PRE_AFFINE, xml_keys.f3h.XML_POST_AFFINE
-            mp_idx(int | None): Default to: None</br>Multi parameter index, for messaging purpose only.
-            type(int): Default to: 0(Zero)</br>It is either an iterator: 0 or an FF: 1
-
-        Returns:
-            (list[hou.Vector2]): a list of hou.Vector2: ((X.x, X.y), (Y.x, Y.y), (O.x, O.y)) / ((A, D), (B, E), (C, F)) ready to be used to set affine parms, or an empty list if something is wrong
-        """      
-        affine_count: int = len(affine)
-        if affine_count == 6:
-            return [hou.Vector2((tuple(affine[i:i + 2]))) for i in (0, 2, 4)]
-        
-        print(datetime.now().strftime('%b-%d-%Y %H:%M:%S'))
-        
-        sel: dict[str, str] = {xml_keys.XML_PRE_AFFINE: f"Pre affine", xml_keys.XML_POST_AFFINE: f"Post affine", xml_keys.f3h.XML_PRE_AFFINE: f"F3H Pre affine", xml_keys.f3h.XML_POST_AFFINE: f"F3H Post affine"}
-        sel_key: str | None = sel.get(key)
-        
-        # Is it an iterator or an FF or None ?
-        iter_type: int | str | None = None
-        if mp_idx is not None:
-            
-            match type:
-                
-                case 0:
-                    iter_type = mp_idx
-                    
-                case 1:
-                    iter_type = 'FF'
-                    
-                case _:
-                    iter_type = None
-        
-        if key in [xml_keys.XML_PRE_AFFINE, xml_keys.XML_POST_AFFINE]:
-            if affine_count == 0:
-                if iter_type is not None:
-                    _MSG: str = f"\t{sel_key} on iterator.{iter_type}, have no affine values. Expeted are: 6\n\t:Reverted back to default affine values."
-                
-                else:
-                    _MSG: str = f"\t{sel_key} have {affine_count} values. Expeted are: 6\n\t:Reverted back to default affine values."
-                
-                print(f"{_MSG}\n")
-                
-                return [hou.Vector2((tuple( f3h_affineDefaults.DEFAULT_IDENT[i:i + 2] ))) for i in (0, 2, 4)]
-            
-            if iter_type is not None:
-                _MSG: str = f"\t{sel_key} on iterator.{iter_type}, have {affine_count} values. Expeted are: 6\n\t:Using 0.0(Zeros) for missing affine values."
-            
-            else:
-                _MSG: str = f"\t{sel_key} have {affine_count} values. Expeted are: 6\n\t:Using 0.0(Zeros) for missing affine values."
-            
-            print(f"{_MSG}\n")
-            
-            return [hou.Vector2((tuple( np_pad(affine, (0, 6-min(6, affine_count)), 'constant', constant_values = 0).tolist()[i:i + 2] ))) for i in (0, 2, 4)]
-        
-        if sel_key is not None:
-            if iter_type is not None:
-                _MSG: str = f"\t{sel_key} on iterator.{iter_type}, have {affine_count} values. Expeted are: 6\n\t:Skipped"
-                print(f"{_MSG}\n")
-                
-            else:
-                _MSG: str = f"\t{sel_key} have {affine_count} values. Expeted are: 6\n\t:Skipped"
-                print(f"{_MSG}\n")
-                
-        return []
     
     
     @staticmethod
@@ -15159,7 +17836,7 @@ class in_flame
     #     return self._name
 
     @cached_slot_property
-    def flame(self) -> tuple[lxmlET._Element, ...] | None:
+    def flame(self) -> tuple[lxmlET._Element, ...] | _xml_flames_data | None:
         return self._flame
 
     @cached_slot_property
@@ -15167,104 +17844,106 @@ class in_flame
         return self._flame_count
     
     @cached_slot_property
-    def out_size(self) -> tuple[str | list[Never], ...]:
-        return self._out_size
+    def out_size(self) -> TA_XML_FlameVals:
+        return self._xml_tree__get_name_list_str(xml_keys.XML_SIZE) # pyright: ignore[reportAttributeAccessIssue]
     
     @cached_slot_property
-    def out_center(self) -> tuple[str | list[Never], ...]:
-        return self._out_center
+    def out_center(self) -> TA_XML_FlameVals:
+        return self._xml_tree__get_name_list_str(xml_keys.XML_CENTER) # pyright: ignore[reportAttributeAccessIssue]
     
     @cached_slot_property
-    def out_rotate(self) -> tuple[str | list[Never], ...]:
-        return self._out_rotate
+    def out_rotate(self) -> TA_XML_FlameVals:
+        return self._xml_tree__get_name_val_str(xml_keys.XML_ROTATE, '0') # pyright: ignore[reportAttributeAccessIssue]
     
     @cached_slot_property
-    def out_scale(self) -> tuple[str | list[Never], ...]:
-        return self._out_scale
+    def out_scale(self) -> TA_XML_FlameVals:
+        return self._xml_tree__get_name_val_str(xml_keys.XML_SCALE, '0') # pyright: ignore[reportAttributeAccessIssue]
     
     @cached_slot_property
-    def out_quality(self) -> tuple[str | list[Never], ...]:
-        return self._out_quality
+    def out_quality(self) -> TA_XML_FlameVals:
+        return self._xml_tree__get_name_val_str(xml_keys.XML_QUALITY, '1000') # pyright: ignore[reportAttributeAccessIssue]
 
     @cached_slot_property
-    def out_brightness(self) -> tuple[str | list[Never], ...]:
-        return self._out_brightness
+    def out_brightness(self) -> TA_XML_FlameVals:
+        return self._xml_tree__get_name_val_str(xml_keys.XML_BRIGHTNESS, '3') # pyright: ignore[reportAttributeAccessIssue]
     
     @cached_slot_property
-    def out_gamma(self) -> tuple[str | list[Never], ...]:
-        return self._out_gamma
+    def out_gamma(self) -> TA_XML_FlameVals:
+        return self._xml_tree__get_name_val_str(xml_keys.XML_GAMMA, '2.5') # pyright: ignore[reportAttributeAccessIssue]
     
     @cached_slot_property
-    def out_highlight_power(self) -> tuple[str | list[Never], ...]:
-        return self._out_highlight_power
+    def out_highlight_power(self) -> TA_XML_FlameVals:
+        return self._xml_tree__get_name_val_str(xml_keys.XML_POWER, '5') # pyright: ignore[reportAttributeAccessIssue]
     
     @cached_slot_property
-    def out_logscale_k2(self) -> tuple[str | list[Never], ...]:
-        return self._out_logscale_k2
+    def out_logscale_k2(self) -> TA_XML_FlameVals:
+        return self._xml_tree__get_name_val_str(xml_keys.XML_K2, '0') # pyright: ignore[reportAttributeAccessIssue]
     
     @cached_slot_property
-    def out_vibrancy(self) -> tuple[str | list[Never], ...]:
-        return self._out_vibrancy
+    def out_vibrancy(self) -> TA_XML_FlameVals:
+        return self._xml_tree__get_name_val_str(xml_keys.XML_VIBRANCY, '0.3333') # pyright: ignore[reportAttributeAccessIssue]
     
     @cached_slot_property
-    def out_palette_mode(self) -> tuple[str | list[Never], ...]:
-        return self._out_palette_mode
+    def out_palette_mode(self) -> TA_XML_FlameVals:
+        return self.get_name(xml_keys.XML_PALETTE_MODE)
     
     # render curves
     
     @cached_slot_property
-    def out_curves(self) -> tuple[str | list[Never], ...]:
-        return self._out_curves
+    def out_curves(self) -> TA_XML_FlameVals:
+        return self._xml_tree__get_name_curve_val_str(xml_keys.XML_CC_CURVES, xml_keys.DEFAULT_CC_CURVES) # pyright: ignore[reportAttributeAccessIssue]
     
     @cached_slot_property
-    def out_curve_overall(self) -> tuple[str | list[Never], ...]:
-        return self._out_curve_overall
+    def out_curve_overall(self) -> TA_XML_FlameVals:
+        return self._xml_tree__get_name_curve_val_str(xml_keys.XML_CC_CURVE_OVERALL, xml_keys.DEFAULT_CC_CURVE) # pyright: ignore[reportAttributeAccessIssue]
     
     @cached_slot_property
-    def out_curve_red(self) -> tuple[str | list[Never], ...]:
-        return self._out_curve_red
+    def out_curve_red(self) -> TA_XML_FlameVals:
+        return self._xml_tree__get_name_curve_val_str(xml_keys.XML_CC_CURVE_RED, xml_keys.DEFAULT_CC_CURVE) # pyright: ignore[reportAttributeAccessIssue]
     
     @cached_slot_property
-    def out_curve_green(self) -> tuple[str | list[Never], ...]:
-        return self._out_curve_green
+    def out_curve_green(self) -> TA_XML_FlameVals:
+        return self._xml_tree__get_name_curve_val_str(xml_keys.XML_CC_CURVE_GREEN, xml_keys.DEFAULT_CC_CURVE) # pyright: ignore[reportAttributeAccessIssue]
     
     @cached_slot_property
-    def out_curve_blue(self) -> tuple[str | list[Never], ...]:
-        return self._out_curve_blue
+    def out_curve_blue(self) -> TA_XML_FlameVals:
+        return self._xml_tree__get_name_curve_val_str(xml_keys.XML_CC_CURVE_BLUE, xml_keys.DEFAULT_CC_CURVE) # pyright: ignore[reportAttributeAccessIssue]
     
     # custom to FLAM3H™ only
     
     @cached_slot_property
-    def flame3h_sys_rip(self) -> tuple[str | list[Never], ...]:
-        return self._flam3h_sys_rip
+    def flame3h_sys_rip(self) -> TA_XML_FlameVals:
+        return self._xml_tree__get_name_val_str(xml_keys.f3h.XML_RIP) # pyright: ignore[reportAttributeAccessIssue] # This xml key must be present to be set otherwise leave it untouched
 
     @cached_slot_property
-    def flam3h_hsv(self) -> tuple[str | list[Never], ...]:
-        return self._flam3h_hsv
+    def flam3h_hsv(self) -> TA_XML_FlameVals:
+        return self._xml_tree__get_name_list_str(xml_keys.f3h.XML_HSV) # pyright: ignore[reportAttributeAccessIssue]
     
+    # just check any of the MB val and if exist mean there is MB data to be set.
+    # this will act as bool and if true, it will hold our xml_keys.f3h.XML_MB_FPS value ( as string )
     @cached_slot_property
-    def flam3h_mb(self) -> tuple[str | list[Never], ...]: # motion blur fps ( frames per second )
-        return self._flam3h_mb
+    def flam3h_mb(self) -> TA_XML_FlameVals: # motion blur fps ( frames per second )
+        return self._xml_tree__get_name_val_str(xml_keys.f3h.XML_MB_FPS) # pyright: ignore[reportAttributeAccessIssue] # This xml key must be present to be set otherwise leave it untouched
     
     @cached_slot_property
-    def flam3h_mb_samples(self) -> tuple[str | list[Never], ...]:
-        return self._flam3h_mb_samples
+    def flam3h_mb_samples(self) -> TA_XML_FlameVals:
+        return self._xml_tree__get_name_val_str(xml_keys.f3h.XML_MB_SAMPLES, '16') # pyright: ignore[reportAttributeAccessIssue]
     
     @cached_slot_property
-    def flam3h_mb_shutter(self) -> tuple[str | list[Never], ...]:
-        return self._flam3h_mb_shutter
+    def flam3h_mb_shutter(self) -> TA_XML_FlameVals:
+        return self._xml_tree__get_name_val_str(xml_keys.f3h.XML_MB_SHUTTER, '0.5') # pyright: ignore[reportAttributeAccessIssue]
     
     @cached_slot_property
-    def flam3h_cp_samples(self) -> tuple[str | list[Never], ...]:
-        return self._flam3h_cp_samples
+    def flam3h_cp_samples(self) -> TA_XML_FlameVals:
+        return self._xml_tree__get_name_val_str(xml_keys.f3h.XML_CP_SAMPLES, '256') # pyright: ignore[reportAttributeAccessIssue]
     
     @cached_slot_property
-    def flam3h_cp_basis(self) -> tuple[str | list[Never], ...]:
-        return self._flam3h_cp_basis
+    def flam3h_cp_basis(self) -> TA_XML_FlameVals:
+        return self._xml_tree__get_name_val_str(xml_keys.f3h.XML_CP_SAMPLES_BASIS, '0') # pyright: ignore[reportAttributeAccessIssue]
     
     @cached_slot_property
-    def flam3h_prefs_f3c(self) -> tuple[str | list[Never], ...]: # flam3 compatibility preferences option
-        return self._flam3h_prefs_f3c
+    def flam3h_prefs_f3c(self) -> TA_XML_FlameVals: # flam3 compatibility preferences option
+        return self._xml_tree__get_name_val_str(xml_keys.f3h.XML_F3C) # pyright: ignore[reportAttributeAccessIssue] # This xml key must be present to be set otherwise leave it untouched
     
 
     def __is_valid_idx(self, idx: int) -> int:
@@ -15310,142 +17989,118 @@ class in_flame
         return None
     
     
-    def __get_xaos(self, xforms: tuple[dict, ...] | None, key: str = xml_keys.XML_XF_XAOS) -> tuple[list[str] | list[Never], ...] | None:
-        """
-        Args:
-            (self):
-            xforms(tuple[dict, ...] | None): list of all xforms contained inside this flame
-            key(str): Default to: xml_keys.XML_XF_XAOS</br>Rhe flame XML xaos tag name.
-
-        Returns:
-            (tuple[list[str] | list[Never], ...] | None): either a list of xaos strings</br>or an empty list instead if the XML key is not found in the XML preset. Or None
-        """
-        if  self.isvalidtree and xforms is not None:
-            _join: Callable[[Iterable[str]], str] = ':'.join
-            _xf_list_cleanup: Callable[[list[str], str, str | None], list[str]] = self.xf_list_cleanup
-            xaos: list = [f"xaos:{_join(_xf_list_cleanup(str(keyval).split(), '1', key))}" if (keyval := xf.get(key)) is not None else [] for xf in xforms]
-
-            _len: Callable[[list[Any]], int] = len
-            if not max(list(map(lambda x: _len(x), xaos))):
-                return None
-            
-            return tuple(xaos)
+    def __get_xforms_data(self, xforms: tuple[dict, ...] | None, type: int = 0) -> dict[str, tuple | None]:
+        """Decode all the xforms data of the selected flame preset in a single pass.</br>
+        Each xform's attributes dict is visited only once and its values are collected into columns,</br>
+        one column for each xform's key (name, weight, pre_blur, xaos, affines, shader, ...) with one value for each xform.</br></br>
         
-        return None
-
+        Every column hold exactly what the separate loops over the xforms, one for each xform's key, used to collect.</br>
+        If an affine or the xaos key is not found in any of the xforms, its column will be None.</br>
+        No Houdini types are built here so it can run off the main thread: the affines are plain tuples of floats, see: in_flame_iter_data.hou_build()</br>
 
-    def __get_affine(self, xforms: tuple[dict, ...] | None, key: str, type: int = 0) -> tuple[tuple[hou.Vector2, ...] | list[Never], ...] | None:
-        """
         Args:
             (self):
             xforms(tuple[dict, ...] | None): list of all xforms contained inside this flame
-            key(str): affine xml tag name. Either 'coefs' for pre affine or 'post' for post affine
-            type(int): Default to: 0(Zero)</br>Only used by the self.affine_coupling(...) definition.</br>It is either an iterator: 0 or an FF: 1
-
-        Returns:
-            (tuple[tuple[hou.Vector2, ...] | list[Never], ...] | None): Either a list of list of tuples of hou.Vector2 ((X.x, X.y), (Y.x, Y.y), (O.x, O.y)) / ((A, D), (B, E), (C, F))</br>or an empty list instead if the XML key is not found in the XML preset. Or None
-        """   
-        if  self.isvalidtree and xforms is not None:
-            _affine_coupling: Callable[[list[float], str, int | None, int], list[hou.Vector2] | list[Never]] = self.affine_coupling
-            _xf_list_cleanup: Callable[[list[str], str, str | None], list[str]] = self.xf_list_cleanup
-            coefs: list = [tuple(_affine_coupling([float(x) for x in _xf_list_cleanup(str(keyval).split(), '0', key)], key, int(idx + 1), type)) if (keyval := xf.get(key)) is not None else [] for idx, xf in enumerate(xforms)]
-            
-            _len: Callable[[list[Any]], int] = len
-            if max(list(map(lambda x: _len(x), coefs))):
-                return tuple(coefs)
-            
-            return None
-            
-        return None
-
-
-    def __get_keyvalue(self, xforms: tuple[dict, ...] | None, key: str, msg: bool = True) -> tuple[str | float | list[Never], ...] | None:
-        """
-        Args:
-            (self):
-            xforms(tuple[dict, ...] | None): list of all xforms contained inside this Flame or None if something went wrong.
-            key(str): xml tag names. For shader: 'color', 'symmetry'->(color_speed), 'opacity'
-            msg(bool): Default to True</br> Set it to False to not print a message.
+            type(int): Default to: 0(Zero)</br>It is either an iterator: 0 or an FF: 1</br>The FF do not collect: weight, pre_blur, xaos and the shader values.
 
         Returns:
-            (tuple[str | float | list[Never], ...] | None): description
+            (dict[str, tuple | None]): The xforms data columns keyed by their xform's key name or an empty dict if there are no xforms.
         """
-        if self.isvalidtree and xforms is not None:
+        if not self.isvalidtree or xforms is None:
+            return {}
+        
+        if type:
+            keyvalue_keys: tuple[str, ...] = (xml_keys.f3h.XML_PRE_AFFINE_ANGLE, xml_keys.f3h.XML_POST_AFFINE_ANGLE, xml_keys.XML_XF_NAME)
+            xaos_key: str | None = None
+        else:
+            keyvalue_keys: tuple[str, ...] = (xml_keys.XML_XF_NAME, xml_keys.XML_XF_WEIGHT, xml_keys.XML_XF_PB, xml_keys.f3h.XML_PRE_AFFINE_ANGLE, xml_keys.f3h.XML_POST_AFFINE_ANGLE, 
+                                              xml_keys.XML_XF_COLOR, xml_keys.XML_XF_COLOR_SPEED, xml_keys.XML_XF_SYMMETRY, xml_keys.XML_XF_OPACITY)
+            xaos_key: str | None = xml_keys.XML_XF_XAOS
             
-            vars_keys_pre: list | None = None
-            if key == xml_keys.XML_XF_PB: vars_keys_pre = in_flame_utils.in_get_xforms_var_keys(xforms, in_flame_utils.in_util_make_PRE(VARS_FLAM3_DICT_IDX.keys()), XML_XF_KEY_EXCLUDE)
+        affine_keys: tuple[str, ...] = (xml_keys.XML_PRE_AFFINE, xml_keys.f3h.XML_PRE_AFFINE, xml_keys.XML_POST_AFFINE, xml_keys.f3h.XML_POST_AFFINE)
+        # Color speed is only used by Fractorium so we silent its warning message when missing
+        keyvalue_msg: tuple[bool, ...] = tuple(key != xml_keys.XML_XF_COLOR_SPEED for key in keyvalue_keys)
+        
+        # This way I keep this dict for all default values purposes
+        opacity_default: str | None = XML_TO_F3H_DEFAULT_VALS.get(xml_keys.XML_XF_OPACITY)
+        keyvalue_defaults: tuple[str, ...] = tuple((opacity_default if opacity_default is not None else '0') if key == xml_keys.XML_XF_OPACITY else '0' for key in keyvalue_keys)
+        keyvalue_missing: tuple[str | None, ...] = tuple(XML_TO_F3H_DEFAULT_VALS.get(key) for key in keyvalue_keys)
+        
+        # I could hard-code the name into the function: def in_vars_keys_remove_pgb(...), but this way I keep this dict global for all purposes.
+        pgb_name: str = VARS_FLAM3_NAME_PRE[VARS_FLAM3_NAME_FROM_IDX[33]]
+        
+        keyvalues: tuple[list[str | float | list[Never]], ...] = tuple([] for _ in keyvalue_keys)
+        affines: tuple[list[tuple[tuple[float, ...], ...] | list[Never]], ...] = tuple([] for _ in affine_keys)
+        xaos: list[str | list[Never]] = []
+        
+        _strip: Callable[[str], str] = str.strip
+        _join: Callable[[Iterable[str]], str] = ':'.join
+        _xf_val_cleanup_str: Callable[[str, str, str | None], str] = self.xf_val_cleanup_str
+        _xf_list_cleanup: Callable[[list[str], str, str | None], list[str]] = self.xf_list_cleanup
+        _affine_decode: Callable[[list[float], str, int | None, int], list[tuple[float, ...]] | list[Never]] = flame_model.affine_decode
+        
+        for idx, xform in enumerate(xforms):
             
-            keyvalues: list[str | float | list[Never]] = []
-            for idx, xform in enumerate(xforms):
+            for key, column, default_val, missing_val, msg in zip(keyvalue_keys, keyvalues, keyvalue_defaults, keyvalue_missing, keyvalue_msg):
                 
-                if xform.get(key) is not None:
-
-                    if key in xml_keys.XML_XF_NAME:
-                        keyvalues.append(str(xform.get(key)).strip())
-                        continue
-                    
+                keyval: str | None = xform.get(key)
+                if keyval is not None:
+                    if key == xml_keys.XML_XF_NAME:
+                        column.append(_strip(str(keyval)))
                     else:
-                        if key in xml_keys.XML_XF_OPACITY:
-                            default_val: str | None = XML_TO_F3H_DEFAULT_VALS.get(xml_keys.XML_XF_OPACITY) # This way I keep this dict for all default values purposes
-                            if default_val is None: default_val = '0'
-                        
-                        else:
-                            default_val: str | None = '0'
-                        
-                        assert default_val is not None
-                        keyvalues.append(float(self.xf_val_cleanup_str(xform.get(key, '0'), default_val, key)))
-                        continue
-                    
-                else:
+                        column.append(float(_xf_val_cleanup_str(keyval, default_val, key)))
+                    continue
+                
+                if key == xml_keys.XML_XF_PB:
                     # Fractorium used to remap "pre_blur" to "pre_gaussian_blur" when you loaded a Flame in and it seem to be fixed in the latest version.
                     # However, if a Flame xform uses a "pre_gaussian_blur" as the first in the list 
                     # mean that every time you save the Flame from Fractorium and load it back in FLAM3H™ you loose a PRE variation's slot.
                     #
                     # Lets remap "pre_gaussian_blur" back to "pre_blur" when we load a flame back in FLAM3H™ if it is the first one in the list.
-                    
-                    # I could hard-code the name into the function: def in_vars_keys_remove_pgb(...), but this way I keep this dict global for all purposes.
-                    pgb_name: str | list[str] | None = in_flame_utils.in_util_make_PRE(in_flame_utils.in_get_dict_key_from_value(VARS_FLAM3_DICT_IDX, 33))
                     pgb_val: str | None = xform.get(pgb_name)
-                    if pgb_val is not None and vars_keys_pre is not None: # This double check because also other keys not related to "pre_blur" can fall into this block otherwise
-                        if vars_keys_pre[idx] and pgb_name in vars_keys_pre[idx][0]:
-                            keyvalues.append(float(self.xf_val_cleanup_str(pgb_val, '0', str(pgb_name))))
-                            
+                    if pgb_val is not None:
+                        xform_vars_pre: TA_STR_ListUnflattened | None = in_flame_utils.in_get_xforms_var_keys((xform,), VARS_FLAM3_KEYS_PRE, XML_XF_KEY_EXCLUDE)
+                        assert xform_vars_pre is not None
+                        if xform_vars_pre[0] and pgb_name in xform_vars_pre[0][0]:
+                            column.append(float(_xf_val_cleanup_str(pgb_val, '0', pgb_name)))
                         else:
-                            keyvalues.append([])
-
+                            column.append([])
                         continue
                     
-                    else:
-                        default_val: str | None = XML_TO_F3H_DEFAULT_VALS.get(key)
-                        if default_val is not None:
-                            keyvalues.append(float(default_val))
-                            if msg: print(f"Warning: iterator.{idx+1}\nIN xml key: {key} -> NOT FOUND, default value used.\n")
-                            
-                        else:
-                            keyvalues.append([])
-                            
-                        continue
-            
-            # CHECKS
-            if key in xml_keys.XML_XF_WEIGHT:
-                # Let the user know
-                in_flame.check_all_iterator_weights(self.node, keyvalues)
+                if missing_val is not None:
+                    column.append(float(missing_val))
+                    if msg: print(f"Warning: iterator.{idx+1}\nIN xml key: {key} -> NOT FOUND, default value used.\n", file=flame_model.warnings_out())
+                else:
+                    column.append([])
+                    
+            for key, column in zip(affine_keys, affines):
+                keyval: str | None = xform.get(key)
+                column.append(tuple(_affine_decode([float(x) for x in _xf_list_cleanup(str(keyval).split(), '0', key)], key, int(idx + 1), type)) if keyval is not None else [])
                 
-            return tuple(keyvalues)
+            if xaos_key is not None:
+                keyval: str | None = xform.get(xaos_key)
+                xaos.append(f"xaos:{_join(_xf_list_cleanup(str(keyval).split(), '1', xaos_key))}" if keyval is not None else [])
         
+        data: dict[str, tuple | None] = dict(zip(keyvalue_keys, map(tuple, keyvalues)))
+        # If an affine or the xaos are not found in any of the xforms, they are None
+        for key, column in zip(affine_keys, affines):
+            data[key] = tuple(column) if any(column) else None
+        if xaos_key is not None:
+            data[xaos_key] = tuple(xaos) if any(xaos) else None
         
-        return None
+        return data
 
         
-    def __get_palette(self, idx: int, key: str = xml_keys.XML_PALETTE) -> tuple[hou.Ramp, int, str] | None:
-        """
+    def __get_palette(self, idx: int, key: str = xml_keys.XML_PALETTE) -> tuple[NDArray[np_float32], str] | None:
+        """The hou.Ramp is built out of it by: in_flame_iter_data.hou_build()</br>
+        
         Args:
             (self):
             idx(int): flame idx out of all flames included in the loaded flame file
             key(str): Default to: xml_keys.XML_PALETTE</br>The flame XML palette tag name
 
         Returns:
-            (tuple[hou.Ramp, int, str] | None): return a tu-ple with an already made hou.Ramp, number of keys, format or None if something went wrong.
+            (tuple[NDArray[np_float32], str] | None): return a tu-ple with the palette RGB colors and its format or None if something went wrong.
         """     
         
         if self.isvalidtree:
@@ -15454,56 +18109,47 @@ class in_flame
             
             if palette_attrib is not None:
                 
-                # _HEX = []
-                # for line in palette_hex.splitlines():
-                #     cleandoc = i_cleandoc(line)
-                #     if(len(cleandoc) > 1):
-                #         [_HEX.append(hex) for hex in wrap(cleandoc, 6)]
-                
-                palette_hex: str = self.flame[idx].find(key).text
-                all_lines: list[str] = [line.replace(" ", "") for line in palette_hex.splitlines()]
-                _len: Callable[[str], int] = len
-                HEXs: list[str] = [h for line in all_lines if (clean := i_cleandoc(line)) and _len(clean) > 1 for h in wrap(clean, 6)]
-                
-                try:
-                    _hex_to_rgb: Callable[[str], tuple] = flam3h_palette_utils.hex_to_rgb
-                    RGBs: list[list[int]] = [list(map(abs, _hex_to_rgb(hex))) for hex in HEXs]
-                    
-                except ValueError as e:
-                    F3H_Exception.F3H_traceback_print_infos(e, extra_info='Invalid hex values in the loaded Flame palette.')
-                    return None
+                # The palette colors are decoded by the hou-free flame model, the hou.Ramp is built by its adapter.
+                rgb: NDArray[np_float32] | None = flame_model.palette_decode(self.flame[idx].find(key).text)
+                if rgb is not None:
+                    format: str | None = dict(palette_attrib).get(xml_keys.XML_PALETTE_FORMAT)
+                    return rgb, str(format)
                 
-                else:
-                    
-                    if RGBs:
-                        
-                        # Convert to NumPy array and normalize
-                        RGBs_array: NDArray[np_float32] = np_array(RGBs[:len(HEXs)], dtype=np_float32)
-                        rgb_from_XML_PALETTE: list[list[float]] = (RGBs_array / 255.0).tolist()
-                        format: str | None = dict(palette_attrib).get(xml_keys.XML_PALETTE_FORMAT)
-                        ramp_keys_count: int = len(rgb_from_XML_PALETTE)
-                        POSs: list[int | float] = list(it_islice(it_count(0, 1.0/(ramp_keys_count-1)), (ramp_keys_count)))
-                        BASESs: list = [hou.rampBasis.Linear] * (ramp_keys_count) # pyright: ignore[reportAttributeAccessIssue] # Houdini HOM API
-                        
-                        return hou.Ramp(BASESs, POSs, rgb_from_XML_PALETTE), ramp_keys_count, str(format)
-                    
-                    else:
-                        return None
+                return None
 
             return None
         
         return None
     
     
-    # custom to FLAM3H™ only
-    def __get_palette_flam3h_hsv(self, idx: int) -> TA_TypeMaker | bool:
+    def get_flame_model(self, idx: int) -> flame_model | None:
+        """Get the hou-free data model of a flame preset.</br>
+
+        Args:
+            (self):
+            idx(int): flame idx out of all flames included in the loaded flame file
+
+        Returns:
+            (flame_model | None): The flame preset data model or None if the flame file is not valid.
         """
+        if self.isvalidtree:
+            assert self.flame is not None
+            # The flame preset has already been decoded with its warnings printed out, do not print them out again.
+            return flame_model(self.flame[idx], False)
+        
+        return None
+    
+    
+    # custom to FLAM3H™ only
+    def __get_palette_flam3h_hsv(self, idx: int) -> list[float] | bool:
+        """The hou.Vector3 is built out of it by: in_flame_iter_data.hou_build()</br>
+        
         Args:
             (self):
             idx(int): flame idx out of all flames included in the loaded flame file
 
         Returns:
-            (TA_TypeMaker | bool): [a hou.Vector type of HSV vals or False] Since we know the HSV is made out of 3 floats, it will always rreturn a: hou.Vector3
+            (list[float] | bool): [the 3 HSV vals or False]
         """   
         if self.isvalidtree:
             palette_hsv_xml_list: str | list[Never] = self.flam3h_hsv[idx]
@@ -15512,7 +18158,7 @@ class in_flame
                 if len(palette_hsv_xml_s) != 3:
                     palette_hsv_xml_s: list[str] = np_pad(palette_hsv_xml_s, (0, 3-min(3, len(palette_hsv_xml_s))), 'constant', constant_values = 1).tolist()
                 
-                return in_flame_utils.in_util_typemaker(list(map(lambda x: float(x), palette_hsv_xml_s )))
+                return list(map(lambda x: float(x), palette_hsv_xml_s ))
             
             return False
         
@@ -15547,7 +18193,7 @@ class in_flame
                 elif key == xml_keys.f3h.XML_MB_SAMPLES:
                     mp_samples: str | list = self.flam3h_mb_samples[idx]
                     if isinstance(mp_samples, list):
-                        print(f"Warning:\nIN xml key: {xml_keys.f3h.XML_MB_SAMPLES} -> NOT FOUND, default value used.\n")
+                        print(f"Warning:\nIN xml key: {xml_keys.f3h.XML_MB_SAMPLES} -> NOT FOUND, default value used.\n", file=flame_model.warnings_out())
                         return int(16) # default
                     
                     return int(mp_samples)
@@ -15555,7 +18201,7 @@ class in_flame
                 elif key == xml_keys.f3h.XML_MB_SHUTTER:
                     mb_shutter: str | list = self.flam3h_mb_shutter[idx]
                     if isinstance(mb_shutter, list):
-                        print(f"Warning:\nIN xml key: {xml_keys.f3h.XML_MB_SHUTTER} -> NOT FOUND, default value used.\n")
+                        print(f"Warning:\nIN xml key: {xml_keys.f3h.XML_MB_SHUTTER} -> NOT FOUND, default value used.\n", file=flame_model.warnings_out())
                         return float(0.5) # default
                     
                     return float(mb_shutter)
@@ -15568,12 +18214,12 @@ class in_flame
         
         
     # custom to FLAM3H™ only
-    def __get_cp_flam3h_samples(self, idx: int, palette: tuple[hou.Ramp, int, str] | None = None) -> int | bool:
+    def __get_cp_flam3h_samples(self, idx: int, palette_count: int | None = None) -> int | bool:
         """
         Args:
             self:
             idx(int): flame idx out of all flames included in the loaded flame file
-            palette(tuple[hou.Ramp, int, str]): Default to None</br>The loaded Flame palette data if any[palette hou ramp parm, colors count, format]</br>otherwise: None
+            palette_count(int | None): Default to None</br>The loaded Flame palette colors count if any</br>otherwise: None
 
         Returns:
             (int | bool): FLAM3H™ palette lookup samples parameter values.
@@ -15589,9 +18235,9 @@ class in_flame
                 # else return the default value
                 return 256
             
-            if palette is not None:
+            if palette_count is not None:
                 
-                count: int = palette[1]
+                count: int = palette_count
                 if count > 0:
                     return int(flam3h_palette_utils.find_nearest_idx(f3h_tabs.CP.DEFAULT_MENU_OPTIONS_PLUS, count))
                 # else return the default value
@@ -15696,61 +18342,64 @@ class in_flame_iter_data(in_flame):
         in_flame ([class]): [inherit properties methods from the in_flame class]
     """  
     
-    __slots__ = ("_cached_data", 
+    __slots__ = ("_cached_data", "_hou_built", "_affines_data", "_palette_data", "_hsv_data", 
                  "_idx", "_xforms", "_xf_name", "_weight", "_pre_blur", "_xaos", 
                  "_coefs", "_f3h_coefs", "_f3h_coefs_angle", "_post", "_f3h_post", "_f3h_post_angle", 
                  "_finalxform", "_finalxform_coefs", "_finalxform_f3h_coefs", "_finalxform_f3h_coefs_angle", "_finalxform_post", "_finalxform_f3h_post", "_finalxform_f3h_post_angle", "_finalxform_name", 
                  "_palette", "_color", "_color_speed", "_symmetry", "_opacity", 
                  "_sys_flam3h_rip", "_cp_flam3h_hsv", "_mb_flam3h_mb_fps", "_mb_flam3h_mb_samples", "_mb_flam3h_mb_shutter", "_cp_flam3h_cp_samples", "_cp_flam3h_cp_basis", "_prefs_flam3h_f3c")
     
-    def __init__(self, node: hou.SopNode, xmlfile: str, idx: int=0) -> None:
+    def __init__(self, node: hou.SopNode, xmlfile: str, idx: int=0, hou_build: bool = True) -> None:
         """
         Args:
             (self):
             node(hou.SopNode): This FLAM3H™ node.
             xmlfile (str): xmlfile (str): xml flame v_type file to load
             idx (int, optional): Default to: 0(Zero)</br>Flame idx out of all flames included in the loaded flame file.
+            hou_build(bool): Default to: True</br>Build the Houdini types out of the decoded flame preset data right away: self.hou_build()</br>Set it to False to decode the flame preset off the main thread (in_flame_prefetch),</br>self.hou_build() must then be called from the main thread before using it.
         """
-        super().__init__(node, xmlfile)
+        super().__init__(node, xmlfile, idx)
+        
+        self._hou_built: bool = False
         
         self._idx: int = self._in_flame__is_valid_idx(idx) # pyright: ignore[reportAttributeAccessIssue]
         self._xforms: tuple[dict, ...] | None = self._in_flame__get_xforms(self.idx, xml_keys.XML_XF) # pyright: ignore[reportAttributeAccessIssue]
-        self._xf_name: tuple[str, ...] | None = self._in_flame__get_keyvalue(self.xforms, xml_keys.XML_XF_NAME) # pyright: ignore[reportAttributeAccessIssue]
-        self._weight: tuple[float, ...] | None = self._in_flame__get_keyvalue(self.xforms, xml_keys.XML_XF_WEIGHT) # pyright: ignore[reportAttributeAccessIssue]
-        self._pre_blur: tuple[float, ...] | None = self._in_flame__get_keyvalue(self.xforms, xml_keys.XML_XF_PB) # pyright: ignore[reportAttributeAccessIssue]
-        self._xaos: tuple[list[str] | list[Never], ...] | None  = self._in_flame__get_xaos(self.xforms) # pyright: ignore[reportAttributeAccessIssue]
-        
-        self._coefs: tuple[tuple[hou.Vector2, ...] | list[Never], ...] | None = self._in_flame__get_affine(self.xforms, xml_keys.XML_PRE_AFFINE) # pyright: ignore[reportAttributeAccessIssue]
-        self._f3h_coefs: tuple[tuple[hou.Vector2, ...] | list[Never], ...] | None = self._in_flame__get_affine(self.xforms, xml_keys.f3h.XML_PRE_AFFINE) # pyright: ignore[reportAttributeAccessIssue]
-        self._f3h_coefs_angle: tuple[float, ...] | None = self._in_flame__get_keyvalue(self.xforms, xml_keys.f3h.XML_PRE_AFFINE_ANGLE) # pyright: ignore[reportAttributeAccessIssue]
-        self._post: tuple[tuple[hou.Vector2, ...] | list[Never], ...] | None  = self._in_flame__get_affine(self.xforms, xml_keys.XML_POST_AFFINE) # pyright: ignore[reportAttributeAccessIssue]
-        self._f3h_post: tuple[tuple[hou.Vector2, ...] | list[Never], ...] | None  = self._in_flame__get_affine(self.xforms, xml_keys.f3h.XML_POST_AFFINE) # pyright: ignore[reportAttributeAccessIssue]
-        self._f3h_post_angle: tuple[float, ...] | None = self._in_flame__get_keyvalue(self.xforms, xml_keys.f3h.XML_POST_AFFINE_ANGLE) # pyright: ignore[reportAttributeAccessIssue]
+        # All the xforms data is decoded in one pass over the xforms and then read from its columns.
+        xforms_data: dict[str, tuple | None] = self._in_flame__get_xforms_data(self.xforms) # pyright: ignore[reportAttributeAccessIssue]
+        self._xf_name: tuple[str, ...] | None = xforms_data.get(xml_keys.XML_XF_NAME)
+        self._weight: tuple[float, ...] | None = xforms_data.get(xml_keys.XML_XF_WEIGHT)
+        self._pre_blur: tuple[float, ...] | None = xforms_data.get(xml_keys.XML_XF_PB)
+        self._xaos: tuple[list[str] | list[Never], ...] | None  = xforms_data.get(xml_keys.XML_XF_XAOS)
+        
+        self._f3h_coefs_angle: tuple[float, ...] | None = xforms_data.get(xml_keys.f3h.XML_PRE_AFFINE_ANGLE)
+        self._f3h_post_angle: tuple[float, ...] | None = xforms_data.get(xml_keys.f3h.XML_POST_AFFINE_ANGLE)
         
         self._finalxform: tuple[dict, ...] | None = self._in_flame__get_xforms(self.idx, xml_keys.XML_FF) # pyright: ignore[reportAttributeAccessIssue]
-        self._finalxform_coefs: tuple[tuple[hou.Vector2, ...] | list[Never], ...] | None = self._in_flame__get_affine(self.finalxform, xml_keys.XML_PRE_AFFINE, 1) # pyright: ignore[reportAttributeAccessIssue]
-        self._finalxform_f3h_coefs: tuple[tuple[hou.Vector2, ...] | list[Never], ...] | None = self._in_flame__get_affine(self.finalxform, xml_keys.f3h.XML_PRE_AFFINE, 1) # pyright: ignore[reportAttributeAccessIssue]
-        self._finalxform_f3h_coefs_angle: tuple[float, ...] | None = self._in_flame__get_keyvalue(self.finalxform, xml_keys.f3h.XML_PRE_AFFINE_ANGLE) # pyright: ignore[reportAttributeAccessIssue]
-        self._finalxform_post: tuple[tuple[hou.Vector2, ...] | list[Never], ...] | None  = self._in_flame__get_affine(self.finalxform, xml_keys.XML_POST_AFFINE, 1) # pyright: ignore[reportAttributeAccessIssue]
-        self._finalxform_f3h_post: tuple[tuple[hou.Vector2, ...] | list[Never], ...] | None = self._in_flame__get_affine(self.finalxform, xml_keys.f3h.XML_POST_AFFINE, 1) # pyright: ignore[reportAttributeAccessIssue]
-        self._finalxform_f3h_post_angle: tuple[float, ...] | None = self._in_flame__get_keyvalue(self.finalxform, xml_keys.f3h.XML_POST_AFFINE_ANGLE) # pyright: ignore[reportAttributeAccessIssue]
-        self._finalxform_name: tuple[str, ...] | None = self._in_flame__get_keyvalue(self.finalxform, xml_keys.XML_XF_NAME) # pyright: ignore[reportAttributeAccessIssue]
-        
-        self._palette: tuple[hou.Ramp, int, str] | None = self._in_flame__get_palette(self.idx) # pyright: ignore[reportAttributeAccessIssue]
-        self._color: tuple[float, ...] | None = self._in_flame__get_keyvalue(self.xforms, xml_keys.XML_XF_COLOR) # pyright: ignore[reportAttributeAccessIssue]
-        self._color_speed: tuple[float, ...] | None = self._in_flame__get_keyvalue(self.xforms, xml_keys.XML_XF_COLOR_SPEED, False) # pyright: ignore[reportAttributeAccessIssue] # Color speed is only used by Fractorium so we silent its warning message when missing
-        self._symmetry: tuple[float, ...] | None = self._in_flame__get_keyvalue(self.xforms, xml_keys.XML_XF_SYMMETRY) # pyright: ignore[reportAttributeAccessIssue]
-        self._opacity: tuple[float, ...] | None = self._in_flame__get_keyvalue(self.xforms, xml_keys.XML_XF_OPACITY) # pyright: ignore[reportAttributeAccessIssue]
+        finalxform_data: dict[str, tuple | None] = self._in_flame__get_xforms_data(self.finalxform, 1) # pyright: ignore[reportAttributeAccessIssue]
+        self._finalxform_f3h_coefs_angle: tuple[float, ...] | None = finalxform_data.get(xml_keys.f3h.XML_PRE_AFFINE_ANGLE)
+        self._finalxform_f3h_post_angle: tuple[float, ...] | None = finalxform_data.get(xml_keys.f3h.XML_POST_AFFINE_ANGLE)
+        self._finalxform_name: tuple[str, ...] | None = finalxform_data.get(xml_keys.XML_XF_NAME)
+        
+        # The affines, the palette and the palette HSV decoded data the Houdini types are built out of: self.hou_build()
+        # The affines and the palette are kept afterward to build the hou-free flame model out of: self.flame_model_from_data()
+        self._affines_data: tuple[dict[str, tuple | None], dict[str, tuple | None]] = (xforms_data, finalxform_data)
+        self._palette_data: tuple[NDArray[np_float32], str] | None = self._in_flame__get_palette(self.idx) # pyright: ignore[reportAttributeAccessIssue]
+        self._color: tuple[float, ...] | None = xforms_data.get(xml_keys.XML_XF_COLOR)
+        self._color_speed: tuple[float, ...] | None = xforms_data.get(xml_keys.XML_XF_COLOR_SPEED)
+        self._symmetry: tuple[float, ...] | None = xforms_data.get(xml_keys.XML_XF_SYMMETRY)
+        self._opacity: tuple[float, ...] | None = xforms_data.get(xml_keys.XML_XF_OPACITY)
         
         # custom to FLAM3H™ only
         self._sys_flam3h_rip: int | None = self._in_flame__get_flam3h_toggle(self.flame3h_sys_rip[self.idx]) # pyright: ignore[reportAttributeAccessIssue]
-        self._cp_flam3h_hsv: TA_TypeMaker | bool = self._in_flame__get_palette_flam3h_hsv(self.idx) # pyright: ignore[reportAttributeAccessIssue]
+        self._hsv_data: list[float] | bool = self._in_flame__get_palette_flam3h_hsv(self.idx) # pyright: ignore[reportAttributeAccessIssue]
         self._mb_flam3h_mb_fps: int | float | bool = self._in_flame__get_mb_flam3h_mb(self.idx, xml_keys.f3h.XML_MB_FPS) # pyright: ignore[reportAttributeAccessIssue]
         self._mb_flam3h_mb_samples: int | float | bool = self._in_flame__get_mb_flam3h_mb(self.idx, xml_keys.f3h.XML_MB_SAMPLES) # pyright: ignore[reportAttributeAccessIssue]
         self._mb_flam3h_mb_shutter: int | float | bool = self._in_flame__get_mb_flam3h_mb(self.idx, xml_keys.f3h.XML_MB_SHUTTER) # pyright: ignore[reportAttributeAccessIssue]
-        self._cp_flam3h_cp_samples: int | bool = self._in_flame__get_cp_flam3h_samples(self.idx, self.palette) # pyright: ignore[reportAttributeAccessIssue]
+        self._cp_flam3h_cp_samples: int | bool = self._in_flame__get_cp_flam3h_samples(self.idx, len(self._palette_data[0]) if self._palette_data is not None else None) # pyright: ignore[reportAttributeAccessIssue]
         self._cp_flam3h_cp_basis: int | bool = self._in_flame__get_cp_flam3h_basis(self.idx) # pyright: ignore[reportAttributeAccessIssue]
         self._prefs_flam3h_f3c: int | None = self._in_flame__get_flam3h_toggle(self.flam3h_prefs_f3c[self.idx]) # pyright: ignore[reportAttributeAccessIssue]
+        
+        if hou_build: self.hou_build()
 
 
     # CLASS: PROPERTIES
@@ -15892,6 +18541,76 @@ class in_flame_iter_data(in_flame):
         return self._prefs_flam3h_f3c
     
     
+    def flame_model_from_data(self) -> flame_model:
+        """Get the hou-free data model of the selected flame preset out of its already decoded data,</br>
+        so the flame preset XML is not walked and its affines and palette are not decoded again like: self.get_flame_model(...) does.</br>
+
+        Args:
+            (self):
+
+        Returns:
+            (flame_model): The flame preset data model.
+        """
+        flame: lxmlET._Element | None = self.flame[self.idx] if self.isvalidtree and self.flame is not None else None
+        _get: Callable[[str], str] = lambda key: str(flame.get(key, '')) if flame is not None else ''
+        return flame_model.from_data(self.xforms if self.xforms is not None else (), 
+                                     self.finalxform[0] if self.finalxform else None, 
+                                     self._affines_data, 
+                                     self._palette_data, 
+                                     _get(xml_keys.XML_XF_NAME), 
+                                     _get(xml_keys.XML_VERSION), 
+                                     _get(xml_keys.XML_PLUGINS))
+    
+    
+    def hou_build(self, node: hou.SopNode | None = None, warnings: str = '') -> None:
+        """Build the Houdini types out of the decoded flame preset data: the affines hou.Vector2, the palette hou.Ramp and the palette HSV hou.Vector3,</br>
+        and let the user know if all the iterators weights are set to 0.0(Zero).</br>
+        The Houdini HOM API is not thread safe so this must run on the main thread. It does something only the first time it is called.</br>
+
+        Args:
+            (self):
+            node(hou.SopNode | None): Default to: None</br>The FLAM3H™ node loading this flame preset, if not the one it has been decoded for.</br>The flame presets decoded off the main thread (in_flame_prefetch) have no FLAM3H™ node until they are loaded.
+            warnings(str): Default to: ''</br>The warnings printed out while decoding this flame preset off the main thread (in_flame_prefetch),</br>printed out now as if it was decoded right now.
+
+        Returns:
+            (None):
+        """
+        if node is not None: self._node = node
+        if self._hou_built:
+            return
+        self._hou_built = True
+        
+        if warnings: print(warnings, end='')
+        
+        _affine: Callable[[Iterable[Iterable[float]]], list[hou.Vector2]] = flame_model_hou.affine
+        def _affines(data: dict[str, tuple | None], key: str) -> tuple[tuple[hou.Vector2, ...] | list[Never], ...] | None:
+            column: tuple | None = data.get(key)
+            return tuple(tuple(_affine(affine)) if isinstance(affine, tuple) else affine for affine in column) if column is not None else None
+        
+        xforms_data, finalxform_data = self._affines_data
+        self._coefs: tuple[tuple[hou.Vector2, ...] | list[Never], ...] | None = _affines(xforms_data, xml_keys.XML_PRE_AFFINE)
+        self._f3h_coefs: tuple[tuple[hou.Vector2, ...] | list[Never], ...] | None = _affines(xforms_data, xml_keys.f3h.XML_PRE_AFFINE)
+        self._post: tuple[tuple[hou.Vector2, ...] | list[Never], ...] | None = _affines(xforms_data, xml_keys.XML_POST_AFFINE)
+        self._f3h_post: tuple[tuple[hou.Vector2, ...] | list[Never], ...] | None = _affines(xforms_data, xml_keys.f3h.XML_POST_AFFINE)
+        self._finalxform_coefs: tuple[tuple[hou.Vector2, ...] | list[Never], ...] | None = _affines(finalxform_data, xml_keys.XML_PRE_AFFINE)
+        self._finalxform_f3h_coefs: tuple[tuple[hou.Vector2, ...] | list[Never], ...] | None = _affines(finalxform_data, xml_keys.f3h.XML_PRE_AFFINE)
+        self._finalxform_post: tuple[tuple[hou.Vector2, ...] | list[Never], ...] | None = _affines(finalxform_data, xml_keys.XML_POST_AFFINE)
+        self._finalxform_f3h_post: tuple[tuple[hou.Vector2, ...] | list[Never], ...] | None = _affines(finalxform_data, xml_keys.f3h.XML_POST_AFFINE)
+        
+        if self._palette_data is not None:
+            rgb, format = self._palette_data
+            self._palette: tuple[hou.Ramp, int, str] | None = (flame_model_hou.ramp(rgb), len(rgb), format)
+        else:
+            self._palette: tuple[hou.Ramp, int, str] | None = None
+        
+        self._cp_flam3h_hsv: TA_TypeMaker | bool = in_flame_utils.in_util_typemaker(self._hsv_data) if isinstance(self._hsv_data, list) else False
+        
+        # CHECKS
+        if self._weight:
+            # Let the user know
+            in_flame.check_all_iterator_weights(self.node, list(self._weight))
+    
+    
 # FLAM3H™ IN FLAME CHECKS start here
 ##########################################
 ##########################################
@@ -16039,62 +18758,433 @@ class in_flame_checks():
         return xaos_bool
     
     
-    def __in_flame_palette_chk(self) -> bool:
-        """Check if the loaded Flame preset posses a valid palette, or a palette at all.</br>
+    def __in_flame_palette_chk(self) -> bool:
+        """Check if the loaded Flame preset posses a valid palette, or a palette at all.</br>
+
+        Args:
+            (self):
+            
+        Returns:
+            (bool): is a valid palette present in the loaded Flame preset ? True or False
+        """  
+        palette_bool: bool = False
+        if self.apo_data.palette is not None: palette_bool = True
+        return palette_bool
+    
+    
+    def __in_flame_ff_chk(self) -> bool:
+        """Check if the loaded Flame preset uses FF(finalXform).</br>
+
+        Args:
+            (self):
+            
+        Returns:
+            (bool): is the FF(finalXform) being used in the loaded Flame preset ? True or False
+        """  
+        ff_bool: bool = False
+        if self.apo_data.finalxform is not None: ff_bool = True
+        return ff_bool
+    
+    
+    def __in_flame_ff_post_chk(self) -> bool:
+        """Check if the loaded Flame preset FF uses post affine.</br>
+
+        Args:
+            (self):
+            
+        Returns:
+            (bool): is the FF(finalXform) if present using its post affine in the loaded Flame preset ? True or False
+        """ 
+        ff_post_bool: bool = False
+        if self.apo_data.finalxform_post is not None: ff_post_bool = True
+        return ff_post_bool
+    
+    
+    def __in_flame_f3h_mb_chk(self) -> bool:
+        """Check if the loaded Flame preset uses Motion Blur.</br>
+
+        Args:
+            (self):
+            
+        Returns:
+            (bool): is the loaded Flame preset using Motion Blur ? True or False
+        """  
+        f3h_mb_bool: bool = False
+        if self.apo_data.mb_flam3h_fps is not False: f3h_mb_bool = True
+        return f3h_mb_bool
+        
+    
+# FLAM3H™ IN PARMS PLAN start here
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+
+
+class in_flame_parms_plan:
+    """
+class in_flame_parms_plan
+
+@STATICMETHODS
+
+@METHODS
+* set(self, name: str, value: Any) -> None:
+* apply(self, undo_name: str) -> None:
+
+    """
+    
+    __slots__ = ("_node", "_parms", "_f3h_iter", "_f3h_iter_FF")
+    
+    def __init__(self, node: hou.SopNode) -> None:
+        """Collect all the parameter values of a Flame preset being loaded so they can be set on the FLAM3H™ node all at once.</br>
+        
+        Args:
+            (self):
+            node(hou.SopNode): FLAM3H™ node to load the flame preset into.
+        """
+        self._node: hou.SopNode = node
+        self._parms: dict[str, Any] = {}
+        # Build those once for the entire Flame preset load
+        self._f3h_iter: flam3h_iterator = flam3h_iterator()
+        self._f3h_iter_FF: flam3h_iterator_FF = flam3h_iterator_FF()
+        
+        
+    # CLASS: PROPERTIES
+    ##########################################
+    ##########################################
+    
+    @property
+    def node(self) -> hou.SopNode:
+        return self._node
+    
+    @property
+    def parms(self) -> dict[str, Any]:
+        return self._parms
+    
+    @property
+    def f3h_iter(self) -> flam3h_iterator:
+        return self._f3h_iter
+    
+    @property
+    def f3h_iter_FF(self) -> flam3h_iterator_FF:
+        return self._f3h_iter_FF
+    
+    
+    def set(self, name: str, value: Any) -> None:
+        """Add a parameter value to the plan.</br>
+        If the same parameter is set more than once, the last value set will be the one applied.</br>
+        
+        Args:
+            (self):
+            name(str): The parameter name or the parameter tuple name.
+            value(Any): The parameter value or the parameter tuple values.
+            
+        Returns:
+            (None):
+        """
+        self._parms[name] = value
+        
+        
+    def apply(self, undo_name: str) -> None:
+        """Set all the collected parameter values on the FLAM3H™ node at once inside a single undo group.</br>
+        The parameters are expected to be already reset and unlocked, as it is the case during a Flame preset load.</br>
+        The names of the parameters set are added to the node parameters changed since the last reset, if they are being tracked: in_flame_utils.in_reset_parms_dirty_track(...)</br>
+        
+        Args:
+            (self):
+            undo_name(str): The name of the undo group.
+            
+        Returns:
+            (None):
+        """
+        if self._parms:
+            # Take the changed parameters record and its node event callback out while setting them so they are not tracked one by one.
+            dirty: set[str] | None = in_flame_utils.in_reset_parms_dirty_untrack(self._node)
+            try:
+                with hou.undos.group(undo_name): # pyright: ignore[reportCallIssue]  # Houdini HOM API
+                    self._node.setParms(self._parms) # pyright: ignore[reportArgumentType]
+            finally:
+                if dirty is not None:
+                    dirty.update(self._parms)
+                    in_flame_utils.in_reset_parms_dirty_track(self._node, dirty)
+            self._parms.clear()
+
+
+# FLAM3H™ IN PREFETCH start here
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+
+
+class in_flame_prefetch:
+    """
+class in_flame_prefetch
+
+@STATICMETHODS
+* prefetch_count(node: hou.SopNode) -> int:
+* set_prefetch_count(node: hou.SopNode, count: int | None) -> None:
+* adjacent_ids(preset_id: int, flame_count: int, count: int) -> list[int]:
+* hip_file_event(event_type: hou.EnumValue) -> None:
+
+@METHODS
+* get(self, node: hou.SopNode, xmlfile: str, preset_id: int) -> in_flame_iter_data | None:
+* request(self, xmlfile: str, preset_id: int, flame_count: int, count: int) -> None:
+* __run(self) -> None:
+* clear(self) -> None:
+* __len__(self) -> int:
+
+    """
+    
+    # The environment variable setting how many flame presets to prefetch on each side for all the FLAM3H™ nodes: in_flame_prefetch.prefetch_count(...)
+    ENV_COUNT: Final = 'FLAM3H_IN_PREFETCH'
+    
+    __slots__ = ("_max_entries", "_entries", "_pending", "_lock", "_thread")
+    
+    def __init__(self, max_entries: int) -> None:
+        """Opt-in prefetch of the flame presets adjacent to the one just loaded from the IN presets menu.</br>
+        Once a flame preset is loaded, the next and previous N flame presets of the same flame file are decoded in a worker thread</br>
+        into an LRU of in_flame_iter_data(...) so stepping through the IN presets one after the other do not need to parse and decode them anymore.</br>
+        The Houdini HOM API is not thread safe, so the worker thread only parse and decode them into plain python types, without any FLAM3H™ node,</br>
+        and their Houdini types are built on the main thread for the FLAM3H™ node loading them: in_flame_iter_data.hou_build(...)</br>
+        The warnings about invalid values found while decoding them are collected per thread: flame_model.warnings_out() and printed out when they are loaded.</br></br>
+        
+        It is OFF by default. How many flame presets to prefetch on each side is set for all the FLAM3H™ nodes with the: FLAM3H_IN_PREFETCH environment variable,</br>
+        for example inside the houdini.env file: FLAM3H_IN_PREFETCH = 4</br>
+        and it can be set per FLAM3H™ node, saved with the hip file: in_flame_prefetch.set_prefetch_count(node, N)</br>
+        Each prefetched flame preset is keyed by the flame file (realpath, mtime, size) so a modified flame file is never served its old data.</br>
+        They are all dropped when a hip file is loaded or the scene is cleared: in_flame_prefetch.hip_file_event(...)</br>
+        Only the latest request is worked on, so stepping fast through the presets do not queue up work that is not needed anymore.</br>
+
+        Args:
+            (self):
+            max_entries(int): The maximum number of prefetched flame presets to keep.
+        """
+        self._max_entries: int = max_entries
+        # The prefetched flame presets and what has been printed out while decoding them
+        self._entries: OrderedDict[tuple[str, int, int, int], tuple[in_flame_iter_data, str]] = OrderedDict()
+        self._pending: tuple[str, tuple[int, int], list[int]] | None = None
+        self._lock: Lock = Lock()
+        self._thread: Thread | None = None
+        
+        
+    @staticmethod
+    def prefetch_count(node: hou.SopNode) -> int:
+        """Get how many flame presets to prefetch on each side of the loaded one for this FLAM3H™ node.</br>
+        The count set on this FLAM3H™ node: in_flame_prefetch.set_prefetch_count(...) if any, otherwise the one from the: FLAM3H_IN_PREFETCH environment variable.</br>
+
+        Args:
+            node(hou.SopNode): This FLAM3H™ node.
+
+        Returns:
+            (int): The number of flame presets to prefetch on each side. 0(Zero) if the prefetch is OFF.
+        """
+        count: str | None = node.userData(f3h_userData.IN_PREFETCH)
+        if count is None:
+            count = os.environ.get(in_flame_prefetch.ENV_COUNT)
+        try:
+            return max(0, int(count)) if count else 0
+        except ValueError:
+            return 0
+    
+    
+    @staticmethod
+    def set_prefetch_count(node: hou.SopNode, count: int | None) -> None:
+        """Set how many flame presets to prefetch on each side of the loaded one for this FLAM3H™ node.</br>
+        It is stored into the node user data so it is saved with the hip file. A count of 0(Zero) turn the prefetch OFF for this FLAM3H™ node</br>
+        and None go back to the: FLAM3H_IN_PREFETCH environment variable.</br>
+
+        Args:
+            node(hou.SopNode): This FLAM3H™ node.
+            count(int | None): The number of flame presets to prefetch on each side.
+
+        Returns:
+            (None):
+        """
+        if count is not None:
+            node.setUserData(f3h_userData.IN_PREFETCH, str(max(0, int(count))))
+        else:
+            flam3h_iterator_utils.destroy_userData(node, f3h_userData.IN_PREFETCH)
+            
+            
+    @staticmethod
+    def adjacent_ids(preset_id: int, flame_count: int, count: int) -> list[int]:
+        """Get the flame presets indexes adjacent to the loaded one, closest first and the next before the previous.</br>
+
+        Args:
+            preset_id(int): The loaded flame preset index.
+            flame_count(int): The number of flame presets inside the flame file.
+            count(int): The number of flame presets on each side.
+
+        Returns:
+            (list[int]): The adjacent flame presets indexes.
+        """
+        ids: list[int] = []
+        for i in range(1, count + 1):
+            if preset_id + i < flame_count: ids.append(preset_id + i)
+            if preset_id - i >= 0: ids.append(preset_id - i)
+        return ids
+    
+    
+    @staticmethod
+    def hip_file_event(event_type: hou.EnumValue) -> None:
+        """Hip file event callback registered by: in_flame_prefetch.request(...)</br>
+        When a hip file start loading or the scene is cleared, drop all the prefetched flame presets and remove this callback.</br>
 
         Args:
-            (self):
-            
+            event_type(hou.EnumValue): The hip file event type.
+
         Returns:
-            (bool): is a valid palette present in the loaded Flame preset ? True or False
-        """  
-        palette_bool: bool = False
-        if self.apo_data.palette is not None: palette_bool = True
-        return palette_bool
+            (None):
+        """
+        _hipFileEventType = hou.hipFileEventType # pyright: ignore[reportAttributeAccessIssue]  # Houdini HOM API
+        if event_type in (_hipFileEventType.BeforeLoad, _hipFileEventType.BeforeClear):
+            hou.hipFile.removeEventCallback(in_flame_prefetch.hip_file_event) # pyright: ignore[reportAttributeAccessIssue]  # Houdini HOM API
+            in_flame_utils.PREFETCH.clear()
     
     
-    def __in_flame_ff_chk(self) -> bool:
-        """Check if the loaded Flame preset uses FF(finalXform).</br>
+    def get(self, node: hou.SopNode, xmlfile: str, preset_id: int) -> in_flame_iter_data | None:
+        """Get a prefetched flame preset to load into a FLAM3H™ node, with its Houdini types built and its warnings printed out.</br>
+        It must be called from the main thread. A prefetched flame preset is handed out only once, so it is removed from the prefetched ones.</br>
 
         Args:
             (self):
-            
+            node(hou.SopNode): The FLAM3H™ node loading the flame preset.
+            xmlfile(str): The flame file full path.
+            preset_id(int): The flame preset index.
+
         Returns:
-            (bool): is the FF(finalXform) being used in the loaded Flame preset ? True or False
-        """  
-        ff_bool: bool = False
-        if self.apo_data.finalxform is not None: ff_bool = True
-        return ff_bool
-    
-    
-    def __in_flame_ff_post_chk(self) -> bool:
-        """Check if the loaded Flame preset FF uses post affine.</br>
+            (in_flame_iter_data | None): The prefetched flame preset data or None if not prefetched for this version of the flame file.
+        """
+        stat: tuple[int, int] | None = _xml_index.xmlfile_stat(xmlfile)
+        if stat is None:
+            return None
+        
+        key: tuple[str, int, int, int] = (os.path.realpath(xmlfile), stat[0], stat[1], preset_id)
+        with self._lock:
+            entry: tuple[in_flame_iter_data, str] | None = self._entries.pop(key, None)
+            
+        if entry is None:
+            return None
+        
+        apo_data, warnings = entry
+        apo_data.hou_build(node, warnings)
+        return apo_data
+        
+        
+    def request(self, xmlfile: str, preset_id: int, flame_count: int, count: int) -> None:
+        """Prefetch the flame presets adjacent to the loaded one in a worker thread.</br>
+        This replace any previous request not yet done.</br>
 
         Args:
             (self):
+            xmlfile(str): The flame file full path.
+            preset_id(int): The loaded flame preset index.
+            flame_count(int): The number of flame presets inside the flame file.
+            count(int): The number of flame presets to prefetch on each side.
+
+        Returns:
+            (None):
+        """
+        stat: tuple[int, int] | None = _xml_index.xmlfile_stat(xmlfile)
+        if stat is None:
+            return
+        
+        path: str = os.path.realpath(xmlfile)
+        # Never prefetch more than what can be kept.
+        count = min(count, self._max_entries // 2)
+        with self._lock:
+            # Drop what has been prefetched out of other versions of this flame file.
+            for k in [k for k in self._entries if k[0] == path and k[1:3] != stat]:
+                del self._entries[k]
+            ids: list[int] = [idx for idx in self.adjacent_ids(preset_id, flame_count, count) if (path, stat[0], stat[1], idx) not in self._entries]
+            if not ids:
+                return
             
+            self._pending = (path, stat, ids)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = Thread(target=self.__run, name="FLAM3H™ IN prefetch", daemon=True)
+                self._thread.start()
+                
+        if __houdini__ and in_flame_prefetch.hip_file_event not in hou.hipFile.eventCallbacks(): # pyright: ignore[reportAttributeAccessIssue]  # Houdini HOM API
+            hou.hipFile.addEventCallback(in_flame_prefetch.hip_file_event) # pyright: ignore[reportAttributeAccessIssue]  # Houdini HOM API
+                
+                
+    def __run(self) -> None:
+        """The worker thread, decoding the flame presets of the latest request one at a time until there are no more requests.</br>
+        No Houdini HOM API is used here: the flame presets are decoded without any FLAM3H™ node and without building their Houdini types,</br>
+        and the warnings printed out while decoding each of them are collected into this thread own buffer: flame_model.warnings_out()</br>
+
+        Args:
+            (self):
+
         Returns:
-            (bool): is the FF(finalXform) if present using its post affine in the loaded Flame preset ? True or False
-        """ 
-        ff_post_bool: bool = False
-        if self.apo_data.finalxform_post is not None: ff_post_bool = True
-        return ff_post_bool
-    
-    
-    def __in_flame_f3h_mb_chk(self) -> bool:
-        """Check if the loaded Flame preset uses Motion Blur.</br>
+            (None):
+        """
+        warnings: local = flame_model.WARNINGS
+        while True:
+            with self._lock:
+                pending: tuple[str, tuple[int, int], list[int]] | None = self._pending
+                self._pending = None
+                if pending is None:
+                    # So the next request start a new worker thread
+                    self._thread = None
+                    return
+                
+            path, stat, ids = pending
+            for idx in ids:
+                # A new request came in, lets work on that one instead.
+                if self._pending is not None:
+                    break
+                
+                warnings.out = StringIO()
+                try:
+                    apo_data: in_flame_iter_data = in_flame_iter_data(cast(Any, None), path, idx, False)
+                    
+                except Exception: # The flame preset will be decoded as usual when loaded, printing out the error if any, so lets just skip it.
+                    continue
+                
+                finally:
+                    out: StringIO = warnings.out
+                    warnings.out = None
+                    
+                # The flame file changed while decoding it.
+                if apo_data.xforms is None or _xml_index.xmlfile_stat(path) != stat:
+                    continue
+                
+                with self._lock:
+                    self._entries[(path, stat[0], stat[1], idx)] = (apo_data, out.getvalue())
+                    while len(self._entries) > self._max_entries:
+                        self._entries.popitem(last=False)
+                        
+                        
+    def clear(self) -> None:
+        """Drop all the prefetched flame presets and any request not yet done.</br>
 
         Args:
             (self):
-            
+
         Returns:
-            (bool): is the loaded Flame preset using Motion Blur ? True or False
-        """  
-        f3h_mb_bool: bool = False
-        if self.apo_data.mb_flam3h_fps is not False: f3h_mb_bool = True
-        return f3h_mb_bool
-        
-    
+            (None):
+        """
+        with self._lock:
+            self._pending = None
+            self._entries.clear()
+            
+            
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
 # FLAM3H™ IN FLAME UTILS start here
 ##########################################
 ##########################################
@@ -16117,6 +19207,9 @@ class in_flame_utils
 * in_util_make_PRE(name: TA_TypeVarCollection) -> str | list[str] | None:
 * in_util_make_POST(name: TA_TypeVarCollection) -> str | list[str] | None:
 * in_load_stats_unknown_vars(preset_id: int, apo_data: in_flame_iter_data) -> list[str]:
+* in_load_stats_unknown_vars_from_plugins(plugins_key: str | list[Never]) -> list[str]:
+* in_load_collect_vars_from_xforms(xforms: tuple[dict, ...] | None, finalxform: tuple[dict, ...] | None, pb_bool: bool, pgb_name: str = 'pre_gaussian_blur') -> list[str]:
+* in_load_collect_vars_missing_from_xforms(xforms: tuple[dict, ...] | None, finalxform: tuple[dict, ...] | None, vars_used: list[str], pgb_name: str = 'pre_gaussian_blur') -> list[str]:
 * in_to_flam3h_is_CHAOS(xml: str) -> bool:
 * in_to_flam3h_clipboard_is_CHAOS() -> bool:
 * in_get_xforms_var_keys( xforms: tuple[dict, ...] | None, 
@@ -16134,14 +19227,14 @@ class in_flame_utils
 * in_get_idx_by_key(key: str) -> int | None:
 * in_util_flam3h_prx_mode(mode: int) -> tuple[str, str]:
 * in_set_affine(mode: int, 
-              node: hou.SopNode, 
+              plan: in_flame_parms_plan, 
               prx: str, 
               apo_data: in_flame_iter_data, 
               flam3h_prm_names: flam3h_iterator_prm_names, 
               mp_idx: int
               ) -> None:
 * in_set_data(mode: int, 
-              node: hou.SopNode, 
+              plan: in_flame_parms_plan, 
               prx: str, 
               apo_data: tuple | list | None, 
               prm_name: str, 
@@ -16158,7 +19251,7 @@ class in_flame_utils
                             func: Callable) -> list[TA_TypeMaker]:
 * in_v_parametric(app: str | list[Never], 
                 mode: int, 
-                node: hou.SopNode, 
+                plan: in_flame_parms_plan, 
                 mp_idx: int, 
                 t_idx: int, 
                 xform: dict, 
@@ -16169,7 +19262,7 @@ class in_flame_utils
                 ) -> None:
 * in_v_parametric_PRE(app: str | list[Never], 
                     mode: int, 
-                    node: hou.SopNode, 
+                    plan: in_flame_parms_plan, 
                     mp_idx: int, 
                     t_idx: int, 
                     xform: dict, 
@@ -16180,7 +19273,7 @@ class in_flame_utils
                     ) -> None:
 * in_v_parametric_POST(app: str, 
                      mode: int, 
-                     node: hou.SopNode, 
+                     plan: in_flame_parms_plan, 
                      mp_idx: int, 
                      t_idx: int, 
                      xform: dict, 
@@ -16190,7 +19283,7 @@ class in_flame_utils
                      apo_prm: tuple
                      ) -> None:
 * in_v_parametric_PRE_FF(app: str | list[Never], 
-                       node: hou.SopNode, 
+                       plan: in_flame_parms_plan, 
                        t_idx: int, 
                        xform: dict, 
                        v_type: int, 
@@ -16199,7 +19292,7 @@ class in_flame_utils
                        apo_prm: tuple
                        ) -> None:
 * in_v_parametric_POST_FF(app: str | list[Never], 
-                        node: hou.SopNode, 
+                        plan: in_flame_parms_plan, 
                         t_idx: int, 
                         xform: dict, 
                         v_type: int, 
@@ -16208,38 +19301,38 @@ class in_flame_utils
                         apo_prm: tuple
                         ) -> None:
 * in_v_generic(mode: int, 
-             node: hou.SopNode, 
+             plan: in_flame_parms_plan, 
              mp_idx: int, 
              t_idx: int, 
              v_type: int, 
              v_weight: float
              ) -> None:
 * in_v_generic_PRE(mode: int, 
-                 node: hou.SopNode, 
+                 plan: in_flame_parms_plan, 
                  mp_idx: int, 
                  t_idx: int, 
                  v_type: int, 
                  v_weight: float
                  ) -> None:
 * in_v_generic_POST(mode: int, 
-                  node: hou.SopNode, 
+                  plan: in_flame_parms_plan, 
                   mp_idx: int, 
                   t_idx: int, 
                   v_type: int, 
                   v_weight: float
                   ) -> None:
-* in_v_generic_PRE_FF(node: hou.SopNode, 
+* in_v_generic_PRE_FF(plan: in_flame_parms_plan, 
                     t_idx: int, 
                     v_type: int, 
                     v_weight: float
                     ) -> None:
-* in_v_generic_POST_FF(node: hou.SopNode, 
+* in_v_generic_POST_FF(plan: in_flame_parms_plan, 
                      t_idx: int, 
                      v_type: int, 
                      v_weight: float
                      ) -> None:
 * in_v_pre_blur(mode: int, 
-              node: hou.SopNode, 
+              plan: in_flame_parms_plan, 
               mp_idx: int, 
               pb_weights: tuple
               ) -> None:
@@ -16248,6 +19341,10 @@ class in_flame_utils
 * in_get_preset_name_iternum(menu_label: str) -> int | None:
 * in_util_join_vars_grp(groups: TA_STR_ListUnflattened) -> str:
 * in_util_vars_flatten_unique_sorted(VARS_list: TA_STR_ListUnflattened, func: Callable, capitalize: bool = False) -> list[str]:
+* in_reset_parms_inventory(node: hou.SopNode, parms: tuple[hou.Parm, ...]) -> tuple[tuple[hou.Parm, ...], tuple[hou.Parm, ...], tuple[hou.Parm, ...]]:
+* in_reset_parms_dirty_event(node: hou.SopNode, event_type: hou.EnumValue, **kwargs) -> None:
+* in_reset_parms_dirty_track(node: hou.SopNode, dirty: set[str] | None = None) -> None:
+* in_reset_parms_dirty_untrack(node: hou.SopNode) -> set[str] | None:
 * in_presets_in_isvalid_file_menu_label(node: hou.SopNode, preset_id: int) -> str:
 * in_set_iter_on_load(node: hou.SopNode, preset_id: int, clipboard: bool, flame_name_clipboard: str) -> int:
 * in_load_sensor_stats_msg(preset_id: int, apo_data: in_flame_iter_data, XML_last_update: bool = False) -> str:
@@ -16289,6 +19386,8 @@ class in_flame_utils
 * in_to_flam3h_toggle_f3h_affine(self) -> None:
 * in_to_flam3h_reset_user_data(self) -> None:
 * in_to_flam3h_reset_iterators_parms(self, node: hou.SopNode, in_flame_iter_count: int) -> None:
+* in_reset_parms_dirty(self, node: hou.SopNode, names: set[str]) -> None:
+* in_reset_parms_diff(self, node: hou.SopNode, parms: tuple[hou.Parm, ...]) -> None:
 * in_to_flam3h_resets(self, node: hou.SopNode, _FLAM3H_INIT_DATA: TA_F3H_Init) -> None:
 * in_to_flam3h_set_iterators(self, node: hou.SopNode, apo_data: in_flame_iter_data, _FLAM3H_INIT_DATA: TA_F3H_Init) -> None:
 * in_to_flam3h_set_motion_blur(self, node: hou.SopNode, apo_data: in_flame_iter_data) -> None:
@@ -16307,6 +19406,9 @@ class in_flame_utils
     
     __slots__ = ("_kwargs", "_node", "_gpu")
     
+    # The flame presets prefetched in this Houdini session, shared by all the FLAM3H™ nodes.
+    PREFETCH: Final[in_flame_prefetch] = in_flame_prefetch(32)
+    
     def __init__(self, kwargs: dict[str, Any]) -> None:
         """
         Args:
@@ -16439,8 +19541,22 @@ class in_flame_utils
         Returns:
             (list[str]): List of sorted uinknown variations if any
         """
-        if apo_data.plugins[preset_id]:
-            plugins: list[str] = [p.strip() for p in str(apo_data.plugins[preset_id]).split() if p]
+        return in_flame_utils.in_load_stats_unknown_vars_from_plugins(apo_data.plugins[preset_id])
+    
+    
+    @staticmethod
+    def in_load_stats_unknown_vars_from_plugins(plugins_key: str | list[Never]) -> list[str]:
+        """Find all the variations that Fractorium lacks if any, out of a flame preset XML plugins key value.</br>
+        Those variations will be classified as: Unknown</br>
+
+        Args:
+            plugins_key(str | list[Never]): The flame preset XML plugins key value.</br>It can also be an empty list if the plugins XML key is missing from the flame preset.
+
+        Returns:
+            (list[str]): List of sorted uinknown variations if any
+        """
+        if plugins_key:
+            plugins: list[str] = [p.strip() for p in str(plugins_key).split() if p]
         else:
             plugins: list[str] = []
         
@@ -16464,6 +19580,128 @@ class in_flame_utils
         return sorted(unknown, key=lambda var: var)
 
 
+    @staticmethod
+    def in_load_collect_vars_from_xforms(xforms: tuple[dict, ...] | None, finalxform: tuple[dict, ...] | None, pb_bool: bool, pgb_name: str = 'pre_gaussian_blur') -> list[str]:
+        """Collect all the used variations out of the xforms and finalxform of a flame preset.</br>
+        They will be collected inside a list of strings and they will be unique(no duplicates) and sorted.</br>
+        No FLAM3H™ node is needed so it can be used for any flame preset, not only the one being loaded.</br>
+
+        Args:
+            xforms(tuple[dict, ...] | None): The flame preset xforms, each one a dict of its XML keys lowercase and values.
+            finalxform(tuple[dict, ...] | None): The flame preset finalxform the same way as the xforms or None if not present.
+            pb_bool(bool): Is the flame preset using pre_blur ? True or False
+            pgb_name(str): Default to: 'pre_gaussian_blur'</br>Correct name of the PRE gaussian blur, always "pre_gaussian_blur" but always computed in advance.</br>This variation will be removed if it is the first one in the list of PRE variations.
+
+        Returns:
+            (list[str]): A list containing the unique used variations sorted alphatically.
+        """  
+        
+        # Cache for resuse
+        _V_F3H_DICT_IDX_keys: KeysView = VARS_FLAM3_DICT_IDX.keys()
+        
+        # ITERATOR COLLECT
+        __EXCLUDE__: tuple[str, ...] = copy(XML_XF_KEY_EXCLUDE)
+        vars_keys: TA_STR_ListUnflattened | None = in_flame_utils.in_get_xforms_var_keys(xforms, _V_F3H_DICT_IDX_keys, __EXCLUDE__)
+        if vars_keys is not None:
+            vars_keys_flatten: list[str] = [item for sublist in vars_keys for item in sublist]
+            if vars_keys_flatten: __EXCLUDE__ += tuple(vars_keys_flatten)
+        vars_keys_PRE_pgb: TA_STR_ListUnflattened | None = in_flame_utils.in_get_xforms_var_keys(xforms, VARS_FLAM3_KEYS_PRE, __EXCLUDE__)
+        vars_keys_PRE: TA_STR_ListUnflattened | None = in_flame_utils.in_vars_keys_remove_pgb(vars_keys_PRE_pgb, pgb_name)
+        if vars_keys_PRE is not None: 
+            vars_keys_PRE_flatten: list[str] = [item for sublist in vars_keys_PRE for item in sublist]
+            if vars_keys_PRE_flatten: __EXCLUDE__ += tuple(vars_keys_PRE_flatten)
+        vars_keys_POST: TA_STR_ListUnflattened | None = in_flame_utils.in_get_xforms_var_keys(xforms, VARS_FLAM3_KEYS_POST, __EXCLUDE__)
+        
+        # FF COLLECT
+        vars_keys_FF = vars_keys_PRE_FF = vars_keys_POST_FF = []
+        if finalxform is not None:
+            __EXCLUDE__ = copy(XML_XF_KEY_EXCLUDE)
+            vars_keys_FF: TA_STR_ListUnflattened | None = in_flame_utils.in_get_xforms_var_keys(finalxform, _V_F3H_DICT_IDX_keys, __EXCLUDE__)
+            if vars_keys_FF is not None:
+                vars_keys_FF_flatten: list[str] = [item for sublist in vars_keys_FF for item in sublist]
+                if vars_keys_FF_flatten: __EXCLUDE__ += tuple(vars_keys_FF_flatten)
+            vars_keys_PRE_FF: TA_STR_ListUnflattened | None = in_flame_utils.in_get_xforms_var_keys(finalxform, VARS_FLAM3_KEYS_PRE, __EXCLUDE__)
+            if vars_keys_PRE_FF is not None:
+                vars_keys_PRE_FF_flatten: list[str] = [item for sublist in vars_keys_PRE_FF for item in sublist]
+                if vars_keys_PRE_FF_flatten: __EXCLUDE__ += tuple(vars_keys_PRE_FF_flatten)
+            vars_keys_POST_FF: TA_STR_ListUnflattened | None = in_flame_utils.in_get_xforms_var_keys(finalxform, VARS_FLAM3_KEYS_POST, __EXCLUDE__)
+        
+        # JOIN PRE, VAR and POST
+        # vars_all: list[list[str]] = vars_keys_PRE + vars_keys + vars_keys_POST + vars_keys_PRE_FF + vars_keys_FF + vars_keys_POST_FF 
+        vars_all: list[list[str]] = (
+            (vars_keys_PRE or [])
+            + (vars_keys or [])
+            + (vars_keys_POST or [])
+            + (vars_keys_PRE_FF or [])
+            + (vars_keys_FF or [])
+            + (vars_keys_POST_FF or [])
+        )
+        if pb_bool: vars_all += [["pre_blur"]]
+        # Unique and sorted
+        vars_used: list[str] = in_flame_utils.in_util_vars_flatten_unique_sorted(vars_all, in_flame_utils.in_util_make_NULL, True)
+        
+        return vars_used
+    
+    
+    @staticmethod
+    def in_load_collect_vars_missing_from_xforms(xforms: tuple[dict, ...] | None, finalxform: tuple[dict, ...] | None, vars_used: list[str], pgb_name: str = 'pre_gaussian_blur') -> list[str]:
+        """Collect all the missing variations out of the xforms and finalxform of a flame preset.</br>
+        They will be collected inside a list of strings and they will be unique(no duplicates) and sorted.</br>
+
+        Args:
+            xforms(tuple[dict, ...] | None): The flame preset xforms, each one a dict of its XML keys lowercase and values.
+            finalxform(tuple[dict, ...] | None): The flame preset finalxform the same way as the xforms or None if not present.
+            vars_used(list[str]): Used variations unique and sorted.</br>This is coming from: in_flame_utils.in_load_collect_vars_from_xforms(...)
+            pgb_name(str): Default to: 'pre_gaussian_blur'</br>Correct name of the PRE gaussian blur, always "pre_gaussian_blur" but always computed in advance.</br>This variation will be removed if it is the first one in the list of PRE variations.
+
+        Returns:
+            (list[str]): A list containing the unique missing variations sorted alphatically.
+        """  
+        # Build ITERATOR MISSING
+        __EXCLUDE__ = copy(XML_XF_KEY_EXCLUDE)
+        vars_keys_from_fractorium: TA_STR_ListUnflattened | None = in_flame_utils.in_get_xforms_var_keys(xforms, VARS_FRACTORIUM_DICT, __EXCLUDE__)
+        if vars_keys_from_fractorium is not None:
+            vars_keys_from_fractorium_flatten: list[str] = [item for sublist in vars_keys_from_fractorium for item in sublist]
+            if vars_keys_from_fractorium_flatten: __EXCLUDE__ += tuple(vars_keys_from_fractorium_flatten)
+        vars_keys_from_fractorium_pre_pgb: TA_STR_ListUnflattened | None = in_flame_utils.in_get_xforms_var_keys_PP(xforms, VARS_FRACTORIUM_DICT_PRE, xml_keys.DEFAULT_VAR_PRE_PRX, __EXCLUDE__)
+        vars_keys_from_fractorium_pre: TA_STR_ListUnflattened | None = in_flame_utils.in_vars_keys_remove_pgb(vars_keys_from_fractorium_pre_pgb, pgb_name)
+        if vars_keys_from_fractorium_pre is not None:
+            vars_keys_from_fractorium_pre_flatten: list[str] = [item for sublist in vars_keys_from_fractorium_pre for item in sublist]
+            if vars_keys_from_fractorium_pre_flatten: __EXCLUDE__ += tuple(vars_keys_from_fractorium_pre_flatten)
+        vars_keys_from_fractorium_post: TA_STR_ListUnflattened | None = in_flame_utils.in_get_xforms_var_keys_PP(xforms, VARS_FRACTORIUM_DICT_POST, xml_keys.DEFAULT_VAR_POST_PRX, __EXCLUDE__)
+        
+        # BUILD FF MISSING
+        vars_keys_from_fractorium_FF = vars_keys_from_fractorium_pre_FF = vars_keys_from_fractorium_post_FF = [] # TA_STR_ListUnflattened
+        if finalxform is not None:
+            __EXCLUDE__ = copy(XML_XF_KEY_EXCLUDE)
+            vars_keys_from_fractorium_FF: TA_STR_ListUnflattened | None = in_flame_utils.in_get_xforms_var_keys(finalxform, VARS_FRACTORIUM_DICT, __EXCLUDE__)
+            if vars_keys_from_fractorium_FF is not None:
+                vars_keys_from_fractorium_FF_flatten: list[str] = [item for sublist in vars_keys_from_fractorium_FF for item in sublist]
+                if vars_keys_from_fractorium_FF_flatten: __EXCLUDE__ += tuple(vars_keys_from_fractorium_FF_flatten)
+            vars_keys_from_fractorium_pre_FF: TA_STR_ListUnflattened | None = in_flame_utils.in_get_xforms_var_keys_PP(finalxform, VARS_FRACTORIUM_DICT_PRE, xml_keys.DEFAULT_VAR_PRE_PRX, __EXCLUDE__)
+            if vars_keys_from_fractorium_pre_FF is not None:
+                vars_keys_from_fractorium_pre_FF_flatten: list[str] = [item for sublist in vars_keys_from_fractorium_pre_FF for item in sublist]
+                if vars_keys_from_fractorium_pre_FF_flatten: __EXCLUDE__ += tuple(vars_keys_from_fractorium_pre_FF_flatten)
+            vars_keys_from_fractorium_post_FF: TA_STR_ListUnflattened | None = in_flame_utils.in_get_xforms_var_keys_PP(finalxform, VARS_FRACTORIUM_DICT_POST, xml_keys.DEFAULT_VAR_POST_PRX, __EXCLUDE__)
+        
+        # JOIN ITERATORS and FF PRE, VARS and POST
+        # vars_keys_from_fractorium_all: list[list[str]] = vars_keys_from_fractorium + vars_keys_from_fractorium_pre + vars_keys_from_fractorium_post + vars_keys_from_fractorium_pre_FF + vars_keys_from_fractorium_FF + vars_keys_from_fractorium_post_FF
+        vars_keys_from_fractorium_all: list[list[str]] = (
+            (vars_keys_from_fractorium or [])
+            + (vars_keys_from_fractorium_pre or [])
+            + (vars_keys_from_fractorium_post or [])
+            + (vars_keys_from_fractorium_pre_FF or [])
+            + (vars_keys_from_fractorium_FF or [])
+            + (vars_keys_from_fractorium_post_FF or [])
+        )
+        # Unique and sorted
+        result_sorted_fractorium: list[str] = in_flame_utils.in_util_vars_flatten_unique_sorted(vars_keys_from_fractorium_all, in_flame_utils.in_util_make_NULL, True)
+        # Build MISSING: Compare, keep and build
+        vars_missing: list[str] = [x for x in result_sorted_fractorium if x not in vars_used]
+        
+        return vars_missing
+    
+    
     @staticmethod
     def in_to_flam3h_is_CHAOS(xml: str) -> bool:
         """Load a flame preset from a file and tell us if it is a Chaotica flame preset or not.</br>
@@ -16678,7 +19916,7 @@ class in_flame_utils
     
     @staticmethod
     def in_set_affine(mode: int, 
-                      node: hou.SopNode, 
+                      plan: in_flame_parms_plan, 
                       prx: str, 
                       apo_data: in_flame_iter_data, 
                       flam3h_prm_names: flam3h_iterator_prm_names, 
@@ -16689,7 +19927,7 @@ class in_flame_utils
         
         Args:
             mode(int): 0 for iterator. 1 for FF
-            node(hou.SopNode): Current FLAM3H™ node
+            plan(in_flame_parms_plan): The parameters plan of the FLAM3H™ node we are loading the flame preset into
             prx(str): parameter name prefix
             apo_data(in_flame_iter_data): Apophysis XML data collection from: class in_flame_iter_data(in_flame)
             flam3h_prm_names(flam3h_iterator_prm_names): Class of FLAM3H™ iterator parameter's names
@@ -16699,66 +19937,66 @@ class in_flame_utils
         zero_vectors: list[hou.Vector2] = [hou.Vector2(tuple([0, 0, 0, 0, 0, 0][i:i + 2])) for i in (0, 2, 4)]
         pre_affine: tuple[str, ...] = (flam3h_prm_names.preaffine_x, flam3h_prm_names.preaffine_y, flam3h_prm_names.preaffine_o)
         post_affine: tuple[str, ...] = (flam3h_prm_names.postaffine_x, flam3h_prm_names.postaffine_y, flam3h_prm_names.postaffine_o)
-        f3h_affine: int = node.parm(f3h_tabs.IN.PRM_FLAM3H_AFFINE_STYLE).eval()
+        f3h_affine: int = plan.node.parm(f3h_tabs.IN.PRM_FLAM3H_AFFINE_STYLE).eval()
         
         if mode:
             
             if f3h_affine and apo_data.finalxform_f3h_coefs is not None and apo_data.finalxform_f3h_coefs[mp_idx]:
-                for id in range(3): node.parmTuple(f"{prx}{pre_affine[id]}").set(apo_data.finalxform_f3h_coefs[mp_idx][id])
-                node.parm(f"{prx}{flam3h_prm_names.preaffine_ang}").set(apo_data.finalxform_f3h_coefs_angle[mp_idx])
+                for id in range(3): plan.set(f"{prx}{pre_affine[id]}", apo_data.finalxform_f3h_coefs[mp_idx][id])
+                plan.set(f"{prx}{flam3h_prm_names.preaffine_ang}", apo_data.finalxform_f3h_coefs_angle[mp_idx])
                 
             else:
                 if apo_data.finalxform_coefs is not None:
                     # The affine XML key: "coefs" must always be present in the XML file.
-                    for id in range(3): node.parmTuple(f"{prx}{pre_affine[id]}").set(apo_data.finalxform_coefs[mp_idx][id])
+                    for id in range(3): plan.set(f"{prx}{pre_affine[id]}", apo_data.finalxform_coefs[mp_idx][id])
                     
                 else:
                     # If not present, we set all the pre affine values for this iterator to a value of: 0(Zero)
                     # Doing so it wont error out on load and it will act as a warning sign.
                     print(f"Warning: iterator.FF\nIN xml key: {xml_keys.XML_PRE_AFFINE} -> NOT FOUND, zero values used.\n")
                     
-                    for id in range(3): node.parm(f"{prx}{pre_affine[id]}").set(zero_vectors[id])
+                    for id in range(3): plan.set(f"{prx}{pre_affine[id]}", zero_vectors[id])
 
             if apo_data.finalxform_post is not None:
-                node.parm(f"{prx}{flam3h_prm_names.postaffine_do}").set(1)
+                plan.set(f"{prx}{flam3h_prm_names.postaffine_do}", 1)
                 if f3h_affine and apo_data.finalxform_f3h_post is not None and apo_data.finalxform_f3h_post[mp_idx]:
-                    for id in range(3): node.parmTuple(f"{prx}{post_affine[id]}").set(apo_data.finalxform_f3h_post[mp_idx][id])
-                    node.parm(f"{prx}{flam3h_prm_names.postaffine_ang}").set(apo_data.finalxform_f3h_post_angle[mp_idx])
+                    for id in range(3): plan.set(f"{prx}{post_affine[id]}", apo_data.finalxform_f3h_post[mp_idx][id])
+                    plan.set(f"{prx}{flam3h_prm_names.postaffine_ang}", apo_data.finalxform_f3h_post_angle[mp_idx])
                     
                 else:
-                    for id in range(3): node.parmTuple(f"{prx}{post_affine[id]}").set(apo_data.finalxform_post[mp_idx][id])
+                    for id in range(3): plan.set(f"{prx}{post_affine[id]}", apo_data.finalxform_post[mp_idx][id])
                 
         else:
             
             if f3h_affine and apo_data.f3h_coefs is not None and apo_data.f3h_coefs[mp_idx]:
-                for id in range(3): node.parmTuple(f"{prx}{pre_affine[id]}_{idx}").set(apo_data.f3h_coefs[mp_idx][id])
-                node.parm(f"{prx}{flam3h_prm_names.preaffine_ang}_{idx}").set(apo_data.f3h_coefs_angle[mp_idx])
+                for id in range(3): plan.set(f"{prx}{pre_affine[id]}_{idx}", apo_data.f3h_coefs[mp_idx][id])
+                plan.set(f"{prx}{flam3h_prm_names.preaffine_ang}_{idx}", apo_data.f3h_coefs_angle[mp_idx])
                 
             else:
                 if apo_data.coefs is not None and apo_data.coefs[mp_idx]:
                     # The affine XML key: "coefs" must always be present in the XML file.
-                    for id in range(3): node.parmTuple(f"{prx}{pre_affine[id]}_{idx}").set(apo_data.coefs[mp_idx][id])
+                    for id in range(3): plan.set(f"{prx}{pre_affine[id]}_{idx}", apo_data.coefs[mp_idx][id])
                     
                 else:
                     # If not present, we set all the pre affine values for this iterator to a value of: 0(Zero)
                     # Doing so it wont error out on load and it will act as a warning sign.
                     print(f"Warning: iterator.{mp_idx+1}\nIN xml key: {xml_keys.XML_PRE_AFFINE} -> NOT FOUND, zero values used.\n")
                     
-                    for id in range(3): node.parmTuple(f"{prx}{pre_affine[id]}_{idx}").set(zero_vectors[id])
+                    for id in range(3): plan.set(f"{prx}{pre_affine[id]}_{idx}", zero_vectors[id])
 
             if apo_data.post is not None and apo_data.post[mp_idx]:
-                node.parm(f"{prx}{flam3h_prm_names.postaffine_do}_{idx}").set(1)
+                plan.set(f"{prx}{flam3h_prm_names.postaffine_do}_{idx}", 1)
                 if f3h_affine and apo_data.f3h_post is not None and apo_data.f3h_post[mp_idx]:
-                    for id in range(3): node.parmTuple(f"{prx}{post_affine[id]}_{idx}").set(apo_data.f3h_post[mp_idx][id])
-                    node.parm(f"{prx}{flam3h_prm_names.postaffine_ang}_{idx}").set(apo_data.f3h_post_angle[mp_idx])
+                    for id in range(3): plan.set(f"{prx}{post_affine[id]}_{idx}", apo_data.f3h_post[mp_idx][id])
+                    plan.set(f"{prx}{flam3h_prm_names.postaffine_ang}_{idx}", apo_data.f3h_post_angle[mp_idx])
                     
                 else:
-                    for id in range(3): node.parmTuple(f"{prx}{post_affine[id]}_{idx}").set(apo_data.post[mp_idx][id])
+                    for id in range(3): plan.set(f"{prx}{post_affine[id]}_{idx}", apo_data.post[mp_idx][id])
 
 
     @staticmethod
     def in_set_data(mode: int, 
-                    node: hou.SopNode, 
+                    plan: in_flame_parms_plan, 
                     prx: str, 
                     apo_data: tuple | list | None, 
                     prm_name: str, 
@@ -16776,7 +20014,7 @@ class in_flame_utils
         
         Args:
             mode(int): 0 for iterator. 1 for FF
-            node(hou.SopNode): Current FLAM3H™ node
+            plan(in_flame_parms_plan): The parameters plan of the FLAM3H™ node we are loading the flame preset into
             prx(str): parameter name prefix
             apo_data(in_flame_iter_data): Apophysis XML data collection from: class in_flame_iter_data(in_flame)
             prm_name(str): parameter name for the current data we want to set
@@ -16788,13 +20026,13 @@ class in_flame_utils
         if mode: pass
         else:
             if apo_data is not None:
-                n: flam3h_iterator_prm_names = flam3h_iterator_prm_names()
+                n: flam3h_iterator_prm_names = plan.f3h_iter
                 if prm_name not in [n.shader_alpha, n.main_weight]:
                     if apo_data[mp_idx]:
-                        node.parm(f"{prx}{prm_name}_{mp_idx + 1}").set(apo_data[mp_idx])
+                        plan.set(f"{prx}{prm_name}_{mp_idx + 1}", apo_data[mp_idx])
                         
                 else:
-                    node.parm(f"{prx}{prm_name}_{mp_idx + 1}").set(apo_data[mp_idx])
+                    plan.set(f"{prx}{prm_name}_{mp_idx + 1}", apo_data[mp_idx])
            
            
     @staticmethod  
@@ -16818,7 +20056,7 @@ class in_flame_utils
         
         # Lets check which one is coming in so to grab the proper parameteric parameters names
         if app.startswith(xml_keys.XML_APP_NAME_FRACTORIUM):
-            check: tuple | None = flam3h_varsPRM_APO().varsPRM_FRACTORIUM_EXCEPTIONS.get(v_type)
+            check: tuple | None = VARS_FRACTORIUM_PRM_EXCEPTIONS.get(v_type)
             if check is not None:
                 return check
             
@@ -16888,7 +20126,7 @@ class in_flame_utils
                     # If a variation parameter FLAM3H™ has is not found, set it to ZERO. Print its name to let us know if not inside XML_XF_PRM_EXCEPTION
                     if n not in XML_XF_PRM_EXCEPTION:
                         var_prm_vals.append(float(0))
-                        print(f"Warning: iterator.{iter_type}\n{node.name()}: PARAMETER NOT FOUND\n-> Variation: {func(in_flame_utils.in_get_dict_key_from_value(VARS_FLAM3_DICT_IDX, v_type))}\n-> Missing parameter: {n}\n")
+                        print(f"Warning: iterator.{iter_type}\n{node.name()}: PARAMETER NOT FOUND\n-> Variation: {func(VARS_FLAM3_NAME_FROM_IDX[v_type])}\n-> Missing parameter: {n}\n")
                         
             VAR.append(in_flame_utils.in_util_typemaker(var_prm_vals))
         
@@ -16898,7 +20136,7 @@ class in_flame_utils
     @staticmethod
     def in_v_parametric(app: str | list[Never], 
                         mode: int, 
-                        node: hou.SopNode, 
+                        plan: in_flame_parms_plan, 
                         mp_idx: int, 
                         t_idx: int, 
                         xform: dict, 
@@ -16913,7 +20151,7 @@ class in_flame_utils
         Args:
             app(str | list[Never]): What software were used to generate this flame preset.</br>It can also be an empty list if the app XML key is missing from the Flame preset we are trying to load.
             mode(int): 0 for iterator. 1 for FF
-            node(hou.SopNode): Current FLAM3H™ node
+            plan(in_flame_parms_plan): The parameters plan of the FLAM3H™ node we are loading the flame preset into
             mp_idx(int): for multiparameter index -> the xform count from the outer loop: (mp_idx + 1)
             t_idx(int): current variation number idx to use with: flam3h_iterator().sec_varsT, flam3h_iterator().sec_varsW
             xform(dict): current xform we are processing to the relative key names and values for the iterator
@@ -16930,7 +20168,7 @@ class in_flame_utils
         # Exceptions: check if this flame need different parameters names based on detected exception
         apo_prm = in_flame_utils.in_prm_name_exceptions(v_type, app, apo_prm)
 
-        _VAR: list[TA_TypeMaker] = in_flame_utils.in_v_parametric_var_collect(node, 
+        _VAR: list[TA_TypeMaker] = in_flame_utils.in_v_parametric_var_collect(plan.node, 
                                                                         mode, 
                                                                         apo_prm, 
                                                                         xform, 
@@ -16943,27 +20181,23 @@ class in_flame_utils
         for idx, prm in enumerate(var_prm[1:-1]):
             # We are not using: def flam3h_prm_utils.setParms()
             # because those parameters have been already unlocked and cleared of their keyframes if any already
-            if mode: node.setParms( # pyright: ignore[reportAttributeAccessIssue]  # Houdini HOM API
-                                    {f"{prx_prm}{prm[0][:-1]}": _VAR[idx]}
-                                    ) 
-            else: node.setParms(    # pyright: ignore[reportAttributeAccessIssue]  # Houdini HOM API
-                                    {f"{prx_prm}{prm[0]}{mpidx}": _VAR[idx]}
-                                    ) 
+            if mode: plan.set(f"{prx_prm}{prm[0][:-1]}", _VAR[idx])
+            else: plan.set(f"{prx_prm}{prm[0]}{mpidx}", _VAR[idx])
 
-        f3h_iter: flam3h_iterator = flam3h_iterator()
+        f3h_iter: flam3h_iterator = plan.f3h_iter
         if mode:
-            node.parm(f"{prx}{f3h_iter.sec_varsT[t_idx][:-1]}").set(v_type)
-            node.parm(f"{prx}{f3h_iter.sec_varsW[t_idx][0][:-1]}").set(v_weight)
+            plan.set(f"{prx}{f3h_iter.sec_varsT[t_idx][:-1]}", v_type)
+            plan.set(f"{prx}{f3h_iter.sec_varsW[t_idx][0][:-1]}", v_weight)
             
         else:
-            node.parm(f"{prx}{f3h_iter.sec_varsT[t_idx]}{mpidx}").set(v_type)
-            node.parm(f"{prx}{f3h_iter.sec_varsW[t_idx][0]}{mpidx}").set(v_weight)
+            plan.set(f"{prx}{f3h_iter.sec_varsT[t_idx]}{mpidx}", v_type)
+            plan.set(f"{prx}{f3h_iter.sec_varsW[t_idx][0]}{mpidx}", v_weight)
             
             
     @staticmethod
     def in_v_parametric_PRE(app: str | list[Never], 
                             mode: int, 
-                            node: hou.SopNode, 
+                            plan: in_flame_parms_plan, 
                             mp_idx: int, 
                             t_idx: int, 
                             xform: dict, 
@@ -16978,7 +20212,7 @@ class in_flame_utils
         Args:
             app(str | list[Never]): What software were used to generate this flame preset.</br>It can also be an empty list if the app XML key is missing from the Flame preset we are trying to load.
             mode(int): 0 for iterator. 1 for FF
-            node(hou.SopNode): Current FLAM3H™ node
+            plan(in_flame_parms_plan): The parameters plan of the FLAM3H™ node we are loading the flame preset into
             mp_idx(int): for multiparameter index -> the xform count from the outer loop: (mp_idx + 1)
             t_idx(int): current variation number idx to use with: flam3h_iterator().sec_prevarsT, flam3h_iterator().sec_prevarsW
             xform(dict): current xform we are processing to the relative key names and values for the iterator
@@ -16995,7 +20229,7 @@ class in_flame_utils
         # Exceptions: check if this flame need different parameters names based on detected exception
         apo_prm = in_flame_utils.in_prm_name_exceptions(v_type, app, apo_prm)
         
-        _VAR: list[TA_TypeMaker] = in_flame_utils.in_v_parametric_var_collect(node, 
+        _VAR: list[TA_TypeMaker] = in_flame_utils.in_v_parametric_var_collect(plan.node, 
                                                                               mode, 
                                                                               apo_prm, 
                                                                               xform, 
@@ -17008,19 +20242,17 @@ class in_flame_utils
         for idx, prm in enumerate(var_prm[1:-1]):
             # We are not using: def flam3h_prm_utils.setParms()
             # because those parameters have been already unlocked and cleared of their keyframes if any already
-            node.setParms(# pyright: ignore[reportAttributeAccessIssue]  # Houdini HOM API
-                        {f"{prx_prm}{prm[0]}{mpidx}": _VAR[idx]}
-                        ) 
+            plan.set(f"{prx_prm}{prm[0]}{mpidx}", _VAR[idx])
 
         # Only on pre variations with parametric so:
-        node.parm(f"{prx}{flam3h_iterator().sec_prevarsT[t_idx]}{mpidx}").set(v_type)
-        node.parm(f"{prx}{flam3h_iterator().sec_prevarsW[1:][t_idx][0]}{mpidx}").set(v_weight)
+        plan.set(f"{prx}{plan.f3h_iter.sec_prevarsT[t_idx]}{mpidx}", v_type)
+        plan.set(f"{prx}{plan.f3h_iter.sec_prevarsW[1:][t_idx][0]}{mpidx}", v_weight)
 
 
     @staticmethod
     def in_v_parametric_POST(app: str | list[Never], 
                              mode: int, 
-                             node: hou.SopNode, 
+                             plan: in_flame_parms_plan, 
                              mp_idx: int, 
                              t_idx: int, 
                              xform: dict, 
@@ -17035,7 +20267,7 @@ class in_flame_utils
         Args:
             app(str | list[Never]): What software were used to generate this flame preset.</br>It can also be an empty list if the app XML key is missing from the Flame preset we are trying to load.
             mode(int): 0 for iterator. 1 for FF
-            node(hou.SopNode): Current FLAM3H™ node
+            plan(in_flame_parms_plan): The parameters plan of the FLAM3H™ node we are loading the flame preset into
             mp_idx(int): for multiparameter index -> the xform count from the outer loop: (mp_idx + 1)
             t_idx(int): current variation number idx to use with: flam3h_iterator().sec_postvarsT, flam3h_iterator().sec_postvarsW
             xform(dict): current xform we are processing to the relative key names and values for the iterator
@@ -17052,7 +20284,7 @@ class in_flame_utils
         # Exceptions: check if this flame need different parameters names based on detected exception
         apo_prm = in_flame_utils.in_prm_name_exceptions(v_type, app, apo_prm)
 
-        _VAR: list[TA_TypeMaker] = in_flame_utils.in_v_parametric_var_collect(node, 
+        _VAR: list[TA_TypeMaker] = in_flame_utils.in_v_parametric_var_collect(plan.node, 
                                                                               mode, 
                                                                               apo_prm, 
                                                                               xform, 
@@ -17064,18 +20296,16 @@ class in_flame_utils
         for idx, prm in enumerate(var_prm[1:-1]):
             # We are not using: def flam3h_prm_utils.setParms()
             # because those parameters have been already unlocked and cleared of their keyframes if any already
-            node.setParms(# pyright: ignore[reportAttributeAccessIssue]  # Houdini HOM API
-                        {f"{prx_prm}{prm[0]}{mpidx}": _VAR[idx]}
-                        ) 
+            plan.set(f"{prx_prm}{prm[0]}{mpidx}", _VAR[idx])
 
         # Only on post variation with parametric so:
-        node.parm(f"{prx}{flam3h_iterator().sec_postvarsT[t_idx]}{mpidx}").set(v_type)
-        node.parm(f"{prx}{flam3h_iterator().sec_postvarsW[t_idx][0]}{mpidx}").set(v_weight)
+        plan.set(f"{prx}{plan.f3h_iter.sec_postvarsT[t_idx]}{mpidx}", v_type)
+        plan.set(f"{prx}{plan.f3h_iter.sec_postvarsW[t_idx][0]}{mpidx}", v_weight)
     
     
     @staticmethod    
     def in_v_parametric_PRE_FF(app: str | list[Never], 
-                               node: hou.SopNode, 
+                               plan: in_flame_parms_plan, 
                                t_idx: int, 
                                xform: dict, 
                                v_type: int, 
@@ -17088,7 +20318,7 @@ class in_flame_utils
         
         Args:
             app(str | list[Never]): What software were used to generate this flame preset.</br>It can also be an empty list if the app XML key is missing from the Flame preset we are trying to load.
-            node(hou.SopNode): Current FLAM3H™ houdini node
+            plan(in_flame_parms_plan): The parameters plan of the FLAM3H™ node we are loading the flame preset into
             t_idx(int): current variation number idx to use with: flam3h_iterator().sec_prevarsT_FF, flam3h_iterator().sec_prevarsW_FF
             xform(dict): current xform we are processing to the relative key names and values for the iterator
             v_type(int): the current variation type index
@@ -17102,7 +20332,7 @@ class in_flame_utils
         # Exceptions: check if this flame need different parameters names based on detected exception
         apo_prm = in_flame_utils.in_prm_name_exceptions(v_type, app, apo_prm)
 
-        _VAR: list[TA_TypeMaker] = in_flame_utils.in_v_parametric_var_collect(node, 
+        _VAR: list[TA_TypeMaker] = in_flame_utils.in_v_parametric_var_collect(plan.node, 
                                                                               1, 
                                                                               apo_prm, 
                                                                               xform, 
@@ -17113,18 +20343,16 @@ class in_flame_utils
         for idx, prm in enumerate(var_prm[1:-1]):
             # We are not using: def flam3h_prm_utils.setParms()
             # because those parameters have been already unlocked and cleared of their keyframes if any already
-            node.setParms(# pyright: ignore[reportAttributeAccessIssue]  # Houdini HOM API
-                        {f"{f3h_ffPrmPrx.PRM_PP}_{prm[0][0:-1]}": _VAR[idx]}
-                        ) 
+            plan.set(f"{f3h_ffPrmPrx.PRM_PP}_{prm[0][0:-1]}", _VAR[idx])
 
         # Only on post variation with parametric so:
-        node.parm(f"{flam3h_iterator_FF().sec_prevarsT_FF[t_idx]}").set(v_type)
-        node.parm(f"{flam3h_iterator_FF().sec_prevarsW_FF[t_idx][0]}").set(v_weight)
+        plan.set(f"{plan.f3h_iter_FF.sec_prevarsT_FF[t_idx]}", v_type)
+        plan.set(f"{plan.f3h_iter_FF.sec_prevarsW_FF[t_idx][0]}", v_weight)
 
 
     @staticmethod
     def in_v_parametric_POST_FF(app: str | list[Never], 
-                                node: hou.SopNode, 
+                                plan: in_flame_parms_plan, 
                                 t_idx: int, 
                                 xform: dict, 
                                 v_type: int, 
@@ -17137,7 +20365,7 @@ class in_flame_utils
         
         Args:
             app(str | list[Never]): What software were used to generate this flame preset.</br>It can also be an empty list if the app XML key is missing from the Flame preset we are trying to load.
-            node(hou.SopNode): Current FLAM3H™ node
+            plan(in_flame_parms_plan): The parameters plan of the FLAM3H™ node we are loading the flame preset into
             t_idx(int): current variation number idx to use with: flam3h_iterator().sec_postvarsT_FF, flam3h_iterator().sec_postvarsW_FF
             xform(dict): current xform we are processing to the relative key names and values for the iterator
             v_type(int): the current variation type index
@@ -17151,7 +20379,7 @@ class in_flame_utils
         # Exceptions: check if this flame need different parameters names based on detected exception
         apo_prm = in_flame_utils.in_prm_name_exceptions(v_type, app, apo_prm)
 
-        _VAR: list[TA_TypeMaker] = in_flame_utils.in_v_parametric_var_collect(node, 
+        _VAR: list[TA_TypeMaker] = in_flame_utils.in_v_parametric_var_collect(plan.node, 
                                                                               1, 
                                                                               apo_prm, 
                                                                               xform, 
@@ -17162,18 +20390,16 @@ class in_flame_utils
         for idx, prm in enumerate(var_prm[1:-1]):
             # We are not using: def flam3h_prm_utils.setParms()
             # because those parameters have been already unlocked and cleared of their keyframes if any already
-            node.setParms(# pyright: ignore[reportAttributeAccessIssue]  # Houdini HOM API
-                        {f"{f3h_ffPrmPrx.PRM_PP}_{prm[0][0:-1]}": _VAR[idx]}
-                        ) 
+            plan.set(f"{f3h_ffPrmPrx.PRM_PP}_{prm[0][0:-1]}", _VAR[idx])
 
         # Only on post variation with parametric so:
-        node.parm(f"{flam3h_iterator_FF().sec_postvarsT_FF[t_idx]}").set(v_type)
-        node.parm(f"{flam3h_iterator_FF().sec_postvarsW_FF[t_idx][0]}").set(v_weight)
+        plan.set(f"{plan.f3h_iter_FF.sec_postvarsT_FF[t_idx]}", v_type)
+        plan.set(f"{plan.f3h_iter_FF.sec_postvarsW_FF[t_idx][0]}", v_weight)
 
 
     @staticmethod
     def in_v_generic(mode: int, 
-                     node: hou.SopNode, 
+                     plan: in_flame_parms_plan, 
                      mp_idx: int, 
                      t_idx: int, 
                      v_type: int, 
@@ -17183,7 +20409,7 @@ class in_flame_utils
         
         Args:
             mode(int): 0 for iterator. 1 for FF
-            node(hou.SopNode): Current FLAM3H™ node
+            plan(in_flame_parms_plan): The parameters plan of the FLAM3H™ node we are loading the flame preset into
             mp_idx(int): Multiparameter index -> the xform count from the outer loop: (mp_idx + 1)
             t_idx(int): Current variation number idx to use with: flam3h_iterator().sec_prevarsT, flam3h_iterator().sec_prevarsW
             v_type(int): Current variation type index
@@ -17193,20 +20419,20 @@ class in_flame_utils
             (None):
         """
         prx, prx_prm = in_flame_utils.in_util_flam3h_prx_mode(mode)
-        f3h_iter: flam3h_iterator = flam3h_iterator()
+        f3h_iter: flam3h_iterator = plan.f3h_iter
         if mode:
-            node.parm(f"{prx}{f3h_iter.sec_varsT[t_idx][:-1]}").set(v_type)
-            node.parm(f"{prx}{f3h_iter.sec_varsW[t_idx][0][:-1]}").set(v_weight)
+            plan.set(f"{prx}{f3h_iter.sec_varsT[t_idx][:-1]}", v_type)
+            plan.set(f"{prx}{f3h_iter.sec_varsW[t_idx][0][:-1]}", v_weight)
             
         else:
             idx = str(mp_idx + 1)
-            node.parm(f"{prx}{f3h_iter.sec_varsT[t_idx]}{idx}").set(v_type)
-            node.parm(f"{prx}{f3h_iter.sec_varsW[t_idx][0]}{idx}").set(v_weight)
+            plan.set(f"{prx}{f3h_iter.sec_varsT[t_idx]}{idx}", v_type)
+            plan.set(f"{prx}{f3h_iter.sec_varsW[t_idx][0]}{idx}", v_weight)
 
 
     @staticmethod
     def in_v_generic_PRE(mode: int, 
-                         node: hou.SopNode, 
+                         plan: in_flame_parms_plan, 
                          mp_idx: int, 
                          t_idx: int, 
                          v_type: int, 
@@ -17216,7 +20442,7 @@ class in_flame_utils
         
         Args:
             mode(int): 0 for iterator. 1 for FF
-            node(hou.SopNode): Current FLAM3H™ node
+            plan(in_flame_parms_plan): The parameters plan of the FLAM3H™ node we are loading the flame preset into
             mp_idx(int): Multiparameter index -> the xform count from the outer loop: (mp_idx + 1)
             t_idx(int): Current variation number idx to use with: flam3h_iterator().sec_prevarsT, flam3h_iterator().sec_prevarsW
             v_type(int): Current variation type index
@@ -17227,13 +20453,13 @@ class in_flame_utils
         """
         idx: str = str(mp_idx + 1)
         prx, prx_prm = in_flame_utils.in_util_flam3h_prx_mode(mode)
-        node.parm(f"{prx}{flam3h_iterator().sec_prevarsT[t_idx]}{idx}").set(v_type)
-        node.parm(f"{prx}{flam3h_iterator().sec_prevarsW[1:][t_idx][0]}{idx}").set(v_weight)
+        plan.set(f"{prx}{plan.f3h_iter.sec_prevarsT[t_idx]}{idx}", v_type)
+        plan.set(f"{prx}{plan.f3h_iter.sec_prevarsW[1:][t_idx][0]}{idx}", v_weight)
 
 
     @staticmethod
     def in_v_generic_POST(mode: int, 
-                          node: hou.SopNode, 
+                          plan: in_flame_parms_plan, 
                           mp_idx: int, 
                           t_idx: int, 
                           v_type: int, 
@@ -17243,7 +20469,7 @@ class in_flame_utils
         
         Args:
             mode(int): [0 for iterator. 1 for FF
-            node(hou.SopNode): Current FLAM3H™ node
+            plan(in_flame_parms_plan): The parameters plan of the FLAM3H™ node we are loading the flame preset into
             mp_idx(int): Multiparameter index -> the xform count from the outer loop: (mp_idx + 1)
             t_idx(int): Current variation number idx to use with: flam3h_iterator().sec_prevarsT, flam3h_iterator().sec_prevarsW
             v_type(int): Current variation type index
@@ -17254,12 +20480,12 @@ class in_flame_utils
         """
         idx: str = str(mp_idx + 1)
         prx, prx_prm = in_flame_utils.in_util_flam3h_prx_mode(mode)
-        node.parm(f"{prx}{flam3h_iterator().sec_postvarsT[t_idx]}{idx}").set(v_type)
-        node.parm(f"{prx}{flam3h_iterator().sec_postvarsW[t_idx][0]}{idx}").set(v_weight)
+        plan.set(f"{prx}{plan.f3h_iter.sec_postvarsT[t_idx]}{idx}", v_type)
+        plan.set(f"{prx}{plan.f3h_iter.sec_postvarsW[t_idx][0]}{idx}", v_weight)
 
 
     @staticmethod
-    def in_v_generic_PRE_FF(node: hou.SopNode, 
+    def in_v_generic_PRE_FF(plan: in_flame_parms_plan, 
                             t_idx: int, 
                             v_type: int, 
                             v_weight: float
@@ -17267,7 +20493,7 @@ class in_flame_utils
         """Set a FLAM3H™ FF PRE variation parameter data from the corresponding data found in the loaded XML Flame preset xform.</br>
         
         Args:
-            node(hou.SopNode): Current FLAM3H™ node
+            plan(in_flame_parms_plan): The parameters plan of the FLAM3H™ node we are loading the flame preset into
             t_idx(int): Current variation number idx to use with: flam3h_iterator().sec_prevarsT, flam3h_iterator().sec_prevarsW
             v_type(int): Current variation type index
             v_weight(float): Current variation weight
@@ -17275,12 +20501,12 @@ class in_flame_utils
         Returns:
             (None):
         """
-        node.parm(f"{flam3h_iterator_FF().sec_prevarsT_FF[t_idx]}").set(v_type)
-        node.parm(f"{flam3h_iterator_FF().sec_prevarsW_FF[t_idx][0]}").set(v_weight)
+        plan.set(f"{plan.f3h_iter_FF.sec_prevarsT_FF[t_idx]}", v_type)
+        plan.set(f"{plan.f3h_iter_FF.sec_prevarsW_FF[t_idx][0]}", v_weight)
 
 
     @staticmethod
-    def in_v_generic_POST_FF(node: hou.SopNode, 
+    def in_v_generic_POST_FF(plan: in_flame_parms_plan, 
                              t_idx: int, 
                              v_type: int, 
                              v_weight: float
@@ -17288,7 +20514,7 @@ class in_flame_utils
         """Set a FLAM3H™ FF POST variation parameter data from the corresponding data found in the loaded XML Flame preset xform.</br>
         
         Args:
-            node(hou.SopNode): Current FLAM3H™ node
+            plan(in_flame_parms_plan): The parameters plan of the FLAM3H™ node we are loading the flame preset into
             t_idx(int): Current variation number idx to use with: flam3h_iterator().sec_prevarsT, flam3h_iterator().sec_prevarsW
             v_type(int): Current variation type index
             v_weight(float): Current variation weight
@@ -17296,13 +20522,13 @@ class in_flame_utils
         Returns:
             (None):
         """
-        node.parm(f"{flam3h_iterator_FF().sec_postvarsT_FF[t_idx]}").set(v_type)
-        node.parm(f"{flam3h_iterator_FF().sec_postvarsW_FF[t_idx][0]}").set(v_weight)
+        plan.set(f"{plan.f3h_iter_FF.sec_postvarsT_FF[t_idx]}", v_type)
+        plan.set(f"{plan.f3h_iter_FF.sec_postvarsW_FF[t_idx][0]}", v_weight)
 
 
     @staticmethod
     def in_v_pre_blur(mode: int, 
-                      node: hou.SopNode, 
+                      plan: in_flame_parms_plan, 
                       mp_idx: int, 
                       pb_weights: tuple
                       ) -> None:
@@ -17310,7 +20536,7 @@ class in_flame_utils
         
         Args:
             mode(int): 0 for iterator. 1 for FF
-            node(hou.SopNode): Current FLAM3H™ node
+            plan(in_flame_parms_plan): The parameters plan of the FLAM3H™ node we are loading the flame preset into
             mp_idx(int): Multiparameter index -> the xform count from the outer loop: (mp_idx + 1)
             pb_weights(tuple): all iterators pre_blur weight values
         
@@ -17323,7 +20549,7 @@ class in_flame_utils
         
         else:
             if pb_weights[mp_idx]:
-                node.parm(f"{prx}{flam3h_iterator_prm_names().prevar_weight_blur}_{mp_idx + 1}").set(pb_weights[mp_idx])
+                plan.set(f"{prx}{plan.f3h_iter.prevar_weight_blur}_{mp_idx + 1}", pb_weights[mp_idx])
 
 
     @staticmethod
@@ -17347,7 +20573,7 @@ class in_flame_utils
             if mode:
                 iter_type = 'FF'
             
-            print(f"Warning: iterator.{iter_type}\n{node.name()}: NEGATIVE VALUE not allowed in PRE or POST\n-> Variation: {func(in_flame_utils.in_get_dict_key_from_value(VARS_FLAM3_DICT_IDX, v_type))}: {w}\n-> Using its absolute value instead: {abs(w)}\n")
+            print(f"Warning: iterator.{iter_type}\n{node.name()}: NEGATIVE VALUE not allowed in PRE or POST\n-> Variation: {func(VARS_FLAM3_NAME_FROM_IDX[v_type])}: {w}\n-> Using its absolute value instead: {abs(w)}\n")
             
             return abs(w)
         
@@ -17403,38 +20629,143 @@ class in_flame_utils
 
 
     @staticmethod
-    def in_util_join_vars_grp(groups: TA_STR_ListUnflattened) -> str:
-        """When formatting a message to print out we use groups as if they were each line of the meesage and join them.</br>
-        This function will avoid to have an extra empty line at the very end.</br>
+    def in_util_join_vars_grp(groups: TA_STR_ListUnflattened) -> str:
+        """When formatting a message to print out we use groups as if they were each line of the meesage and join them.</br>
+        This function will avoid to have an extra empty line at the very end.</br>
+
+        Args:
+            groups(TA_STR_ListUnflattened): The groups to join
+
+        Returns:
+            (str): The final message without the extra empty line at the end.
+        """     
+        _join: Callable[[Iterable[str]], str] = ', '.join
+        _len: Callable[[list[Any]], int] = len
+        vars: list[str] = [_join(grp) + (",\n" if i < _len(groups) - 1 else ".") for i, grp in enumerate(groups)]
+        
+        return ''.join(vars)
+
+
+    @staticmethod
+    def in_util_vars_flatten_unique_sorted(VARS_list: TA_STR_ListUnflattened, func: Callable, capitalize: bool = False) -> list[str]:
+        """Return a flattened list of unique and sorted items without duplicates.
+
+        Args:
+            VARS_list(TA_STR_ListUnflattened): The data to flatten, remove duplicates and sort.
+            func(Callable): Function to turn variation names from VAR to PRE or POST or none based on the function provided.
+            capitalize(bool): Default to: False</br>capitalize the variation's names if any are found.
+
+        Returns:
+            (list[str]): Return a flattened list of unique and sorted items without duplicates.
+        """
+        
+        _str_capitalize: Callable[[str], str] = str.capitalize
+        return [_str_capitalize(func(x)) if capitalize else str(func(x)) for x in sorted(set(item for sublist in VARS_list for item in sublist)) if x]
+    
+    
+    @staticmethod
+    def in_reset_parms_inventory(node: hou.SopNode, parms: tuple[hou.Parm, ...]) -> tuple[tuple[hou.Parm, ...], tuple[hou.Parm, ...], tuple[hou.Parm, ...]]:
+        """Get this FLAM3H™ node parameters inventory used to reset its parameters when loading a Flame preset.</br>
+        The parameters are split into: private parameters, multi parameter instances and all the others.</br>
+        The inventory is stored into the node cachedUserData and it is rebuilt only when the node parameters count or the FLAM3H™ HDA definition changed since it was last built.</br>
+
+        Args:
+            node(hou.SopNode): This FLAM3H™ node
+            parms(tuple[hou.Parm, ...]): This FLAM3H™ node current parameters: node.parms()
+
+        Returns:
+            (tuple[tuple[hou.Parm, ...], tuple[hou.Parm, ...], tuple[hou.Parm, ...]]): The private parameters, the multi parameter instances and all the other parameters.
+        """
+        definition: hou.HDADefinition | None = node.type().definition()
+        key: tuple[str | None, float | None, int] = (definition.libraryFilePath(), definition.modificationTime(), len(parms)) if definition is not None else (None, None, len(parms))
+        cached: tuple[tuple[str | None, float | None, int], tuple, tuple, tuple] | None = node.cachedUserData(f3h_cachedUserData.in_reset_parms_inventory)
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2], cached[3]
+        
+        pvt: list[hou.Parm] = []
+        multi: list[hou.Parm] = []
+        other: list[hou.Parm] = []
+        for p in parms:
+            if p.name() in f3h_pvt.PVT_ALL: pvt.append(p)
+            elif p.isMultiParmInstance(): multi.append(p)
+            else: other.append(p)
+            
+        inventory: tuple[tuple[hou.Parm, ...], tuple[hou.Parm, ...], tuple[hou.Parm, ...]] = (tuple(pvt), tuple(multi), tuple(other))
+        node.setCachedUserData(f3h_cachedUserData.in_reset_parms_inventory, (key, *inventory))
+        return inventory
+    
+    
+    @staticmethod
+    def in_reset_parms_dirty_event(node: hou.SopNode, event_type: hou.EnumValue, **kwargs) -> None:
+        """Node event callback registered by: in_flame_utils.in_reset_parms_dirty_track(...)</br>
+        Add the name of every parameter tuple that changed value, animation or lock state to this FLAM3H™ node changed parameters record,</br>
+        so the next Flame preset load only need to reset those. This include the changes coming from an undo or a redo.</br>
+        A parameter tuple that become animated ( keyframes or expressions ) is recorded even if its value did not change.</br></br>
+        
+        When Houdini do not tell which parameter tuple changed or a multi parameter instances count changed (iterators added, removed or moved around),</br>
+        the record is dropped and the next Flame preset load will walk all the node parameters instead.</br>
 
         Args:
-            groups(TA_STR_ListUnflattened): The groups to join
+            node(hou.SopNode): This FLAM3H™ node
+            event_type(hou.EnumValue): The node event type.
+            **kwargs: The node event data. The changed parameter tuple is in: kwargs["parm_tuple"]
 
         Returns:
-            (str): The final message without the extra empty line at the end.
-        """     
-        _join: Callable[[Iterable[str]], str] = ', '.join
-        _len: Callable[[list[Any]], int] = len
-        vars: list[str] = [_join(grp) + (",\n" if i < _len(groups) - 1 else ".") for i, grp in enumerate(groups)]
+            (None):
+        """
+        dirty: set[str] | None = node.cachedUserData(f3h_cachedUserData.in_reset_parms_dirty)
+        if dirty is None:
+            return
         
-        return ''.join(vars)
+        parm_tuple: hou.ParmTuple | None = kwargs.get("parm_tuple")
+        if parm_tuple is None or parm_tuple.parmTemplate().type() == hou.parmTemplateType.Folder:
+            flam3h_iterator_utils.destroy_cachedUserData(node, f3h_cachedUserData.in_reset_parms_dirty)
+        else:
+            dirty.add(parm_tuple.name())
+            
+            
+    @staticmethod
+    def in_reset_parms_dirty_track(node: hou.SopNode, dirty: set[str] | None = None) -> None:
+        """Start a new, empty, changed parameters record for this FLAM3H™ node right after its parameters have been reset,</br>
+        and register the node event callback that keep it up to date if it is not already: in_flame_utils.in_reset_parms_dirty_event(...)</br></br>
+        
+        Both the record and the callback only live in the current Houdini session,</br>
+        so the first Flame preset load after a hip file load always walk all the node parameters.</br>
 
+        Args:
+            node(hou.SopNode): This FLAM3H™ node
+            dirty(set[str] | None): Default to: None</br>The changed parameters record to start from instead of an empty one,</br>as taken out by: in_flame_utils.in_reset_parms_dirty_untrack(...)
 
+        Returns:
+            (None):
+        """
+        callback: Callable[..., None] = in_flame_utils.in_reset_parms_dirty_event
+        if not any(cb == callback for _, cb in node.eventCallbacks()):
+            _nodeEventType = hou.nodeEventType # pyright: ignore[reportAttributeAccessIssue]  # Houdini HOM API
+            node.addEventCallback((_nodeEventType.ParmTupleChanged, _nodeEventType.ParmTupleAnimated, _nodeEventType.ParmTupleLockChanged), callback) # pyright: ignore[reportArgumentType]
+        node.setCachedUserData(f3h_cachedUserData.in_reset_parms_dirty, dirty if dirty is not None else set())
+    
+    
     @staticmethod
-    def in_util_vars_flatten_unique_sorted(VARS_list: TA_STR_ListUnflattened, func: Callable, capitalize: bool = False) -> list[str]:
-        """Return a flattened list of unique and sorted items without duplicates.
+    def in_reset_parms_dirty_untrack(node: hou.SopNode) -> set[str] | None:
+        """Remove the node event callback registered by: in_flame_utils.in_reset_parms_dirty_track(...) and take this FLAM3H™ node changed parameters record out,</br>
+        so the parameters about to be set all at once (a reset or a Flame preset load) do not fire the callback one by one.</br>
+        Call: in_flame_utils.in_reset_parms_dirty_track(...) once done to track the changes again.</br>
 
         Args:
-            VARS_list(TA_STR_ListUnflattened): The data to flatten, remove duplicates and sort.
-            func(Callable): Function to turn variation names from VAR to PRE or POST or none based on the function provided.
-            capitalize(bool): Default to: False</br>capitalize the variation's names if any are found.
+            node(hou.SopNode): This FLAM3H™ node
 
         Returns:
-            (list[str]): Return a flattened list of unique and sorted items without duplicates.
+            (set[str] | None): The changed parameters record or None if they were not being tracked.
         """
+        callback: Callable[..., None] = in_flame_utils.in_reset_parms_dirty_event
+        for event_types, cb in node.eventCallbacks():
+            if cb == callback:
+                node.removeEventCallback(event_types, cb)
         
-        _str_capitalize: Callable[[str], str] = str.capitalize
-        return [_str_capitalize(func(x)) if capitalize else str(func(x)) for x in sorted(set(item for sublist in VARS_list for item in sublist)) if x]
+        dirty: set[str] | None = node.cachedUserData(f3h_cachedUserData.in_reset_parms_dirty)
+        if dirty is not None: flam3h_iterator_utils.destroy_cachedUserData(node, f3h_cachedUserData.in_reset_parms_dirty)
+        return dirty
     
     
     @staticmethod
@@ -18407,6 +21738,7 @@ class in_flame_utils
                                 node: hou.SopNode, 
                                 apo_data: in_flame_iter_data, 
                                 preset_id: int, 
+                                plan: in_flame_parms_plan
                                 ) -> None:
         """Set the FLAM3H™ iterators/FF parameters based on collected XML data from the flame file loaded.</br>
         
@@ -18419,6 +21751,7 @@ class in_flame_utils
             node(hou.SopNode): FLAM3H™ node
             apo_data(in_flame_iter_data): Flames data from the flame file loaded in: class in_flame_iter_data(in_flame)
             preset_id(int): the flame preset we are loading out of all the presets included in the flame file
+            plan(in_flame_parms_plan): The parameters plan collecting all the parameter values to be set at once on the FLAM3H™ node
             exclude_keys(tuple): exclude those keys inside the current xform/iterator from the search to speed up a little
             
         Returns:
@@ -18431,8 +21764,7 @@ class in_flame_utils
         _V_F3H_DICT_IDX_keys: KeysView = VARS_FLAM3_DICT_IDX.keys()
         
         # I could hard-code the name into the function: def in_vars_keys_remove_pgb(...), but this way I keep this dict global for all purposes.
-        pgb_name: str | list[str] | None = self.in_util_make_PRE(self.in_get_dict_key_from_value(VARS_FLAM3_DICT_IDX, 33))
-        assert isinstance(pgb_name, str)
+        pgb_name: str = VARS_FLAM3_NAME_PRE[VARS_FLAM3_NAME_FROM_IDX[33]]
         
         xforms, _MAX_VARS_MODE = self.in_get_xforms_data_and_flam3h_vars_limit(mode, apo_data)
         
@@ -18443,20 +21775,20 @@ class in_flame_utils
             vars_keys_flatten: list[str] = [item for sublist in vars_keys for item in sublist]
             if vars_keys_flatten: __EXCLUDE__ += tuple(vars_keys_flatten)
         assert vars_keys is not None # This can be asserted because this definition is run after this Flame preset has been checked for its validity.
-        vars_keys_pre_pgb: TA_STR_ListUnflattened | None = self.in_get_xforms_var_keys(xforms, self.in_util_make_PRE(_V_F3H_DICT_IDX_keys), __EXCLUDE__)
+        vars_keys_pre_pgb: TA_STR_ListUnflattened | None = self.in_get_xforms_var_keys(xforms, VARS_FLAM3_KEYS_PRE, __EXCLUDE__)
         vars_keys_pre: TA_STR_ListUnflattened | None = self.in_vars_keys_remove_pgb(vars_keys_pre_pgb, pgb_name)
         if vars_keys_pre is not None:
             vars_keys_pre_flatten: list[str] = [item for sublist in vars_keys_pre for item in sublist]
             if vars_keys_pre_flatten: __EXCLUDE__ += tuple(vars_keys_pre_flatten)
         assert vars_keys_pre is not None # This can be asserted because this definition is run after this Flame preset has been checked for its validity.
-        vars_keys_post: TA_STR_ListUnflattened | None = self.in_get_xforms_var_keys(xforms, self.in_util_make_POST(_V_F3H_DICT_IDX_keys), __EXCLUDE__)
+        vars_keys_post: TA_STR_ListUnflattened | None = self.in_get_xforms_var_keys(xforms, VARS_FLAM3_KEYS_POST, __EXCLUDE__)
         assert vars_keys_post is not None # This can be asserted because this definition is run after this Flame preset has been checked for its validity.
         
         app: str = apo_data.sw_version[preset_id]
         prx, prx_prm = self.in_util_flam3h_prx_mode(mode)
-        var_prm: tuple = flam3h_varsPRM().varsPRM
-        apo_prm: tuple = flam3h_varsPRM_APO().varsPRM
-        n: flam3h_iterator_prm_names = flam3h_iterator_prm_names()
+        var_prm: tuple = VARS_FLAM3H_PRM_FROM_IDX
+        apo_prm: tuple = VARS_APO_PRM_FROM_IDX
+        n: flam3h_iterator_prm_names = plan.f3h_iter
         
         # Set variations ( iterator and FF )
         for mp_idx, xform in enumerate(xforms):
@@ -18477,7 +21809,7 @@ class in_flame_utils
                     if apo_prm[v_type][-1]:
                         self.in_v_parametric(app, 
                                              mode, 
-                                             node, 
+                                             plan, 
                                              mp_idx, 
                                              t_idx, 
                                              xform, 
@@ -18487,22 +21819,22 @@ class in_flame_utils
                                              apo_prm[v_type]
                                              )
                     else:
-                        self.in_v_generic(mode, node, mp_idx, t_idx, v_type, v_weight)
+                        self.in_v_generic(mode, plan, mp_idx, t_idx, v_type, v_weight)
                 else:
                     # if this variation is not found, set it to Linear and its weight to ZERO
                     # Note that if the missing variation will is int the first slot inside any of the available types (PRE, VAR or POST)
                     # it will be set to its respective default value becasue the multi param parameters are reverted baco to their defaults on Flame load.
-                    self.in_v_generic(mode, node, mp_idx, t_idx, 0, 0)
+                    self.in_v_generic(mode, plan, mp_idx, t_idx, 0, 0)
                     
             # Set pre blur if found
             assert apo_data.pre_blur is not None
-            self.in_v_pre_blur(mode, node, mp_idx, apo_data.pre_blur)
+            self.in_v_pre_blur(mode, plan, mp_idx, apo_data.pre_blur)
                     
             if mode:
                 assert apo_data.finalxform_name is not None
                 # Set finalxform name first if any
                 if apo_data.finalxform_name[0]:
-                    node.parm(f"{prx}{n.main_note}").set(apo_data.finalxform_name[0])
+                    plan.set(f"{prx}{n.main_note}", apo_data.finalxform_name[0])
                     
                 # Collect FF PRE vars in excess  
                 if len(vars_keys_pre[mp_idx]) > xml_keys.f3h.DEFAULT_MAX_FF_VARS_PRE:
@@ -18518,7 +21850,7 @@ class in_flame_utils
                             v_weight: float = self.in_util_check_negative_weight(node, w, v_type, mode, mp_idx, self.in_util_make_PRE)
                             if apo_prm[v_type][-1]:
                                 self.in_v_parametric_PRE_FF(app, 
-                                                            node, 
+                                                            plan, 
                                                             t_idx, 
                                                             xform, 
                                                             v_type, 
@@ -18526,7 +21858,7 @@ class in_flame_utils
                                                             var_prm[v_type], 
                                                             apo_prm[v_type]
                                                             )
-                            else: self.in_v_generic_PRE_FF(node, t_idx, v_type, v_weight)
+                            else: self.in_v_generic_PRE_FF(plan, t_idx, v_type, v_weight)
                          
                 # Collect FF POST vars in excess       
                 if len(vars_keys_post[mp_idx]) > xml_keys.f3h.DEFAULT_MAX_FF_VARS_POST:
@@ -18541,7 +21873,7 @@ class in_flame_utils
                             v_weight: float = self.in_util_check_negative_weight(node, w, v_type, mode, mp_idx, self.in_util_make_POST)
                             if apo_prm[v_type][-1]:
                                 self.in_v_parametric_POST_FF(app, 
-                                                             node, 
+                                                             plan, 
                                                              t_idx, 
                                                              xform, 
                                                              v_type, 
@@ -18549,7 +21881,7 @@ class in_flame_utils
                                                              var_prm[v_type], 
                                                              apo_prm[v_type]
                                                              )
-                            else: self.in_v_generic_POST_FF(node, t_idx, v_type, v_weight)
+                            else: self.in_v_generic_POST_FF(plan, t_idx, v_type, v_weight)
                 
                 # Print all skipped FF vars if any
                 if FF_vars_skipped:
@@ -18575,7 +21907,7 @@ class in_flame_utils
                             if apo_prm[v_type][-1]:
                                 self.in_v_parametric_PRE(app, 
                                                          mode, 
-                                                         node, 
+                                                         plan, 
                                                          mp_idx, 
                                                          t_idx, 
                                                          xform, 
@@ -18584,7 +21916,7 @@ class in_flame_utils
                                                          var_prm[v_type], 
                                                          apo_prm[v_type]
                                                          )
-                            else: self.in_v_generic_PRE(mode, node, mp_idx, t_idx, v_type, v_weight)
+                            else: self.in_v_generic_PRE(mode, plan, mp_idx, t_idx, v_type, v_weight)
                 
                 # Collect iterator POST vars in excess
                 if len(vars_keys_post[mp_idx]) > xml_keys.f3h.DEFAULT_MAX_ITER_VARS_POST:
@@ -18600,7 +21932,7 @@ class in_flame_utils
                             if apo_prm[v_type][-1]:
                                 self.in_v_parametric_POST(app, 
                                                           mode, 
-                                                          node, 
+                                                          plan, 
                                                           mp_idx, 
                                                           t_idx, 
                                                           xform, 
@@ -18609,7 +21941,7 @@ class in_flame_utils
                                                           var_prm[v_type], 
                                                           apo_prm[v_type]
                                                           )
-                            else: self.in_v_generic_POST(mode, node, mp_idx, t_idx, v_type, v_weight)
+                            else: self.in_v_generic_POST(mode, plan, mp_idx, t_idx, v_type, v_weight)
                        
                 # Print all skipped iterators vars if any
                 if iterator_vars_skipped:
@@ -18617,7 +21949,7 @@ class in_flame_utils
                     print(build)
                                 
                 # Activate iterator
-                node.parm(f"{n.main_vactive}_{mp_idx + 1}").set(1)
+                plan.set(f"{n.main_vactive}_{mp_idx + 1}", 1)
                 # Set the rest of the iterator(FLAME or FF) parameters
                 apo_data_set: dict[str, tuple | None] = {n.main_note: apo_data.xf_name, 
                                                          n.main_weight: apo_data.weight,
@@ -18626,10 +21958,10 @@ class in_flame_utils
                                                          n.shader_speed: apo_data.symmetry,
                                                          n.shader_alpha: apo_data.opacity
                                                          }
-                for key, value in apo_data_set.items(): self.in_set_data(mode, node, prx, value, key, mp_idx)
+                for key, value in apo_data_set.items(): self.in_set_data(mode, plan, prx, value, key, mp_idx)
             
             # Set Affine ( PRE, POST and F3H_PRE, F3H_POST) for this iterator or FF
-            self.in_set_affine(mode, node, prx, apo_data, n, mp_idx)
+            self.in_set_affine(mode, plan, prx, apo_data, n, mp_idx)
 
 
     def in_load_collect_vars(self, apo_data: in_flame_iter_data, data_checks: in_flame_checks, pgb_name: str = 'pre_gaussian_blur') -> list[str]:
@@ -18645,52 +21977,7 @@ class in_flame_utils
         Returns:
             (list[str]): A list containing the unique used variations sorted alphatically.
         """  
-        
-        # Cache for resuse
-        _V_F3H_DICT_IDX_keys: KeysView = VARS_FLAM3_DICT_IDX.keys()
-        
-        # ITERATOR COLLECT
-        __EXCLUDE__: tuple[str, ...] = copy(XML_XF_KEY_EXCLUDE)
-        vars_keys: TA_STR_ListUnflattened | None = self.in_get_xforms_var_keys(apo_data.xforms, _V_F3H_DICT_IDX_keys, __EXCLUDE__)
-        if vars_keys is not None:
-            vars_keys_flatten: list[str] = [item for sublist in vars_keys for item in sublist]
-            if vars_keys_flatten: __EXCLUDE__ += tuple(vars_keys_flatten)
-        vars_keys_PRE_pgb: TA_STR_ListUnflattened | None = self.in_get_xforms_var_keys(apo_data.xforms, self.in_util_make_PRE(_V_F3H_DICT_IDX_keys), __EXCLUDE__)
-        vars_keys_PRE: TA_STR_ListUnflattened | None = self.in_vars_keys_remove_pgb(vars_keys_PRE_pgb, pgb_name)
-        if vars_keys_PRE is not None: 
-            vars_keys_PRE_flatten: list[str] = [item for sublist in vars_keys_PRE for item in sublist]
-            if vars_keys_PRE_flatten: __EXCLUDE__ += tuple(vars_keys_PRE_flatten)
-        vars_keys_POST: TA_STR_ListUnflattened | None = self.in_get_xforms_var_keys(apo_data.xforms, self.in_util_make_POST(_V_F3H_DICT_IDX_keys), __EXCLUDE__)
-        
-        # FF COLLECT
-        vars_keys_FF = vars_keys_PRE_FF = vars_keys_POST_FF = []
-        if data_checks.ff_bool:
-            __EXCLUDE__ = copy(XML_XF_KEY_EXCLUDE)
-            vars_keys_FF: TA_STR_ListUnflattened | None = self.in_get_xforms_var_keys(apo_data.finalxform, _V_F3H_DICT_IDX_keys, __EXCLUDE__)
-            if vars_keys_FF is not None:
-                vars_keys_FF_flatten: list[str] = [item for sublist in vars_keys_FF for item in sublist]
-                if vars_keys_FF_flatten: __EXCLUDE__ += tuple(vars_keys_FF_flatten)
-            vars_keys_PRE_FF: TA_STR_ListUnflattened | None = self.in_get_xforms_var_keys(apo_data.finalxform, self.in_util_make_PRE(_V_F3H_DICT_IDX_keys), __EXCLUDE__)
-            if vars_keys_PRE_FF is not None:
-                vars_keys_PRE_FF_flatten: list[str] = [item for sublist in vars_keys_PRE_FF for item in sublist]
-                if vars_keys_PRE_FF_flatten: __EXCLUDE__ += tuple(vars_keys_PRE_FF_flatten)
-            vars_keys_POST_FF: TA_STR_ListUnflattened | None = self.in_get_xforms_var_keys(apo_data.finalxform, self.in_util_make_POST(_V_F3H_DICT_IDX_keys), __EXCLUDE__)
-        
-        # JOIN PRE, VAR and POST
-        # vars_all: list[list[str]] = vars_keys_PRE + vars_keys + vars_keys_POST + vars_keys_PRE_FF + vars_keys_FF + vars_keys_POST_FF 
-        vars_all: list[list[str]] = (
-            (vars_keys_PRE or [])
-            + (vars_keys or [])
-            + (vars_keys_POST or [])
-            + (vars_keys_PRE_FF or [])
-            + (vars_keys_FF or [])
-            + (vars_keys_POST_FF or [])
-        )
-        if data_checks.pb_bool: vars_all += [["pre_blur"]]
-        # Unique and sorted
-        vars_used: list[str] = self.in_util_vars_flatten_unique_sorted(vars_all, self.in_util_make_NULL, True)
-        
-        return vars_used
+        return self.in_load_collect_vars_from_xforms(apo_data.xforms, apo_data.finalxform if data_checks.ff_bool else None, data_checks.pb_bool, pgb_name)
     
     
     def in_load_collect_vars_missing(self, apo_data: in_flame_iter_data, data_checks: in_flame_checks, vars_used: list[str], pgb_name: str = 'pre_gaussian_blur') -> list[str]:
@@ -18707,51 +21994,10 @@ class in_flame_utils
         Returns:
             (list[str]): A list containing the unique missing variations sorted alphatically.
         """  
-        # Build ITERATOR MISSING
-        __EXCLUDE__ = copy(XML_XF_KEY_EXCLUDE)
-        vars_keys_from_fractorium: TA_STR_ListUnflattened | None = self.in_get_xforms_var_keys(apo_data.xforms, VARS_FRACTORIUM_DICT, __EXCLUDE__)
-        if vars_keys_from_fractorium is not None:
-            vars_keys_from_fractorium_flatten: list[str] = [item for sublist in vars_keys_from_fractorium for item in sublist]
-            if vars_keys_from_fractorium_flatten: __EXCLUDE__ += tuple(vars_keys_from_fractorium_flatten)
-        vars_keys_from_fractorium_pre_pgb: TA_STR_ListUnflattened | None = self.in_get_xforms_var_keys_PP(apo_data.xforms, VARS_FRACTORIUM_DICT_PRE, xml_keys.DEFAULT_VAR_PRE_PRX, __EXCLUDE__)
-        vars_keys_from_fractorium_pre: TA_STR_ListUnflattened | None = self.in_vars_keys_remove_pgb(vars_keys_from_fractorium_pre_pgb, pgb_name)
-        if vars_keys_from_fractorium_pre is not None:
-            vars_keys_from_fractorium_pre_flatten: list[str] = [item for sublist in vars_keys_from_fractorium_pre for item in sublist]
-            if vars_keys_from_fractorium_pre_flatten: __EXCLUDE__ += tuple(vars_keys_from_fractorium_pre_flatten)
-        vars_keys_from_fractorium_post: TA_STR_ListUnflattened | None = self.in_get_xforms_var_keys_PP(apo_data.xforms, VARS_FRACTORIUM_DICT_POST, xml_keys.DEFAULT_VAR_POST_PRX, __EXCLUDE__)
-        
-        # BUILD FF MISSING
-        vars_keys_from_fractorium_FF = vars_keys_from_fractorium_pre_FF = vars_keys_from_fractorium_post_FF = [] # TA_STR_ListUnflattened
-        if data_checks.ff_bool:
-            __EXCLUDE__ = copy(XML_XF_KEY_EXCLUDE)
-            vars_keys_from_fractorium_FF: TA_STR_ListUnflattened | None = self.in_get_xforms_var_keys(apo_data.finalxform, VARS_FRACTORIUM_DICT, __EXCLUDE__)
-            if vars_keys_from_fractorium_FF is not None:
-                vars_keys_from_fractorium_FF_flatten: list[str] = [item for sublist in vars_keys_from_fractorium_FF for item in sublist]
-                if vars_keys_from_fractorium_FF_flatten: __EXCLUDE__ += tuple(vars_keys_from_fractorium_FF_flatten)
-            vars_keys_from_fractorium_pre_FF: TA_STR_ListUnflattened | None = self.in_get_xforms_var_keys_PP(apo_data.finalxform, VARS_FRACTORIUM_DICT_PRE, xml_keys.DEFAULT_VAR_PRE_PRX, __EXCLUDE__)
-            if vars_keys_from_fractorium_pre_FF is not None:
-                vars_keys_from_fractorium_pre_FF_flatten: list[str] = [item for sublist in vars_keys_from_fractorium_pre_FF for item in sublist]
-                if vars_keys_from_fractorium_pre_FF_flatten: __EXCLUDE__ += tuple(vars_keys_from_fractorium_pre_FF_flatten)
-            vars_keys_from_fractorium_post_FF: TA_STR_ListUnflattened | None = self.in_get_xforms_var_keys_PP(apo_data.finalxform, VARS_FRACTORIUM_DICT_POST, xml_keys.DEFAULT_VAR_POST_PRX, __EXCLUDE__)
-        
-        # JOIN ITERATORS and FF PRE, VARS and POST
-        # vars_keys_from_fractorium_all: list[list[str]] = vars_keys_from_fractorium + vars_keys_from_fractorium_pre + vars_keys_from_fractorium_post + vars_keys_from_fractorium_pre_FF + vars_keys_from_fractorium_FF + vars_keys_from_fractorium_post_FF
-        vars_keys_from_fractorium_all: list[list[str]] = (
-            (vars_keys_from_fractorium or [])
-            + (vars_keys_from_fractorium_pre or [])
-            + (vars_keys_from_fractorium_post or [])
-            + (vars_keys_from_fractorium_pre_FF or [])
-            + (vars_keys_from_fractorium_FF or [])
-            + (vars_keys_from_fractorium_post_FF or [])
-        )
-        # Unique and sorted
-        result_sorted_fractorium: list[str] = self.in_util_vars_flatten_unique_sorted(vars_keys_from_fractorium_all, self.in_util_make_NULL, True)
-        # Build MISSING: Compare, keep and build
-        vars_missing: list[str] = [x for x in result_sorted_fractorium if x not in vars_used]
-        
-        return vars_missing
+        return self.in_load_collect_vars_missing_from_xforms(apo_data.xforms, apo_data.finalxform if data_checks.ff_bool else None, vars_used, pgb_name)
     
     
+
     def in_load_vars_used_msg(self, vars_used: list[str], grp_num: int = 5) -> str:
         """Build the IN infos stats message for the used variations in the Flame preset we just loaded.</br>
 
@@ -18843,8 +22089,7 @@ class in_flame_utils
         if XML_last_update: XML_updated = '*'
         
         # I could hard-code the name into the function: def in_vars_keys_remove_pgb(...), but this way I keep this dict global for all purposes.
-        pgb_name: str | list[str] | None = self.in_util_make_PRE(self.in_get_dict_key_from_value(VARS_FLAM3_DICT_IDX, 33))
-        assert isinstance(pgb_name, str)
+        pgb_name: str = VARS_FLAM3_NAME_PRE[VARS_FLAM3_NAME_FROM_IDX[33]]
         
         # checks msgs
         opacity_bool_msg = post_bool_msg = xaos_bool_msg = ff_post_bool_msg = "NO"
@@ -18970,9 +22215,10 @@ class in_flame_utils
 
             _is_valid_file: bool = node.parm(f3h_tabs.IN.PVT_PRM_ISVALID_FILE).eval()
             _is_valid_preset: bool = node.parm(f3h_tabs.IN.PVT_PRM_ISVALID_PRESET).eval()
-            _xml_tree_obj: _xml_tree = _xml_tree(xml_file_path)
+            # The menu labels only need the presets names, use the cached streaming index instead of building the full: _xml_tree(...)
+            _xml_index_obj: _xml_index = _xml_index.xmlfile_index(xml_file_path)
             
-            if _xml_tree_obj.isvalidtree and _is_valid_file and _is_valid_preset:
+            if _xml_index_obj.isvalidtree and _is_valid_file and _is_valid_preset:
                 
                 in_idx: int = int(node.parm(f3h_tabs.IN.PRM_PRESETS).eval())
                 is_clipboard: int = node.parm(f3h_tabs.IN.PVT_PRM_CLIPBOARD_TOGGLE).eval()
@@ -18981,7 +22227,7 @@ class in_flame_utils
                 _menu_func: Callable[[hou.SopNode, TA_Menu, int, str | list[Never], int, int], None] = (self.menu_in_presets_loop_enum if enum else self.menu_in_presets_loop)
                 
                 menu: TA_Menu = []
-                preset_names: tuple[str | list[Never], ...] = _xml_tree_obj.get_name()
+                preset_names: tuple[str | list[Never], ...] = _xml_index_obj.name
                 for i, item in enumerate(preset_names):
                     _menu_func(node, menu, i, item, in_idx, is_clipboard)
                         
@@ -19075,15 +22321,16 @@ class in_flame_utils
 
             _is_valid_file: bool = node.parm(f3h_tabs.IN.PVT_PRM_ISVALID_FILE).eval()
             _is_valid_preset: bool = node.parm(f3h_tabs.IN.PVT_PRM_ISVALID_PRESET).eval()
-            _xml_tree_obj: _xml_tree = _xml_tree(xml_file_path)
+            # The menu labels only need the presets names, use the cached streaming index instead of building the full: _xml_tree(...)
+            _xml_index_obj: _xml_index = _xml_index.xmlfile_index(xml_file_path)
             
-            if _xml_tree_obj.isvalidtree and _is_valid_file and not _is_valid_preset:
+            if _xml_index_obj.isvalidtree and _is_valid_file and not _is_valid_preset:
                     
                 enum: bool = node.parm(f3h_tabs.PREFS.PRM_ENUMERATE_MENU).eval()
                 _menu_func: Callable[[hou.SopNode, TA_Menu, int, str | list[Never]], None] = (self.menu_in_presets_empty_loop_enum if enum else self.menu_in_presets_empty_loop)
                 
                 menu: TA_Menu = []
-                preset_names: tuple[str | list[Never], ...] = _xml_tree_obj.get_name()
+                preset_names: tuple[str | list[Never], ...] = _xml_index_obj.name
                 for i, item in enumerate(preset_names):
                     _menu_func(node, menu, i, item)
                     
@@ -19220,8 +22467,8 @@ class in_flame_utils
         """
         xml: str = self.node.parm(f3h_tabs.IN.PRM_PATH).eval()
         # Here we could take a shortcut and use: if node.parm(f3h_tabs.IN.PVT_ISVALID_FILE).eval(): instead,
-        # but for now we keep it safe and use the class: _xml_tree(..) instead.
-        if _xml_tree(xml).isvalidtree:
+        # but for now we keep it safe and use: _xml_tree.xmlfile_isvalid(..) instead.
+        if _xml_tree.xmlfile_isvalid(xml):
             flam3h_general_utils(self.kwargs).flam3h_toggle(prm)
             self.in_to_flam3h()
         else:
@@ -19245,9 +22492,9 @@ class in_flame_utils
         node: hou.SopNode = self.node
         xml, clipboard, preset_id, flame_name_clipboard, load_from_clipboard, chaos = self.in_to_flam3h_init_data(node)
         
-        # Here we are forced to use the class: _xml_tree(...) becasue a Flame can come from the clipboard
+        # Here we are forced to use: _xml_tree.xmlfile_isvalid(...) becasue a Flame can come from the clipboard
         # and we need to carefully validate it before proceding.
-        if xml is not None and _xml_tree(xml).isvalidtree:
+        if _xml_tree.xmlfile_isvalid(xml):
             
             apo_data: in_flame_iter_data = in_flame_iter_data(node, xml, preset_id)
             if apo_data.f3h_coefs is not None or apo_data.f3h_post is not None or apo_data.finalxform_f3h_coefs is not None or apo_data.finalxform_f3h_post:
@@ -19317,6 +22564,11 @@ class in_flame_utils
     def in_to_flam3h_reset_iterators_parms(self, node: hou.SopNode, in_flame_iter_count: int) -> None:
         """Prior to this, I was setting the iterator's count to zero and then back to the requested count to reset all their values.</br>
         It was not the fastest solution and this is actually making it more performant overall.</br>
+        
+        The iterators in excess are removed first so they do not need to be reset at all.</br>
+        If this FLAM3H™ node parameters changed since its last reset are being tracked, only those are reset,</br>
+        otherwise only the parameters that are animated, locked or not at their default values are touched.</br>
+        The node event callback is removed for the duration of the reset and the changes from now on are tracked: in_flame_utils.in_reset_parms_dirty_track(...)</br>
 
         Args:
             (self):
@@ -19326,31 +22578,99 @@ class in_flame_utils
         Returns:
             (None):
         """
+        # The parameters changed since the last reset, if tracked. Take the record and its node event callback out first so the reset itself is not tracked.
+        dirty: set[str] | None = self.in_reset_parms_dirty_untrack(node)
+        
         # iterators count
         flam3h_iter_count_prm = node.parm(f3h_tabs.PRM_ITERATORS_COUNT)
+        if flam3h_iter_count_prm.isLocked(): flam3h_iter_count_prm.lock(False)
+        if flam3h_iter_count_prm.keyframes(): flam3h_iter_count_prm.deleteAllKeyframes()
         flam3h_iter_count: int = flam3h_iter_count_prm.eval()
         
-        for p in node.parms():
-            if p.name() in f3h_pvt.PVT_ALL:
-                p.lock(False)
-                p.deleteAllKeyframes()
-                p.lock(True)
-                
-            else:
-                p.lock(False)
-                p.deleteAllKeyframes()
-                    
-            if p.isMultiParmInstance():
-                p.revertToDefaults()
+        # Remove the iterators in excess before the reset
+        if in_flame_iter_count < flam3h_iter_count:
+            flam3h_iter_count_prm.set(in_flame_iter_count)
+        
+        if dirty is not None:
+            self.in_reset_parms_dirty(node, dirty)
+            
+        else:
+            parms: tuple[hou.Parm, ...] = node.parms()
+            try:
+                self.in_reset_parms_diff(node, parms)
+            except hou.ObjectWasDeleted:
+                # The node parameters layout changed but not its parameters count, rebuild the inventory and try again.
+                flam3h_iterator_utils.destroy_cachedUserData(node, f3h_cachedUserData.in_reset_parms_inventory)
+                self.in_reset_parms_diff(node, parms)
             
         if in_flame_iter_count > flam3h_iter_count:
             flam3h_iter_count_prm.set(in_flame_iter_count)
+            
+        self.in_reset_parms_dirty_track(node)
 
-        elif in_flame_iter_count == flam3h_iter_count:
-            pass
 
-        else:
-            flam3h_iter_count_prm.set(in_flame_iter_count)
+    def in_reset_parms_dirty(self, node: hou.SopNode, names: set[str]) -> None:
+        """Reset only the parameters changed since this FLAM3H™ node last reset, the same way: self.in_reset_parms_diff(...) does,</br>
+        so the node parameters do not need to be walked all.</br>
+        The parameters of the iterators already removed are skipped.</br>
+
+        Args:
+            (self):
+            node(hou.SopNode): This FLAM3H™ node
+            names(set[str]): The parameter tuples names changed since the last reset: in_flame_utils.in_reset_parms_dirty_event(...)
+
+        Returns:
+            (None):
+        """
+        for name in names:
+            prm_tuple: hou.ParmTuple | None = node.parmTuple(name)
+            if prm_tuple is None:
+                continue
+            
+            for p in prm_tuple:
+                if p.name() in f3h_pvt.PVT_ALL:
+                    if p.keyframes():
+                        p.lock(False)
+                        p.deleteAllKeyframes()
+                    if not p.isLocked(): p.lock(True)
+                    continue
+                
+                if p.isLocked(): p.lock(False)
+                if p.keyframes(): p.deleteAllKeyframes()
+                if p.isMultiParmInstance() and not p.isAtDefault(): p.revertToDefaults()
+
+
+    def in_reset_parms_diff(self, node: hou.SopNode, parms: tuple[hou.Parm, ...]) -> None:
+        """Reset this FLAM3H™ node parameters touching only the ones that need it:</br>
+        * animated or locked parameters will have their keyframes deleted and they will be unlocked ( private parameters will be locked back ).
+        * multi parameter instances not at their default values will be reverted to their defaults.
+
+        Args:
+            (self):
+            node(hou.SopNode): This FLAM3H™ node
+            parms(tuple[hou.Parm, ...]): This FLAM3H™ node current parameters: node.parms()
+
+        Returns:
+            (None):
+        """
+        pvt, multi, other = self.in_reset_parms_inventory(node, parms)
+        
+        for p in pvt:
+            if p.keyframes():
+                p.lock(False)
+                p.deleteAllKeyframes()
+                p.lock(True)
+            elif not p.isLocked():
+                p.lock(True)
+                
+        for p in other:
+            if p.isLocked(): p.lock(False)
+            if p.keyframes(): p.deleteAllKeyframes()
+            
+        for p in multi:
+            if p.isLocked(): p.lock(False)
+            if p.keyframes(): p.deleteAllKeyframes()
+            if not p.isAtDefault(): p.revertToDefaults()
 
 
     def in_to_flam3h_resets(self, node: hou.SopNode, _FLAM3H_INIT_DATA: TA_F3H_Init) -> None:
@@ -19437,17 +22757,24 @@ class in_flame_utils
                     # Otherwise always turn it OFF
                     flam3h_prm_utils.private_prm_set(node, f3h_tabs.PREFS.PVT_PRM_RIP, 0)
 
+        # Collect all the iterators and FF parameter values into a plan
+        # so they can be set all at once instead of one parameter at a time.
+        plan: in_flame_parms_plan = in_flame_parms_plan(node)
+        
         # Set iterators
-        self.in_flam3h_set_iterators(0, node, apo_data, preset_id)
+        self.in_flam3h_set_iterators(0, node, apo_data, preset_id, plan)
         
         # FF
         ####################################################
         flam3h_iterator_utils(self.kwargs).flam3h_reset_FF()
         if apo_data.finalxform is not None:
             flam3h_prm_utils.private_prm_set(node, f3h_tabs.PREFS.PVT_PRM_DOFF, 1)
-            self.in_flam3h_set_iterators(1, node, apo_data, preset_id)
+            self.in_flam3h_set_iterators(1, node, apo_data, preset_id, plan)
         else:
             flam3h_prm_utils.private_prm_set(node, f3h_tabs.PREFS.PVT_PRM_DOFF, 0)
+            
+        # Apply the iterators and FF parameters plan
+        plan.apply("FLAM3H™ IN load flame")
 
         # Disable post affine if they are at default values (iterators and FF)
         # This should not be needed because the post affine are not added to the XML flame preset when at default values
@@ -19974,10 +23301,11 @@ class in_flame_utils
         _FLAM3H_INIT_DATA: TA_F3H_Init = self.in_to_flam3h_init_data(node)
         xml, clipboard, preset_id, flame_name_clipboard, attempt_from_clipboard, chaos = _FLAM3H_INIT_DATA
 
-        if xml is not None and _xml_tree(xml).isvalidtree:
+        if _xml_tree.xmlfile_isvalid(xml):
 
-            # IN flame preset data
-            apo_data: in_flame_iter_data = in_flame_iter_data(node, xml, preset_id)
+            # IN flame preset data ( prefetched if any )
+            apo_data: in_flame_iter_data | None = None if clipboard else self.PREFETCH.get(node, xml, preset_id)
+            if apo_data is None: apo_data = in_flame_iter_data(node, xml, preset_id)
             # If there are xforms/iterators
             if apo_data.xforms is not None:
                 
@@ -20018,6 +23346,10 @@ class in_flame_utils
                 data: str | None = node.userData(f3h_userData.XML_LAST)
                 if data is None or not _xml_tree(data).isvalidtree:
                     out_flame_utils(self.kwargs).out_userData_XML_last_loaded(f3h_userData.XML_LAST, apo_data.name[preset_id])
+                    
+                # Prefetch the adjacent flame presets, if ON for this FLAM3H™ node
+                prefetch_count: int = self.PREFETCH.prefetch_count(node)
+                if prefetch_count and not clipboard: self.PREFETCH.request(xml, preset_id, apo_data.flame_count, prefetch_count)
                 
             else:
                 if attempt_from_clipboard: _MSG: str = "Flame IN Clipboard: The loaded Flame preset have 0(Zero) xforms/iterators. SKIPPED"
@@ -20096,7 +23428,7 @@ class in_flame_utils
         _FLAM3H_INIT_DATA: TA_F3H_Init = self.in_to_flam3h_init_data(node)
         xml, clipboard, preset_id, flame_name_clipboard, attempt_from_clipboard, chaos = _FLAM3H_INIT_DATA
 
-        if xml is not None and _xml_tree(xml).isvalidtree:
+        if _xml_tree.xmlfile_isvalid(xml):
 
             # IN flame preset data
             apo_data: in_flame_iter_data = in_flame_iter_data(node, xml, preset_id)
@@ -20160,6 +23492,36 @@ VARS_FRACTORIUM_DICT_PRE: dict[str, tuple[str, ...]]  = in_flame_utils.in_util_v
 VARS_FRACTORIUM_DICT_POST: dict[str, tuple[str, ...]] = in_flame_utils.in_util_vars_dict_type_maker(VARS_FRACTORIUM_DICT, in_flame_utils.in_util_make_POST)
 
 
+# VARIATIONS LOOKUP TABLES start here
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+# Built only once on import, so loading, saving and copy/paste can look the variations up directly
+# instead of scanning VARS_FLAM3_DICT_IDX or rebuilding the variations parameters names every time.
+
+# Variation index -> variation name
+VARS_FLAM3_NAME_FROM_IDX: Final[tuple[str, ...]] = tuple(in_flame_utils.in_get_dict_key_from_value(VARS_FLAM3_DICT_IDX, v_type) for v_type in range(max(VARS_FLAM3_DICT_IDX.values()) + 1))
+# Variation name -> PRE and POST variation names
+VARS_FLAM3_NAME_PRE: Final[MappingProxyType[str, str]] = MappingProxyType({v_name: str(in_flame_utils.in_util_make_PRE(v_name)) for v_name in VARS_FLAM3_DICT_IDX})
+VARS_FLAM3_NAME_POST: Final[MappingProxyType[str, str]] = MappingProxyType({v_name: str(in_flame_utils.in_util_make_POST(v_name)) for v_name in VARS_FLAM3_DICT_IDX})
+# All the PRE and POST variation names, to look them up inside the XML xforms keys: in_flame_utils.in_get_xforms_var_keys(...)
+VARS_FLAM3_KEYS_PRE: Final[frozenset[str]] = frozenset(in_flame_utils.in_util_make_PRE(VARS_FLAM3_DICT_IDX.keys()) or ())
+VARS_FLAM3_KEYS_POST: Final[frozenset[str]] = frozenset(in_flame_utils.in_util_make_POST(VARS_FLAM3_DICT_IDX.keys()) or ())
+# Variation index -> FLAM3H™ parametric parameters names: iterators, FF and FF PRE/POST
+VARS_FLAM3H_PRM_FROM_IDX: Final[tuple[tuple, ...]] = flam3h_varsPRM().varsPRM
+VARS_FLAM3H_PRM_FF_FROM_IDX: Final[tuple[tuple, ...]] = flam3h_varsPRM_FF(f3h_ffPrmPrx.PRM).varsPRM_FF()
+VARS_FLAM3H_PRM_FF_PP_FROM_IDX: Final[tuple[tuple, ...]] = flam3h_varsPRM_FF(f3h_ffPrmPrx.PRM_PP).varsPRM_FF()
+# Variation index -> Apophysis and Fractorium parametric parameters names
+VARS_APO_PRM_FROM_IDX: Final[tuple[tuple, ...]] = flam3h_varsPRM_APO().varsPRM
+VARS_FRACTORIUM_PRM_EXCEPTIONS: Final[MappingProxyType[int, tuple]] = MappingProxyType(flam3h_varsPRM_APO().varsPRM_FRACTORIUM_EXCEPTIONS)
+VARS_FRACTORIUM_PRM_FROM_IDX: Final[tuple[tuple, ...]] = tuple(VARS_FRACTORIUM_PRM_EXCEPTIONS.get(v_type, apo_prm) for v_type, apo_prm in enumerate(VARS_APO_PRM_FROM_IDX))
+
+
 # SAVE XML FILES start here
 ##########################################
 ##########################################
@@ -20200,11 +23562,16 @@ class out_flame_utils
 * out_xaos_cleanup(xaos: TA_STR_ListUnflattened) -> TA_STR_ListUnflattened:
 * out_xaos_collect(node: hou.SopNode, iter_count: int, prm: str) -> TA_XAOS_Collect:
 * out_xaos_collect_vactive(node: hou.SopNode, fill: list[list[str]] | list[list[float]], prm: str) -> list[list[str] | list[Never]]:
+* out_xaos_fill(xaos: TA_XAOS_Collect, iter_count: int) -> list[list[float]]:
+* out_xaos_note_parse(note: str) -> tuple[float, ...] | None:
 * _out_pretty_print(current: lxmlET._Element, parent: lxmlET._Element | None = None, index: int = -1, depth: int = 0) -> None: #type: ignore
+* _out_xml_has_mixed_content(current: lxmlET._Element) -> bool:
+* _out_pretty_print_element(elem: lxmlET._Element) -> lxmlET._Element:
 * menu_out_presets_loop(menu: TA_Menu, i: int, item: str) -> None:
 * menu_out_presets_loop_enum(menu: TA_Menu, i: int, item: str) -> None:
 * out_collect_var_section_names_dict(node: hou.SopNode, mode: bool = False, var_section: str = "VAR") -> dict[str, list[str]] | bool:
 * out_build_xf_names(f3d: out_flame_xforms_data) -> tuple[str, ...]:
+* out_vars_prm_lookup(vars_prm: tuple, apo_prm: tuple) -> TA_OUT_Vars_Lookup:
 
 @METHODS
 * get_iter_affine_pre(self, iterator_num: int) -> TA_Affine:
@@ -20240,11 +23607,8 @@ class out_flame_utils
 * out_flame_properties_build(self, f3r: out_flame_render_properties) -> dict:
 * out_flam3_compatibility_check_and_msg(self, msg: bool = True) -> bool:                              
 * out_populate_xform_vars_XML(self, 
-                            varsPRM: tuple, 
-                            TYPES_tuple: tuple[str, ...], 
-                            WEIGHTS_tuple: tuple[tuple[str, int], ...], 
+                            VARS: TA_OUT_Vars_Snapshot, 
                             element_xform: lxmlET._Element,
-                            MP_IDX: str, 
                             FUNC: Callable, 
                             BLUR_PRE: bool = False) -> list[str]:
 * out_build_XML(self, flame: lxmlET._Element, msg: bool = True) -> bool:
@@ -20252,10 +23616,11 @@ class out_flame_utils
 * out_userData_XML_last_loaded(self, data_name: str = f3h_userData.XML_LAST, flame_name: str | None = None) -> None:
 * out_new_XML(self, outpath: str) -> None:
 * out_preset_XML_clipboard(self) -> None
-* out_append_XML(self, root: lxmlET._Element, out_path: str) -> None:
+* out_append_XML(self, out_path: str) -> None:
 * out_XML(self) -> None:
 * __out_flame_data(self, prm_name: str = '') -> str:
 * __out_flame_name(self, prm_name: str | None = XML_RENDER_HOUDINI_DICT.get(xml_keys.XML_XF_NAME)) -> str:
+* __out_xf_prm_snapshot(self) -> TA_OUT_XF_Snapshot:
 * __out_xf_data(self, prm_name: str) -> tuple[str, ...]:
 * __out_xf_data_color_speed(self) -> tuple[str, ...]:
 * __out_xf_name(self) -> tuple[str, ...]:
@@ -20266,6 +23631,9 @@ class out_flame_utils
 * __out_xf_postaffine(self) -> TA_OUT_Post_Affine:
 * __out_finalxf_preaffine(self) -> TA_OUT_Affine_FF:
 * __out_finalxf_postaffine(self) -> TA_OUT_Affine_FF:
+* __out_vars_collect(self, varsPRM: tuple, lookup: dict[int, TA_OUT_Vars_Lookup], TYPES_tuple: tuple[str, ...], WEIGHTS_tuple: tuple[tuple[str, int], ...], MP_IDX: str) -> TA_OUT_Vars_Snapshot:
+* __out_xf_vars(self) -> Triple[tuple[TA_OUT_Vars_Snapshot, ...]]:
+* __out_finalxf_vars(self) -> Triple[TA_OUT_Vars_Snapshot]:
 * __out_palette_hex(self) -> str:
 * __out_flame_palette_mode(self) -> str:
 * __out_flame_data_flam3h_hsv(self, prm_name: str = f3h_tabs.CP.PRM_RAMP_HSV_VAL_NAME) -> str | bool:
@@ -20735,9 +24103,10 @@ class out_flame_utils
         Returns:
             (TA_STR_ListUnflattened): A list/tuple of list[str]/tuple[str] with the rounded values if any
         """    
-        _is_integer: Callable[[float], bool] = float.is_integer
+        _float: type[float] = float
         _round: Callable[[float, int], float] = round
-        return [[str(int(float(i))) if _is_integer(float(i)) else str(_round(float(i), xml_keys.f3h.DEFAULT_ROUND_DECIMAL_COUNT)) for i in item] for item in val_list]
+        _decimals: int = xml_keys.f3h.DEFAULT_ROUND_DECIMAL_COUNT
+        return [[str(int(f)) if (f := _float(i)).is_integer() else str(_round(f, _decimals)) for i in item] for item in val_list]
     
     
     @staticmethod
@@ -21094,15 +24463,23 @@ class out_flame_utils
         """   
 
         val: list = []
-        val_prev: list[list[str]] | None = flam3h_iterator_utils.auto_set_xaos_data_get_XAOS_PREV(node)
+        val_prev: list[list[float]] | None = flam3h_iterator_utils.auto_set_xaos_data_get_XAOS_PREV(node)
+        # The xaos notes FLAM3H™ set last time, already parsed.
+        xaos_notes: dict[str, tuple[float, ...]] = node.cachedUserData(f3h_cachedUserData.xaos_notes) or {}
         
         for iter in range(iter_count):
             
             # Get this iterator Xoas command string
             iter_xaos: str = node.parm(f"{prm}_{iter + 1}").eval()
             
+            # If this xaos string has not been modified since FLAM3H™ set it, no need to parse it back.
+            # Unless the history is too short to validate it, in which case it will go through the undo below as always.
+            xaos_note: tuple[float, ...] | None = xaos_notes.get(iter_xaos)
+            if xaos_note is not None and not (xaos_note and val_prev is not None and len(val_prev) == iter_count and len(val_prev[iter]) < min(len(xaos_note), iter_count)):
+                val.append(list(xaos_note[:iter_count]))
+            
             # If the xaos string is not empty
-            if iter_xaos:
+            elif iter_xaos:
                 
                 strip: list[str] = iter_xaos.split(':')
                 
@@ -21113,7 +24490,7 @@ class out_flame_utils
                         _xaos: list[str] = strip[1:iter_count + 1]
                         _xf_val_cleanup_str: Callable[[str], str] = in_flame.xf_val_cleanup_str
                         if _xaos[0] and val_prev is not None and len(val_prev) == iter_count:
-                            _xaos_strip: list[str] = [str(_val_now) if (_val_now := float(_xf_val_cleanup_str(str(x), val_prev[iter][idx]))) >= 0 else '1' for idx, x in enumerate(_xaos)]
+                            _xaos_strip: list[str] = [str(_val_now) if (_val_now := float(_xf_val_cleanup_str(str(x), str(val_prev[iter][idx])))) >= 0 else '1' for idx, x in enumerate(_xaos)]
                             
                         else:
                             # Otherwise use the safer version.
@@ -21190,8 +24567,11 @@ class out_flame_utils
             (list[list[str] | list[Never]]): return a list of list[str] with the NO-active iterators taken into consideration.
         """    
         xaos_no_vactive: list[list[str] | list[Never]] = []
+        # Evaluate each iterator active parameter only once and not once per xaos weight.
+        _parm: Callable[[str], hou.Parm] = node.parm
+        vactive: list[int] = [_parm(f"{prm}_{idx + 1}").eval() for idx in range(max((len(x) for x in fill), default=0))]
         for x in fill:
-            collect: list[str] = [str(item) for idx, item in enumerate(x) if node.parm(f"{prm}_{idx + 1}").eval()]
+            collect: list[str] = [str(item) for idx, item in enumerate(x) if vactive[idx]]
             
             if collect:
                 xaos_no_vactive.append(collect)
@@ -21202,9 +24582,54 @@ class out_flame_utils
         return xaos_no_vactive
 
 
+    @staticmethod
+    def out_xaos_fill(xaos: TA_XAOS_Collect, iter_count: int) -> list[list[float]]:
+        """Build the numeric xaos matrix out of the collected xaos weights.</br>
+        Each iterator's xaos weights are converted into floats and the missing weights, if any, are filled with a value of: 1.0</br>
+
+        Args:
+            xaos(TA_XAOS_Collect): The xaos weights. From: out_xaos_collect(...)
+            iter_count(int): Iterator's count
+
+        Returns:
+            (list[list[float]]): The iter_count x iter_count xaos matrix.
+        """
+        _float: type[float] = float
+        return [[_float(x) for x in item[:iter_count]] + [1.0] * (iter_count - len(item)) for item in xaos]
+    
+    
+    @staticmethod
+    def out_xaos_note_parse(note: str) -> tuple[float, ...] | None:
+        """Parse a well formed xaos note string into its xaos weights, the same way out_xaos_collect(...) would.</br>
+        It is used to parse the xaos notes FLAM3H™ set itself so they can be looked up instead of being parsed back every time.</br>
+
+        Args:
+            note(str): The xaos note string. e.g: "xaos:1:0.5:1"
+
+        Returns:
+            (tuple[float, ...] | None): The xaos weights or None if the note is not well formed.
+        """
+        strip: list[str] = note.split(':')
+        if strip[0].lower().replace(" ", "") != 'xaos':
+            return None
+        
+        if strip[1:] == ['']:
+            return ()
+        
+        try:
+            return tuple(_val if (_val := float(x)) >= 0 else 1.0 for x in strip[1:])
+        except ValueError:
+            return None
+
+
     @staticmethod
     def _out_pretty_print(current: lxmlET._Element, parent: lxmlET._Element | None = None, index: int = -1, depth: int = 0) -> None: #type: ignore
         """Reformat the XML data in a pretty way.</br>
+        The tree is walked iteratively, each element set the text and tails of its own children,</br>
+        so big flame files do not pay for a recursive call per element.</br></br>
+        
+        When possible, the lxml native indent is used instead. It give the same result as long as</br>
+        no element with children has also some actual text in it (mixed content), that lxml indent would preserve.</br>
 
         Args:
             current(lxmlET._Element): The Flame XML root we want to reformat.
@@ -21212,10 +24637,6 @@ class out_flame_utils
             index(int): Default to: -1
             depth(int): Default to: 0(Zero)
         """
-
-        for i, node in enumerate(current):
-            out_flame_utils._out_pretty_print(node, current, i, depth + 1)
-
         if parent is not None:
             if index == 0:
                 parent.text = '\n' + ('  ' * depth)
@@ -21224,6 +24645,80 @@ class out_flame_utils
             if index == len(parent) - 1:
                 current.tail = '\n' + ('  ' * (depth - 1))
                 
+        elif hasattr(lxmlET, 'indent') and not out_flame_utils._out_xml_has_mixed_content(current):
+            lxmlET.indent(current, space='  ', level=depth)
+            return
+        
+        indents: dict[int, str] = {}
+        stack: list[tuple[lxmlET._Element, int]] = [(current, depth)]
+        while stack:
+            elem, d = stack.pop()
+            children: list[lxmlET._Element] = list(elem)
+            if children:
+                
+                indent: str | None = indents.get(d + 1)
+                if indent is None:
+                    indent = indents[d + 1] = '\n' + ('  ' * (d + 1))
+                    
+                elem.text = indent
+                for child in children:
+                    child.tail = indent
+                    if len(child):
+                        stack.append((child, d + 1))
+                children[-1].tail = '\n' + ('  ' * d)
+                
+                
+    @staticmethod
+    def _out_xml_has_mixed_content(current: lxmlET._Element) -> bool:
+        """Check if any element with children has also some actual text in it, either its own text or its children tails.</br>
+
+        Args:
+            current(lxmlET._Element): The XML element to check, including all its children.
+
+        Returns:
+            (bool): True if there is mixed content. False if not.
+        """
+        _isspace: Callable[[str], bool] = str.isspace
+        for elem in current.iter(lxmlET.Element):
+            if len(elem):
+                
+                text: str | None = elem.text
+                if text and not _isspace(text):
+                    return True
+                
+                for child in elem:
+                    tail: str | None = child.tail
+                    if tail and not _isspace(tail):
+                        return True
+                    
+        return False
+    
+    
+    @staticmethod
+    def _out_pretty_print_element(elem: lxmlET._Element) -> lxmlET._Element:
+        """Reformat a single element in place, exactly as it would be if its entire XML tree was reformatted with: out_flame_utils._out_pretty_print(...)</br>
+        This is used to reformat only the flame presets that are actually going to be written out, when the flame file tree has been loaded without reformatting it.</br>
+
+        Args:
+            elem(lxmlET._Element): The element to reformat, usually a flame preset.
+
+        Returns:
+            (lxmlET._Element): The same element, reformatted.
+        """
+        parent: lxmlET._Element | None = elem.getparent()
+        if parent is None:
+            out_flame_utils._out_pretty_print(elem)
+            
+        else:
+            depth: int = sum(1 for _ in elem.iterancestors())
+            index: int = parent.index(elem)
+            out_flame_utils._out_pretty_print(elem, parent, index, depth)
+            # This tail is set by the next sibling when reformatting the entire XML tree.
+            if index < len(parent) - 1:
+                elem.tail = '\n' + ('  ' * depth)
+                
+        return elem
+                
                 
     @staticmethod
     def menu_out_presets_loop(menu: TA_Menu, i: int, item: str | list[Never]) -> None:
@@ -21307,7 +24802,7 @@ class out_flame_utils
         
         # Shortcuts
         eval_parm = node.parm
-        _in_get_dict_key_from_value: Callable[[dict[str, int], int], str] = in_flame_utils.in_get_dict_key_from_value
+        _names: tuple[str, ...] = VARS_FLAM3_NAME_FROM_IDX
 
         names_idx: dict[str, list[str]] = {}
 
@@ -21315,7 +24810,7 @@ class out_flame_utils
             if not node.parm(f3h_tabs.PREFS.PVT_PRM_DOFF).eval():
                 return False
 
-            names: list[str] = [_in_get_dict_key_from_value(VARS_FLAM3_DICT_IDX, eval_parm(T_tuple[i]).eval()) for i, prm in enumerate(W_tuple) if eval_parm(prm[0]).eval() != 0]
+            names: list[str] = [_names[eval_parm(T_tuple[i]).eval()] for i, prm in enumerate(W_tuple) if eval_parm(prm[0]).eval() != 0]
             if names:
                 names_idx["FF"] = names
 
@@ -21323,7 +24818,7 @@ class out_flame_utils
             iter_count: int = node.parm(f3h_tabs.PRM_ITERATORS_COUNT).eval()
             for i in range(1, iter_count + 1):
                 suffix = str(i)
-                names = [_in_get_dict_key_from_value(VARS_FLAM3_DICT_IDX, eval_parm(f"{T_tuple[j]}{suffix}").eval()) for j, prm in enumerate(W_tuple) if eval_parm(f"{prm[0]}{suffix}").eval() != 0]
+                names = [_names[eval_parm(f"{T_tuple[j]}{suffix}").eval()] for j, prm in enumerate(W_tuple) if eval_parm(f"{prm[0]}{suffix}").eval() != 0]
                 if names:
                     names_idx[suffix] = names
 
@@ -21375,6 +24870,38 @@ class out_flame_utils
         return tuple(f"iterator_{i + 1}" if _flam3h_iterator_is_default_name((xfn := xf_name[i])) or not str(xfn).strip() else xfn for i in range(iter_count))
 
 
+    @staticmethod
+    def out_vars_prm_lookup(vars_prm: tuple, apo_prm: tuple) -> TA_OUT_Vars_Lookup:
+        """Build the lookup table of a parametric variation to be used by the OUT variation's snapshot.</br>
+        It pair the FLAM3H™ parametric parameters names with the number of components to collect from each of them</br>
+        and it flatten the parameters names to be written out in the same order.</br></br>
+        
+        A component count of zero mark a single value parameter (hou.Parm) instead of a tuple one (hou.ParmTuple).</br>
+
+        Args:
+            vars_prm(tuple): FLAM3H™ variation's type and its parametric parameters names: flam3h_varsPRM().varsPRM[v_type]
+            apo_prm(tuple): APO variation's type and its parametric parameters names, Fractorium exceptions already applied if needed: flam3h_varsPRM_APO().varsPRM[v_type]
+
+        Returns:
+            (TA_OUT_Vars_Lookup): tuple[tuple[tuple[str: FLAM3H™ parameter name, int: components count], ...], tuple[str: parameters names to write out, ...]]
+        """
+        if not vars_prm[-1]:
+            return (), ()
+        
+        f3h_prm: tuple = vars_prm[1:-1]
+        prm_names: list[tuple[str, int]] = []
+        out_names: list[str] = []
+        for id, p in enumerate(apo_prm[1:-1]):
+            if f3h_prm[id][-1]:
+                prm_names.append((f3h_prm[id][0], len(p)))
+                out_names.extend(p[i] for i in range(len(p)))
+            else:
+                prm_names.append((f3h_prm[id][0], 0))
+                out_names.append(p[0])
+                
+        return tuple(prm_names), tuple(out_names)
+
+
     # CLASS: PROPERTIES
     ##########################################
     ##########################################
@@ -21418,6 +24945,18 @@ class out_flame_utils
     def palette(self) -> hou.Ramp:
         return self._palette
     
+    @cached_slot_property
+    def xf_prm_snapshot(self) -> TA_OUT_XF_Snapshot:
+        return self._out_flame_utils__out_xf_prm_snapshot() # pyright: ignore[reportAttributeAccessIssue]
+    
+    @cached_slot_property
+    def out_vars_apo_prm(self) -> tuple[tuple, ...]:
+        # If OUT Tab -> USE_FRACTORIUM_PRM_NAMES toggle is ON
+        # make sure to use the parametric variation's parameters names that Fractorium expect.
+        if self.node.parm(f3h_tabs.OUT.PRM_USE_FRACTORIUM_PRM_NAMES).eval():
+            return VARS_FRACTORIUM_PRM_FROM_IDX
+        return VARS_APO_PRM_FROM_IDX
+    
     @property
     def palette_hsv_do(self) -> int:
         return self._palette_hsv_do
@@ -21641,7 +25180,7 @@ class out_flame_utils
         _FLAM3H_INIT_DATA: tuple[str | None, int] = self.out_to_flam3h_init_data_quick(node, tab)
         xml, preset_id = _FLAM3H_INIT_DATA
 
-        if xml is not None and _xml_tree(xml).isvalidtree:
+        if _xml_tree.xmlfile_isvalid(xml):
 
             # IN flame preset data
             apo_data: in_flame_iter_data = in_flame_iter_data(node, xml, preset_id)
@@ -22090,7 +25629,7 @@ class out_flame_utils
             (tuple): the xaos TO values to write out.
         """
         val: TA_XAOS_Collect = self.out_xaos_collect(self.node, self.iter_count, self.flam3h_iter_prm_names.xaos)
-        fill: list[list[str]] = [np_pad(item, (0,self.iter_count - len(item)), 'constant', constant_values = 1).tolist() for item in val]
+        fill: list[list[float]] = self.out_xaos_fill(val, self.iter_count)
         xaos_vactive: list[list[str] | list[Never]] = self.out_xaos_collect_vactive(self.node, fill, self.flam3h_iter_prm_names.main_vactive)
         _join: Callable[[Iterable[str]], str] = ' '.join
 
@@ -22107,7 +25646,7 @@ class out_flame_utils
             (tuple): the xaos FROM values transposed into xaos TO values to write out.
         """
         val: TA_XAOS_Collect = self.out_xaos_collect(self.node, self.iter_count, self.flam3h_iter_prm_names.xaos)
-        fill: list[NDArray] = [np_pad(item, (0,self.iter_count - len(item)), 'constant', constant_values = 1) for item in val]
+        fill: list[list[float]] = self.out_xaos_fill(val, self.iter_count)
         t: list[list[float]] = np_transpose(np_resize(fill, (self.iter_count, self.iter_count))).tolist()
         _join: Callable[[Iterable[str]], str] = ' '.join
         if mode:
@@ -22132,9 +25671,9 @@ class out_flame_utils
         # This undo's disabler is needed to make the undo work. 
         with hou.undos.disabler(): # pyright: ignore[reportCallIssue]   # Houdini HOM API
             
-            # For the OUT Tab menu presets we are forced to use the class: _xml_tree(...)
-            # Instead of the lightweight version class: _xml(...)
-            apo_data: _xml_tree = _xml_tree(xml_file_path)
+            # For the OUT Tab menu presets we are forced to carefully validate the flame file
+            # but we do not need to build the full class: _xml_tree(...), the cached streaming index is enough.
+            apo_data: _xml_index = _xml_index.xmlfile_index(xml_file_path)
             
             if apo_data.isvalidtree:
                 
@@ -22142,7 +25681,7 @@ class out_flame_utils
                 
                 _menu_func: Callable[[TA_Menu, int, str | list[Never]], None] = (self.menu_out_presets_loop_enum if enum else self.menu_out_presets_loop)
                 
-                preset_names: list = apo_data.name
+                preset_names: tuple[str | list[Never], ...] = apo_data.name
                 
                 menu: TA_Menu = []
                 for i, item in enumerate(preset_names):
@@ -22525,11 +26064,8 @@ class out_flame_utils
         
         
     def out_populate_xform_vars_XML(self, 
-                                    varsPRM: tuple, 
-                                    TYPES_tuple: tuple[str, ...], 
-                                    WEIGHTS_tuple: tuple[tuple[str, int], ...], 
+                                    VARS: TA_OUT_Vars_Snapshot, 
                                     element_xform: lxmlET._Element,
-                                    MP_IDX: str, 
                                     FUNC: Callable, 
                                     BLUR_PRE: bool = False) -> list[str]:
         """Set this iterator variations:
@@ -22538,14 +26074,14 @@ class out_flame_utils
         
         inside the xform (lxmlET._Element) to be written out into the XML file.
         
-        It will also return a list of used variations in the provided iterator/xform.
+        It will also return a list of used variations in the provided iterator/xform.</br></br>
+        
+        The variation's data is read from the snapshot collected by the out_flame_xforms_data class</br>
+        so no FLAM3H™ parameters are evaluated in here.
         
         Args:
-            varsPRM(tuple): FLAM3H™ variation's types and their parametric parameters names.
-            TYPES_tuple(tuple[str, ...]): FLAM3H™ variation's types parameters names.
-            WEIGHTS_tuple(tuple[tuple[str, int], ...]): FLAM3H™ variation's weights parameters names.
+            VARS(TA_OUT_Vars_Snapshot): This iterator/xform variations snapshot for the section we are writing out (VAR, PRE or POST).</br>Any of the out_flame_xforms_data: xf_vars, xf_prevars, xf_postvars, finalxf_vars, finalxf_prevars, finalxf_postvars
             XFORM(lxmlET._Element): The current xform (lxmlET._Element) to populate.
-            MP_IDX(str): Current multiparameter index
             FUNC(Callable): Callable definition to convert variation's names between VAR, PRE and POST.</br>
                 - in_flame_utils.in_util_make_NULL
                 - in_flame_utils.in_util_make_PRE
@@ -22555,38 +26091,18 @@ class out_flame_utils
         Returns:
             (list[str]): List of used variation in this iterator/xform
         """
-        node: hou.SopNode = self.node
+        _set: Callable[[str, str], None] = element_xform.set
+        _out_util_round_float: Callable[[float], str] = self.out_util_round_float
         names: list = []
-        for idx, prm in enumerate(WEIGHTS_tuple):
-            prm_w: float = node.parm(f"{prm[0]}{MP_IDX}").eval()
-            if prm_w != 0:
-                v_type: int = node.parm(f"{TYPES_tuple[idx]}{MP_IDX}").eval()
-                v_name: str = in_flame_utils.in_get_dict_key_from_value(VARS_FLAM3_DICT_IDX, v_type)
-                names.append(v_name)
-                if BLUR_PRE:
-                    element_xform.set(FUNC(f"{v_name}_pre") if v_type == 26 else FUNC(v_name), self.out_util_round_float(prm_w))
-                else:
-                    element_xform.set(FUNC(v_name), self.out_util_round_float(prm_w))
-                vars_prm: tuple = varsPRM[v_type]
-                if vars_prm[-1]:
-                    f3h_prm: tuple = varsPRM[v_type][1:-1]
-
-                    # If OUT Tab -> USE_FRACTORIUM_PRM_NAMES toggle is ON
-                    # make sure to use the parametric variation's parameters names that Fractorium expect.
-                    apo_prm: tuple = flam3h_varsPRM_APO().varsPRM[v_type]
-                    if node.parm(f3h_tabs.OUT.PRM_USE_FRACTORIUM_PRM_NAMES).eval():
-                        out_prm: tuple = in_flame_utils.in_prm_name_exceptions(v_type, xml_keys.XML_APP_NAME_FRACTORIUM, apo_prm)[1:-1]
-                    else:
-                        out_prm: tuple = apo_prm[1:-1]
-                        
-                    for id, p in enumerate(out_prm):
-                        if f3h_prm[id][-1]:
-                            for i in range(len(p)): # for i, n in enumerate(p):
-                                vals: tuple[float, ...] = node.parmTuple(f"{f3h_prm[id][0]}{MP_IDX}").eval()
-                                element_xform.set(FUNC(p[i]), self.out_util_round_float(vals[i]))
-                        else:
-                            val: float = node.parm(f"{f3h_prm[id][0]}{MP_IDX}").eval()
-                            element_xform.set(FUNC(p[0]), self.out_util_round_float(val))
+        for v_name, v_type, prm_w, out_names, vals in VARS:
+            names.append(v_name)
+            if BLUR_PRE and v_type == 26:
+                _set(FUNC(f"{v_name}_pre"), _out_util_round_float(prm_w))
+            else:
+                _set(FUNC(v_name), _out_util_round_float(prm_w))
+                
+            for out_name, val in zip(out_names, vals):
+                _set(FUNC(out_name), _out_util_round_float(val))
                             
         return names
 
@@ -22620,8 +26136,6 @@ class out_flame_utils
         
         for iter in range(f3d.iter_count):
             
-            mp_idx = str(int(iter + 1))
-            
             if int(f3d.xf_vactive[iter]):
                 
                 xf: lxmlET._Element = lxmlET.SubElement(flame, xml_keys.XML_XF)
@@ -22653,10 +26167,9 @@ class out_flame_utils
                     xf.set(xml_keys.XML_XF_XAOS, f3d.xf_xaos[iter])
                     
                 xf.set(xml_keys.XML_XF_OPACITY, f3d.xf_opacity[iter])
-                f3h_iter: flam3h_iterator = flam3h_iterator()
-                names_VARS.append(self.out_populate_xform_vars_XML(flam3h_varsPRM().varsPRM, f3h_iter.sec_varsT, f3h_iter.sec_varsW, xf, mp_idx, in_flame_utils.in_util_make_NULL))
-                names_VARS_PRE.append(self.out_populate_xform_vars_XML(flam3h_varsPRM().varsPRM, f3h_iter.sec_prevarsT, f3h_iter.sec_prevarsW[1:], xf, mp_idx, in_flame_utils.in_util_make_PRE, True))
-                names_VARS_POST.append(self.out_populate_xform_vars_XML(flam3h_varsPRM().varsPRM, f3h_iter.sec_postvarsT, f3h_iter.sec_postvarsW, xf, mp_idx, in_flame_utils.in_util_make_POST))
+                names_VARS.append(self.out_populate_xform_vars_XML(f3d.xf_vars[iter], xf, in_flame_utils.in_util_make_NULL))
+                names_VARS_PRE.append(self.out_populate_xform_vars_XML(f3d.xf_prevars[iter], xf, in_flame_utils.in_util_make_PRE, True))
+                names_VARS_POST.append(self.out_populate_xform_vars_XML(f3d.xf_postvars[iter], xf, in_flame_utils.in_util_make_POST))
         
         # SET finalxform (FF)
         names_VARS_FF: list[str] = []
@@ -22683,10 +26196,9 @@ class out_flame_utils
                     finalxf.set(xml_keys.f3h.XML_POST_AFFINE, f3d.finalxf_f3h_postaffine)
                     finalxf.set(xml_keys.f3h.XML_POST_AFFINE_ANGLE, f3d.finalxf_f3h_postaffine_angle)
                     
-            f3h_iter_FF: flam3h_iterator_FF = flam3h_iterator_FF()
-            names_VARS_FF = self.out_populate_xform_vars_XML(flam3h_varsPRM_FF(f"{f3h_ffPrmPrx.PRM}").varsPRM_FF(), f3h_iter_FF.sec_varsT_FF, f3h_iter_FF.sec_varsW_FF, finalxf, '', in_flame_utils.in_util_make_NULL)
-            names_VARS_PRE_FF = self.out_populate_xform_vars_XML(flam3h_varsPRM_FF(f"{f3h_ffPrmPrx.PRM_PP}").varsPRM_FF(), f3h_iter_FF.sec_prevarsT_FF, f3h_iter_FF.sec_prevarsW_FF, finalxf, '', in_flame_utils.in_util_make_PRE, True)
-            names_VARS_POST_FF = self.out_populate_xform_vars_XML(flam3h_varsPRM_FF(f"{f3h_ffPrmPrx.PRM_PP}").varsPRM_FF(), f3h_iter_FF.sec_postvarsT_FF, f3h_iter_FF.sec_postvarsW_FF, finalxf, '', in_flame_utils.in_util_make_POST)
+            names_VARS_FF = self.out_populate_xform_vars_XML(f3d.finalxf_vars, finalxf, in_flame_utils.in_util_make_NULL)
+            names_VARS_PRE_FF = self.out_populate_xform_vars_XML(f3d.finalxf_prevars, finalxf, in_flame_utils.in_util_make_PRE, True)
+            names_VARS_POST_FF = self.out_populate_xform_vars_XML(f3d.finalxf_postvars, finalxf, in_flame_utils.in_util_make_POST)
         
         # SET palette
         palette: lxmlET._Element = lxmlET.SubElement(flame, xml_keys.XML_PALETTE)
@@ -22875,7 +26387,7 @@ class out_flame_utils
         _FLAM3H_INIT_DATA: tuple[str | None, int] = self.out_to_flam3h_init_data_quick(node)
         xml, preset_id = _FLAM3H_INIT_DATA
 
-        if xml is not None and _xml_tree(xml).isvalidtree:
+        if _xml_tree.xmlfile_isvalid(xml):
 
             # OUT flame preset data
             apo_data: in_flame_iter_data = in_flame_iter_data(node, xml, preset_id)
@@ -22903,12 +26415,13 @@ class out_flame_utils
             flam3h_general_utils.flash_message(node, f"{_MSG}")
 
 
-    def out_append_XML(self, root: lxmlET._Element, out_path: str) -> None:
+    def out_append_XML(self, out_path: str) -> None:
         """Append a XML flame file to the current OUT flame lib file.</br>
+        When possible, only the new flame preset is written out into the OUT flame lib file (_xml_index.flame_append(...)),</br>
+        otherwise the entire OUT flame lib file is parsed and written out again with the new flame preset in it.</br>
 
         Args:
             (self):
-            root(lxmlET._Element): Current OUT flame lib file data XML root.
             out_path(str): Current OUT flame full file path.
 
         Returns:
@@ -22916,13 +26429,19 @@ class out_flame_utils
         """
         node: hou.SopNode = self.node
         
+        root: lxmlET._Element = lxmlET.Element(xml_keys.XML_ROOT)
         flame: lxmlET._Element = lxmlET.SubElement(root, xml_keys.XML_NAME)
         flame.tag = xml_keys.XML_NAME
         
         if self.out_build_XML(flame):
             self._out_pretty_print(root)
-            tree: lxmlET._ElementTree = lxmlET.ElementTree(root)
-            tree.write(out_path)
+            
+            if not _xml_index.xmlfile_index(out_path).flame_append(flame):
+                root = _xml_tree(out_path).root
+                root.append(flame)
+                self._out_pretty_print(root)
+                tree: lxmlET._ElementTree = lxmlET.ElementTree(root)
+                tree.write(out_path)
 
             prm = node.parm(f3h_tabs.OUT.PRM_FLAME_PRESET_NAME)
             flam3h_prm_utils.set(node, prm, '')
@@ -23002,13 +26521,14 @@ class out_flame_utils
                         flam3h_prm_utils.set(node, f3h_tabs.OUT.PRM_PATH, out_path_checked)
                         
                         exist: bool = os.path.exists(out_path_checked)
-                        apo_data: in_flame = in_flame(node, out_path_checked)
+                        # No need to parse the entire OUT flame lib file here, the flame file index is enough to know if it is valid.
+                        isvalidtree: bool = _xml_tree.xmlfile_isvalid(out_path_checked) if exist else False
                         _CHK = True
                         
                         if kwargs["ctrl"]:
                             
                             if exist:
-                                if apo_data.isvalidtree:
+                                if isvalidtree:
                                     self.out_new_XML(out_path_checked)
                                     # Clear OUT presets menu filepath cache (this is done to force update the preset menu)
                                     flam3h_iterator_utils.destroy_cachedUserData(node, f3h_cachedUserData.out_presets_filepath)
@@ -23022,8 +26542,8 @@ class out_flame_utils
                         else:
                             
                             if exist:
-                                if apo_data.isvalidtree:
-                                    self.out_append_XML(apo_data.root, out_path_checked)
+                                if isvalidtree:
+                                    self.out_append_XML(out_path_checked)
                                     # Clear OUT presets menu filepath cache (this is done to force update the preset menu)
                                     flam3h_iterator_utils.destroy_cachedUserData(node, f3h_cachedUserData.out_presets_filepath)
                                 else:
@@ -23166,8 +26686,57 @@ class out_flame_utils
         return self.out_auto_add_iter_num(iter_num, flame_name, autoadd, True, self.gpu)
         
         
+    def __out_xf_prm_snapshot(self) -> TA_OUT_XF_Snapshot:
+        """Collect, in a single pass, all the xforms/iterators parameter's values the OUT collectors need.</br>
+        Every parameter is evaluated only once and the result is keyed by its FLAM3H™ parameter name (without the multi parameter index),</br>
+        each holding a tuple with one value for each iterator.</br></br>
+        
+        The pre affine and post affine X, Y, O are evaluated as tuples.</br>
+        The post affine values of the iterators with the post affine OFF are not evaluated and stored as: None</br></br>
+        
+        Note:</br>
+        This is memoized by the: xf_prm_snapshot @cached_slot_property</br>
+        so it must not be used after any of those parameters have been modified by the same class instance.
+
+        Args:
+            (self):
+
+        Returns:
+            (TA_OUT_XF_Snapshot): dict[str: parameter name, tuple: one value for each iterator]
+        """  
+        _parm: Callable[[str], hou.Parm] = self.node.parm
+        _parmTuple: Callable[[str], hou.ParmTuple] = self.node.parmTuple
+        n: flam3h_iterator_prm_names = self.flam3h_iter_prm_names
+        
+        prm_names: tuple[str, ...] = (n.main_note, n.main_vactive, n.main_weight, n.shader_color, n.shader_speed, n.shader_alpha, n.prevar_weight_blur, n.postaffine_do)
+        pre_names: tuple[str, ...] = (n.preaffine_x, n.preaffine_y, n.preaffine_o)
+        post_names: tuple[str, ...] = (n.postaffine_x, n.postaffine_y, n.postaffine_o)
+        
+        snapshot: dict[str, list[Any]] = {prm_name: [] for prm_name in (*prm_names, *pre_names, n.preaffine_ang, *post_names, n.postaffine_ang)}
+        for iter_num in range(1, self.iter_count + 1):
+            
+            for prm_name in prm_names:
+                snapshot[prm_name].append(_parm(f"{prm_name}_{iter_num}").eval())
+                
+            for prm_name in pre_names:
+                snapshot[prm_name].append(_parmTuple(f"{prm_name}_{iter_num}").eval())
+            snapshot[n.preaffine_ang].append(_parm(f"{n.preaffine_ang}_{iter_num}").eval())
+            
+            if snapshot[n.postaffine_do][-1]:
+                for prm_name in post_names:
+                    snapshot[prm_name].append(_parmTuple(f"{prm_name}_{iter_num}").eval())
+                snapshot[n.postaffine_ang].append(_parm(f"{n.postaffine_ang}_{iter_num}").eval())
+                
+            else:
+                for prm_name in (*post_names, n.postaffine_ang):
+                    snapshot[prm_name].append(None)
+                    
+        return {prm_name: tuple(val) for prm_name, val in snapshot.items()}
+        
+        
     def __out_xf_data(self, prm_name: str) -> tuple[str, ...]:
         """Prepare the xform/iterator single value parameters into a proper string to be written out.</br>
+        The values are read from the xforms/iterators parameter's snapshot if available.</br>
 
         Args:
             (self):
@@ -23177,8 +26746,10 @@ class out_flame_utils
             (str): The FLAM3H™ parameter prepped into a string for writing out into the Flame preset file.
         """    
         _out_util_round_float: Callable[[float], str] = self.out_util_round_float
-        val: list[str] = [str(_out_util_round_float(self.node.parm(f"{prm_name}_{iter}").eval())) for iter in range(1, self.iter_count + 1)]
-        return tuple(val)
+        vals: tuple[Any, ...] | None = self.xf_prm_snapshot.get(prm_name)
+        if vals is None:
+            vals = tuple(self.node.parm(f"{prm_name}_{iter}").eval() for iter in range(1, self.iter_count + 1))
+        return tuple(str(_out_util_round_float(v)) for v in vals)
     
     
     def __out_xf_data_color_speed(self) -> tuple[str, ...]:
@@ -23191,10 +26762,8 @@ class out_flame_utils
         Returns:
             (str): The FLAM3H™ parameter prepped into a string for writing out into the Flame preset file.
         """    
-        _shader_speed_name: str = flam3h_iterator_prm_names().shader_speed
         _out_util_round_float: Callable[[float], str] = self.out_util_round_float
-        val: list[str] = [str(_out_util_round_float((1.0-self.node.parm(f"{_shader_speed_name}_{iter}").eval())/2.0)) for iter in range(1, self.iter_count + 1)]
-        return tuple(val)
+        return tuple(str(_out_util_round_float((1.0-v)/2.0)) for v in self.xf_prm_snapshot[self.flam3h_iter_prm_names.shader_speed])
     
 
     def __out_xf_name(self) -> tuple[str, ...]:
@@ -23206,8 +26775,7 @@ class out_flame_utils
         Returns:
             (tuple): tuple of all the FLAM3H™ names/notes prepped into strings for writing out into the Flame preset file.
         """    
-        val: list[str] = [str(self.node.parm(f"{self.flam3h_iter_prm_names.main_note}_{iter}").eval()).strip() for iter in range(1, self._iter_count + 1)]
-        return tuple(val)
+        return tuple(str(v).strip() for v in self.xf_prm_snapshot[self.flam3h_iter_prm_names.main_note])
     
     
     def __out_finalxf_name(self) -> str:
@@ -23235,8 +26803,7 @@ class out_flame_utils
         Returns:
             (tuple): tuple of all the FLAM3H™ xforms/iterators pre_blur parameters prepped into strings for writing out into the Flame preset file.
         """   
-        val: list[str] = [str( self.node.parm(f"{self.flam3h_iter_prm_names.prevar_weight_blur}_{iter}").eval() ) if self.node.parm(f"{self.flam3h_iter_prm_names.prevar_weight_blur}_{iter}").eval() > 0 else '' for iter in range(1, self.iter_count + 1)]
-        return tuple(val)
+        return tuple(str(v) if v > 0 else '' for v in self.xf_prm_snapshot[self.flam3h_iter_prm_names.prevar_weight_blur])
 
 
     def __out_xf_xaos(self) -> tuple[str, ...]:
@@ -23265,13 +26832,13 @@ class out_flame_utils
         Returns:
             (TA_OUT_Pre_Affine): tuple[tuple[flam3_affine], tuple[F3H_affine], tuple[F3H Rotation angle]]. tuple of all the FLAM3H™ xforms/iterators pre_affine parameters prepped into strings for writing out into the Flame preset file.
         """   
+        n: flam3h_iterator_prm_names = self.flam3h_iter_prm_names
+        snapshot: TA_OUT_XF_Snapshot = self.xf_prm_snapshot
         val: list[list[str]] = []
         f3h_val: list[list[str]] = []
         f3h_angleDeg: list[str] = []
-        for iter in range(self.iter_count):
-            iter_num: int = iter + 1
-            collect: TA_Affine = self.get_iter_affine_pre(iterator_num=iter_num)
-            angleDeg: float = self.get_iter_affine_pre_rot(iterator_num=iter_num)
+        for collect_x, collect_y, collect_o, angleDeg in zip(snapshot[n.preaffine_x], snapshot[n.preaffine_y], snapshot[n.preaffine_o], snapshot[n.preaffine_ang]):
+            collect: TA_Affine = [collect_x, collect_y, collect_o]
             f3h_angleDeg.append(str(round(angleDeg, xml_keys.f3h.DEFAULT_ROUND_DECIMAL_COUNT)))
             flatten: list[float] = [item for sublist in self.out_affine_rot(collect, angleDeg) for item in sublist]
             f3h_flatten: list[float] = [item for sublist in collect for item in sublist]
@@ -23293,13 +26860,14 @@ class out_flame_utils
         Returns:
             (TA_OUT_Post_Affine): tuple[tuple[str: flam3_affine], tuple[str: F3H_affine], tuple[str: F3H Rotation angle]]. tuple of all the FLAM3H™ xforms/iterators post_affine parameters prepped into strings for writing out into the Flame preset file.
         """   
+        n: flam3h_iterator_prm_names = self.flam3h_iter_prm_names
+        snapshot: TA_OUT_XF_Snapshot = self.xf_prm_snapshot
         val: list[list[str] | list[Never]] = []
         f3h_val: list[list[str] | list[Never]] = []
         f3h_angleDeg: list[str | list[Never]] = []
-        for iter_num in range(1, self.iter_count + 1):
-            if self.node.parm(f"{self.flam3h_iter_prm_names.postaffine_do}_{iter_num}").eval():
-                collect: TA_Affine = self.get_iter_affine_post(iterator_num=iter_num)
-                angleDeg: float = self.get_iter_affine_post_rot(iterator_num=iter_num)
+        for post_do, collect_x, collect_y, collect_o, angleDeg in zip(snapshot[n.postaffine_do], snapshot[n.postaffine_x], snapshot[n.postaffine_y], snapshot[n.postaffine_o], snapshot[n.postaffine_ang]):
+            if post_do:
+                collect: TA_Affine = [collect_x, collect_y, collect_o]
                 if f3h_affineDefaults.DEFAULT_IDENT != [item for sublist in collect for item in sublist] or angleDeg != 0:
                     f3h_angleDeg.append(str(round(angleDeg, xml_keys.f3h.DEFAULT_ROUND_DECIMAL_COUNT)))
                     flatten: list[float] = [item for sublist in self.out_affine_rot(collect, angleDeg) for item in sublist]
@@ -23376,6 +26944,103 @@ class out_flame_utils
         return '', '', ''
     
     
+    def __out_vars_collect(self, varsPRM: tuple, lookup: dict[int, TA_OUT_Vars_Lookup], TYPES_tuple: tuple[str, ...], WEIGHTS_tuple: tuple[tuple[str, int], ...], MP_IDX: str) -> TA_OUT_Vars_Snapshot:
+        """Collect the used variations of an iterator/xform section (VAR, PRE or POST) into a snapshot to be written out.</br>
+        Each used variation is stored as: (name, type, weight, parametric parameters names, parametric parameters values)</br>
+        with the parametric values already flattened in the same order of their names.</br></br>
+        
+        Every parameter is evaluated only once and the lookup table is filled the first time a parametric variation is found.
+
+        Args:
+            (self):
+            varsPRM(tuple): FLAM3H™ variation's types and their parametric parameters names.
+            lookup(dict[int, TA_OUT_Vars_Lookup]): The lookup table to use for this varsPRM, keyed by variation type. It is filled in place if needed.
+            TYPES_tuple(tuple[str, ...]): FLAM3H™ variation's types parameters names.
+            WEIGHTS_tuple(tuple[tuple[str, int], ...]): FLAM3H™ variation's weights parameters names.
+            MP_IDX(str): Current multiparameter index
+
+        Returns:
+            (TA_OUT_Vars_Snapshot): The used variations snapshot of this iterator/xform section.
+        """  
+        _parm: Callable[[str], hou.Parm] = self.node.parm
+        _parmTuple: Callable[[str], hou.ParmTuple] = self.node.parmTuple
+        collect: list[tuple[str, int, float, tuple[str, ...], tuple[float, ...]]] = []
+        for idx, prm in enumerate(WEIGHTS_tuple):
+            prm_w: float = _parm(f"{prm[0]}{MP_IDX}").eval()
+            if prm_w != 0:
+                v_type: int = _parm(f"{TYPES_tuple[idx]}{MP_IDX}").eval()
+                v_lookup: TA_OUT_Vars_Lookup | None = lookup.get(v_type)
+                if v_lookup is None:
+                    v_lookup = lookup[v_type] = self.out_vars_prm_lookup(varsPRM[v_type], self.out_vars_apo_prm[v_type])
+                    
+                vals: list[float] = []
+                for prm_name, size in v_lookup[0]:
+                    if size:
+                        vals.extend(_parmTuple(f"{prm_name}{MP_IDX}").eval()[:size])
+                    else:
+                        vals.append(_parm(f"{prm_name}{MP_IDX}").eval())
+                        
+                collect.append((VARS_FLAM3_NAME_FROM_IDX[v_type], v_type, prm_w, v_lookup[1], tuple(vals)))
+                
+        return tuple(collect)
+    
+    
+    def __out_xf_vars(self) -> Triple[tuple[TA_OUT_Vars_Snapshot, ...]]:
+        """Collect, in a single sweep, the used variations of each active xform/iterator to be written out.</br>
+        Inactive iterators will get an empty snapshot.</br>
+
+        Args:
+            (self):
+
+        Returns:
+            (Triple[tuple[TA_OUT_Vars_Snapshot, ...]]): tuple[tuple[VAR], tuple[PRE], tuple[POST]]. One snapshot for each xform/iterator.
+        """  
+        f3h_iter: flam3h_iterator = self.flam3h_iter
+        varsPRM: tuple = VARS_FLAM3H_PRM_FROM_IDX
+        lookup: dict[int, TA_OUT_Vars_Lookup] = {}
+        sec_prevarsW: tuple[tuple[str, int], ...] = f3h_iter.sec_prevarsW[1:]
+        
+        xf_vars: list[TA_OUT_Vars_Snapshot] = []
+        xf_prevars: list[TA_OUT_Vars_Snapshot] = []
+        xf_postvars: list[TA_OUT_Vars_Snapshot] = []
+        for iter, vactive in enumerate(self.xf_prm_snapshot[self.flam3h_iter_prm_names.main_vactive]):
+            if vactive:
+                mp_idx = str(int(iter + 1))
+                xf_vars.append(self.__out_vars_collect(varsPRM, lookup, f3h_iter.sec_varsT, f3h_iter.sec_varsW, mp_idx))
+                xf_prevars.append(self.__out_vars_collect(varsPRM, lookup, f3h_iter.sec_prevarsT, sec_prevarsW, mp_idx))
+                xf_postvars.append(self.__out_vars_collect(varsPRM, lookup, f3h_iter.sec_postvarsT, f3h_iter.sec_postvarsW, mp_idx))
+            else:
+                xf_vars.append(())
+                xf_prevars.append(())
+                xf_postvars.append(())
+                
+        return tuple(xf_vars), tuple(xf_prevars), tuple(xf_postvars)
+    
+    
+    def __out_finalxf_vars(self) -> Triple[TA_OUT_Vars_Snapshot]:
+        """Collect the used variations of the FF/finalXform to be written out.</br>
+        If the FF is not active all the snapshots will be empty.</br>
+
+        Args:
+            (self):
+
+        Returns:
+            (Triple[TA_OUT_Vars_Snapshot]): tuple[VAR, PRE, POST]
+        """  
+        if not self.flam3h_do_FF:
+            return (), (), ()
+        
+        f3h_iter_FF: flam3h_iterator_FF = self.flam3h_iter_FF
+        # The FF posses two sets of parameteric parameters, so two lookup tables.
+        varsPRM_FF: tuple = VARS_FLAM3H_PRM_FF_FROM_IDX
+        varsPRM_FF_PP: tuple = VARS_FLAM3H_PRM_FF_PP_FROM_IDX
+        lookup_PP: dict[int, TA_OUT_Vars_Lookup] = {}
+        
+        return (self.__out_vars_collect(varsPRM_FF, {}, f3h_iter_FF.sec_varsT_FF, f3h_iter_FF.sec_varsW_FF, ''),
+                self.__out_vars_collect(varsPRM_FF_PP, lookup_PP, f3h_iter_FF.sec_prevarsT_FF, f3h_iter_FF.sec_prevarsW_FF, ''),
+                self.__out_vars_collect(varsPRM_FF_PP, lookup_PP, f3h_iter_FF.sec_postvarsT_FF, f3h_iter_FF.sec_postvarsW_FF, ''))
+    
+    
     def __out_palette_hex(self) -> str:
         """Prepare the FLAM3H™ palette ramp parameter to be written out into the Flame preset file.</br>
 
@@ -23387,12 +27052,9 @@ class out_flame_utils
         """  
         _PALETTE_KEYS_OUT = self.out_palette_keys_count(self.palette_plus_do, len(self.palette.keys()), 0)
         POSs: list[int | float] = list(it_islice(it_count(0, 1.0/(int(_PALETTE_KEYS_OUT)-1)), int(_PALETTE_KEYS_OUT)))
-        _rgb_to_hex: Callable[[tuple[float, ...]], str] = flam3h_palette_utils.rgb_to_hex
-        HEXs: list[str] = [_rgb_to_hex(tuple(self.palette.lookup(p))) for p in POSs]
-        n: int = 8
-        hex_grp: TA_STR_ListUnflattened = [HEXs[i:i + n] for i in range(0, len(HEXs), n)]
-        _join: Callable[[Iterable[str]], str] = ''.join
-        hex_join: list = [f"      {_join(grp)}\n" for grp in hex_grp] # 6 times \s
+        HEXs: str = flam3h_palette_utils.rgb_to_hex_array(flam3h_palette_utils.ramp_lookup_array(self.palette, POSs))
+        n: int = 8 * 6 # 8 HEX colors per line, 6 characters each
+        hex_join: list[str] = [f"      {HEXs[i:i + n]}\n" for i in range(0, len(HEXs), n)] # 6 times \s
         
         return f"\n{''.join(hex_join)}    " # 4 times \s
     
@@ -23614,109 +27276,737 @@ class out_flame_render_properties(out_flame_utils):
         return self._flame_name
     
     @property
-    def flame_size(self) -> str:
-        return self._flame_size
+    def flame_size(self) -> str:
+        return self._flame_size
+    
+    @property
+    def flame_center(self) -> str:
+        return self._flame_center
+    
+    @property
+    def flame_scale(self) -> str:
+        return self._flame_scale
+    
+    @property
+    def flame_rotate(self) -> str:
+        return self._flame_rotate
+    
+    @property
+    def flame_quality(self) -> str:
+        return self._flame_quality
+    
+    @property
+    def flame_brightness(self) -> str:
+        return self._flame_brightness
+    
+    @property
+    def flame_gamma(self) -> str:
+        return self._flame_gamma
+    
+    @property
+    def flame_k2(self) -> str:
+        return self._flame_k2
+    
+    @property
+    def flame_vibrancy(self) -> str:
+        return self._flame_vibrancy
+    
+    @property
+    def flame_highlight(self) -> str:
+        return self._flame_highlight
+    
+    # OUT render curves (Fractorium)
+    
+    @property
+    def flame_render_curves(self) -> str:
+        return self._flame_render_curves
+    
+    @property
+    def flame_overall_curve(self) -> str:
+        return self._flame_overall_curve
+    
+    @property
+    def flame_red_curve(self) -> str:
+        return self._flame_red_curve
+    
+    @property
+    def flame_green_curve(self) -> str:
+        return self._flame_green_curve
+    
+    @property
+    def flame_blue_curve(self) -> str:
+        return self._flame_blue_curve
+    
+    # OUT palette mode (Fractorium)
+    
+    @property
+    def flame_cp_mode(self) -> str:
+        return self._flame_cp_mode
+    
+    # custom to FLAM3H™ only
+    
+    @property
+    def flam3h_sys_rip(self) -> str:
+        return self._flam3h_sys_rip
+    
+    @property
+    def flam3h_cp_hsv(self) -> str | bool:
+        return self._flam3h_cp_hsv
+    
+    @property
+    def flam3h_mb_fps(self) -> str | bool:
+        return self._flam3h_mb_fps
+    
+    @property
+    def flam3h_mb_samples(self) -> str | bool:
+        return self._flam3h_mb_samples
+    
+    @property
+    def flam3h_mb_shutter(self) -> str | bool:
+        return self._flam3h_mb_shutter
+    
+    @property
+    def flam3h_cp_samples(self) -> str | bool:
+        return self._flam3h_cp_samples
+    
+    @property
+    def flam3h_cp_basis(self) -> str | bool:
+        return self._flam3h_cp_basis
+    
+    @property
+    def flam3h_prefs_f3c(self) -> str:
+        return self._flam3h_prefs_f3c
+
+
+# OUT FLAME XFORMS DATA start here
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+
+
+class out_flame_xforms_data(out_flame_utils):
+    """
+    Args:
+        out_flame_utils ([class]): [inherit properties methods from the out_flame_utils class]
+    """  
+    
+    __slots__ = ("_xf_name", "_xf_vactive", "_xf_weight", "_xf_xaos", 
+                 "_xf_color", "_xf_symmetry", "_xf_color_speed", "_xf_opacity", 
+                 "_xf_pre_blur", 
+                 "_xf_preaffine", "_xf_f3h_preaffine", "_xf_f3h_preaffine_angle", "_xf_postaffine", "_xf_f3h_postaffine", "_xf_f3h_postaffine_angle", 
+                 "_finalxf_name", "_finalxf_preaffine", "_finalxf_f3h_preaffine", "_finalxf_f3h_preaffine_angle", "_finalxf_postaffine", "_finalxf_f3h_postaffine", "_finalxf_f3h_postaffine_angle", 
+                 "_xf_vars", "_xf_prevars", "_xf_postvars", "_finalxf_vars", "_finalxf_prevars", "_finalxf_postvars", 
+                 "_palette_hex",)
+    
+    def __init__(self, kwargs: dict[str, Any]) -> None:
+        """
+        Args:
+            kwargs(dict[str, Any]): this FLAM3H™ node houdini kwargs.
+            
+        Returns:
+            (None):
+        """ 
+        super().__init__(kwargs)
+        
+        # FLAM3 data
+        self._xf_name: tuple[str, ...] = self._out_flame_utils__out_xf_name() # pyright: ignore[reportAttributeAccessIssue]
+        self._xf_vactive: tuple[str, ...] = self._out_flame_utils__out_xf_data(self.flam3h_iter_prm_names.main_vactive) # pyright: ignore[reportAttributeAccessIssue]
+        self._xf_weight: tuple[str, ...] = self._out_flame_utils__out_xf_data(self.flam3h_iter_prm_names.main_weight) # pyright: ignore[reportAttributeAccessIssue]
+        self._xf_xaos: tuple[str, ...] = self._out_flame_utils__out_xf_xaos() # pyright: ignore[reportAttributeAccessIssue]
+        
+        self._xf_color: tuple[str, ...] = self._out_flame_utils__out_xf_data(self.flam3h_iter_prm_names.shader_color) # pyright: ignore[reportAttributeAccessIssue]
+        self._xf_symmetry: tuple[str, ...] = self._out_flame_utils__out_xf_data(self.flam3h_iter_prm_names.shader_speed) # pyright: ignore[reportAttributeAccessIssue]
+        self._xf_color_speed: tuple[str, ...] = self._out_flame_utils__out_xf_data_color_speed() # pyright: ignore[reportAttributeAccessIssue]
+        self._xf_opacity: tuple[str, ...] = self._out_flame_utils__out_xf_data(self.flam3h_iter_prm_names.shader_alpha) # pyright: ignore[reportAttributeAccessIssue]
+        
+        self._xf_pre_blur: tuple[str, ...] = self._out_flame_utils__out_xf_pre_blur() # pyright: ignore[reportAttributeAccessIssue]
+        
+        # Each affine collector runs only once, reading from the memoized xforms/iterators parameter's snapshot.
+        xf_preaffine: TA_OUT_Pre_Affine = self._out_flame_utils__out_xf_preaffine() # pyright: ignore[reportAttributeAccessIssue]
+        self._xf_preaffine: tuple[str, ...] = xf_preaffine[0]
+        self._xf_f3h_preaffine: tuple[str, ...] = xf_preaffine[1]
+        self._xf_f3h_preaffine_angle: tuple[str, ...] = xf_preaffine[2]
+        xf_postaffine: TA_OUT_Post_Affine = self._out_flame_utils__out_xf_postaffine() # pyright: ignore[reportAttributeAccessIssue]
+        self._xf_postaffine: tuple[str | list[Never], ...] = xf_postaffine[0]
+        self._xf_f3h_postaffine: tuple[str | list[Never], ...] = xf_postaffine[1]
+        self._xf_f3h_postaffine_angle: tuple[str | list[Never], ...] = xf_postaffine[2]
+        
+        self._finalxf_name: str = self._out_flame_utils__out_finalxf_name() # pyright: ignore[reportAttributeAccessIssue]
+        finalxf_preaffine: TA_OUT_Affine_FF = self._out_flame_utils__out_finalxf_preaffine() # pyright: ignore[reportAttributeAccessIssue]
+        self._finalxf_preaffine: str = finalxf_preaffine[0]
+        self._finalxf_f3h_preaffine: str = finalxf_preaffine[1]
+        self._finalxf_f3h_preaffine_angle: str = finalxf_preaffine[2]
+        finalxf_postaffine: TA_OUT_Affine_FF = self._out_flame_utils__out_finalxf_postaffine() # pyright: ignore[reportAttributeAccessIssue]
+        self._finalxf_postaffine: str = finalxf_postaffine[0]
+        self._finalxf_f3h_postaffine: str = finalxf_postaffine[1]
+        self._finalxf_f3h_postaffine_angle: str = finalxf_postaffine[2]
+        
+        # Variations snapshot, so the XML build do not need to evaluate any of the variation's parameters.
+        self._xf_vars, self._xf_prevars, self._xf_postvars = self._out_flame_utils__out_xf_vars() # pyright: ignore[reportAttributeAccessIssue]
+        self._finalxf_vars, self._finalxf_prevars, self._finalxf_postvars = self._out_flame_utils__out_finalxf_vars() # pyright: ignore[reportAttributeAccessIssue]
+        
+        self._palette_hex: str = self._out_flame_utils__out_palette_hex() # pyright: ignore[reportAttributeAccessIssue]
+
+
+    # CLASS: PROPERTIES
+    ##########################################
+    ##########################################
+
+    @property
+    def xf_name(self) -> tuple[str, ...]:
+        return self._xf_name
+    
+    @property
+    def xf_vactive(self) -> tuple[str, ...]:
+        return self._xf_vactive
+    
+    @property
+    def xf_weight(self) -> tuple[str, ...]:
+        return self._xf_weight
+    
+    @property
+    def xf_xaos(self) -> tuple[str, ...]:
+        return self._xf_xaos
+    
+    @property
+    def xf_pre_blur(self) -> tuple[str, ...]:
+        return self._xf_pre_blur
+    
+    @property
+    def xf_color(self) -> tuple[str, ...]:
+        return self._xf_color
+    
+    @property
+    def xf_symmetry(self) -> tuple[str, ...]:
+        return self._xf_symmetry
+    
+    @property
+    def xf_color_speed(self) -> tuple[str, ...]:
+        return self._xf_color_speed
     
     @property
-    def flame_center(self) -> str:
-        return self._flame_center
+    def xf_opacity(self) -> tuple[str, ...]:
+        return self._xf_opacity
     
     @property
-    def flame_scale(self) -> str:
-        return self._flame_scale
+    def xf_preaffine(self) -> tuple[str, ...]:
+        return self._xf_preaffine
     
     @property
-    def flame_rotate(self) -> str:
-        return self._flame_rotate
+    def xf_f3h_preaffine(self) -> tuple[str, ...]:
+        return self._xf_f3h_preaffine
     
     @property
-    def flame_quality(self) -> str:
-        return self._flame_quality
+    def xf_f3h_preaffine_angle(self) -> tuple[str, ...]:
+        return self._xf_f3h_preaffine_angle
     
     @property
-    def flame_brightness(self) -> str:
-        return self._flame_brightness
+    def xf_postaffine(self) -> tuple[str | list[Never], ...]:
+        return self._xf_postaffine
     
     @property
-    def flame_gamma(self) -> str:
-        return self._flame_gamma
+    def xf_f3h_postaffine(self) -> tuple[str | list[Never], ...]:
+        return self._xf_f3h_postaffine
     
     @property
-    def flame_k2(self) -> str:
-        return self._flame_k2
+    def xf_f3h_postaffine_angle(self) -> tuple[str | list[Never], ...]:
+        return self._xf_f3h_postaffine_angle
     
     @property
-    def flame_vibrancy(self) -> str:
-        return self._flame_vibrancy
+    def finalxf_name(self) -> str:
+        return self._finalxf_name
     
     @property
-    def flame_highlight(self) -> str:
-        return self._flame_highlight
+    def finalxf_preaffine(self) -> str:
+        return self._finalxf_preaffine
     
-    # OUT render curves (Fractorium)
+    @property
+    def finalxf_f3h_preaffine(self) -> str:
+        return self._finalxf_f3h_preaffine
     
     @property
-    def flame_render_curves(self) -> str:
-        return self._flame_render_curves
+    def finalxf_f3h_preaffine_angle(self) -> str:
+        return self._finalxf_f3h_preaffine_angle
     
     @property
-    def flame_overall_curve(self) -> str:
-        return self._flame_overall_curve
+    def finalxf_postaffine(self) -> str:
+        return self._finalxf_postaffine
     
     @property
-    def flame_red_curve(self) -> str:
-        return self._flame_red_curve
+    def finalxf_f3h_postaffine(self) -> str:
+        return self._finalxf_f3h_postaffine
     
     @property
-    def flame_green_curve(self) -> str:
-        return self._flame_green_curve
+    def finalxf_f3h_postaffine_angle(self) -> str:
+        return self._finalxf_f3h_postaffine_angle
     
     @property
-    def flame_blue_curve(self) -> str:
-        return self._flame_blue_curve
+    def xf_vars(self) -> tuple[TA_OUT_Vars_Snapshot, ...]:
+        return self._xf_vars
     
-    # OUT palette mode (Fractorium)
+    @property
+    def xf_prevars(self) -> tuple[TA_OUT_Vars_Snapshot, ...]:
+        return self._xf_prevars
     
     @property
-    def flame_cp_mode(self) -> str:
-        return self._flame_cp_mode
+    def xf_postvars(self) -> tuple[TA_OUT_Vars_Snapshot, ...]:
+        return self._xf_postvars
     
-    # custom to FLAM3H™ only
+    @property
+    def finalxf_vars(self) -> TA_OUT_Vars_Snapshot:
+        return self._finalxf_vars
     
     @property
-    def flam3h_sys_rip(self) -> str:
-        return self._flam3h_sys_rip
+    def finalxf_prevars(self) -> TA_OUT_Vars_Snapshot:
+        return self._finalxf_prevars
     
     @property
-    def flam3h_cp_hsv(self) -> str | bool:
-        return self._flam3h_cp_hsv
+    def finalxf_postvars(self) -> TA_OUT_Vars_Snapshot:
+        return self._finalxf_postvars
     
     @property
-    def flam3h_mb_fps(self) -> str | bool:
-        return self._flam3h_mb_fps
+    def palette_hex(self) -> str:
+        return self._palette_hex
+
+
+# FLAME LIBRARY BATCH CONVERTER start here
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+##########################################
+
+
+class flam3h_library_converter:
+    """
+class flam3h_library_converter
+
+@STATICMETHODS
+* xform_remap_prm_names(xform: lxmlET._Element) -> list[str]:
+* xform_remap_pgb(xform: lxmlET._Element, pgb_name: str) -> bool:
+* xforms_vars_missing(xforms: list[lxmlET._Element]) -> list[str]:
+* flame_palette_normalize(flame: lxmlET._Element, palette_plus: bool = True) -> dict[str, Any]:
+* flame_normalize(flame: lxmlET._Element, palette_plus: bool = True) -> dict[str, Any]:
+* xmlfile_convert(xmlfile: str, out_dir: str, palette_plus: bool = True) -> dict[str, Any]:
+* xmlfile_convert_failed(xmlfile: str, e: BaseException) -> dict[str, Any]:
+* xmlfiles_collect(in_dir: str) -> list[str]:
+
+@METHODS
+* convert(self) -> dict[str, Any]:
+
+    """
+    
+    REPORT_FILE_NAME: Final = 'FLAM3H_convert_report.json'
+    
+    __slots__ = ("_in_dir", "_out_dir", "_report_file", "_palette_plus", "_max_workers")
+    
+    def __init__(self, in_dir: str, out_dir: str, report_file: str | None = None, palette_plus: bool = True, max_workers: int | None = None) -> None:
+        """Headless batch converter of flame library files into FLAM3H™ compatible flame library files.</br>
+        Every flame preset get the same fixups FLAM3H™ does when loading it in, so the converted libraries load as they are</br>
+        and a JSON report collect, for each flame preset, what has been changed and what FLAM3H™ can not load.</br></br>
+        
+        * Fractorium parametric parameters names are remapped to the Apophysis ones: in_flame_utils.in_prm_name_exceptions(...)
+        * A "pre_gaussian_blur" first in the list of PRE variations is remapped back to "pre_blur"
+        * The palette is resampled to 256 colors, or to the closest palette 256+ colors count, and written out in the FLAM3H™ palette layout.
+        * Missing and unknown variations are collected into the report.
+        
+        No FLAM3H™ node is used so it can run from hython or a render node without a UI.</br>
+        The flame library files are converted in parallel across a process pool when not inside a Houdini UI session.</br>
+
+        Args:
+            (self):
+            in_dir(str): The directory with the flame library files to convert.
+            out_dir(str): The directory to write the converted flame library files into. It must not be the same as: in_dir
+            report_file(str | None): Default to: None</br>The JSON report full file path. If None, it will be written into the out_dir as: flam3h_library_converter.REPORT_FILE_NAME
+            palette_plus(bool): Default to: True</br>Keep the palettes with more than 256 colors (up to 1024) or resample them all to 256 colors.
+            max_workers(int | None): Default to: None</br>The number of worker processes. If None, the number of CPUs is used. 1(One) will convert the flame library files one after the other.
+        """
+        self._in_dir: str = in_dir
+        self._out_dir: str = out_dir
+        self._report_file: str = report_file if report_file is not None else os.path.join(out_dir, self.REPORT_FILE_NAME)
+        self._palette_plus: bool = palette_plus
+        self._max_workers: int | None = max_workers
+        
+        
+    @staticmethod
+    def xform_remap_prm_names(xform: lxmlET._Element) -> list[str]:
+        """Rename the Fractorium parametric parameters names of an xform into the Apophysis ones FLAM3H™ use.</br>
+        The exceptions are the ones in: VARS_FRACTORIUM_PRM_EXCEPTIONS, also used by: in_flame_utils.in_prm_name_exceptions(...)</br>
+        The XML keys are matched case insensitive as Fractorium can write them out in mixed case, for example: Mobius_Re_A</br>
+
+        Args:
+            xform(lxmlET._Element): The xform or finalxform to remap.
+
+        Returns:
+            (list[str]): The remapped variations names if any.
+        """
+        remapped: list[str] = []
+        attrib = xform.attrib
+        # lower case key -> the key as it is in the XML
+        keys: dict[str, str] = {str(key).lower(): str(key) for key in attrib.keys()}
+        for v_type in VARS_FRACTORIUM_PRM_EXCEPTIONS:
+            
+            names: list[tuple[str, str]] = [(frac.lower(), apo.lower()) for frac_names, apo_names in zip(VARS_FRACTORIUM_PRM_FROM_IDX[v_type][1:-1], VARS_APO_PRM_FROM_IDX[v_type][1:-1]) for frac, apo in zip(frac_names, apo_names)]
+            for func in (in_flame_utils.in_util_make_NULL, in_flame_utils.in_util_make_PRE, in_flame_utils.in_util_make_POST):
+                
+                done: bool = False
+                for frac, apo in names:
+                    frac_key: str = str(func(frac))
+                    key: str | None = keys.get(frac_key)
+                    if key is not None and frac_key != (apo_key := str(func(apo))):
+                        attrib[apo_key] = attrib.pop(key)
+                        del keys[frac_key]
+                        keys[apo_key] = apo_key
+                        done = True
+                        
+                if done: remapped.append(str(func(VARS_FLAM3_NAME_FROM_IDX[v_type])))
+                
+        return remapped
+    
+    
+    @staticmethod
+    def xform_remap_pgb(xform: lxmlET._Element, pgb_name: str) -> bool:
+        """Remap a "pre_gaussian_blur" back to "pre_blur" if it is the first one in the list of PRE variations of an xform,</br>
+        the same as FLAM3H™ does when loading a flame preset in so we do not loose a PRE variation's slot.</br>
+        The XML keys are matched case insensitive.</br>
+
+        Args:
+            xform(lxmlET._Element): The xform to remap.
+            pgb_name(str): The name of the "pre_gaussian_blur" variation to check against.
+
+        Returns:
+            (bool): True if it has been remapped and False if not.
+        """
+        attrib = xform.attrib
+        # lower case key -> the key as it is in the XML
+        keys: dict[str, str] = {str(key).lower(): str(key) for key in attrib.keys()}
+        if xml_keys.XML_XF_PB not in keys:
+            vars_pre: TA_STR_ListUnflattened | None = in_flame_utils.in_get_xforms_var_keys((dict.fromkeys(keys),), VARS_FLAM3_KEYS_PRE, XML_XF_KEY_EXCLUDE)
+            if vars_pre is not None and vars_pre[0] and vars_pre[0][0] == pgb_name:
+                attrib[xml_keys.XML_XF_PB] = attrib.pop(keys[pgb_name])
+                return True
+            
+        return False
+    
+    
+    @staticmethod
+    def xforms_vars_missing(xforms: list[lxmlET._Element]) -> list[str]:
+        """Collect the variations Fractorium has but FLAM3H™ lacks, used by the xforms.</br>
+        Those variations will be classified as: Missing</br>
+
+        Args:
+            xforms(list[lxmlET._Element]): The xforms and finalxform of a flame preset.
+
+        Returns:
+            (list[str]): The unique missing variations sorted alphatically if any.
+        """
+        missing: set[str] = set()
+        for xform in xforms:
+            for key in xform.keys():
+                
+                if key in XML_XF_KEY_EXCLUDE:
+                    continue
+                
+                name: str = key.lower()
+                if name.startswith((xml_keys.DEFAULT_VAR_PRE_PRX, xml_keys.DEFAULT_VAR_POST_PRX)):
+                    name = str(in_flame_utils.in_util_make_VAR(name))
+                    
+                if name and name not in VARS_FLAM3_DICT_IDX and name in VARS_FRACTORIUM_DICT.get(name[0], ()):
+                    missing.add(key.capitalize())
+                    
+        return sorted(missing)
+    
+    
+    @staticmethod
+    def flame_palette_normalize(flame: lxmlET._Element, palette_plus: bool = True) -> dict[str, Any]:
+        """Rewrite the palette of a flame preset the way FLAM3H™ would save it out after loading it in.</br>
+        The palette colors are resampled to 256 colors, or when palette_plus is True, to the closest palette 256+ colors count: f3h_tabs.CP.DEFAULT_MENU_OPTIONS_PLUS</br>
+        clamped at 1024 colors, and written out 8 HEX colors per line.</br>
+
+        Args:
+            flame(lxmlET._Element): The flame preset to normalize.
+            palette_plus(bool): Default to: True</br>Keep the palettes with more than 256 colors or resample them all to 256 colors.
+
+        Returns:
+            (dict[str, Any]): The palette report: colors count in and out and if it has been resampled. An "error" key is set instead if the palette can not be read.
+        """
+        palette: lxmlET._Element | None = flame.find(xml_keys.XML_PALETTE)
+        if palette is None or not palette.text:
+            return {'error': 'Palette not found.'}
+        
+        # The same way: in_flame.__get_palette(...) read it
+        rgb: NDArray[np_float32] | None = flame_model.palette_decode(palette.text, 'Invalid hex values in the Flame palette.')
+        if rgb is None:
+            return {'error': 'Invalid hex values in the Flame palette.'}
+        
+        count: int = len(rgb)
+        if count <= 256 or not palette_plus:
+            count_out: int = int(f3h_tabs.CP.DEFAULT_COUNT_256)
+        elif count <= 1024:
+            count_out: int = int(flam3h_palette_utils.find_nearest_idx(f3h_tabs.CP.DEFAULT_MENU_OPTIONS_PLUS, count))
+        else:
+            count_out: int = int(f3h_tabs.CP.DEFAULT_COUNT_1024)
+            
+        rgb_out: NDArray[np_float64] = rgb.astype(np_float64)
+        if count != count_out:
+            if count > 1:
+                # Same ramp keys positions as: in_flame.__get_palette(...) and same lookup positions as: out_flame_utils.__out_palette_hex(...)
+                keys: list[int | float] = list(it_islice(it_count(0, 1.0/(count-1)), count))
+                POSs: list[int | float] = list(it_islice(it_count(0, 1.0/(count_out-1)), count_out))
+                rgb_out = np_array([np_interp(POSs, keys, rgb_out[:, c]) for c in range(3)], dtype=np_float64).T
+            else:
+                rgb_out = np_resize(rgb_out, (count_out, 3))
+                
+        HEXs: str = flam3h_palette_utils.rgb_to_hex_array(rgb_out)
+        n: int = 8 * 6 # 8 HEX colors per line, 6 characters each
+        hex_join: list[str] = [f"      {HEXs[i:i + n]}\n" for i in range(0, len(HEXs), n)] # 6 times \s
+        
+        palette.text = f"\n{''.join(hex_join)}    " # 4 times \s
+        palette.set(xml_keys.XML_PALETTE_COUNT, str(count_out))
+        palette.set(xml_keys.XML_PALETTE_FORMAT, f3h_tabs.CP.DEFAULT_MSG_COLOR_FORMAT)
+        
+        return {'count': count, 'count_out': count_out, 'resampled': count != count_out}
+    
+    
+    @staticmethod
+    def flame_normalize(flame: lxmlET._Element, palette_plus: bool = True) -> dict[str, Any]:
+        """Apply all the FLAM3H™ fixups to a flame preset, in place.</br>
+
+        Args:
+            flame(lxmlET._Element): The flame preset to normalize.
+            palette_plus(bool): Default to: True</br>Keep the palettes with more than 256 colors or resample them all to 256 colors.
+
+        Returns:
+            (dict[str, Any]): The flame preset report.
+        """
+        # if the app XML key is missing, set it to start with the Fractorium prefix the same as: in_flame_utils.in_prm_name_exceptions(...)
+        app: str = str(flame.get(xml_keys.XML_VERSION, f"{xml_keys.XML_APP_NAME_FRACTORIUM}-NOT-FOUND")).upper()
+        xforms: list[lxmlET._Element] = list(flame.iter(xml_keys.XML_XF))
+        finalxforms: list[lxmlET._Element] = list(flame.iter(xml_keys.XML_FF))
+        
+        # Only flames coming from Fractorium (or saved out from FLAM3H™ using the Fractorium parametric names) use the exceptions names
+        prm_remapped: list[str] = []
+        if app.startswith(xml_keys.XML_APP_NAME_FRACTORIUM):
+            for xform in xforms + finalxforms:
+                prm_remapped += flam3h_library_converter.xform_remap_prm_names(xform)
+            # The parametric names are now the Apophysis ones, so FLAM3H™ must not look for the Fractorium ones when loading it in.
+            if prm_remapped:
+                flame.set(xml_keys.XML_VERSION, f'{xml_keys.XML_APP_NAME_FLAM3H}-{flam3h_general_utils.my_system()}-{__version__}')
+        
+        pgb_name: str = VARS_FLAM3_NAME_PRE[VARS_FLAM3_NAME_FROM_IDX[33]]
+        pgb_remapped: int = sum(flam3h_library_converter.xform_remap_pgb(xform, pgb_name) for xform in xforms)
+        
+        return {'name': flame.get(xml_keys.XML_XF_NAME, ''),
+                'app': app,
+                'iterators': len(xforms),
+                'ff': bool(finalxforms),
+                'prm_remapped': sorted(set(prm_remapped)),
+                'pgb_remapped': pgb_remapped,
+                'vars_missing': flam3h_library_converter.xforms_vars_missing(xforms + finalxforms),
+                'vars_unknown': in_flame_utils.in_load_stats_unknown_vars_from_plugins(flame.get(xml_keys.XML_PLUGINS, [])),
+                'palette': flam3h_library_converter.flame_palette_normalize(flame, palette_plus)
+                }
+    
+    
+    @staticmethod
+    def xmlfile_convert(xmlfile: str, out_dir: str, palette_plus: bool = True) -> dict[str, Any]:
+        """Convert a flame library file into a FLAM3H™ compatible flame library file, written into out_dir with the same file name.</br>
+        This is what each worker process run, so it only take and return picklable data.</br>
+
+        Args:
+            xmlfile(str): The flame library file full path.
+            out_dir(str): The directory to write the converted flame library file into.
+            palette_plus(bool): Default to: True</br>Keep the palettes with more than 256 colors or resample them all to 256 colors.
+
+        Returns:
+            (dict[str, Any]): The flame library file report. An "error" key is set if the flame library file could not be converted.
+        """
+        report: dict[str, Any] = {'file': xmlfile, 'out': None, 'flames': []}
+        try:
+            tree: lxmlET._ElementTree = lxmlET.parse(xmlfile)
+            
+        except (OSError, lxmlET.XMLSyntaxError) as e:
+            report['error'] = str(e)
+            return report
+        
+        root: lxmlET._Element = tree.getroot()
+        if xml_keys.XML_ROOT not in str(root.tag).lower():
+            report['error'] = 'Not a valid flame library file.' if xml_keys.XML_ROOT_CHAOS not in str(root.tag).lower() else 'Chaotica flame library files are not supported.'
+            return report
+        
+        flames: list[lxmlET._Element] = list(root.iter(xml_keys.XML_NAME))
+        if not flames:
+            report['error'] = 'No flame presets found.'
+            return report
+        
+        for flame in flames:
+            try:
+                report['flames'].append(flam3h_library_converter.flame_normalize(flame, palette_plus))
+            except (ValueError, KeyError, IndexError) as e:
+                report['flames'].append({'name': flame.get(xml_keys.XML_XF_NAME, ''), 'error': str(e)})
+        
+        outpath: str = os.path.join(out_dir, os.path.basename(xmlfile))
+        try:
+            out_flame_utils._out_pretty_print(root)
+            tree.write(outpath)
+            
+        except OSError as e:
+            report['error'] = str(e)
+            return report
+        
+        report['out'] = outpath
+        return report
+    
+    
+    @staticmethod
+    def xmlfile_convert_failed(xmlfile: str, e: BaseException) -> dict[str, Any]:
+        """The flame library file report for when its conversion failed with an unexpected error,</br>
+        so a single malformed flame library file do not abort the whole batch.</br>
+
+        Args:
+            xmlfile(str): The flame library file full path.
+            e(BaseException): The error the conversion failed with.
+
+        Returns:
+            (dict[str, Any]): The flame library file report with the "error" key set.
+        """
+        return {'file': xmlfile, 'out': None, 'flames': [], 'error': f"{type(e).__name__}: {e}"}
+    
+    
+    @staticmethod
+    def xmlfiles_collect(in_dir: str) -> list[str]:
+        """Collect all the flame library files inside a directory, not recursive.</br>
+
+        Args:
+            in_dir(str): The directory to look into.
+
+        Returns:
+            (list[str]): The flame library files full paths sorted alphabetically.
+        """
+        try:
+            entries: list[os.DirEntry] = list(os.scandir(in_dir))
+        except OSError:
+            return []
+        
+        return sorted(e.path for e in entries if e.is_file() and os.path.splitext(e.name)[-1].lower() in (".flame", ".xml"))
+    
+    
+    # CLASS: PROPERTIES
+    ##########################################
+    ##########################################
     
     @property
-    def flam3h_mb_samples(self) -> str | bool:
-        return self._flam3h_mb_samples
+    def in_dir(self) -> str:
+        return self._in_dir
     
     @property
-    def flam3h_mb_shutter(self) -> str | bool:
-        return self._flam3h_mb_shutter
+    def out_dir(self) -> str:
+        return self._out_dir
     
     @property
-    def flam3h_cp_samples(self) -> str | bool:
-        return self._flam3h_cp_samples
+    def report_file(self) -> str:
+        return self._report_file
     
     @property
-    def flam3h_cp_basis(self) -> str | bool:
-        return self._flam3h_cp_basis
+    def palette_plus(self) -> bool:
+        return self._palette_plus
     
     @property
-    def flam3h_prefs_f3c(self) -> str:
-        return self._flam3h_prefs_f3c
+    def max_workers(self) -> int | None:
+        return self._max_workers
+    
+    
+    def convert(self) -> dict[str, Any]:
+        """Convert all the flame library files inside: self.in_dir and write the JSON report out.</br>
+        The flame library files are converted across a process pool unless inside a Houdini UI session or self.max_workers is 1(One).</br>
+        If the process pool can not be used or it break, the flame library files not converted yet will be converted one after the other.</br>
+        A flame library file failing to convert is recorded into the report with its error and the others are converted anyway.</br>
 
+        Args:
+            (self):
 
-# OUT FLAME XFORMS DATA start here
+        Returns:
+            (dict[str, Any]): The full report, also written out into: self.report_file
+        """
+        xmlfiles: list[str] = self.xmlfiles_collect(self.in_dir)
+        report: dict[str, Any] = {'in_dir': self.in_dir, 'out_dir': self.out_dir, 'palette_plus': self.palette_plus, 'files': []}
+        
+        if os.path.realpath(self.in_dir) == os.path.realpath(self.out_dir):
+            report['error'] = 'The output directory must not be the same as the input directory.'
+            return report
+        
+        os.makedirs(self.out_dir, exist_ok=True)
+        
+        converted: list[dict[str, Any] | None] = [None] * len(xmlfiles)
+        if len(xmlfiles) > 1 and self.max_workers != 1 and (not __houdini__ or not hou.isUIAvailable()):
+            try:
+                with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                    futures: list[Future] = [pool.submit(self.xmlfile_convert, xmlfile, self.out_dir, self.palette_plus) for xmlfile in xmlfiles]
+                    for idx, future in enumerate(futures):
+                        try:
+                            converted[idx] = future.result()
+                        except BrokenProcessPool:
+                            # Left to be converted one after the other
+                            pass
+                        except Exception as e:
+                            converted[idx] = self.xmlfile_convert_failed(xmlfiles[idx], e)
+                            
+                if any(file is None for file in converted):
+                    print("Warning:\nFLAM3H™ library converter: the process pool broke, converting the remaining files one after the other.\n")
+                    
+            except (OSError, RuntimeError) as e:
+                # No processes available or the pool broke while submitting, lets convert them one after the other
+                print(f"Warning:\nFLAM3H™ library converter: the process pool failed ({e}), converting one file after the other.\n")
+                
+        for idx, file in enumerate(converted):
+            if file is None:
+                try:
+                    converted[idx] = self.xmlfile_convert(xmlfiles[idx], self.out_dir, self.palette_plus)
+                except Exception as e:
+                    converted[idx] = self.xmlfile_convert_failed(xmlfiles[idx], e)
+        
+        files: list[dict[str, Any]] = [file for file in converted if file is not None]
+        report['files'] = files
+        
+        # Totals
+        flames: list[dict[str, Any]] = [f for file in files for f in file['flames']]
+        vars_missing: dict[str, int] = {}
+        vars_unknown: dict[str, int] = {}
+        for f in flames:
+            for var in f.get('vars_missing', ()): vars_missing[var] = vars_missing.get(var, 0) + 1
+            for var in f.get('vars_unknown', ()): vars_unknown[var] = vars_unknown.get(var, 0) + 1
+            
+        report['totals'] = {'files': len(files),
+                            'files_failed': sum(1 for file in files if 'error' in file),
+                            'flames': len(flames),
+                            'flames_failed': sum(1 for f in flames if 'error' in f),
+                            'prm_remapped': sum(1 for f in flames if f.get('prm_remapped')),
+                            'pgb_remapped': sum(f.get('pgb_remapped', 0) for f in flames),
+                            'palettes_resampled': sum(1 for f in flames if f.get('palette', {}).get('resampled')),
+                            'palettes_plus': sum(1 for f in flames if f.get('palette', {}).get('count_out', 0) > 256),
+                            'vars_missing': dict(sorted(vars_missing.items())),
+                            'vars_unknown': dict(sorted(vars_unknown.items()))
+                            }
+        
+        try:
+            with open(self.report_file, 'w') as w:
+                json.dump(report, w, indent=4)
+                
+        except OSError as e:
+            print(f"Warning:\nFLAM3H™ library converter: could not write the report file: {self.report_file}\n{e}\n")
+        
+        return report
+
+
+# FLAME LIBRARY CATALOG start here
 ##########################################
 ##########################################
 ##########################################
@@ -23727,155 +28017,493 @@ class out_flame_render_properties(out_flame_utils):
 ##########################################
 
 
-class out_flame_xforms_data(out_flame_utils):
+class flam3h_library_catalog:
+    """
+class flam3h_library_catalog
+
+@STATICMETHODS
+* default_cache_file() -> str:
+* add_dir(in_dir: str) -> None:
+* shared() -> flam3h_library_catalog:
+* flame_stats(flame: lxmlET._Element) -> dict[str, Any]:
+* flames_stats(data: bytes) -> list[dict[str, Any]] | None:
+
+@METHODS
+* load(self) -> bool:
+* save(self) -> bool:
+* index(self, xmlfile: str) -> list[dict[str, Any]] | None:
+* index_queued(self) -> None:
+* start(self, xmlfiles: Iterable[str]) -> bool:
+* start_dir(self, in_dir: str) -> bool:
+* wait(self, timeout: float | None = None) -> bool:
+* stop(self) -> None:
+* query(self, 
+        vars: Iterable[str] = (), 
+        min_iterators: int | None = None, 
+        max_iterators: int | None = None, 
+        ff: bool | None = None, 
+        missing: bool | None = None, 
+        unknown: bool | None = None, 
+        xmlfiles: Iterable[str] | None = None
+        ) -> list[tuple[str, int, str]]:
+
     """
-    Args:
-        out_flame_utils ([class]): [inherit properties methods from the out_flame_utils class]
-    """  
     
-    __slots__ = ("_xf_name", "_xf_vactive", "_xf_weight", "_xf_xaos", 
-                 "_xf_color", "_xf_symmetry", "_xf_color_speed", "_xf_opacity", 
-                 "_xf_pre_blur", 
-                 "_xf_preaffine", "_xf_f3h_preaffine", "_xf_f3h_preaffine_angle", "_xf_postaffine", "_xf_f3h_postaffine", "_xf_f3h_postaffine_angle", 
-                 "_finalxf_name", "_finalxf_preaffine", "_finalxf_f3h_preaffine", "_finalxf_f3h_preaffine_angle", "_finalxf_postaffine", "_finalxf_f3h_postaffine", "_finalxf_f3h_postaffine_angle", 
-                 "_palette_hex",)
+    CACHE_FILE_NAME: Final = 'FLAM3H_library_catalog.json'
+    CACHE_VERSION: Final = 2
+    # The catalog shared by all the FLAM3H™ nodes in this session: flam3h_library_catalog.shared()
+    SHARED: flam3h_library_catalog | None = None
+    # The folders of the flame files selected in the IN tab, waiting for the shared catalog to be asked for: flam3h_library_catalog.add_dir(...)
+    DIRS: list[str] = []
     
-    def __init__(self, kwargs: dict[str, Any]) -> None:
-        """
-        Args:
-            kwargs(dict[str, Any]): this FLAM3H™ node houdini kwargs.
-            
-        Returns:
-            (None):
-        """ 
-        super().__init__(kwargs)
-        
-        # FLAM3 data
-        self._xf_name: tuple[str, ...] = self._out_flame_utils__out_xf_name() # pyright: ignore[reportAttributeAccessIssue]
-        self._xf_vactive: tuple[str, ...] = self._out_flame_utils__out_xf_data(self.flam3h_iter_prm_names.main_vactive) # pyright: ignore[reportAttributeAccessIssue]
-        self._xf_weight: tuple[str, ...] = self._out_flame_utils__out_xf_data(self.flam3h_iter_prm_names.main_weight) # pyright: ignore[reportAttributeAccessIssue]
-        self._xf_xaos: tuple[str, ...] = self._out_flame_utils__out_xf_xaos() # pyright: ignore[reportAttributeAccessIssue]
+    __slots__ = ("_cache_file", "_files", "_paths", "_dirty", "_lock", "_stop", "_thread", "_queue", "_active")
+    
+    def __init__(self, cache_file: str) -> None:
+        """Catalog of the flame presets stats for entire flame library files: iterators count, variations used, missing and unknown variations,</br>
+        palette colors count and FF, post affine, xaos and pre_blur usage. The same stats the IN tab show for the loaded flame preset only.</br></br>
         
-        self._xf_color: tuple[str, ...] = self._out_flame_utils__out_xf_data(self.flam3h_iter_prm_names.shader_color) # pyright: ignore[reportAttributeAccessIssue]
-        self._xf_symmetry: tuple[str, ...] = self._out_flame_utils__out_xf_data(self.flam3h_iter_prm_names.shader_speed) # pyright: ignore[reportAttributeAccessIssue]
-        self._xf_color_speed: tuple[str, ...] = self._out_flame_utils__out_xf_data_color_speed() # pyright: ignore[reportAttributeAccessIssue]
-        self._xf_opacity: tuple[str, ...] = self._out_flame_utils__out_xf_data(self.flam3h_iter_prm_names.shader_alpha) # pyright: ignore[reportAttributeAccessIssue]
+        The flame library files are indexed in a worker thread and the stats persist into a JSON cache file keyed by the flame library file digest,</br>
+        so a flame library file is indexed again only if its content changed, no matter where it has been moved or copied to.</br>
+        No FLAM3H™ node and no Houdini types are used so it can safely run outside the main thread.</br>
         
-        self._xf_pre_blur: tuple[str, ...] = self._out_flame_utils__out_xf_pre_blur() # pyright: ignore[reportAttributeAccessIssue]
+        Once indexed, the flame presets can be queried, for example: all the flame presets using "julian" with 10 or less iterators and no unknown variations:</br>
+        catalog.query(vars=('julian',), max_iterators=10, unknown=False)</br></br>
         
-        self._xf_preaffine: tuple[str, ...] = self._out_flame_utils__out_xf_preaffine()[0] # pyright: ignore[reportAttributeAccessIssue]
-        self._xf_f3h_preaffine: tuple[str, ...] = self._out_flame_utils__out_xf_preaffine()[1] # pyright: ignore[reportAttributeAccessIssue]
-        self._xf_f3h_preaffine_angle: tuple[str, ...] = self._out_flame_utils__out_xf_preaffine()[2] # pyright: ignore[reportAttributeAccessIssue]
-        self._xf_postaffine: tuple[str, ...] = self._out_flame_utils__out_xf_postaffine()[0] # pyright: ignore[reportAttributeAccessIssue]
-        self._xf_f3h_postaffine: tuple[str | list[Never], ...] = self._out_flame_utils__out_xf_postaffine()[1] # pyright: ignore[reportAttributeAccessIssue]
-        self._xf_f3h_postaffine_angle: tuple[str | list[Never], ...] = self._out_flame_utils__out_xf_postaffine()[2] # pyright: ignore[reportAttributeAccessIssue]
+        Inside Houdini, the folder of every flame file selected in the IN tab: flam3h_general_utils.flam3h_init_presets_IN_PRESETS(...) is only remembered.</br>
+        They are indexed by the catalog shared by all the FLAM3H™ nodes: flam3h_library_catalog.shared() once it is asked for, like from the Python shell:</br>
+        hou.phm().flam3.flam3h_library_catalog.shared().query(vars=('julian',), max_iterators=10, unknown=False)
+
+        Args:
+            (self):
+            cache_file(str): The JSON cache file full path. It is loaded if it exist.
+        """
+        self._cache_file: str = cache_file
+        # flame library file digest -> flame presets stats
+        self._files: dict[str, list[dict[str, Any]]] = {}
+        # flame library file realpath -> (mtime in nanoseconds, size in bytes, digest)
+        self._paths: dict[str, tuple[int, int, str]] = {}
+        self._dirty: bool = False
+        self._lock: Lock = Lock()
+        self._stop: Event = Event()
+        self._thread: Thread | None = None
+        # The flame library files waiting to be indexed by the worker thread and if it is running.
+        self._queue: deque[str] = deque()
+        self._active: bool = False
+        self.load()
         
-        self._finalxf_name: str = self._out_flame_utils__out_finalxf_name() # pyright: ignore[reportAttributeAccessIssue]
-        self._finalxf_preaffine: str = self._out_flame_utils__out_finalxf_preaffine()[0] # pyright: ignore[reportAttributeAccessIssue]
-        self._finalxf_f3h_preaffine: str = self._out_flame_utils__out_finalxf_preaffine()[1] # pyright: ignore[reportAttributeAccessIssue]
-        self._finalxf_f3h_preaffine_angle: str = self._out_flame_utils__out_finalxf_preaffine()[2] # pyright: ignore[reportAttributeAccessIssue]
-        self._finalxf_postaffine: str = self._out_flame_utils__out_finalxf_postaffine()[0] # pyright: ignore[reportAttributeAccessIssue]
-        self._finalxf_f3h_postaffine: str = self._out_flame_utils__out_finalxf_postaffine()[1] # pyright: ignore[reportAttributeAccessIssue]
-        self._finalxf_f3h_postaffine_angle: str = self._out_flame_utils__out_finalxf_postaffine()[2] # pyright: ignore[reportAttributeAccessIssue]
         
-        self._palette_hex: str = self._out_flame_utils__out_palette_hex() # pyright: ignore[reportAttributeAccessIssue]
+    @staticmethod
+    def default_cache_file() -> str:
+        """Get the default JSON cache file full path, inside the Houdini user preference directory: $HOUDINI_USER_PREF_DIR</br>
+        Outside Houdini, the HOUDINI_USER_PREF_DIR environment variable is used if set, otherwise the user home directory.</br>
 
+        Returns:
+            (str): The default JSON cache file full path.
+        """
+        if __houdini__:
+            pref_dir: str = hou.homeHoudiniDirectory() # pyright: ignore[reportAttributeAccessIssue]  # Houdini HOM API
+        else:
+            pref_dir: str = os.environ.get('HOUDINI_USER_PREF_DIR') or os.path.expanduser('~')
+        return os.path.join(pref_dir, flam3h_library_catalog.CACHE_FILE_NAME)
+    
+    
+    @staticmethod
+    def add_dir(in_dir: str) -> None:
+        """Remember a folder with flame library files to be indexed by the shared catalog once it is asked for: flam3h_library_catalog.shared()</br>
+        Nothing is read or written here, so it is cheap enough to run every time a flame file is selected in the IN tab.</br>
 
-    # CLASS: PROPERTIES
-    ##########################################
-    ##########################################
+        Args:
+            in_dir(str): The directory with the flame library files to index.
 
-    @property
-    def xf_name(self) -> tuple[str, ...]:
-        return self._xf_name
+        Returns:
+            (None):
+        """
+        if in_dir not in flam3h_library_catalog.DIRS:
+            flam3h_library_catalog.DIRS.append(in_dir)
     
-    @property
-    def xf_vactive(self) -> tuple[str, ...]:
-        return self._xf_vactive
     
-    @property
-    def xf_weight(self) -> tuple[str, ...]:
-        return self._xf_weight
+    @staticmethod
+    def shared() -> flam3h_library_catalog:
+        """Get the catalog shared by all the FLAM3H™ nodes in this session, created the first time it is asked for</br>
+        out of the default JSON cache file: flam3h_library_catalog.default_cache_file()</br>
+        The folders remembered since it was last asked for: flam3h_library_catalog.add_dir(...) are queued to be indexed in its worker thread.</br>
+
+        Returns:
+            (flam3h_library_catalog): The shared catalog.
+        """
+        if flam3h_library_catalog.SHARED is None:
+            flam3h_library_catalog.SHARED = flam3h_library_catalog(flam3h_library_catalog.default_cache_file())
+        for in_dir in flam3h_library_catalog.DIRS:
+            flam3h_library_catalog.SHARED.start_dir(in_dir)
+        flam3h_library_catalog.DIRS.clear()
+        return flam3h_library_catalog.SHARED
     
-    @property
-    def xf_xaos(self) -> tuple[str, ...]:
-        return self._xf_xaos
     
-    @property
-    def xf_pre_blur(self) -> tuple[str, ...]:
-        return self._xf_pre_blur
+    @staticmethod
+    def flame_stats(flame: lxmlET._Element) -> dict[str, Any]:
+        """Collect the stats of a flame preset the same way the IN tab does when loading it in: in_flame_utils.in_load_stats_msg(...)</br>
+
+        Args:
+            flame(lxmlET._Element): The flame preset XML element.
+
+        Returns:
+            (dict[str, Any]): The flame preset stats.
+        """
+        _lower: Callable[[str], str] = str.lower
+        # The same way: in_flame.__get_xforms(...) collect them
+        xforms: tuple[dict, ...] = tuple(dict(zip([_lower(x) for x in xf.keys()], xf.values())) for xf in flame.iter(xml_keys.XML_XF))
+        finalxform: tuple[dict, ...] | None = tuple(dict(zip([_lower(x) for x in xf.keys()], xf.values())) for xf in flame.iter(xml_keys.XML_FF)) or None
+        
+        # The same way: in_flame.__get_xforms_data(...) remap "pre_gaussian_blur" back to "pre_blur" if it is the first one in the list of PRE variations.
+        pgb_name: str = VARS_FLAM3_NAME_PRE[VARS_FLAM3_NAME_FROM_IDX[33]]
+        pb_bool: bool = False
+        for xform in xforms:
+            keyval: str | None = xform.get(xml_keys.XML_XF_PB)
+            if keyval is None and xform.get(pgb_name) is not None:
+                xform_vars_pre: TA_STR_ListUnflattened | None = in_flame_utils.in_get_xforms_var_keys((xform,), VARS_FLAM3_KEYS_PRE, XML_XF_KEY_EXCLUDE)
+                if xform_vars_pre is not None and xform_vars_pre[0] and pgb_name in xform_vars_pre[0][0]:
+                    keyval = xform.get(pgb_name)
+            if keyval is not None and float(in_flame.xf_val_cleanup_str(keyval)):
+                pb_bool = True
+                break
+            
+        vars_used: list[str] = in_flame_utils.in_load_collect_vars_from_xforms(xforms, finalxform, pb_bool, pgb_name)
+        
+        palette_count: int = 0
+        palette_error: str | None = None
+        palette: lxmlET._Element | None = flame.find(xml_keys.XML_PALETTE)
+        if palette is not None and palette.text:
+            # Silently, as this run in a worker thread: the error is kept into the stats instead.
+            rgb: NDArray[np_float32] | None = flame_model.palette_decode(palette.text, verbose=False)
+            if rgb is not None: palette_count = len(rgb)
+            else: palette_error = 'Invalid hex values in the Flame palette.'
+        
+        name: str | None = flame.get(xml_keys.XML_XF_NAME)
+        return {'name': name.strip() if name is not None and len(name) else '[]',
+                'app': str(flame.get(xml_keys.XML_VERSION, '')),
+                'iterators': len(xforms),
+                'ff': finalxform is not None,
+                'post': any(xml_keys.XML_POST_AFFINE in xform for xform in xforms),
+                'ff_post': finalxform is not None and any(xml_keys.XML_POST_AFFINE in xform for xform in finalxform),
+                'xaos': any(xml_keys.XML_XF_XAOS in xform for xform in xforms),
+                'pre_blur': pb_bool,
+                'palette': palette_count,
+                'palette_error': palette_error,
+                'vars': vars_used,
+                'vars_missing': in_flame_utils.in_load_collect_vars_missing_from_xforms(xforms, finalxform, vars_used, pgb_name),
+                'vars_unknown': in_flame_utils.in_load_stats_unknown_vars_from_plugins(flame.get(xml_keys.XML_PLUGINS, []))
+                }
+        
+        
+    @staticmethod
+    def flames_stats(data: bytes) -> list[dict[str, Any]] | None:
+        """Collect the stats of all the flame presets inside a flame library file.</br>
+
+        Args:
+            data(bytes): The flame library file content.
+
+        Returns:
+            (list[dict[str, Any]] | None): The stats of each flame preset, in the same order they are inside the flame library file, or None if it is not a valid flame library file.
+        """
+        try:
+            root: lxmlET._Element = lxmlET.fromstring(data)
+            
+        except (lxmlET.XMLSyntaxError, ValueError):
+            return None
+        
+        if xml_keys.XML_ROOT not in str(root.tag).lower():
+            return None
+        
+        flames: list[dict[str, Any]] = []
+        for flame in root.iter(xml_keys.XML_NAME):
+            try:
+                flames.append(flam3h_library_catalog.flame_stats(flame))
+            except (ValueError, KeyError, IndexError) as e:
+                name: str | None = flame.get(xml_keys.XML_XF_NAME)
+                flames.append({'name': name.strip() if name is not None and len(name) else '[]', 'error': str(e)})
+                
+        return flames if flames else None
     
-    @property
-    def xf_color(self) -> tuple[str, ...]:
-        return self._xf_color
     
-    @property
-    def xf_symmetry(self) -> tuple[str, ...]:
-        return self._xf_symmetry
+    # CLASS: PROPERTIES
+    ##########################################
+    ##########################################
     
     @property
-    def xf_color_speed(self) -> tuple[str, ...]:
-        return self._xf_color_speed
+    def cache_file(self) -> str:
+        return self._cache_file
     
     @property
-    def xf_opacity(self) -> tuple[str, ...]:
-        return self._xf_opacity
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
     
-    @property
-    def xf_preaffine(self) -> tuple[str, ...]:
-        return self._xf_preaffine
     
-    @property
-    def xf_f3h_preaffine(self) -> tuple[str, ...]:
-        return self._xf_f3h_preaffine
+    def load(self) -> bool:
+        """Load the JSON cache file if it exist and it is of the same version of this catalog.</br>
+
+        Args:
+            (self):
+
+        Returns:
+            (bool): True if loaded and False if not.
+        """
+        try:
+            with open(self._cache_file, 'r') as r:
+                data: dict[str, Any] = json.load(r)
+                
+        except (OSError, ValueError):
+            return False
+        
+        if not isinstance(data, dict) or data.get('version') != self.CACHE_VERSION:
+            return False
+        
+        with self._lock:
+            self._files = dict(data.get('files', {}))
+            self._paths = {path: (int(v[0]), int(v[1]), str(v[2])) for path, v in dict(data.get('paths', {})).items()}
+            self._dirty = False
+            
+        return True
     
-    @property
-    def xf_f3h_preaffine_angle(self) -> tuple[str, ...]:
-        return self._xf_f3h_preaffine_angle
     
-    @property
-    def xf_postaffine(self) -> tuple[str, ...]:
-        return self._xf_postaffine
+    def save(self) -> bool:
+        """Write the JSON cache file out, only if something changed since it was last loaded or saved.</br>
+        It is first written into a temporary file and then moved in place so a broken cache file is never left behind.</br>
+
+        Args:
+            (self):
+
+        Returns:
+            (bool): True if written out or if there was nothing to write and False if something went wrong.
+        """
+        with self._lock:
+            if not self._dirty:
+                return True
+            # Only the flame library files still reachable are kept.
+            digests: set[str] = set(v[2] for v in self._paths.values())
+            data: dict[str, Any] = {'version': self.CACHE_VERSION,
+                                    'files': {digest: flames for digest, flames in self._files.items() if digest in digests},
+                                    'paths': dict(self._paths)
+                                    }
+            self._dirty = False
+            
+        # Replace the file the cache file path resolve to, so a symbolic link is not turned into a regular file.
+        real_path: str = os.path.realpath(self._cache_file)
+        try:
+            fd, tmp_path = mkstemp(prefix='.f3h_', suffix='.tmp', dir=os.path.dirname(real_path))
+            try:
+                with os.fdopen(fd, 'w') as w:
+                    json.dump(data, w)
+                os.replace(tmp_path, real_path)
+                
+            except OSError:
+                os.remove(tmp_path)
+                raise
+            
+        except OSError as e:
+            with self._lock: self._dirty = True
+            print(f"Warning:\nFLAM3H™ library catalog: could not write the cache file: {self._cache_file}\n{e}\n")
+            return False
+        
+        return True
     
-    @property
-    def xf_f3h_postaffine(self) -> tuple[str | list[Never], ...]:
-        return self._xf_f3h_postaffine
     
-    @property
-    def xf_f3h_postaffine_angle(self) -> tuple[str | list[Never], ...]:
-        return self._xf_f3h_postaffine_angle
+    def index(self, xmlfile: str) -> list[dict[str, Any]] | None:
+        """Get the flame presets stats of a flame library file, indexing it only if not already cached for its current content.</br>
+
+        Args:
+            (self):
+            xmlfile(str): The flame library file full path.
+
+        Returns:
+            (list[dict[str, Any]] | None): The stats of each flame preset or None if it is not a valid flame library file.
+        """
+        path: str = os.path.realpath(xmlfile)
+        stat: tuple[int, int] | None = _xml_index.xmlfile_stat(path)
+        if stat is None:
+            return None
+        
+        with self._lock:
+            known: tuple[int, int, str] | None = self._paths.get(path)
+            if known is not None and known[:2] == stat and known[2] in self._files:
+                return self._files[known[2]]
+            
+        try:
+            with open(path, 'rb') as f:
+                data: bytes = f.read()
+                
+        except OSError:
+            return None
+        
+        digest: str = blake2b(data, digest_size=16).hexdigest()
+        with self._lock:
+            flames: list[dict[str, Any]] | None = self._files.get(digest)
+            
+        if flames is None:
+            flames = self.flames_stats(data)
+            if flames is None:
+                return None
+            
+        with self._lock:
+            self._files[digest] = flames
+            self._paths[path] = (stat[0], stat[1], digest)
+            self._dirty = True
+            
+        return flames
     
-    @property
-    def finalxf_name(self) -> str:
-        return self._finalxf_name
     
-    @property
-    def finalxf_preaffine(self) -> str:
-        return self._finalxf_preaffine
+    def index_queued(self) -> None:
+        """Index the queued flame library files one after the other and write the JSON cache file out once done.</br>
+        This is what the worker thread run: it keep going as long as flame library files are queued: self.start(...)</br>
+        and it will stop in between flame library files if asked to: self.stop()</br>
+
+        Args:
+            (self):
+
+        Returns:
+            (None):
+        """
+        while True:
+            while not self._stop.is_set():
+                with self._lock:
+                    if not self._queue:
+                        break
+                    xmlfile: str = self._queue.popleft()
+                self.index(xmlfile)
+                
+            self.save()
+            
+            # More flame library files may have been queued while writing the JSON cache file out.
+            with self._lock:
+                if self._stop.is_set():
+                    self._queue.clear()
+                if not self._queue:
+                    self._active = False
+                    return
+        
+        
+    def start(self, xmlfiles: Iterable[str]) -> bool:
+        """Queue the flame library files to be indexed in a worker thread, starting it if it is not already running.</br>
+
+        Args:
+            (self):
+            xmlfiles(Iterable[str]): The flame library files full paths.
+
+        Returns:
+            (bool): True if started or queued behind the flame library files already being indexed and False if there is nothing to index.
+        """
+        xmlfiles = list(xmlfiles)
+        if not xmlfiles:
+            return False
+        
+        with self._lock:
+            self._queue.extend(xmlfiles)
+            if self._active:
+                return True
+            self._active = True
+            
+        self._stop.clear()
+        self._thread = Thread(target=self.index_queued, name="FLAM3H™ library catalog", daemon=True)
+        self._thread.start()
+        return True
     
-    @property
-    def finalxf_f3h_preaffine(self) -> str:
-        return self._finalxf_f3h_preaffine
     
-    @property
-    def finalxf_f3h_preaffine_angle(self) -> str:
-        return self._finalxf_f3h_preaffine_angle
+    def start_dir(self, in_dir: str) -> bool:
+        """Start indexing all the flame library files inside a directory, not recursive, in a worker thread.</br>
+        The flame library files already indexed for their current content are only checked: self.index(...)</br>
+
+        Args:
+            (self):
+            in_dir(str): The directory with the flame library files to index.
+
+        Returns:
+            (bool): True if started or queued and False if there is nothing to index.
+        """
+        return self.start(flam3h_library_converter.xmlfiles_collect(in_dir))
     
-    @property
-    def finalxf_postaffine(self) -> str:
-        return self._finalxf_postaffine
     
-    @property
-    def finalxf_f3h_postaffine(self) -> str:
-        return self._finalxf_f3h_postaffine
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait for the worker thread to finish indexing, the queued flame library files included.</br>
+
+        Args:
+            (self):
+            timeout(float | None): Default to: None</br>The maximum time to wait in seconds, None will wait until done.
+
+        Returns:
+            (bool): True if done and False if still running.
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return not self.is_running
     
-    @property
-    def finalxf_f3h_postaffine_angle(self) -> str:
-        return self._finalxf_f3h_postaffine_angle
     
-    @property
-    def palette_hex(self) -> str:
-        return self._palette_hex
+    def stop(self) -> None:
+        """Ask the worker thread to stop after the flame library file it is currently indexing and wait for it.</br>
+        What has been indexed so far is written out into the JSON cache file and the flame library files still queued are dropped.</br>
+
+        Args:
+            (self):
+
+        Returns:
+            (None):
+        """
+        self._stop.set()
+        self.wait()
+        
+        
+    def query(self, 
+              vars: Iterable[str] = (), 
+              min_iterators: int | None = None, 
+              max_iterators: int | None = None, 
+              ff: bool | None = None, 
+              missing: bool | None = None, 
+              unknown: bool | None = None, 
+              xmlfiles: Iterable[str] | None = None
+              ) -> list[tuple[str, int, str]]:
+        """Find the flame presets matching all the requested conditions out of the indexed flame library files.</br>
+        The flame library files still being indexed, or queued to be, are waited for first.</br>
+        Every condition left to None is not checked.</br>
+
+        Args:
+            (self):
+            vars(Iterable[str]): Default to: ()</br>The variations the flame presets must all use, case insensitive: ('julian', 'spherical')
+            min_iterators(int | None): Default to: None</br>The minimum number of iterators.
+            max_iterators(int | None): Default to: None</br>The maximum number of iterators.
+            ff(bool | None): Default to: None</br>Must the flame presets use the FF ? True or False
+            missing(bool | None): Default to: None</br>Must the flame presets use variations FLAM3H™ do not have ? True or False
+            unknown(bool | None): Default to: None</br>Must the flame presets use unknown variations ? True or False
+            xmlfiles(Iterable[str] | None): Default to: None</br>Look only inside those flame library files full paths, otherwise inside all the indexed flame library files.
+
+        Returns:
+            (list[tuple[str, int, str]]): The matching flame presets: (flame library file realpath, flame preset index, flame preset name), sorted by file and index.
+        """
+        self.wait()
+        
+        vars_query: set[str] = set(str(var).lower() for var in vars)
+        paths: set[str] | None = set(os.path.realpath(xmlfile) for xmlfile in xmlfiles) if xmlfiles is not None else None
+        
+        with self._lock:
+            items: list[tuple[str, list[dict[str, Any]]]] = [(path, self._files[v[2]]) for path, v in self._paths.items() if v[2] in self._files and (paths is None or path in paths)]
+            
+        found: list[tuple[str, int, str]] = []
+        for path, flames in items:
+            for idx, f in enumerate(flames):
+                if 'error' in f:
+                    continue
+                if min_iterators is not None and f['iterators'] < min_iterators:
+                    continue
+                if max_iterators is not None and f['iterators'] > max_iterators:
+                    continue
+                if ff is not None and f['ff'] != ff:
+                    continue
+                if missing is not None and bool(f['vars_missing']) != missing:
+                    continue
+                if unknown is not None and bool(f['vars_unknown']) != unknown:
+                    continue
+                if vars_query and not vars_query.issubset(var.lower() for var in f['vars']):
+                    continue
+                found.append((path, idx, f['name']))
+                
+        return sorted(found)
 
 
 # PYSIDE start here (panels and such)
@@ -23889,7 +28517,7 @@ class out_flame_xforms_data(out_flame_utils):
 ##########################################
 
 
-class SvgIcon(QtWidgets.QWidget): # pyright: ignore[reportGeneralTypeIssues]  # this is becasue the import branches at the top
+class SvgIcon(QtWidgets.QWidget if __pyside_version__ is not None else object): # pyright: ignore[reportGeneralTypeIssues]  # this is becasue the import branches at the top. Without PySide (outside Houdini) it is never instanced.
     """A QWidget for displaying an SVG image.</br></br>
 
     This widget wraps a QSvgRenderer to render SVG content inside a QWidget.</br>
@@ -24036,7 +28664,7 @@ class pyside_master:
     
     """ 
     
-    class F3H_msg_panel(QtWidgets.QWidget): # pyright: ignore[reportGeneralTypeIssues]  # this is becasue the import branches at the top
+    class F3H_msg_panel(QtWidgets.QWidget if __pyside_version__ is not None else object): # pyright: ignore[reportGeneralTypeIssues]  # this is becasue the import branches at the top. Without PySide (outside Houdini) it is never instanced.
         """A default PySide meassage panel.</br></br>
 
         Can be used in different scenarios to display a short message nicely.</br></br>
@@ -0,0 +1,34 @@
+"""Load the FLAM3H™ python module outside Houdini, the same as on a CPU-only machine without it."""
+
+import os
+import sys
+import importlib.util
+from types import ModuleType
+
+ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULE_PATH: str = os.path.join(ROOT, 'src', 'py__3_13', 'py_flam3__3_13.py')
+FLAME_LIBS: str = os.path.join(ROOT, '__FLAM3H_flame_libs')
+MODULE_NAME: str = 'py_flam3__3_13_headless'
+
+
+def load() -> ModuleType:
+    """Import the module with hou and nodesearch made unavailable (a None entry in sys.modules makes their import fail)."""
+    module: ModuleType | None = sys.modules.get(MODULE_NAME)
+    if module is not None:
+        return module
+
+    saved: dict[str, ModuleType | None] = {name: sys.modules.get(name) for name in ('hou', 'nodesearch')}
+    sys.modules.update(dict.fromkeys(saved))
+    try:
+        spec = importlib.util.spec_from_file_location(MODULE_NAME, MODULE_PATH)
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[MODULE_NAME] = module
+        spec.loader.exec_module(module)
+    finally:
+        for name, mod in saved.items():
+            if mod is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = mod
+    return module
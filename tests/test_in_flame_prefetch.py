@@ -0,0 +1,95 @@
+import io
+import os
+import time
+import shutil
+import tempfile
+import unittest
+import contextlib
+from unittest import mock
+
+from _headless import FLAME_LIBS, load
+
+
+class TestInFlamePrefetch(unittest.TestCase):
+
+    LIB: str = 'F3H_LOCK_APOPHYSIS_SephFlamePack.flame'
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.f3h = load()
+
+    def setUp(self) -> None:
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+        self.xmlfile = os.path.join(tmp, self.LIB)
+        shutil.copy(os.path.join(FLAME_LIBS, self.LIB), self.xmlfile)
+        self.prefetch = self.f3h.in_flame_prefetch(8)
+        self.addCleanup(self.prefetch.clear)
+
+    def wait(self, count: int) -> None:
+        deadline = time.monotonic() + 30
+        while len(self.prefetch) < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(self.prefetch), count)
+
+    def test_adjacent_ids(self) -> None:
+        adjacent_ids = self.f3h.in_flame_prefetch.adjacent_ids
+        self.assertEqual(adjacent_ids(5, 10, 2), [6, 4, 7, 3])
+        self.assertEqual(adjacent_ids(0, 10, 2), [1, 2])
+        self.assertEqual(adjacent_ids(9, 10, 2), [8, 7])
+        self.assertEqual(adjacent_ids(0, 1, 3), [])
+
+    def test_prefetch_count(self) -> None:
+        prefetch_count = self.f3h.in_flame_prefetch.prefetch_count
+        user_data: dict[str, str] = {}
+        node = mock.Mock(userData=user_data.get)
+        with mock.patch.dict(os.environ, {self.f3h.in_flame_prefetch.ENV_COUNT: ''}):
+            self.assertEqual(prefetch_count(node), 0)
+        with mock.patch.dict(os.environ, {self.f3h.in_flame_prefetch.ENV_COUNT: '3'}):
+            self.assertEqual(prefetch_count(node), 3)
+            # The count saved on the node wins over the environment variable, 0(Zero) included.
+            user_data[self.f3h.f3h_userData.IN_PREFETCH] = '0'
+            self.assertEqual(prefetch_count(node), 0)
+            user_data[self.f3h.f3h_userData.IN_PREFETCH] = 'x'
+            self.assertEqual(prefetch_count(node), 0)
+
+    def test_request_get_round_trip(self) -> None:
+        # An invalid weight on the second flame preset: its warning must be collected, not printed out by the worker thread.
+        with open(self.xmlfile, encoding='utf-8') as f:
+            flames = f.read().split('<flame ')
+        flames[2] = flames[2].replace('weight="', 'weight="x', 1)
+        with open(self.xmlfile, 'w', encoding='utf-8') as f:
+            f.write('<flame '.join(flames))
+
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            self.prefetch.request(self.xmlfile, 0, 4, 1)
+            self.wait(1)
+        self.assertEqual(stdout.getvalue(), '')
+
+        node = object()
+        with mock.patch.object(self.f3h.in_flame_iter_data, 'hou_build') as hou_build:
+            self.assertIsNone(self.prefetch.get(node, self.xmlfile, 2))
+            apo_data = self.prefetch.get(node, self.xmlfile, 1)
+            self.assertIsNotNone(apo_data)
+            # Handed out only once
+            self.assertIsNone(self.prefetch.get(node, self.xmlfile, 1))
+
+        self.assertEqual(apo_data.idx, 1)
+        self.assertTrue(apo_data.xforms)
+        hou_build.assert_called_once()
+        built_node, warnings = hou_build.call_args.args
+        self.assertIs(built_node, node)
+        self.assertIn('NOT A VALUE', warnings)
+        self.assertEqual(len(self.prefetch), 0)
+
+    def test_modified_file_is_not_served(self) -> None:
+        self.prefetch.request(self.xmlfile, 1, 4, 1)
+        self.wait(2)
+        with open(self.xmlfile, 'a', encoding='utf-8') as f:
+            f.write('\n')
+        self.assertIsNone(self.prefetch.get(object(), self.xmlfile, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
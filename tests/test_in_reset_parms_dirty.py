@@ -0,0 +1,158 @@
+import unittest
+from types import SimpleNamespace
+from typing import Any, Callable
+from unittest import mock
+
+from _headless import load
+
+
+class _OperationFailed(Exception):
+    pass
+
+
+# Only the bits of the HOM API the changed parameters record make use of.
+_HOU = SimpleNamespace(
+    nodeEventType=SimpleNamespace(ParmTupleChanged='ParmTupleChanged', ParmTupleAnimated='ParmTupleAnimated', ParmTupleLockChanged='ParmTupleLockChanged'),
+    parmTemplateType=SimpleNamespace(Float='Float', Folder='Folder'),
+    OperationFailed=_OperationFailed,
+)
+
+
+class _Parm:
+    """A parameter firing the node events the way Houdini does: a keyframe alone is an animation change, not a value change."""
+
+    def __init__(self, node: '_Node', name: str, default: float, multi: bool) -> None:
+        self.node, self._name, self.default, self.multi = node, name, default, multi
+        self.value: float = default
+        self.locked: bool = False
+        self.frames: list[tuple[float, float]] = []
+        self.tuple: _ParmTuple = _ParmTuple(self)
+
+    def name(self) -> str: return self._name
+    def eval(self) -> float: return self.frames[0][1] if self.frames else self.value
+    def isLocked(self) -> bool: return self.locked
+    def keyframes(self) -> tuple[tuple[float, float], ...]: return tuple(self.frames)
+    def isMultiParmInstance(self) -> bool: return self.multi
+    def isAtDefault(self) -> bool: return not self.frames and self.value == self.default
+
+    def set(self, value: float) -> None:
+        if value != self.value:
+            self.value = value
+            self.node.fire('ParmTupleChanged', self.tuple)
+
+    def lock(self, on: bool) -> None:
+        if on != self.locked:
+            self.locked = on
+            self.node.fire('ParmTupleLockChanged', self.tuple)
+
+    def setKeyframe(self, frame: float, value: float) -> None:
+        was_animated: bool = bool(self.frames)
+        self.frames.append((frame, value))
+        if not was_animated: self.node.fire('ParmTupleAnimated', self.tuple)
+
+    def deleteAllKeyframes(self) -> None:
+        if self.frames:
+            self.frames.clear()
+            self.node.fire('ParmTupleAnimated', self.tuple)
+
+    def revertToDefaults(self) -> None:
+        self.set(self.default)
+
+
+class _ParmTuple:
+
+    def __init__(self, parm: _Parm) -> None:
+        self.parm = parm
+
+    def __iter__(self): return iter((self.parm,))
+    def name(self) -> str: return self.parm.name()
+    def parmTemplate(self) -> Any: return SimpleNamespace(type=lambda: _HOU.parmTemplateType.Float)
+
+
+class _Node:
+
+    def __init__(self, f3h) -> None:
+        self.cached: dict[str, Any] = {}
+        self.callbacks: list[tuple[tuple[str, ...], Callable[..., None]]] = []
+        self.delivered: int = 0
+        self._parms: dict[str, _Parm] = {}
+        iter_count: str = f3h.f3h_tabs.PRM_ITERATORS_COUNT
+        self._parms[iter_count] = _Parm(self, iter_count, 3, False)
+        self._parms['xaos_1'] = _Parm(self, 'xaos_1', 0.0, True)
+
+    def fire(self, event_type: str, parm_tuple: _ParmTuple) -> None:
+        for event_types, callback in self.callbacks:
+            if event_type in event_types:
+                self.delivered += 1
+                callback(node=self, event_type=event_type, parm_tuple=parm_tuple)
+
+    def parm(self, name: str) -> _Parm | None: return self._parms.get(name)
+    def parmTuple(self, name: str) -> _ParmTuple | None: return self._parms[name].tuple if name in self._parms else None
+    def eventCallbacks(self) -> tuple[tuple[tuple[str, ...], Callable[..., None]], ...]: return tuple(self.callbacks)
+    def addEventCallback(self, event_types: tuple[str, ...], callback: Callable[..., None]) -> None: self.callbacks.append((event_types, callback))
+    def removeEventCallback(self, event_types: tuple[str, ...], callback: Callable[..., None]) -> None: self.callbacks.remove((event_types, callback))
+    def cachedUserData(self, name: str) -> Any: return self.cached.get(name)
+    def setCachedUserData(self, name: str, value: Any) -> None: self.cached[name] = value
+
+    def destroyCachedUserData(self, name: str) -> None:
+        if self.cached.pop(name, None) is None: raise _OperationFailed(name)
+
+
+class TestInResetParmsDirty(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.f3h = load()
+
+    def setUp(self) -> None:
+        patcher = mock.patch.object(self.f3h, 'hou', _HOU)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.node = _Node(self.f3h)
+        self.utils = self.f3h.in_flame_utils({'node': self.node})
+        # As right after a Flame preset load
+        self.f3h.in_flame_utils.in_reset_parms_dirty_track(self.node)
+
+    def dirty(self) -> set[str] | None:
+        return self.node.cachedUserData(self.f3h.f3h_cachedUserData.in_reset_parms_dirty)
+
+    def test_keyframed_parm_is_reset_by_the_next_load(self) -> None:
+        xaos: _Parm = self.node._parms['xaos_1']
+        # A keyframe that leave the value unchanged
+        xaos.setKeyframe(1, xaos.default)
+        self.assertEqual(self.dirty(), {'xaos_1'})
+
+        self.utils.in_to_flam3h_reset_iterators_parms(self.node, 3)
+        self.assertFalse(xaos.keyframes())
+        self.assertTrue(xaos.isAtDefault())
+        # Tracked again, and the reset itself is not in the new record
+        self.assertEqual(self.dirty(), set())
+
+    def test_changed_and_locked_parms_are_reset_by_the_next_load(self) -> None:
+        xaos: _Parm = self.node._parms['xaos_1']
+        xaos.set(1.0)
+        xaos.lock(True)
+        self.assertEqual(self.dirty(), {'xaos_1'})
+
+        self.utils.in_to_flam3h_reset_iterators_parms(self.node, 3)
+        self.assertFalse(xaos.isLocked())
+        self.assertTrue(xaos.isAtDefault())
+        self.assertEqual(len(self.node.callbacks), 1)
+
+    def test_reset_does_not_fire_the_callback(self) -> None:
+        xaos: _Parm = self.node._parms['xaos_1']
+        xaos.set(1.0)
+        xaos.lock(True)
+        xaos.setKeyframe(1, 2.0)
+        delivered: int = self.node.delivered
+
+        self.utils.in_to_flam3h_reset_iterators_parms(self.node, 3)
+        self.assertTrue(xaos.isAtDefault())
+        # The unlock, the keyframes removal and the revert to default all happened without the callback registered.
+        self.assertEqual(self.node.delivered, delivered)
+        self.assertEqual(len(self.node.callbacks), 1)
+        self.assertEqual(self.dirty(), set())
+
+
+if __name__ == '__main__':
+    unittest.main()
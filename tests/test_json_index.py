@@ -0,0 +1,71 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from _headless import load
+
+
+PRESETS = {
+    'fire': {'f3h_hex': 'FF0000\n00FF00', 'f3h_hsv': '1 1 1'},
+    'café [{":}]': {'f3h_hex': '0000FF'},
+    'grey': {'f3h_hex': '808080', 'f3h_keys': [0.0, 0.5, {'x': 1}]},
+}
+
+
+class TestJsonIndex(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.f3h = load()
+
+    def setUp(self) -> None:
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+        patcher = mock.patch.dict(os.environ, {'HOUDINI_USER_PREF_DIR': os.path.join(tmp, 'prefs')})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.jsonfile = os.path.join(tmp, 'palettes.json')
+
+    def index(self, text: str):
+        with open(self.jsonfile, 'w', encoding='utf-8') as f:
+            f.write(text)
+        return self.f3h._json_index.jsonfile_index(self.jsonfile)
+
+    def test_index_offsets(self) -> None:
+        for text in (json.dumps(PRESETS, indent=4), json.dumps(PRESETS), json.dumps(PRESETS, ensure_ascii=False)):
+            index = self.index(text)
+            for preset, data in PRESETS.items():
+                idx = index.preset_idx(preset)
+                self.assertIsNotNone(idx)
+                self.assertEqual(index.preset_load(idx, preset), data)
+
+    def test_invalid_file_is_not_indexed(self) -> None:
+        index = self.index(json.dumps(PRESETS, indent=4)[:-1])
+        self.assertIsNone(index.preset_idx('fire'))
+        self.assertFalse(index.preset_append({'blue': {'f3h_hex': '0000FF'}}))
+
+    def test_append_in_place(self) -> None:
+        index = self.index(json.dumps(PRESETS, indent=4))
+        new = {'blue': {'f3h_hex': '0000FF'}, 'ünï': {'f3h_hex': 'FFFFFF'}}
+        self.assertTrue(index.preset_append(new))
+
+        with open(self.jsonfile, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), json.dumps(PRESETS | new, indent=4))
+        for preset, data in (PRESETS | new).items():
+            self.assertEqual(index.preset_load(index.preset_idx(preset), preset), data)
+
+    def test_append_fall_back_on_other_layouts(self) -> None:
+        new = {'blue': {'f3h_hex': '0000FF'}}
+        for text in (json.dumps(PRESETS), json.dumps(PRESETS, indent=2), json.dumps(PRESETS, indent=4) + '\n'):
+            index = self.index(text)
+            self.assertTrue(index.preset_idx('fire') is not None)
+            self.assertFalse(index.preset_append(new))
+            with open(self.jsonfile, 'r', encoding='utf-8') as f:
+                self.assertEqual(f.read(), text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import lxml.etree as lxmlET
+
+from _headless import FLAME_LIBS, load
+
+
+class TestLibraryCatalog(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.f3h = load()
+
+    def setUp(self) -> None:
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+        self.cache_file = os.path.join(tmp, 'catalog.json')
+
+    def test_index_reload_and_query(self) -> None:
+        catalog_cls = self.f3h.flam3h_library_catalog
+        catalog = catalog_cls(self.cache_file)
+        self.assertTrue(catalog.start_dir(FLAME_LIBS))
+        self.assertTrue(catalog.wait(120))
+        self.assertTrue(os.path.isfile(self.cache_file))
+
+        found = catalog.query(vars=('julian',), max_iterators=10, unknown=False)
+        self.assertTrue(found)
+
+        # The reloaded cache answers the same without indexing the flame library files again.
+        reloaded = catalog_cls(self.cache_file)
+        with mock.patch.object(catalog_cls, 'flames_stats') as flames_stats:
+            for xmlfile in self.f3h.flam3h_library_converter.xmlfiles_collect(FLAME_LIBS):
+                self.assertIsNotNone(reloaded.index(xmlfile))
+            flames_stats.assert_not_called()
+        self.assertEqual(reloaded.query(vars=('julian',), max_iterators=10, unknown=False), found)
+
+        for path, idx, name in found:
+            flame = lxmlET.parse(path).getroot().findall('flame')[idx]
+            self.assertEqual(flame.get('name', '').strip() or '[]', name)
+            xforms = flame.findall('xform')
+            self.assertLessEqual(len(xforms), 10)
+            self.assertTrue(any(xf.get('julian') is not None for xf in xforms + flame.findall('finalxform')))
+
+    def test_start_queues_while_running(self) -> None:
+        catalog_cls = self.f3h.flam3h_library_catalog
+        catalog = catalog_cls(self.cache_file)
+        xmlfiles = self.f3h.flam3h_library_converter.xmlfiles_collect(FLAME_LIBS)
+        other_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, other_dir)
+        other = shutil.copy(xmlfiles[0], os.path.join(other_dir, 'other.flame'))
+
+        # Hold the worker thread on the first flame library file so the second folder is asked for while it is still running.
+        gate = threading.Event()
+        index = catalog_cls.index
+        def held_index(self, xmlfile):
+            gate.wait(30)
+            return index(self, xmlfile)
+        with mock.patch.object(catalog_cls, 'index', held_index):
+            self.assertTrue(catalog.start(xmlfiles[:1]))
+            self.assertTrue(catalog.start_dir(other_dir))
+            self.assertTrue(catalog.is_running)
+            gate.set()
+            self.assertTrue(catalog.wait(120))
+
+        self.assertEqual({path for path, _, _ in catalog.query()}, {os.path.realpath(xmlfiles[0]), os.path.realpath(other)})
+
+    def test_add_dir_is_indexed_once_the_shared_catalog_is_asked_for(self) -> None:
+        catalog_cls = self.f3h.flam3h_library_catalog
+        with mock.patch.object(catalog_cls, 'SHARED', None), \
+             mock.patch.object(catalog_cls, 'DIRS', []), \
+             mock.patch.dict(os.environ, {'HOUDINI_USER_PREF_DIR': os.path.dirname(self.cache_file)}):
+            catalog_cls.add_dir(FLAME_LIBS)
+            catalog_cls.add_dir(FLAME_LIBS)
+            self.assertEqual(catalog_cls.DIRS, [FLAME_LIBS])
+            # Nothing is read or written until the shared catalog is asked for.
+            self.assertIsNone(catalog_cls.SHARED)
+            self.assertFalse(os.path.exists(catalog_cls.default_cache_file()))
+
+            found = catalog_cls.shared().query(vars=('julian',))
+            self.assertTrue(found)
+            self.assertEqual(catalog_cls.DIRS, [])
+            self.assertTrue(os.path.isfile(catalog_cls.default_cache_file()))
+
+    def test_invalid_palette_is_kept_in_the_stats(self) -> None:
+        flame = lxmlET.fromstring('<flame name="bad palette"><xform weight="1" coefs="1 0 0 1 0 0" linear="1"/>'
+                                  '<palette count="2" format="RGB">FF0000ZZ00GG</palette></flame>')
+        with mock.patch('builtins.print') as printed:
+            stats = self.f3h.flam3h_library_catalog.flame_stats(flame)
+        printed.assert_not_called()
+        self.assertEqual(stats['palette'], 0)
+        self.assertTrue(stats['palette_error'])
+
+    def test_default_cache_file(self) -> None:
+        with mock.patch.dict(os.environ, {'HOUDINI_USER_PREF_DIR': os.path.dirname(self.cache_file)}):
+            self.assertEqual(self.f3h.flam3h_library_catalog.default_cache_file(),
+                             os.path.join(os.path.dirname(self.cache_file), self.f3h.flam3h_library_catalog.CACHE_FILE_NAME))
+
+
+if __name__ == '__main__':
+    unittest.main()
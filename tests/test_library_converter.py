@@ -0,0 +1,84 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import lxml.etree as lxmlET
+
+from _headless import FLAME_LIBS, load
+
+
+class TestLibraryConverterRemap(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.f3h = load()
+
+    def test_mixed_case_fractorium_prm_names_without_version(self) -> None:
+        # Fractorium write the mobius parameters in mixed case, and the version XML key is missing: it must be treated as Fractorium.
+        flame = lxmlET.fromstring('<flame name="mobius">'
+                                  '<xform weight="1" coefs="1 0 0 1 0 0" mobius="1" Mobius_Re_A="0.5" Mobius_Im_D="-0.25" '
+                                  'pre_oscilloscope="1" Pre_Oscilloscope_Frequency="3"/>'
+                                  '<palette count="2" format="RGB">FF000000FF00</palette>'
+                                  '</flame>')
+        report = self.f3h.flam3h_library_converter.flame_normalize(flame)
+        xform = flame.find('xform')
+        assert xform is not None
+
+        self.assertEqual(report['prm_remapped'], ['mobius', 'pre_oscilloscope'])
+        self.assertEqual(xform.get('re_a'), '0.5')
+        self.assertEqual(xform.get('im_d'), '-0.25')
+        self.assertEqual(xform.get('pre_oscope_frequency'), '3')
+        for key in ('Mobius_Re_A', 'Mobius_Im_D', 'Pre_Oscilloscope_Frequency'):
+            self.assertIsNone(xform.get(key))
+        self.assertTrue(str(flame.get('version')).startswith(self.f3h.xml_keys.XML_APP_NAME_FLAM3H))
+
+    def test_mixed_case_pre_gaussian_blur(self) -> None:
+        xform = lxmlET.fromstring('<xform weight="1" Pre_Gaussian_Blur="0.3" pre_sinusoidal="1" linear="1"/>')
+        self.assertTrue(self.f3h.flam3h_library_converter.xform_remap_pgb(xform, 'pre_gaussian_blur'))
+        self.assertEqual(xform.get('pre_blur'), '0.3')
+        self.assertIsNone(xform.get('Pre_Gaussian_Blur'))
+
+
+
+class TestLibraryConverterConvert(unittest.TestCase):
+
+    LIBS: tuple[str, ...] = ('F3H_LOCK_APOPHYSIS_SephFlamePack.flame', 'F3H_LOCK_FRACTORIUM_c-91_examples.flame')
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.f3h = load()
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.in_dir = os.path.join(self.tmp, 'in')
+        self.out_dir = os.path.join(self.tmp, 'out')
+        os.makedirs(self.in_dir)
+        for name in self.LIBS:
+            shutil.copy(os.path.join(FLAME_LIBS, name), self.in_dir)
+        # A malformed flame library file must be reported without aborting the batch.
+        with open(os.path.join(self.in_dir, 'broken.flame'), 'w') as f:
+            f.write('<flames><flame name="broken"><xform weight="1"')
+
+    def test_convert_default_workers(self) -> None:
+        report = self.f3h.flam3h_library_converter(self.in_dir, self.out_dir).convert()
+
+        files = {os.path.basename(file['file']): file for file in report['files']}
+        self.assertEqual(sorted(files), sorted((*self.LIBS, 'broken.flame')))
+        self.assertIn('error', files['broken.flame'])
+        self.assertIsNone(files['broken.flame']['out'])
+        self.assertEqual(report['totals']['files_failed'], 1)
+
+        for name in self.LIBS:
+            file = files[name]
+            self.assertNotIn('error', file)
+            self.assertTrue(file['flames'])
+            out = lxmlET.parse(file['out']).getroot()
+            self.assertEqual(len(out.findall('flame')), len(file['flames']))
+        self.assertEqual(report['totals']['flames'], sum(len(files[name]['flames']) for name in self.LIBS))
+        self.assertTrue(os.path.isfile(os.path.join(self.out_dir, self.f3h.flam3h_library_converter.REPORT_FILE_NAME)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+import io
+import os
+import zlib
+import struct
+import tempfile
+import unittest
+import contextlib
+from unittest import mock
+
+import numpy
+import lxml.etree as lxmlET
+
+from _headless import FLAME_LIBS, load
+
+
+class TestPreviewRendererHeadless(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.f3h = load()
+
+    def test_module_imports_without_houdini(self) -> None:
+        self.assertFalse(self.f3h.__houdini__)
+
+    def test_render_bundled_preset_to_png(self) -> None:
+        root = lxmlET.parse(os.path.join(FLAME_LIBS, 'F3H_LOCK_APOPHYSIS_SephFlamePack.flame')).getroot()
+        model = self.f3h.flame_model(root.findall('flame')[0])
+        renderer = self.f3h.flam3h_preview_renderer(model, width=64, height=48, samples=20000, batch=5000, seed=7)
+        rgba = renderer.render_uint8()
+        self.assertIsNotNone(rgba)
+        self.assertEqual(rgba.shape, (48, 64, 4))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            filepath = os.path.join(tmp, 'preview.png')
+            self.f3h.flam3h_preview_renderer.write_png(rgba, filepath)
+            with open(filepath, 'rb') as f:
+                png = f.read()
+
+        self.assertEqual(png[:8], b'\x89PNG\r\n\x1a\n')
+        width, height = struct.unpack('>II', png[16:24])
+        self.assertEqual((width, height), (64, 48))
+        # Something has been drawn: some pixels are not fully transparent
+        self.assertGreater(int(rgba[..., 3].max()), 0)
+        # The IDAT data decompress to one filter byte plus the RGBA bytes per row
+        idat_at = png.index(b'IDAT')
+        idat_len = struct.unpack('>I', png[idat_at - 4:idat_at])[0]
+        self.assertEqual(len(zlib.decompress(png[idat_at + 4:idat_at + 4 + idat_len])), 48 * (1 + 64 * 4))
+
+    def sierpinski(self, chaos: str = '') -> list[tuple[float, float]]:
+        """Render the linear Sierpinski triangle with corners (0, 0), (1, 0) and (0, 1) and return the world position of the centre of every hit pixel."""
+        xforms = ''.join(f'<xform weight="1" color="{idx / 2}" coefs="0.5 0 0 0.5 {tx} {ty}" linear="1"{chaos}/>'
+                         for idx, (tx, ty) in enumerate(((0, 0), (0.5, 0), (0, 0.5))))
+        model = self.f3h.flame_model(lxmlET.fromstring(f'<flame name="sierpinski">{xforms}</flame>'))
+        width = height = 64
+        center, scale = (0.5, 0.5), 56.0
+        renderer = self.f3h.flam3h_preview_renderer(model, width=width, height=height, samples=20000, batch=5000, seed=7, center=center, scale=scale)
+        rgba = renderer.render()
+        self.assertIsNotNone(rgba)
+        iy, ix = (rgba[..., 3] > 0).nonzero()
+        return [(center[0] + (i + 0.5 - 0.5 * width) / scale, center[1] + (0.5 * height - j - 0.5) / scale) for i, j in zip(ix, iy)]
+
+    def test_sierpinski_geometry(self) -> None:
+        # One pixel of tolerance around the pixel centres
+        tol = 1.0 / 56.0
+        hits = self.sierpinski()
+        for x, y in hits:
+            # Inside the triangle
+            self.assertTrue(x >= -tol and y >= -tol and x + y <= 1.0 + 2.0 * tol, (x, y))
+            # But not inside its central hole
+            self.assertFalse(x < 0.5 - tol and y < 0.5 - tol and x + y > 0.5 + 2.0 * tol, (x, y))
+        # All three xforms are drawn
+        self.assertTrue(any(x > 0.5 + tol for x, _ in hits))
+        self.assertTrue(any(y > 0.5 + tol for _, y in hits))
+        self.assertTrue(any(x < 0.5 - tol and y < 0.5 - tol for x, y in hits))
+
+    def test_sierpinski_zeroed_xaos_excludes_an_xform(self) -> None:
+        # No xform can jump to the third one, which lift the points up: only the bottom edge is left.
+        hits = self.sierpinski(' chaos="1 1 0"')
+        self.assertTrue(hits)
+        for x, y in hits:
+            self.assertLessEqual(abs(y), 1.0 / 56.0, (x, y))
+        self.assertGreater(max(x for x, _ in hits) - min(x for x, _ in hits), 0.9)
+
+    def test_fisheye_is_not_swapped(self) -> None:
+        # The same as the FLAM3H™ VEX: V_FISHEYE(...) scale the point without swapping X and Y.
+        x, y = self.f3h.flam3h_preview_renderer.variation(16, numpy.array([1.0]), numpy.array([0.0]), (), numpy.zeros((3, 2)), numpy.random.default_rng(0))
+        self.assertAlmostEqual(float(x[0]), 1.0)
+        self.assertAlmostEqual(float(y[0]), 0.0)
+
+    def test_model_from_in_flame_iter_data(self) -> None:
+        # The model built out of the already decoded columns match the one built out of the flame preset XML.
+        xmlfile = os.path.join(FLAME_LIBS, 'F3H_LOCK_APOPHYSIS_SephFlamePack.flame')
+        with contextlib.redirect_stdout(io.StringIO()):
+            apo_data = self.f3h.in_flame_iter_data(None, xmlfile, 1, False)
+        expected = apo_data.get_flame_model(apo_data.idx)
+        # Nothing is decoded again.
+        with mock.patch.object(self.f3h.flame_model, 'affines_array') as affines_array, mock.patch.object(self.f3h.flame_model, 'palette_decode') as palette_decode:
+            model = self.f3h.flam3h_preview_renderer(apo_data).model
+        affines_array.assert_not_called()
+        palette_decode.assert_not_called()
+        self.assertEqual(model.name, expected.name)
+        self.assertEqual([{k.lower(): v for k, v in xf.items()} for xf in expected.xforms], list(model.xforms))
+        for attr in ('coefs', 'post', 'finalxform_coefs', 'finalxform_post', 'palette'):
+            a, b = getattr(model, attr), getattr(expected, attr)
+            self.assertEqual(a is None, b is None, attr)
+            if a is not None:
+                numpy.testing.assert_array_equal(a, b)
+
+    def test_color_speed(self) -> None:
+        xform_compile = self.f3h.flam3h_preview_renderer.xform_compile
+        self.assertEqual(xform_compile({'color_speed': '0.25', 'symmetry': '1'}, None, None)['color_speed'], 0.25)
+        # Without it, from the symmetry: flam3 (1 - symmetry) / 2
+        self.assertEqual(xform_compile({'symmetry': '-1'}, None, None)['color_speed'], 1.0)
+        self.assertEqual(xform_compile({}, None, None, '1')['color_speed'], 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()